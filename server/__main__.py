@@ -48,6 +48,28 @@ Examples:
         dest="ssl_key",
         help="Path to SSL private key file. For Let's Encrypt, use privkey.pem",
     )
+    parser.add_argument(
+        "--checkpoint-interval",
+        dest="checkpoint_interval",
+        type=float,
+        default=5.0,
+        help="Seconds between saves of changed tables (default: 5)",
+    )
+    parser.add_argument(
+        "--snapshot-format",
+        dest="snapshot_format",
+        choices=["binary", "json"],
+        default="binary",
+        help="Storage format for game state: compressed binary, or readable "
+        "JSON for debugging (default: binary)",
+    )
+    parser.add_argument(
+        "--no-estimate-prefetch",
+        dest="prefetch_estimates",
+        action="store_false",
+        help="Don't simulate default-option games in the background to "
+        "pre-compute duration estimates",
+    )
 
     args = parser.parse_args()
 
@@ -64,6 +86,9 @@ Examples:
             port=args.port,
             ssl_cert=args.ssl_cert,
             ssl_key=args.ssl_key,
+            checkpoint_interval=args.checkpoint_interval,
+            snapshot_format=args.snapshot_format,
+            prefetch_estimates=args.prefetch_estimates,
         )
     )
 
@@ -16,6 +16,12 @@ Usage examples:
     # Output as JSON for machine parsing
     python -m server.cli simulate lightturret --bots 2 --json
 
+    # Reproduce a run exactly (the seed of every run is in its JSON output)
+    python -m server.cli simulate pig --bots 2 --seed 42
+
+    # Skip messages, menus and sounds when only the result matters
+    python -m server.cli simulate pig --bots 2 --headless --json
+
     # Test serialization (save/restore after each tick)
     python -m server.cli simulate threes --bots 2 --test-serialization
 
@@ -24,11 +30,31 @@ Usage examples:
 
     # Show game options
     python -m server.cli show-options lightturret
+
+    # Recompute all skill ratings from the stored game history
+    python -m server.cli ratings rebuild --db playpalace.db
+
+    # Report game snapshot size and encode/decode time per game type
+    python -m server.cli snapshot stats --json
+
+    # Simulate 200 games of every type on 4 cores; JSON can be diffed
+    python -m server.cli bench all --games 200 --jobs 4 --seed 1 --json
+
+    # Rebuild a stored table's game at tick 200 of its journal, timing replay
+    python -m server.cli journal replay TABLE_ID --db playpalace.db --tick 200
+
+    # Regenerate the Farkle bot's policy tables (games/farkle/policy.bin)
+    python -m server.cli policy farkle
+
+    # Build the optimal Yahtzee bot's table, then compare it with the simple bot
+    python -m server.cli policy yahtzee
+    python -m server.cli bench yahtzee --bots 1 -o bot_strategy=optimal
 """
 
 import argparse
 import json
 import sys
+import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -63,6 +89,7 @@ class SpectatorUser(User):
     _menus: dict = field(default_factory=dict)  # menu_id -> items
     _json_mode: bool = False
     _quiet: bool = False
+    _headless: bool = False  # Discard output without rendering it
 
     @property
     def username(self) -> str:
@@ -86,7 +113,12 @@ class SpectatorUser(User):
             print(f"  {text}")
 
     def speak(self, text: str, buffer: str = "misc") -> None:
-        self._log(text)
+        if not self._headless:
+            self._log(text)
+
+    def speak_l(self, message_id: str, buffer: str = "misc", **kwargs) -> None:
+        if not self._headless:
+            super().speak_l(message_id, buffer, **kwargs)
 
     def play_sound(
         self, name: str, volume: int = 100, pan: int = 0, pitch: int = 100
@@ -153,6 +185,10 @@ class GameSimulator:
         quiet: bool = False,
         max_ticks: int = 10000000,
         test_serialization: bool = False,
+        seed: int | None = None,
+        headless: bool = False,
+        fast_forward: bool = True,
+        time_bots: bool = False,
     ):
         self.game_type = game_type
         self.bot_names = bot_names
@@ -161,10 +197,19 @@ class GameSimulator:
         self.quiet = quiet
         self.max_ticks = max_ticks
         self.test_serialization = test_serialization
+        self.seed = seed
+        # Skip all presentation work: the run's messages are not captured
+        self.headless = headless
+        # Jump over ticks that only count down timers (see Game.get_idle_ticks)
+        self.fast_forward = fast_forward
+        self.time_bots = time_bots
 
         self.game: Game | None = None
         self.spectator: SpectatorUser | None = None
         self.game_class: type | None = None
+        # Calls to the game's bot_think and the time spent in them
+        self.bot_decisions = 0
+        self.bot_think_seconds = 0.0
 
     def setup(self) -> bool:
         """Set up the game. Returns True on success."""
@@ -194,15 +239,21 @@ class GameSimulator:
 
         # Create game instance
         self.game = self.game_class()
+        self.game._headless = self.headless
+        if self.seed is not None:
+            self.game.rng.seed(self.seed)
 
         # Apply options
         if hasattr(self.game, "options"):
             for key, value in self.options.items():
                 if hasattr(self.game.options, key):
-                    # Convert value to appropriate type
+                    # Convert values given as text (-o key=value) to the
+                    # option's type
                     # Note: Check bool before int because bool is a subclass of int
                     current = getattr(self.game.options, key)
-                    if isinstance(current, bool):
+                    if not isinstance(value, str):
+                        pass
+                    elif isinstance(current, bool):
                         value = value.lower() in ("true", "1", "yes")
                     elif isinstance(current, int):
                         value = int(value)
@@ -214,7 +265,11 @@ class GameSimulator:
 
         # Create spectator to watch the game
         self.spectator = SpectatorUser(
-            _username="__spectator__", _json_mode=self.json_mode, _quiet=self.quiet
+            _username="__spectator__",
+            _uuid=self._next_uuid(),
+            _json_mode=self.json_mode,
+            _quiet=self.quiet,
+            _headless=self.headless,
         )
 
         # Set up host
@@ -222,7 +277,8 @@ class GameSimulator:
 
         # Add bot players
         for name in self.bot_names:
-            bot_user = Bot(name)
+            # Ids come from the game's generator so seeded runs repeat exactly
+            bot_user = Bot(name, uuid=self._next_uuid())
             player = self.game.create_player(bot_user.uuid, name, is_bot=True)
             self.game.players.append(player)
             self.game.attach_user(player.id, bot_user)
@@ -237,6 +293,10 @@ class GameSimulator:
 
         return True
 
+    def _next_uuid(self) -> str:
+        """Generate a user id from the game's random generator."""
+        return str(uuid.UUID(int=self.game.rng.getrandbits(128), version=4))
+
     def _save_and_restore(self, tick: int) -> None:
         """Save game to JSON and restore it, testing serialization."""
         if not self.game or not self.game_class:
@@ -250,6 +310,7 @@ class GameSimulator:
         saved_status_box_open = set(self.game._status_box_open)
         saved_actions_menu_open = set(self.game._actions_menu_open)
         saved_turn_index = self.game.turn_index
+        saved_headless = self.game._headless
 
         # Serialize to JSON
         try:
@@ -270,11 +331,59 @@ class GameSimulator:
         self.game._pending_actions = saved_pending_actions
         self.game._status_box_open = saved_status_box_open
         self.game._actions_menu_open = saved_actions_menu_open
+        self.game._headless = saved_headless
 
         # Restore turn_index before rebuild
         self.game.turn_index = saved_turn_index
         self.game.rebuild_runtime_state()
 
+    def _time_bot_decisions(self) -> None:
+        """Count and time the game's bot_think calls."""
+        import time
+
+        think = getattr(self.game, "bot_think", None)
+        if not self.time_bots or think is None:
+            return
+
+        def timed_think(player):
+            started = time.perf_counter()
+            try:
+                return think(player)
+            finally:
+                self.bot_think_seconds += time.perf_counter() - started
+                self.bot_decisions += 1
+
+        self.game.bot_think = timed_think
+
+    def _seat_scores(self) -> list[int] | None:
+        """Final score of each seat, for games that report final_scores."""
+        if self.game.status != "finished":
+            return None
+        scores = self.game.build_game_result().custom_data.get("final_scores")
+        if not isinstance(scores, dict):
+            return None
+        try:
+            return [scores[name] for name in self.bot_names]
+        except KeyError:
+            return None
+
+    def _winning_seats(self) -> list[int]:
+        """Seats (indices into bot_names) that won, or [] if nobody did."""
+        if self.game.status != "finished":
+            return []
+        result = self.game.build_game_result()
+        # Rankings normally leave bots out; here every seat is a bot
+        for player_result in result.player_results:
+            player_result.is_bot = False
+        rankings = self.game.get_rankings_for_rating(result)
+        if len(rankings) < 2:
+            return []  # Everyone tied
+        seats = {
+            player.id: seat
+            for seat, player in enumerate(self.game.players[: len(self.bot_names)])
+        }
+        return sorted(seats[pid] for pid in rankings[0] if pid in seats)
+
     def run(self) -> dict[str, Any]:
         """Run the simulation to completion. Returns results dict."""
         if not self.game or not self.spectator:
@@ -282,25 +391,36 @@ class GameSimulator:
 
         if not self.json_mode and not self.quiet:
             mode_str = " [testing serialization]" if self.test_serialization else ""
+            if self.headless:
+                mode_str += " [headless]"
             print(
                 f"\n=== {self.game.get_name()} ({len(self.bot_names)} bots){mode_str} ===\n"
             )
 
         # Start the game
         self.game.setup_keybinds()
+        self._time_bot_decisions()
         self.game.on_start()
 
         # Run game loop
         tick = 0
         serialization_error = None
         while self.game.game_active and tick < self.max_ticks:
-            self.game.on_tick()
-            tick += 1
+            idle = self.game.get_idle_ticks() if self.fast_forward else 0
+            if idle > 0:
+                # Counted as ticks so durations match a ticked run
+                skipped = int(min(idle, self.max_ticks - tick))
+                self.game.skip_idle_ticks(skipped)
+                tick += skipped
+            else:
+                self.game.on_tick()
+                tick += 1
 
             # Test serialization after each tick if enabled
             if self.test_serialization:
                 try:
                     self._save_and_restore(tick)
+                    self._time_bot_decisions()
                 except RuntimeError as e:
                     serialization_error = str(e)
                     if not self.json_mode:
@@ -325,9 +445,14 @@ class GameSimulator:
         results = {
             "game_type": self.game_type,
             "game_name": self.game.get_name(),
+            "seed": self.game.rng.initial_seed,
             "ticks": tick,
             "rounds": self.game.round,
             "timed_out": timed_out,
+            "winners": self._winning_seats(),
+            "scores": self._seat_scores(),
+            "bot_decisions": self.bot_decisions,
+            "bot_think_seconds": self.bot_think_seconds,
             "messages": filtered_messages,
             "final_menu": filtered_menu,
         }
@@ -456,6 +581,9 @@ def cmd_simulate(args):
         quiet=args.quiet,
         max_ticks=args.max_ticks,
         test_serialization=args.test_serialization,
+        seed=args.seed,
+        headless=args.headless,
+        fast_forward=not args.no_fast_forward,
     )
 
     if not simulator.setup():
@@ -476,6 +604,484 @@ def cmd_simulate(args):
                     print(f"  {line}")
 
 
+def cmd_ratings_rebuild(args):
+    """Rebuild player_ratings by replaying the full game_results history."""
+    from server.persistence.database import Database
+    from server.game_utils.stats_helpers import RatingRebuilder
+
+    if not Path(args.db).exists():
+        print(f"Error: Database '{args.db}' not found")
+        sys.exit(1)
+
+    db = Database(args.db)
+    db.connect()
+
+    # Each game decides its own placements, exactly as after a live game
+    extractors = {
+        game_class.get_type(): game_class().get_rankings_for_rating
+        for game_class in GameRegistry.get_all()
+    }
+    rebuilder = RatingRebuilder(db, extractors, chunk_size=args.chunk_size)
+
+    def report(stats: dict) -> None:
+        if not args.json:
+            print(
+                f"  {stats['games_processed']} games, "
+                f"{stats['players_rated']} ratings, "
+                f"{stats['games_per_second']:.0f} games/s"
+            )
+
+    try:
+        stats = rebuilder.run(resume=args.resume, on_progress=report)
+    finally:
+        db.close()
+
+    if args.json:
+        print(json.dumps(stats, indent=2))
+    else:
+        print(
+            f"\nRebuilt {stats['players_rated']} ratings from "
+            f"{stats['games_rated']} rated games "
+            f"({stats['games_processed']} processed) in "
+            f"{stats['elapsed_seconds']:.1f}s "
+            f"({stats['games_per_second']:.0f} games/s)"
+        )
+
+
+def cmd_ratings(args):
+    """Dispatch rating maintenance subcommands."""
+    if args.ratings_command == "rebuild":
+        cmd_ratings_rebuild(args)
+
+
+def _sample_game_states(
+    game_type: str, samples: int = 8, every_ticks: int = 100
+) -> list[dict]:
+    """Capture a bot game's serialized state at start and every few ticks."""
+    game_class = get_game_class(game_type)
+    num_bots = max(3, game_class.get_min_players())
+    num_bots = min(num_bots, game_class.get_max_players())
+    simulator = GameSimulator(
+        game_type=game_type,
+        bot_names=BOT_NAMES[:num_bots],
+        options={},
+        json_mode=True,
+        quiet=True,
+    )
+    if not simulator.setup():
+        return []
+
+    game = simulator.game
+    game.setup_keybinds()
+    game.on_start()
+    states = [game.to_dict()]
+    tick = 0
+    while game.game_active and len(states) < samples and tick < every_ticks * 200:
+        game.on_tick()
+        tick += 1
+        if tick % every_ticks == 0:
+            states.append(game.to_dict())
+    return states
+
+
+def cmd_snapshot_stats(args):
+    """Report snapshot size and encode/decode time per game type."""
+    import time
+
+    from server.persistence.snapshot import (
+        FORMAT_BINARY,
+        decode_snapshot,
+        encode_snapshot,
+    )
+
+    game_types = args.game_types or [g.get_type() for g in GameRegistry.get_all()]
+    report = []
+    for game_type in game_types:
+        if not get_game_class(game_type):
+            print(f"Error: Unknown game type '{game_type}'")
+            sys.exit(1)
+        states = _sample_game_states(game_type)
+        if not states:
+            continue
+
+        json_bytes = snapshot_bytes = 0
+        encode_s = decode_s = 0.0
+        for state in states:
+            json_bytes += len(json.dumps(state).encode("utf-8"))
+            started = time.perf_counter()
+            snapshot = encode_snapshot(state, FORMAT_BINARY)
+            encoded = time.perf_counter()
+            decode_snapshot(snapshot)
+            decode_s += time.perf_counter() - encoded
+            encode_s += encoded - started
+            snapshot_bytes += len(snapshot)
+
+        n = len(states)
+        report.append(
+            {
+                "game_type": game_type,
+                "samples": n,
+                "json_bytes": json_bytes // n,
+                "snapshot_bytes": snapshot_bytes // n,
+                "ratio": json_bytes / snapshot_bytes,
+                "encode_ms": encode_s * 1000 / n,
+                "decode_ms": decode_s * 1000 / n,
+            }
+        )
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(
+        f"{'game':<16}{'json':>10}{'snapshot':>10}{'ratio':>8}"
+        f"{'encode ms':>11}{'decode ms':>11}"
+    )
+    for row in report:
+        print(
+            f"{row['game_type']:<16}{row['json_bytes']:>10}"
+            f"{row['snapshot_bytes']:>10}{row['ratio']:>7.1f}x"
+            f"{row['encode_ms']:>11.2f}{row['decode_ms']:>11.2f}"
+        )
+
+
+def cmd_snapshot_train(args):
+    """Train a snapshot compression dictionary on every game type."""
+    from server.persistence.snapshot import DICTIONARY_SIZE, train_dictionary
+
+    samples = []
+    for game_class in GameRegistry.get_all():
+        for state in _sample_game_states(game_class.get_type()):
+            samples.append(json.dumps(state, separators=(",", ":")))
+
+    dictionary = train_dictionary(samples, size=args.size or DICTIONARY_SIZE)
+    Path(args.output).write_bytes(dictionary)
+    print(
+        f"Wrote {len(dictionary)} byte dictionary from {len(samples)} samples "
+        f"to {args.output}"
+    )
+
+
+def cmd_snapshot(args):
+    """Dispatch game snapshot subcommands."""
+    if args.snapshot_command == "stats":
+        cmd_snapshot_stats(args)
+    elif args.snapshot_command == "train":
+        cmd_snapshot_train(args)
+
+
+def cmd_journal_replay(args):
+    """Reconstruct a stored table's game from its snapshot and journal."""
+    import time
+
+    from server.persistence.database import Database
+    from server.persistence.snapshot import load_game
+    from server.tables.journal import replay_journal
+
+    db = Database(args.db)
+    db.connect()
+    try:
+        table = db.load_table(args.table_id)
+        entries = db.load_journal(args.table_id) or []
+    finally:
+        db.close()
+    if not table or not table.game_json:
+        print(f"Error: No stored game for table '{args.table_id}'")
+        sys.exit(1)
+    game_class = get_game_class(table.game_type)
+    if not game_class:
+        print(f"Error: Unknown game type '{table.game_type}'")
+        sys.exit(1)
+
+    game = load_game(game_class, table.game_json)
+    game.rebuild_runtime_state()
+    game.setup_keybinds()
+    for player in game.players:
+        if player.is_bot:
+            game.attach_user(player.id, Bot(player.name, uuid=player.id))
+
+    started = time.perf_counter()
+    ticks = replay_journal(game, entries, until_tick=args.tick)
+    elapsed = time.perf_counter() - started
+
+    result = {
+        "table_id": args.table_id,
+        "game_type": table.game_type,
+        "entries": len(entries),
+        "ticks": ticks,
+        "replay_ms": elapsed * 1000,
+        "ticks_per_second": ticks / elapsed if elapsed > 0 else None,
+        "game_active": game.game_active,
+    }
+    if args.state:
+        result["state"] = game.to_dict()
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    print(
+        f"Replayed {len(entries)} journal entries and {ticks} ticks of "
+        f"{table.game_type} table {args.table_id} in {elapsed * 1000:.1f}ms"
+    )
+    if result["ticks_per_second"]:
+        print(f"{result['ticks_per_second']:.0f} ticks/s")
+
+
+def _distribution(values: list[int]) -> dict[str, float]:
+    """Summarize values as min, percentiles, max and mean."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def percentile(p: int) -> int:
+        return ordered[min(len(ordered) - 1, len(ordered) * p // 100)]
+
+    return {
+        "min": ordered[0],
+        "p10": percentile(10),
+        "p50": percentile(50),
+        "p90": percentile(90),
+        "max": ordered[-1],
+        "mean": sum(ordered) / len(ordered),
+    }
+
+
+def _bench_summary(
+    game_type: str, num_bots: int, results: list[dict], elapsed: float
+) -> dict[str, Any]:
+    """Aggregate one game type's simulation results."""
+    ticks = [r["ticks"] for r in results]
+    wins = [0] * num_bots
+    for result in results:
+        for seat in result["winners"]:
+            wins[seat] += 1
+    rss = [r["peak_rss_kb"] for r in results if r["peak_rss_kb"] is not None]
+    scored = [r["scores"] for r in results if r["scores"] is not None]
+    decisions = sum(r["bot_decisions"] for r in results)
+    think_seconds = sum(r["bot_think_seconds"] for r in results)
+    return {
+        "game_type": game_type,
+        "bots": num_bots,
+        "games": len(results),
+        "timed_out": sum(r["timed_out"] for r in results),
+        "no_winner": sum(not r["winners"] for r in results),
+        "ticks": _distribution(ticks),
+        "rounds": _distribution([r["rounds"] for r in results]),
+        "seat_win_rates": [w / len(results) for w in wins],
+        # Only for games that report final scores
+        "seat_scores": [
+            _distribution([scores[seat] for scores in scored])
+            for seat in range(num_bots)
+        ]
+        if scored
+        else None,
+        "bot_decisions": decisions,
+        # Timing and memory vary between runs; the rest is seeded
+        "throughput": {
+            "seconds": elapsed,
+            "games_per_second": len(results) / elapsed,
+            "ticks_per_second": sum(ticks) / elapsed,
+            "decision_us": think_seconds * 1e6 / decisions if decisions else None,
+            "peak_rss_kb": max(rss) if rss else None,
+        },
+    }
+
+
+def _bench_bots(game_class: type[Game], requested: int | None) -> int:
+    """Bots per benchmark game: as requested, within the game's limits."""
+    num_bots = requested or max(2, game_class.get_min_players())
+    return max(
+        game_class.get_min_players(), min(num_bots, game_class.get_max_players())
+    )
+
+
+def _bench_submit(service, requests: list) -> list:
+    """Queue benchmark simulations, exiting if the service refuses them."""
+    futures = service.submit_many(requests)
+    if futures is None:
+        print(f"Error: Cannot queue {len(requests)} simulations")
+        sys.exit(1)
+    return futures
+
+
+def cmd_bench(args):
+    """Simulate many games of each type in parallel and report throughput."""
+    import os
+    import time
+
+    from server.game_utils.simulation import (
+        SimulationRequest,
+        SimulationService,
+        peak_rss_kb,
+        run_simulation,
+    )
+
+    if not args.game_types or "all" in args.game_types:
+        game_types = [g.get_type() for g in GameRegistry.get_all()]
+    else:
+        game_types = args.game_types
+    for game_type in game_types:
+        if not get_game_class(game_type):
+            print(f"Error: Unknown game type '{game_type}'")
+            sys.exit(1)
+    jobs = args.jobs or os.cpu_count() or 1
+    options = {}
+    for opt in args.option or []:
+        if "=" in opt:
+            key, value = opt.split("=", 1)
+            options[key.strip()] = value.strip()
+
+    # Start the workers (or load everything here) before timing anything
+    warmup = SimulationRequest(
+        game_types[0], _bench_bots(get_game_class(game_types[0]), None), max_ticks=1
+    )
+    service = None
+    if jobs > 1:
+        # Room for a whole batch (or the warmup) plus the done callbacks of
+        # the previous one, which can run just after its results are read
+        service = SimulationService(
+            max_workers=jobs, max_pending=max(jobs, args.games) + jobs
+        )
+        for future in _bench_submit(service, [warmup] * jobs):
+            future.result()
+    else:
+        run_simulation(warmup)
+
+    report = []
+    try:
+        for game_type in game_types:
+            num_bots = _bench_bots(get_game_class(game_type), args.bots)
+            requests = [
+                SimulationRequest(
+                    game_type=game_type,
+                    num_bots=num_bots,
+                    options=options,
+                    max_ticks=args.max_ticks,
+                    seed=args.seed + i,
+                    headless=not args.presentation,
+                    time_bots=True,
+                )
+                for i in range(args.games)
+            ]
+            started = time.perf_counter()
+            if service:
+                results = [f.result() for f in _bench_submit(service, requests)]
+            else:
+                results = [run_simulation(request) for request in requests]
+            elapsed = time.perf_counter() - started
+            report.append(_bench_summary(game_type, num_bots, results, elapsed))
+            if not args.json:
+                _print_bench_row(report[-1])
+    finally:
+        if service:
+            service.shutdown()
+
+    if args.json:
+        output = {
+            "settings": {
+                "games": args.games,
+                "seed": args.seed,
+                "jobs": jobs,
+                "max_ticks": args.max_ticks,
+                "presentation": args.presentation,
+                "options": options,
+            },
+            "peak_rss_kb": peak_rss_kb(),
+            "results": report,
+        }
+        print(json.dumps(output, indent=2))
+
+
+def _print_bench_row(row: dict[str, Any]) -> None:
+    """Print one game type's benchmark summary."""
+    throughput = row["throughput"]
+    rss = throughput["peak_rss_kb"]
+    win_rates = " ".join(f"{rate:.0%}" for rate in row["seat_win_rates"])
+    decision_us = throughput["decision_us"]
+    scores = row["seat_scores"]
+    print(
+        f"{row['game_type']:<16}{row['bots']} bots  "
+        f"{throughput['games_per_second']:8.1f} games/s "
+        f"{throughput['ticks_per_second']:10.0f} ticks/s  "
+        f"ticks p50 {row['ticks']['p50']:<7} rounds p50 {row['rounds']['p50']:<4}"
+        f"  seat wins {win_rates}"
+        + (
+            "  mean scores " + " ".join(f"{s['mean']:.1f}" for s in scores)
+            if scores
+            else ""
+        )
+        + (f"  {decision_us:.0f}us/decision" if decision_us else "")
+        + (f"  rss {rss // 1024}MB" if rss else "")
+        + (f"  {row['timed_out']} timed out" if row["timed_out"] else "")
+    )
+
+
+def cmd_journal(args):
+    """Dispatch table journal subcommands."""
+    if args.journal_command == "replay":
+        cmd_journal_replay(args)
+
+
+def cmd_policy_farkle(args):
+    """Generate the Farkle bot's expected-value policy tables."""
+    import time
+
+    from server.games.farkle.policy import (
+        POLICY_PATH,
+        FarklePolicy,
+        build_tables,
+        encode_policy,
+    )
+
+    started = time.perf_counter()
+    data = encode_policy(*build_tables())
+    elapsed = time.perf_counter() - started
+    output = Path(args.output) if args.output else POLICY_PATH
+    output.write_bytes(data)
+
+    policy = FarklePolicy(data)
+    print(
+        f"Wrote {len(data)} byte Farkle policy to {output} in {elapsed:.2f}s "
+        f"({policy.roll_value(0, 6):.1f} expected points per turn)"
+    )
+
+
+def cmd_policy_yahtzee(args):
+    """Generate the Yahtzee bot's optimal solitaire position values."""
+    import time
+
+    from server.games.yahtzee.policy import (
+        POLICY_PATH,
+        YahtzeePolicy,
+        build_values,
+        encode_policy,
+    )
+
+    def report(done: int, total: int) -> None:
+        if done % 256 == 0 or done == total:
+            elapsed = time.perf_counter() - started
+            print(f"  {done}/{total} scoresheets, {elapsed:.0f}s", flush=True)
+
+    started = time.perf_counter()
+    data = encode_policy(build_values(progress=report))
+    elapsed = time.perf_counter() - started
+    output = Path(args.output) if args.output else POLICY_PATH
+    output.write_bytes(data)
+
+    policy = YahtzeePolicy(data)
+    print(
+        f"Wrote {len(data)} byte Yahtzee policy to {output} in {elapsed:.0f}s "
+        f"({policy.value(0, 0, False):.2f} expected points per game)"
+    )
+
+
+def cmd_policy(args):
+    """Dispatch bot policy table subcommands."""
+    if args.policy_command == "farkle":
+        cmd_policy_farkle(args)
+    elif args.policy_command == "yahtzee":
+        cmd_policy_yahtzee(args)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="PlayPalace CLI for AI agents",
@@ -521,6 +1127,21 @@ def main():
         default=10000000,
         help="Maximum ticks before timeout (default: 10000000)",
     )
+    sim_parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed the game's random generator for a reproducible run",
+    )
+    sim_parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Skip messages, menus and sounds (faster; no game output)",
+    )
+    sim_parser.add_argument(
+        "--no-fast-forward",
+        action="store_true",
+        help="Run every tick instead of skipping ticks where only timers count down",
+    )
     sim_parser.add_argument(
         "--test-serialization",
         "-s",
@@ -528,6 +1149,158 @@ def main():
         help="Save and restore game state after each tick to test serialization",
     )
 
+    # bench command
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Simulate many games in parallel and report throughput and outcomes",
+    )
+    bench_parser.add_argument(
+        "game_types",
+        nargs="*",
+        help="Game types to simulate, or 'all' (default: all)",
+    )
+    bench_parser.add_argument(
+        "--games", type=int, default=100, help="Games per game type (default: 100)"
+    )
+    bench_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Worker processes (default: one per CPU; 1 runs in this process)",
+    )
+    bench_parser.add_argument(
+        "--seed",
+        type=int,
+        default=1,
+        help="Seed of the first game; game i uses seed + i (default: 1)",
+    )
+    bench_parser.add_argument(
+        "--bots",
+        type=int,
+        help="Bots per game (default: the game's minimum, at least 2)",
+    )
+    bench_parser.add_argument(
+        "--max-ticks",
+        type=int,
+        default=1_000_000,
+        help="Ticks before a game counts as timed out (default: 1000000)",
+    )
+    bench_parser.add_argument(
+        "--presentation",
+        action="store_true",
+        help="Render messages, menus and sounds as for real players",
+    )
+    bench_parser.add_argument(
+        "--option",
+        "-o",
+        action="append",
+        help="Game option as key=value, for every game (can be repeated)",
+    )
+    bench_parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+    # ratings command
+    ratings_parser = subparsers.add_parser(
+        "ratings", help="Maintain player skill ratings"
+    )
+    ratings_subparsers = ratings_parser.add_subparsers(
+        dest="ratings_command", required=True
+    )
+    rebuild_parser = ratings_subparsers.add_parser(
+        "rebuild",
+        help="Recompute player_ratings from the full game history "
+        "(run while the server is stopped)",
+    )
+    rebuild_parser.add_argument(
+        "--db",
+        default="playpalace.db",
+        help="Path to the server database (default: playpalace.db)",
+    )
+    rebuild_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=5000,
+        help="Games replayed between checkpoints (default: 5000)",
+    )
+    rebuild_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted rebuild from its last checkpoint",
+    )
+    rebuild_parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+    # snapshot command
+    snapshot_parser = subparsers.add_parser(
+        "snapshot", help="Inspect and tune the stored game snapshot format"
+    )
+    snapshot_subparsers = snapshot_parser.add_subparsers(
+        dest="snapshot_command", required=True
+    )
+    stats_parser = snapshot_subparsers.add_parser(
+        "stats", help="Report snapshot size and encode/decode time per game type"
+    )
+    stats_parser.add_argument(
+        "game_types", nargs="*", help="Game types to measure (default: all)"
+    )
+    stats_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    train_parser = snapshot_subparsers.add_parser(
+        "train", help="Train a compression dictionary from simulated games"
+    )
+    train_parser.add_argument(
+        "--output",
+        required=True,
+        help="Dictionary file to write (e.g. persistence/snapshot_dicts/2.zdict)",
+    )
+    train_parser.add_argument(
+        "--size", type=int, help="Dictionary size in bytes (default: 32768)"
+    )
+
+    # journal command
+    journal_parser = subparsers.add_parser(
+        "journal", help="Work with stored table journals"
+    )
+    journal_subparsers = journal_parser.add_subparsers(
+        dest="journal_command", required=True
+    )
+    replay_parser = journal_subparsers.add_parser(
+        "replay", help="Rebuild a table's game from its snapshot and journal"
+    )
+    replay_parser.add_argument("table_id", help="Table to replay")
+    replay_parser.add_argument(
+        "--db",
+        default="playpalace.db",
+        help="Path to the server database (default: playpalace.db)",
+    )
+    replay_parser.add_argument(
+        "--tick",
+        type=int,
+        help="Stop at this tick of the segment (default: last checkpoint)",
+    )
+    replay_parser.add_argument(
+        "--state", action="store_true", help="Include the game state in JSON output"
+    )
+    replay_parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+    # policy command
+    policy_parser = subparsers.add_parser(
+        "policy", help="Generate precomputed bot policy tables"
+    )
+    policy_subparsers = policy_parser.add_subparsers(
+        dest="policy_command", required=True
+    )
+    farkle_policy_parser = policy_subparsers.add_parser(
+        "farkle", help="Generate the Farkle bot's expected-value tables"
+    )
+    farkle_policy_parser.add_argument(
+        "--output", help="File to write (default: games/farkle/policy.bin)"
+    )
+    yahtzee_policy_parser = policy_subparsers.add_parser(
+        "yahtzee",
+        help="Generate the Yahtzee bot's optimal strategy values (takes minutes)",
+    )
+    yahtzee_policy_parser.add_argument(
+        "--output", help="File to write (default: games/yahtzee/policy.bin)"
+    )
+
     args = parser.parse_args()
 
     if args.command == "list-games":
@@ -536,6 +1309,16 @@ def main():
         cmd_show_options(args)
     elif args.command == "simulate":
         cmd_simulate(args)
+    elif args.command == "bench":
+        cmd_bench(args)
+    elif args.command == "ratings":
+        cmd_ratings(args)
+    elif args.command == "snapshot":
+        cmd_snapshot(args)
+    elif args.command == "journal":
+        cmd_journal(args)
+    elif args.command == "policy":
+        cmd_policy(args)
     else:
         parser.print_help()
         sys.exit(1)
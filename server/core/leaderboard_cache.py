@@ -0,0 +1,122 @@
+"""Response cache for leaderboard and stats menus."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class _CacheEntry:
+    """A cached value and the player it belongs to (None for shared boards)."""
+
+    value: Any
+    player_id: str | None = None
+
+
+class LeaderboardCache:
+    """
+    LRU cache for rendered leaderboards and stats menus.
+
+    Entries are keyed by (game_type, board_id, locale). Shared boards (wins,
+    rating, custom leaderboards) hold MenuItem lists that are reused by every
+    user of the same locale. Personal boards (my stats) are tagged with the
+    owning player.
+
+    Use locale=None for locale-independent values such as GameResult lists.
+    """
+
+    DEFAULT_MAX_ENTRIES = 512
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str, str | None], _CacheEntry] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, game_type: str, board_id: str, locale: str | None) -> Any | None:
+        """Get a cached value, or None on a miss."""
+        key = (game_type, board_id, locale)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def put(
+        self,
+        game_type: str,
+        board_id: str,
+        locale: str | None,
+        value: Any,
+        player_id: str | None = None,
+    ) -> None:
+        """
+        Store a value, evicting the least recently used entries if full.
+
+        Args:
+            game_type: Game type the value was computed for ("" for cross-game)
+            board_id: Leaderboard or menu identifier
+            locale: Locale the value was rendered in (None if locale-independent)
+            value: The value to cache (treated as immutable by callers)
+            player_id: Owning player for personal boards, None for shared boards
+        """
+        key = (game_type, board_id, locale)
+        self._entries[key] = _CacheEntry(value=value, player_id=player_id)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, game_type: str) -> int:
+        """
+        Drop entries affected by a new result for a game type.
+
+        Every entry of the game type is dropped, shared or personal: stats
+        are built from the latest results of the game type, so a new result
+        can push older games out of anyone's stats, not just its players'.
+        For the same reason personal cross-game entries (game type "", like
+        the "my stats" game list) are dropped for everyone.
+
+        Returns:
+            Number of entries removed.
+        """
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if key[0] == game_type or (key[0] == "" and entry.player_id is not None)
+        ]
+        for key in stale:
+            del self._entries[key]
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries (metrics are kept)."""
+        self._entries.clear()
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_stats(self) -> dict:
+        """Get cache metrics."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hit_ratio,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
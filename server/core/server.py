@@ -1,19 +1,27 @@
 """Main server class that ties everything together."""
 
 import asyncio
+import time
 from pathlib import Path
+from typing import Callable
 
 import json
 
 from .tick import TickScheduler
+from .checkpoint import TableCheckpointer
+from .leaderboard_cache import LeaderboardCache
 from ..network.websocket_server import WebSocketServer, ClientConnection
 from ..persistence.database import Database
+from ..persistence.snapshot import FORMAT_BINARY, load_game
 from ..auth.auth import AuthManager
 from ..tables.manager import TableManager
 from ..users.network_user import NetworkUser
 from ..users.base import MenuItem, EscapeBehavior
 from ..users.preferences import UserPreferences, DiceKeepingStyle
 from ..games.registry import GameRegistry, get_game_class
+from ..game_utils.estimates import EstimatePrefetcher
+from ..game_utils.stats_helpers import RatingCache
+from ..game_utils.simulation import SimulationService
 from ..messages.localization import Localization
 
 
@@ -31,6 +39,9 @@ class Server:
     Coordinates all components: network, auth, tables, games, and persistence.
     """
 
+    # How often queued rating updates are written to the database (5 seconds)
+    RATING_FLUSH_INTERVAL_TICKS = 100
+
     def __init__(
         self,
         host: str = "0.0.0.0",
@@ -39,6 +50,9 @@ class Server:
         locales_dir: str | Path | None = None,
         ssl_cert: str | Path | None = None,
         ssl_key: str | Path | None = None,
+        checkpoint_interval: float = TableCheckpointer.DEFAULT_INTERVAL_S,
+        snapshot_format: str = FORMAT_BINARY,
+        prefetch_estimates: bool = True,
     ):
         self.host = host
         self.port = port
@@ -46,12 +60,20 @@ class Server:
         self._ssl_key = ssl_key
 
         # Initialize components
-        self._db = Database(db_path)
+        self._db = Database(db_path, snapshot_format=snapshot_format)
         self._auth: AuthManager | None = None
         self._tables = TableManager()
         self._tables._server = self  # Enable callbacks from TableManager
         self._ws_server: WebSocketServer | None = None
         self._tick_scheduler: TickScheduler | None = None
+        self._checkpointer = TableCheckpointer(
+            self._tables, self._db, interval=checkpoint_interval
+        )
+        self._leaderboard_cache = LeaderboardCache()
+        self._estimate_prefetcher = (
+            EstimatePrefetcher(self._db) if prefetch_estimates else None
+        )
+        self._tick_count = 0
 
         # User tracking
         self._users: dict[str, NetworkUser] = {}  # username -> NetworkUser
@@ -73,6 +95,9 @@ class Server:
         # Load existing tables
         self._load_tables()
 
+        # Build the bots' lookup tables before the first tick
+        self._warm_up_games()
+
         # Start WebSocket server
         self._ws_server = WebSocketServer(
             host=self.host,
@@ -89,6 +114,9 @@ class Server:
         self._tick_scheduler = TickScheduler(self._on_tick)
         await self._tick_scheduler.start()
 
+        # Persist changed tables in the background
+        await self._checkpointer.start()
+
         protocol = "wss" if self._ssl_cert else "ws"
         print(f"Server running on {protocol}://{self.host}:{self.port}")
 
@@ -96,13 +124,20 @@ class Server:
         """Stop the server."""
         print("Stopping server...")
 
-        # Save all tables
+        # Stop background checkpoints, then save all tables
+        await self._checkpointer.stop()
         self._save_tables()
 
+        # Write any queued rating updates
+        RatingCache.for_db(self._db).flush()
+
         # Stop tick scheduler
         if self._tick_scheduler:
             await self._tick_scheduler.stop()
 
+        # Stop duration estimation workers
+        SimulationService.shutdown_shared()
+
         # Stop WebSocket server
         if self._ws_server:
             await self._ws_server.stop()
@@ -110,43 +145,45 @@ class Server:
         # Close database
         self._db.close()
 
+        stats = self._leaderboard_cache.get_stats()
+        print(
+            f"Leaderboard cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_ratio']:.0%} hit ratio), {stats['entries']} entries."
+        )
+        stats = self._checkpointer.get_stats()
+        print(
+            f"Checkpoints: {stats['checkpoints']} runs, "
+            f"{stats['tables_written']} table writes, "
+            f"max RPO {stats['max_rpo_seconds']:.1f}s."
+        )
+
         print("Server stopped.")
 
     def _load_tables(self) -> None:
-        """Load tables from database and restore their games."""
-        from ..users.bot import Bot
+        """
+        Load tables from the database.
 
-        tables = self._db.load_all_tables()
-        for table in tables:
+        Only table metadata is restored here. Each game is deserialized the
+        first time its table is touched (e.g. a member reconnects or joins),
+        and the rest are restored a few per tick by the table manager.
+        """
+        started = time.perf_counter()
+        count = 0
+        for table in self._db.iter_tables():
             self._tables.add_table(table)
+            table.defer_restore()
+            count += 1
 
-            # Restore game from JSON if present
-            if table.game_json:
-                game_class = get_game_class(table.game_type)
-                if not game_class:
-                    print(f"WARNING: Could not find game class for {table.game_type}")
-                    continue
-
-                # Deserialize game and rebuild runtime state
-                game = game_class.from_json(table.game_json)
-                game.rebuild_runtime_state()
-                table.game = game
-                game._table = table
-
-                # Setup keybinds (runtime only, not serialized)
-                game.setup_keybinds()
-                # Attach bots (humans will be attached when they reconnect)
-                # Action sets are already restored from serialization
-                for player in game.players:
-                    if player.is_bot:
-                        bot_user = Bot(player.name)
-                        game.attach_user(player.id, bot_user)
-
-        print(f"Loaded {len(tables)} tables from database.")
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"Loaded {count} tables from database in {elapsed_ms:.0f} ms.")
 
-        # Delete all tables from database after loading to prevent stale data
-        # on subsequent restarts. Tables will be re-saved on shutdown.
-        self._db.delete_all_tables()
+    def _warm_up_games(self) -> None:
+        """Let every game precompute what its bots use."""
+        started = time.perf_counter()
+        for game_class in GameRegistry.get_all():
+            game_class.warm_up()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"Warmed up bot tables in {elapsed_ms:.0f} ms.")
 
     def _save_tables(self) -> None:
         """Save all tables to database."""
@@ -162,6 +199,15 @@ class Server:
         # Flush queued messages for all users
         self._flush_user_messages()
 
+        # Periodically persist rating updates in one batch
+        self._tick_count += 1
+        if self._tick_count % self.RATING_FLUSH_INTERVAL_TICKS == 0:
+            RatingCache.for_db(self._db).flush()
+
+        # Pre-compute duration estimates while the simulation pool is idle
+        if self._estimate_prefetcher:
+            self._estimate_prefetcher.on_tick()
+
     def _flush_user_messages(self) -> None:
         """Send all queued messages for all users."""
         for username, user in self._users.items():
@@ -964,8 +1010,8 @@ class Server:
         # All players available - create table and restore game
         table = self._tables.create_table(record.game_type, user.username, user)
 
-        # Load game from JSON and rebuild runtime state
-        game = game_class.from_json(record.game_json)
+        # Load game from its snapshot and rebuild runtime state
+        game = load_game(game_class, record.game_json)
         game.rebuild_runtime_state()
         table.game = game
         game._table = table  # Enable game to call table.destroy()
@@ -1044,8 +1090,7 @@ class Server:
             return
 
         # Check if there's any data for this game
-        results = self._db.get_game_stats(game_type, limit=1)
-        if not results:
+        if not self._get_game_results(game_type):
             # No data - speak message and stay on game selection
             user.speak_l("leaderboard-no-data")
             return
@@ -1103,10 +1148,14 @@ class Server:
         }
 
     def _get_game_results(self, game_type: str) -> list:
-        """Get game results as GameResult objects."""
+        """Get game results as GameResult objects (cached until the next result)."""
         from ..game_utils.game_result import GameResult, PlayerResult
         import json
 
+        cached = self._leaderboard_cache.get(game_type, "results", None)
+        if cached is not None:
+            return cached
+
         results = self._db.get_game_stats(game_type, limit=100)
         game_results = []
 
@@ -1131,12 +1180,53 @@ class Server:
                 )
             )
 
+        self._leaderboard_cache.put(game_type, "results", None, game_results)
         return game_results
 
+    def _show_cached_leaderboard(
+        self,
+        user: NetworkUser,
+        game_type: str,
+        game_name: str,
+        board_id: str,
+        builder: Callable[[str, str], list[MenuItem]],
+    ) -> None:
+        """Show a leaderboard, rendering it only if not cached for the user's locale.
+
+        Args:
+            user: The user to show the leaderboard to
+            game_type: The game type the leaderboard is for
+            game_name: Localized game name (kept in menu state for navigation)
+            board_id: Leaderboard identifier used as part of the cache key
+            builder: Called as builder(game_type, locale) to render the items
+        """
+        items = self._leaderboard_cache.get(game_type, board_id, user.locale)
+        if items is None:
+            items = builder(game_type, user.locale)
+            self._leaderboard_cache.put(game_type, board_id, user.locale, items)
+
+        user.show_menu(
+            "game_leaderboard",
+            items,
+            multiletter=True,
+            escape_behavior=EscapeBehavior.SELECT_LAST,
+        )
+        self._user_states[user.username] = {
+            "menu": "game_leaderboard",
+            "game_type": game_type,
+            "game_name": game_name,
+        }
+
     def _show_wins_leaderboard(
         self, user: NetworkUser, game_type: str, game_name: str
     ) -> None:
         """Show win leaders leaderboard."""
+        self._show_cached_leaderboard(
+            user, game_type, game_name, "wins", self._build_wins_leaderboard
+        )
+
+    def _build_wins_leaderboard(self, game_type: str, locale: str) -> list[MenuItem]:
+        """Build win leaders leaderboard items."""
         from ..game_utils.stats_helpers import LeaderboardHelper
 
         game_results = self._get_game_results(game_type)
@@ -1174,7 +1264,7 @@ class Server:
             items.append(
                 MenuItem(
                     text=Localization.get(
-                        user.locale,
+                        locale,
                         "leaderboard-wins-entry",
                         rank=rank,
                         player=stats["name"],
@@ -1186,24 +1276,19 @@ class Server:
                 )
             )
 
-        items.append(MenuItem(text=Localization.get(user.locale, "back"), id="back"))
-
-        user.show_menu(
-            "game_leaderboard",
-            items,
-            multiletter=True,
-            escape_behavior=EscapeBehavior.SELECT_LAST,
-        )
-        self._user_states[user.username] = {
-            "menu": "game_leaderboard",
-            "game_type": game_type,
-            "game_name": game_name,
-        }
+        items.append(MenuItem(text=Localization.get(locale, "back"), id="back"))
+        return items
 
     def _show_rating_leaderboard(
         self, user: NetworkUser, game_type: str, game_name: str
     ) -> None:
         """Show skill rating leaderboard."""
+        self._show_cached_leaderboard(
+            user, game_type, game_name, "rating", self._build_rating_leaderboard
+        )
+
+    def _build_rating_leaderboard(self, game_type: str, locale: str) -> list[MenuItem]:
+        """Build skill rating leaderboard items."""
         from ..game_utils.stats_helpers import RatingHelper
 
         rating_helper = RatingHelper(self._db, game_type)
@@ -1214,7 +1299,7 @@ class Server:
         if not ratings:
             items.append(
                 MenuItem(
-                    text=Localization.get(user.locale, "leaderboard-no-ratings"),
+                    text=Localization.get(locale, "leaderboard-no-ratings"),
                     id="no_data",
                 )
             )
@@ -1236,7 +1321,7 @@ class Server:
                 items.append(
                     MenuItem(
                         text=Localization.get(
-                            user.locale,
+                            locale,
                             "leaderboard-rating-entry",
                             rank=rank,
                             player=player_name,
@@ -1248,24 +1333,19 @@ class Server:
                     )
                 )
 
-        items.append(MenuItem(text=Localization.get(user.locale, "back"), id="back"))
-
-        user.show_menu(
-            "game_leaderboard",
-            items,
-            multiletter=True,
-            escape_behavior=EscapeBehavior.SELECT_LAST,
-        )
-        self._user_states[user.username] = {
-            "menu": "game_leaderboard",
-            "game_type": game_type,
-            "game_name": game_name,
-        }
+        items.append(MenuItem(text=Localization.get(locale, "back"), id="back"))
+        return items
 
     def _show_total_score_leaderboard(
         self, user: NetworkUser, game_type: str, game_name: str
     ) -> None:
         """Show total score leaderboard."""
+        self._show_cached_leaderboard(
+            user, game_type, game_name, "total_score", self._build_total_score_leaderboard
+        )
+
+    def _build_total_score_leaderboard(self, game_type: str, locale: str) -> list[MenuItem]:
+        """Build total score leaderboard items."""
         from ..game_utils.stats_helpers import LeaderboardHelper
 
         game_results = self._get_game_results(game_type)
@@ -1295,7 +1375,7 @@ class Server:
             items.append(
                 MenuItem(
                     text=Localization.get(
-                        user.locale,
+                        locale,
                         "leaderboard-score-entry",
                         rank=rank,
                         player=stats["name"],
@@ -1305,24 +1385,19 @@ class Server:
                 )
             )
 
-        items.append(MenuItem(text=Localization.get(user.locale, "back"), id="back"))
-
-        user.show_menu(
-            "game_leaderboard",
-            items,
-            multiletter=True,
-            escape_behavior=EscapeBehavior.SELECT_LAST,
-        )
-        self._user_states[user.username] = {
-            "menu": "game_leaderboard",
-            "game_type": game_type,
-            "game_name": game_name,
-        }
+        items.append(MenuItem(text=Localization.get(locale, "back"), id="back"))
+        return items
 
     def _show_high_score_leaderboard(
         self, user: NetworkUser, game_type: str, game_name: str
     ) -> None:
         """Show high score leaderboard."""
+        self._show_cached_leaderboard(
+            user, game_type, game_name, "high_score", self._build_high_score_leaderboard
+        )
+
+    def _build_high_score_leaderboard(self, game_type: str, locale: str) -> list[MenuItem]:
+        """Build high score leaderboard items."""
         game_results = self._get_game_results(game_type)
 
         # Build high scores per player
@@ -1349,7 +1424,7 @@ class Server:
             items.append(
                 MenuItem(
                     text=Localization.get(
-                        user.locale,
+                        locale,
                         "leaderboard-score-entry",
                         rank=rank,
                         player=stats["name"],
@@ -1359,24 +1434,19 @@ class Server:
                 )
             )
 
-        items.append(MenuItem(text=Localization.get(user.locale, "back"), id="back"))
-
-        user.show_menu(
-            "game_leaderboard",
-            items,
-            multiletter=True,
-            escape_behavior=EscapeBehavior.SELECT_LAST,
-        )
-        self._user_states[user.username] = {
-            "menu": "game_leaderboard",
-            "game_type": game_type,
-            "game_name": game_name,
-        }
+        items.append(MenuItem(text=Localization.get(locale, "back"), id="back"))
+        return items
 
     def _show_games_played_leaderboard(
         self, user: NetworkUser, game_type: str, game_name: str
     ) -> None:
         """Show games played leaderboard."""
+        self._show_cached_leaderboard(
+            user, game_type, game_name, "games_played", self._build_games_played_leaderboard
+        )
+
+    def _build_games_played_leaderboard(self, game_type: str, locale: str) -> list[MenuItem]:
+        """Build games played leaderboard items."""
         game_results = self._get_game_results(game_type)
 
         # Count games per player
@@ -1400,7 +1470,7 @@ class Server:
             items.append(
                 MenuItem(
                     text=Localization.get(
-                        user.locale,
+                        locale,
                         "leaderboard-games-entry",
                         rank=rank,
                         player=stats["name"],
@@ -1410,19 +1480,8 @@ class Server:
                 )
             )
 
-        items.append(MenuItem(text=Localization.get(user.locale, "back"), id="back"))
-
-        user.show_menu(
-            "game_leaderboard",
-            items,
-            multiletter=True,
-            escape_behavior=EscapeBehavior.SELECT_LAST,
-        )
-        self._user_states[user.username] = {
-            "menu": "game_leaderboard",
-            "game_type": game_type,
-            "game_name": game_name,
-        }
+        items.append(MenuItem(text=Localization.get(locale, "back"), id="back"))
+        return items
 
     def _extract_value_from_path(
         self, data: dict, path: str, player_id: str, player_name: str
@@ -1457,6 +1516,18 @@ class Server:
         config: dict,
     ) -> None:
         """Show a custom leaderboard using declarative config."""
+        self._show_cached_leaderboard(
+            user,
+            game_type,
+            game_name,
+            f"custom_{config['id']}",
+            lambda gt, locale: self._build_custom_leaderboard(gt, locale, config),
+        )
+
+    def _build_custom_leaderboard(
+        self, game_type: str, locale: str, config: dict
+    ) -> list[MenuItem]:
+        """Build custom leaderboard items using declarative config."""
         game_results = self._get_game_results(game_type)
 
         lb_id = config["id"]
@@ -1539,7 +1610,7 @@ class Server:
             items.append(
                 MenuItem(
                     text=Localization.get(
-                        user.locale,
+                        locale,
                         entry_key,
                         rank=rank,
                         player=name,
@@ -1549,19 +1620,8 @@ class Server:
                 )
             )
 
-        items.append(MenuItem(text=Localization.get(user.locale, "back"), id="back"))
-
-        user.show_menu(
-            "game_leaderboard",
-            items,
-            multiletter=True,
-            escape_behavior=EscapeBehavior.SELECT_LAST,
-        )
-        self._user_states[user.username] = {
-            "menu": "game_leaderboard",
-            "game_type": game_type,
-            "game_name": game_name,
-        }
+        items.append(MenuItem(text=Localization.get(locale, "back"), id="back"))
+        return items
 
     async def _handle_leaderboards_selection(
         self, user: NetworkUser, selection_id: str, state: dict
@@ -1621,32 +1681,42 @@ class Server:
 
     def _show_my_stats_menu(self, user: NetworkUser) -> None:
         """Show game selection menu for personal stats (only games user has played)."""
-        categories = GameRegistry.get_by_category()
-        items = []
-
-        # Add only games where the user has stats
-        for category_key in sorted(categories.keys()):
-            for game_class in categories[category_key]:
-                game_type = game_class.get_type()
-                # Check if user has played this game
-                game_results = self._get_game_results(game_type)
-                has_stats = any(
-                    p.player_id == user.uuid
-                    for result in game_results
-                    for p in result.player_results
-                )
-                if has_stats:
-                    game_name = Localization.get(user.locale, game_class.get_name_key())
-                    items.append(
-                        MenuItem(text=game_name, id=f"stats_{game_type}")
+        cache_key = f"my_stats_menu:{user.uuid}"
+        items = self._leaderboard_cache.get("", cache_key, user.locale)
+        if items is None:
+            categories = GameRegistry.get_by_category()
+            items = []
+
+            # Add only games where the user has stats
+            for category_key in sorted(categories.keys()):
+                for game_class in categories[category_key]:
+                    game_type = game_class.get_type()
+                    # Check if user has played this game
+                    game_results = self._get_game_results(game_type)
+                    has_stats = any(
+                        p.player_id == user.uuid
+                        for result in game_results
+                        for p in result.player_results
                     )
+                    if has_stats:
+                        game_name = Localization.get(
+                            user.locale, game_class.get_name_key()
+                        )
+                        items.append(
+                            MenuItem(text=game_name, id=f"stats_{game_type}")
+                        )
 
-        if not items:
-            user.speak_l("my-stats-no-games")
-            self._show_main_menu(user)
-            return
+            if not items:
+                user.speak_l("my-stats-no-games")
+                self._show_main_menu(user)
+                return
 
-        items.append(MenuItem(text=Localization.get(user.locale, "back"), id="back"))
+            items.append(
+                MenuItem(text=Localization.get(user.locale, "back"), id="back")
+            )
+            self._leaderboard_cache.put(
+                "", cache_key, user.locale, items, player_id=user.uuid
+            )
 
         user.show_menu(
             "my_stats_menu",
@@ -1658,14 +1728,72 @@ class Server:
 
     def _show_my_game_stats(self, user: NetworkUser, game_type: str) -> None:
         """Show personal stats for a specific game."""
-        from ..game_utils.stats_helpers import RatingHelper
-
         game_class = get_game_class(game_type)
         if not game_class:
             user.speak_l("game-type-not-found")
             return
 
         game_name = Localization.get(user.locale, game_class.get_name_key())
+
+        cache_key = f"my_stats:{user.uuid}"
+        items = self._leaderboard_cache.get(game_type, cache_key, user.locale)
+        if items is None:
+            items = self._build_my_game_stats(user, game_class)
+            if items is None:
+                user.speak_l("my-stats-no-data")
+                return
+            self._leaderboard_cache.put(
+                game_type, cache_key, user.locale, items, player_id=user.uuid
+            )
+
+        # Rank moves whenever anyone's rating changes, so it is never cached
+        rank_item = self._build_rating_rank_item(user, game_type)
+        if rank_item:
+            position = next(
+                (i + 1 for i, item in enumerate(items) if item.id == "rating"), None
+            )
+            if position is not None:
+                items = items[:position] + [rank_item] + items[position:]
+
+        user.show_menu(
+            "my_game_stats",
+            items,
+            multiletter=True,
+            escape_behavior=EscapeBehavior.SELECT_LAST,
+        )
+        self._user_states[user.username] = {
+            "menu": "my_game_stats",
+            "game_type": game_type,
+            "game_name": game_name,
+        }
+
+    def _build_rating_rank_item(
+        self, user: NetworkUser, game_type: str
+    ) -> MenuItem | None:
+        """Build the "rank N of M" item for a user's rating, if they are rated."""
+        from ..game_utils.stats_helpers import RatingHelper
+
+        rating_helper = RatingHelper(self._db, game_type)
+        rank = rating_helper.get_rank(user.uuid)
+        if rank is None:
+            return None
+        return MenuItem(
+            text=Localization.get(
+                user.locale,
+                "my-stats-rating-rank",
+                rank=rank,
+                total=rating_helper.get_rated_count(),
+            ),
+            id="rating_rank",
+        )
+
+    def _build_my_game_stats(
+        self, user: NetworkUser, game_class
+    ) -> list[MenuItem] | None:
+        """Build personal stats items for a game. Returns None if never played."""
+        from ..game_utils.stats_helpers import RatingHelper
+
+        game_type = game_class.get_type()
         game_results = self._get_game_results(game_type)
 
         # Calculate player's personal stats
@@ -1697,8 +1825,7 @@ class Server:
                         high_score = score
 
         if games_played == 0:
-            user.speak_l("my-stats-no-data")
-            return
+            return None
 
         items = []
         # Basic stats
@@ -1772,18 +1899,7 @@ class Server:
         self._add_custom_stats(user, game_class, game_results, items)
 
         items.append(MenuItem(text=Localization.get(user.locale, "back"), id="back"))
-
-        user.show_menu(
-            "my_game_stats",
-            items,
-            multiletter=True,
-            escape_behavior=EscapeBehavior.SELECT_LAST,
-        )
-        self._user_states[user.username] = {
-            "menu": "my_game_stats",
-            "game_type": game_type,
-            "game_name": game_name,
-        }
+        return items
 
     def _add_custom_stats(
         self,
@@ -1903,6 +2019,7 @@ class Server:
 
     def on_table_destroy(self, table) -> None:
         """Handle table destruction. Called by TableManager."""
+        self._db.delete_table(table.table_id)
         if not table.game:
             return
         # Return all human players to main menu
@@ -1931,6 +2048,9 @@ class Server:
             custom_data=result.custom_data,
         )
 
+        # Drop cached leaderboards and stats this result can change
+        self._leaderboard_cache.invalidate(result.game_type)
+
     def on_table_save(self, table, username: str) -> None:
         """Handle table save request. Called by TableManager."""
         import json
@@ -2054,6 +2174,9 @@ async def run_server(
     port: int = 8000,
     ssl_cert: str | Path | None = None,
     ssl_key: str | Path | None = None,
+    checkpoint_interval: float = TableCheckpointer.DEFAULT_INTERVAL_S,
+    snapshot_format: str = FORMAT_BINARY,
+    prefetch_estimates: bool = True,
 ) -> None:
     """Run the server.
 
@@ -2062,8 +2185,19 @@ async def run_server(
         port: Port number to listen on
         ssl_cert: Path to SSL certificate file (for WSS support)
         ssl_key: Path to SSL private key file (for WSS support)
+        checkpoint_interval: Seconds between background table checkpoints
+        snapshot_format: How game state is stored ("binary" or "json")
+        prefetch_estimates: Pre-compute duration estimates in the background
     """
-    server = Server(host=host, port=port, ssl_cert=ssl_cert, ssl_key=ssl_key)
+    server = Server(
+        host=host,
+        port=port,
+        ssl_cert=ssl_cert,
+        ssl_key=ssl_key,
+        checkpoint_interval=checkpoint_interval,
+        snapshot_format=snapshot_format,
+        prefetch_estimates=prefetch_estimates,
+    )
     await server.start()
 
     try:
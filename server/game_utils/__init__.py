@@ -1,10 +1,24 @@
 """Shared game utilities."""
 
 from .actions import Action, ActionSet, MenuInput, EditboxInput
-from .dice import DiceSet, roll_dice, roll_die
+from .dice import (
+    DiceSet,
+    KeepTurn,
+    outcome_chance,
+    roll_dice,
+    roll_die,
+    roll_outcomes,
+)
 from .dice_game_mixin import DiceGameMixin
 from .game_result import GameResult, PlayerResult
-from .stats_helpers import LeaderboardHelper, LeaderboardEntry, RatingHelper, PlayerRating
+from .rng import GameRandom
+from .stats_helpers import (
+    LeaderboardHelper,
+    LeaderboardEntry,
+    RatingHelper,
+    RatingCache,
+    PlayerRating,
+)
 
 __all__ = [
     "Action",
@@ -14,11 +28,16 @@ __all__ = [
     "DiceSet",
     "roll_dice",
     "roll_die",
+    "roll_outcomes",
+    "outcome_chance",
+    "KeepTurn",
     "DiceGameMixin",
     "GameResult",
     "PlayerResult",
+    "GameRandom",
     "LeaderboardHelper",
     "LeaderboardEntry",
     "RatingHelper",
+    "RatingCache",
     "PlayerRating",
 ]
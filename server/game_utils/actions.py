@@ -1,10 +1,11 @@
 """Action system for games - declarative callbacks for state management."""
 
 import copy
+import functools
 import inspect
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
 from mashumaro.mixins.json import DataClassJSONMixin
 
@@ -76,6 +77,95 @@ class Action(DataClassJSONMixin):
     input_request: MenuInput | EditboxInput | None = None
 
 
+class ActionTemplates:
+    """
+    Process-wide registry of shared Action instances.
+
+    Actions are pure data and are never modified after creation, so players
+    (and games of the same type) holding an identical action share one
+    instance. Handler names make templates effectively per game class; the
+    static label makes them per locale.
+    """
+
+    # Interning just stops sharing past this many distinct actions
+    MAX_TEMPLATES = 50_000
+
+    _by_key: dict[tuple, Action] = {}
+    _dicts: dict[int, dict[str, Any]] = {}  # id(template) -> to_dict() output
+
+    @staticmethod
+    def _key(data: dict[str, Any]) -> tuple:
+        """Identity of an action from its serialized form."""
+        request = data.get("input_request")
+        if request is not None:
+            request = tuple(sorted(request.items()))
+        return (
+            data["id"],
+            data["label"],
+            data["handler"],
+            data["is_enabled"],
+            data["is_hidden"],
+            data.get("get_label"),
+            request,
+        )
+
+    @staticmethod
+    def _action_key(action: Action) -> tuple:
+        """Same as _key, without serializing the action."""
+        request = action.input_request
+        if request is not None:
+            request = tuple(sorted(vars(request).items()))
+        return (
+            action.id,
+            action.label,
+            action.handler,
+            action.is_enabled,
+            action.is_hidden,
+            action.get_label,
+            request,
+        )
+
+    @classmethod
+    def _register(cls, key: tuple, action: Action, data: dict[str, Any]) -> Action:
+        if len(cls._by_key) >= cls.MAX_TEMPLATES:
+            cls.clear()
+        cls._by_key[key] = action
+        cls._dicts[id(action)] = data
+        return action
+
+    @classmethod
+    def intern(cls, action: Action) -> Action:
+        """Get the shared instance equal to an action."""
+        if id(action) in cls._dicts:
+            return action
+        key = cls._action_key(action)
+        template = cls._by_key.get(key)
+        if template is None:
+            template = cls._register(key, action, action.to_dict())
+        return template
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Action:
+        """Get the shared instance for a serialized action."""
+        key = cls._key(data)
+        action = cls._by_key.get(key)
+        if action is None:
+            action = cls._register(key, Action.from_dict(data), data)
+        return action
+
+    @classmethod
+    def to_dict(cls, action: Action) -> dict[str, Any]:
+        """Serialize an action, reusing the cached form of templates."""
+        data = cls._dicts.get(id(action))
+        return data if data is not None else action.to_dict()
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget all templates (existing instances stay valid)."""
+        cls._by_key.clear()
+        cls._dicts.clear()
+
+
 @dataclass
 class ResolvedAction:
     """
@@ -92,6 +182,16 @@ class ResolvedAction:
     visible: bool
 
 
+@functools.cache
+def _function_accepts_action_id(func: Callable) -> bool:
+    return "action_id" in inspect.signature(func).parameters
+
+
+def _accepts_action_id(method: Callable) -> bool:
+    """Check if a callback accepts an action_id kwarg (cached per function)."""
+    return _function_accepts_action_id(getattr(method, "__func__", method))
+
+
 @dataclass
 class ActionSet(DataClassJSONMixin):
     """
@@ -107,6 +207,7 @@ class ActionSet(DataClassJSONMixin):
 
     def add(self, action: Action) -> None:
         """Add an action to this set."""
+        action = ActionTemplates.intern(action)
         self._actions[action.id] = action
         if action.id not in self._order:
             self._order.append(action.id)
@@ -137,9 +238,7 @@ class ActionSet(DataClassJSONMixin):
         if action.is_enabled:
             method = getattr(game, action.is_enabled, None)
             if method:
-                # Check if method accepts action_id kwarg
-                sig = inspect.signature(method)
-                if 'action_id' in sig.parameters:
+                if _accepts_action_id(method):
                     disabled_reason = method(player, action_id=action.id)
                 else:
                     disabled_reason = method(player)
@@ -149,9 +248,7 @@ class ActionSet(DataClassJSONMixin):
         if action.is_hidden:
             method = getattr(game, action.is_hidden, None)
             if method:
-                # Check if method accepts action_id kwarg
-                sig = inspect.signature(method)
-                if 'action_id' in sig.parameters:
+                if _accepts_action_id(method):
                     visibility = method(player, action_id=action.id)
                 else:
                     visibility = method(player)
@@ -210,3 +307,101 @@ class ActionSet(DataClassJSONMixin):
     def copy(self) -> "ActionSet":
         """Deep copy for templates."""
         return copy.deepcopy(self)
+
+    def clone(self) -> "ActionSet":
+        """Copy the set's membership and order, sharing the (immutable) actions."""
+        return ActionSet(
+            name=self.name, _actions=dict(self._actions), _order=list(self._order)
+        )
+
+
+def template_action_set(
+    method: Callable[["Game", "Player"], ActionSet],
+) -> Callable[["Game", "Player"], ActionSet]:
+    """
+    Build an action set once per locale and hand out clones.
+
+    For create_*_action_set methods whose result depends only on the
+    player's locale. Overrides that call super() get their own clone, so
+    adding to it does not touch the template.
+    """
+    templates: dict[str, ActionSet] = {}
+
+    @functools.wraps(method)
+    def wrapper(game: "Game", player: "Player") -> ActionSet:
+        user = game.get_user(player)
+        locale = user.locale if user else "en"
+        template = templates.get(locale)
+        if template is None:
+            template = templates[locale] = method(game, player)
+        return template.clone()
+
+    return wrapper
+
+
+def serialize_action_sets(value: dict[str, list[ActionSet]]) -> dict[str, Any]:
+    """
+    Serialize players' action sets with each distinct action stored once.
+
+    Sets become the indices of their actions in a shared "templates" list;
+    the order is only written when it differs from insertion order.
+    """
+    templates: list[dict[str, Any]] = []
+    index: dict[int, int] = {}
+    players = {}
+    for player_id, action_sets in value.items():
+        entries = []
+        for action_set in action_sets:
+            refs = []
+            for action in action_set._actions.values():
+                ref = index.get(id(action))
+                if ref is None:
+                    ref = index[id(action)] = len(templates)
+                    templates.append(ActionTemplates.to_dict(action))
+                refs.append(ref)
+            entry: dict[str, Any] = {"name": action_set.name, "actions": refs}
+            if action_set._order != list(action_set._actions):
+                entry["order"] = list(action_set._order)
+            entries.append(entry)
+        players[player_id] = entries
+    return {"templates": templates, "players": players}
+
+
+def deserialize_action_sets(data: dict[str, Any]) -> dict[str, list[ActionSet]]:
+    """Inverse of serialize_action_sets; also reads the older per-player form."""
+    if not ("templates" in data and isinstance(data.get("players"), dict)):
+        # Older snapshots: {player_id: [full ActionSet dicts]}
+        return {
+            player_id: [
+                ActionSet(
+                    name=s["name"],
+                    _actions={
+                        aid: ActionTemplates.from_dict(a)
+                        for aid, a in s["_actions"].items()
+                    },
+                    _order=list(s["_order"]),
+                )
+                for s in action_sets
+            ]
+            for player_id, action_sets in data.items()
+        }
+
+    templates = [ActionTemplates.from_dict(t) for t in data["templates"]]
+    result = {}
+    for player_id, entries in data["players"].items():
+        action_sets = []
+        for entry in entries:
+            actions = {}
+            for ref in entry["actions"]:
+                action = templates[ref]
+                actions[action.id] = action
+            order = entry.get("order")
+            action_sets.append(
+                ActionSet(
+                    name=entry["name"],
+                    _actions=actions,
+                    _order=list(order) if order is not None else list(actions),
+                )
+            )
+        result[player_id] = action_sets
+    return result
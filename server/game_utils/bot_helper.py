@@ -6,7 +6,8 @@ This is a stateless helper that operates on serialized Player fields:
 - player.bot_target: Game-specific target value
 """
 
-from typing import TYPE_CHECKING
+import math
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     from ..games.base import Game, Player
@@ -29,6 +30,9 @@ class BotHelper:
 
         # When something happens that should make bots pause:
         BotHelper.jolt_bots(game, ticks=10)
+
+    Games using SearchBotMixin (game_utils.search) have their bots search
+    for a move on the ticks they spend thinking.
     """
 
     # Default think ticks when not specified
@@ -72,6 +76,29 @@ class BotHelper:
         """Get the game-specific target for a bot."""
         return player.bot_target
 
+    @staticmethod
+    def journaled_choice(
+        game: "Game", player: "Player", choose: Callable[[], str | None]
+    ) -> str | None:
+        """
+        Make a bot decision that depends on timing, reproducibly.
+
+        Bot decisions are not journaled since they follow from the game's
+        state; one that also depends on e.g. CPU time or a background thread
+        goes through here. Live, choose() decides and the result is recorded
+        in the table's journal; while a journal is replayed the recorded
+        result is returned instead.
+        """
+        replay = game._bot_replay
+        if replay is not None:
+            if replay and replay[0][0] == player.id:
+                return replay.popleft()[1]
+            return None
+        choice = choose()
+        if game._table is not None:
+            game._table.journal.record_bot_choice(player.id, choice)
+        return choice
+
     @staticmethod
     def on_tick(game: "Game", debug: bool = False) -> None:
         """
@@ -95,6 +122,8 @@ class BotHelper:
         # Count down thinking time
         if current.bot_think_ticks > 0:
             current.bot_think_ticks -= 1
+            if hasattr(game, "bot_search_tick"):
+                game.bot_search_tick(current)
             return
 
         # Execute pending action if we have one
@@ -109,3 +138,40 @@ class BotHelper:
             action_id = game.bot_think(current)
             if action_id:
                 current.bot_pending_action = action_id
+
+    @staticmethod
+    def idle_ticks(game: "Game", waiting: bool = False) -> float:
+        """
+        Ticks on which on_tick() would only count down thinking time.
+
+        Args:
+            game: The game instance.
+            waiting: The game knows bot_think() returns None (without side
+                effects) until something else happens, e.g. between rounds.
+
+        Returns:
+            The tick count, or math.inf if no bot is due to act.
+        """
+        if not game.game_active or game.status != "playing":
+            return math.inf
+        current = game.current_player
+        if not current or not current.is_bot:
+            return math.inf
+        if current.bot_pending_action:
+            return 0
+        if waiting:
+            return math.inf
+        if current.bot_think_ticks and hasattr(game, "bot_search_busy"):
+            # A search runs on thinking ticks, so they can't be skipped
+            if game.bot_search_busy(current):
+                return 0
+        return current.bot_think_ticks
+
+    @staticmethod
+    def skip_ticks(game: "Game", ticks: int) -> None:
+        """Count down thinking time as ticks on_tick() calls would."""
+        if not game.game_active or game.status != "playing":
+            return
+        current = game.current_player
+        if current and current.is_bot:
+            current.bot_think_ticks = max(0, current.bot_think_ticks - ticks)
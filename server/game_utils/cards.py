@@ -2,12 +2,18 @@
 Reusable card and deck utilities for card games.
 
 Provides Card, Deck, and DeckFactory classes that can be used by any card game.
+
+Games keep hundreds of cards in their state (deck, hands, piles), so cards
+are small interned objects that serialize as single ints, and decks are
+deques that serialize as int lists.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 import random
 
 from mashumaro.mixins.json import DataClassJSONMixin
+from mashumaro.types import SerializableType
 
 from ..messages.localization import Localization
 
@@ -28,14 +34,65 @@ RS_RANK_SKIP = 18
 RS_RANK_NINETY_NINE = 19
 
 
-@dataclass
-class Card(DataClassJSONMixin):
-    """A playing card."""
+# Packed card layout: id << CARD_ID_SHIFT | rank << CARD_RANK_SHIFT | suit
+CARD_RANK_SHIFT = 3
+CARD_ID_SHIFT = 8
+
+
+def pack_card(id: int, rank: int, suit: int) -> int:
+    """
+    Pack a card's fields into one int.
+
+    Raises:
+        ValueError: If a field doesn't fit its bits (rank 0-31, suit 0-7,
+            id 0 or more), which would make the card collide with another.
+    """
+    if not 0 <= rank < 1 << CARD_ID_SHIFT - CARD_RANK_SHIFT:
+        raise ValueError(f"Card rank {rank} is out of range")
+    if not 0 <= suit < 1 << CARD_RANK_SHIFT:
+        raise ValueError(f"Card suit {suit} is out of range")
+    if id < 0:
+        raise ValueError(f"Card id {id} is out of range")
+    return id << CARD_ID_SHIFT | rank << CARD_RANK_SHIFT | suit
+
+
+class Card(SerializableType):
+    """
+    A playing card.
+
+    Cards are immutable and interned: every Card with the same id, rank and
+    suit is the same object, so the decks built each round and games loaded
+    from saves share one small set of instances. A card serializes as the
+    int from pack_card(); cards saved as {"id", "rank", "suit"} objects by
+    older versions still load.
+    """
+
+    __slots__ = ("id", "rank", "suit")
 
     id: int  # Unique identifier
     rank: int  # Card rank (1-13 for standard, 1-10 for Italian, 14-19 for RS Games special)
     suit: int  # Suit number (0=none, 1=diamonds, 2=clubs, 3=hearts, 4=spades)
 
+    def __new__(cls, id: int, rank: int, suit: int) -> "Card":
+        packed = pack_card(id, rank, suit)
+        card = _INTERNED_CARDS.get(packed)
+        if card is None:
+            card = object.__new__(cls)
+            object.__setattr__(card, "id", id)
+            object.__setattr__(card, "rank", rank)
+            object.__setattr__(card, "suit", suit)
+            _INTERNED_CARDS[packed] = card
+        return card
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("cards are immutable")
+
+    def __reduce__(self):
+        return Card, (self.id, self.rank, self.suit)
+
+    def __repr__(self) -> str:
+        return f"Card(id={self.id}, rank={self.rank}, suit={self.suit})"
+
     def __hash__(self) -> int:
         return self.id
 
@@ -44,27 +101,69 @@ class Card(DataClassJSONMixin):
             return False
         return self.id == other.id
 
+    @property
+    def packed(self) -> int:
+        """The card as one int (see pack_card)."""
+        return pack_card(self.id, self.rank, self.suit)
+
+    @classmethod
+    def unpack(cls, packed: int) -> "Card":
+        """The card packed into an int by pack_card()."""
+        return cls(
+            packed >> CARD_ID_SHIFT,
+            packed >> CARD_RANK_SHIFT & (1 << CARD_ID_SHIFT - CARD_RANK_SHIFT) - 1,
+            packed & (1 << CARD_RANK_SHIFT) - 1,
+        )
+
+    def _serialize(self) -> int:
+        return self.packed
+
+    @classmethod
+    def _deserialize(cls, value: int | dict) -> "Card":
+        if isinstance(value, dict):
+            # Saved before cards were packed
+            return cls(value["id"], value["rank"], value["suit"])
+        return cls.unpack(value)
+
+
+# Every card created so far, by packed value
+_INTERNED_CARDS: dict[int, Card] = {}
+
 
 @dataclass
 class Deck(DataClassJSONMixin):
-    """A deck of cards with draw/shuffle operations."""
+    """
+    A deck of cards with draw/shuffle operations.
+
+    Cards are kept top first in a deque, so drawing from the top and adding
+    to either end take constant time. Serialized as a list of packed cards.
+    """
+
+    cards: deque[Card] = field(default_factory=deque)
 
-    cards: list[Card] = field(default_factory=list)
+    def __post_init__(self):
+        if not isinstance(self.cards, deque):
+            self.cards = deque(self.cards)
 
-    def shuffle(self) -> None:
-        """Shuffle the deck in place."""
-        random.shuffle(self.cards)
+    def shuffle(self, rng: random.Random | None = None) -> None:
+        """Shuffle the deck, using rng (e.g. the game's) if given."""
+        cards = list(self.cards)
+        (rng or random).shuffle(cards)
+        self.cards = deque(cards)
+
+    def replace(self, cards: list[Card]) -> None:
+        """Replace the deck's cards (top first)."""
+        self.cards = deque(cards)
 
     def draw(self, count: int = 1) -> list[Card]:
         """Draw cards from the top of the deck."""
-        drawn = self.cards[:count]
-        self.cards = self.cards[count:]
-        return drawn
+        draw_one = self.cards.popleft
+        return [draw_one() for _ in range(min(count, len(self.cards)))]
 
     def draw_one(self) -> Card | None:
         """Draw a single card from the top of the deck."""
         if self.cards:
-            return self.cards.pop(0)
+            return self.cards.popleft()
         return None
 
     def add(self, cards: list[Card]) -> None:
@@ -72,8 +171,8 @@ class Deck(DataClassJSONMixin):
         self.cards.extend(cards)
 
     def add_top(self, cards: list[Card]) -> None:
-        """Add cards to the top of the deck."""
-        self.cards = cards + self.cards
+        """Add cards to the top of the deck (the first one on top)."""
+        self.cards.extendleft(reversed(cards))
 
     def size(self) -> int:
         """Return the number of cards in the deck."""
@@ -81,12 +180,12 @@ class Deck(DataClassJSONMixin):
 
     def is_empty(self) -> bool:
         """Check if the deck is empty."""
-        return len(self.cards) == 0
+        return not self.cards
 
     def clear(self) -> list[Card]:
         """Remove and return all cards from the deck."""
-        cards = self.cards
-        self.cards = []
+        cards = list(self.cards)
+        self.cards.clear()
         return cards
 
 
@@ -94,12 +193,15 @@ class DeckFactory:
     """Factory for creating common deck types."""
 
     @staticmethod
-    def italian_deck(num_decks: int = 1) -> tuple[Deck, dict[int, Card]]:
+    def italian_deck(
+        num_decks: int = 1, rng: random.Random | None = None
+    ) -> tuple[Deck, dict[int, Card]]:
         """
         Create Italian 40-card deck (4 suits x 10 ranks).
 
         Args:
             num_decks: Number of decks to combine.
+            rng: Random generator to shuffle with (e.g. the game's).
 
         Returns:
             Tuple of (shuffled deck, card lookup dict mapping id -> Card)
@@ -115,16 +217,19 @@ class DeckFactory:
                     card_lookup[card_id] = card
                     card_id += 1
         deck = Deck(cards=cards)
-        deck.shuffle()
+        deck.shuffle(rng)
         return deck, card_lookup
 
     @staticmethod
-    def standard_deck(num_decks: int = 1) -> tuple[Deck, dict[int, Card]]:
+    def standard_deck(
+        num_decks: int = 1, rng: random.Random | None = None
+    ) -> tuple[Deck, dict[int, Card]]:
         """
         Create standard 52-card deck (4 suits x 13 ranks).
 
         Args:
             num_decks: Number of decks to combine.
+            rng: Random generator to shuffle with (e.g. the game's).
 
         Returns:
             Tuple of (shuffled deck, card lookup dict mapping id -> Card)
@@ -140,11 +245,13 @@ class DeckFactory:
                     card_lookup[card_id] = card
                     card_id += 1
         deck = Deck(cards=cards)
-        deck.shuffle()
+        deck.shuffle(rng)
         return deck, card_lookup
 
     @staticmethod
-    def rs_games_deck() -> tuple[Deck, dict[int, Card]]:
+    def rs_games_deck(
+        rng: random.Random | None = None,
+    ) -> tuple[Deck, dict[int, Card]]:
         """
         Create RS Games 60-card deck for Ninety-Nine variant.
 
@@ -152,6 +259,9 @@ class DeckFactory:
         - Number cards 1-9: 4 of each (36 cards)
         - Special cards: +10, -10, Pass, Reverse, Skip, Ninety-Nine (4 of each, 24 cards)
 
+        Args:
+            rng: Random generator to shuffle with (e.g. the game's).
+
         Returns:
             Tuple of (shuffled deck, card lookup dict mapping id -> Card)
         """
@@ -184,7 +294,7 @@ class DeckFactory:
                 card_id += 1
 
         deck = Deck(cards=cards)
-        deck.shuffle()
+        deck.shuffle(rng)
         return deck, card_lookup
 
 
@@ -1,6 +1,19 @@
-"""Dice utilities for dice-based games."""
-
+"""
+Dice utilities for dice-based games.
+
+Besides DiceSet and single rolls this has exact distributions for bots
+and outcome predictions: roll_outcomes() lists every distinct roll with its
+probability, outcome_chance() sums them for a test (e.g. the chance a
+Farkle roll scores), and KeepTurn solves turns where each roll keeps at
+least one die (Threes, 1-4-24). All are cached, so repeated queries cost a
+lookup.
+"""
+
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass, field
+import functools
+from itertools import combinations_with_replacement, product
+from math import factorial
 import random
 
 from mashumaro.mixins.json import DataClassJSONMixin
@@ -68,7 +81,12 @@ class DiceSet(DataClassJSONMixin):
         self.kept = []
         self.locked = []
 
-    def roll(self, lock_kept: bool = True, clear_kept: bool = True) -> list[int]:
+    def roll(
+        self,
+        lock_kept: bool = True,
+        clear_kept: bool = True,
+        rng: random.Random | None = None,
+    ) -> list[int]:
         """
         Roll the dice.
 
@@ -80,13 +98,16 @@ class DiceSet(DataClassJSONMixin):
                       Set False for games where you can unkeep after rolling.
             clear_kept: If True, clears kept list after rolling.
                        Set False to preserve kept state.
+            rng: Random generator to roll with (e.g. the game's).
+                 Defaults to the random module.
 
         Returns:
             List of all dice values after rolling.
         """
+        rng = rng or random
         if not self.has_rolled:
             # First roll - roll all dice
-            self.values = [random.randint(1, self.sides) for _ in range(self.num_dice)]
+            self.values = [rng.randint(1, self.sides) for _ in range(self.num_dice)]
         else:
             if lock_kept:
                 # Lock the kept dice
@@ -97,7 +118,7 @@ class DiceSet(DataClassJSONMixin):
             # Roll only dice that are neither locked nor kept
             for i in range(self.num_dice):
                 if i not in self.locked and i not in self.kept:
-                    self.values[i] = random.randint(1, self.sides)
+                    self.values[i] = rng.randint(1, self.sides)
 
             if clear_kept:
                 # Reset kept to just locked dice
@@ -238,11 +259,113 @@ class DiceSet(DataClassJSONMixin):
         )
 
 
-def roll_dice(num_dice: int = 1, sides: int = 6) -> list[int]:
+def roll_dice(
+    num_dice: int = 1, sides: int = 6, rng: random.Random | None = None
+) -> list[int]:
     """Roll multiple dice and return their values."""
-    return [random.randint(1, sides) for _ in range(num_dice)]
+    rng = rng or random
+    return [rng.randint(1, sides) for _ in range(num_dice)]
 
 
-def roll_die(sides: int = 6) -> int:
+def roll_die(sides: int = 6, rng: random.Random | None = None) -> int:
     """Roll a single die and return its value."""
-    return random.randint(1, sides)
+    return (rng or random).randint(1, sides)
+
+
+@functools.cache
+def roll_outcomes(
+    num_dice: int, sides: int = 6
+) -> tuple[tuple[float, tuple[int, ...]], ...]:
+    """Every roll of num_dice dice as a sorted tuple, with its probability."""
+    outcomes = []
+    for roll in combinations_with_replacement(range(1, sides + 1), num_dice):
+        ways = factorial(num_dice)
+        for face in set(roll):
+            ways //= factorial(roll.count(face))
+        outcomes.append((ways / sides**num_dice, roll))
+    return tuple(outcomes)
+
+
+@functools.cache
+def outcome_chance(
+    test: Callable[[tuple[int, ...]], bool], num_dice: int, sides: int = 6
+) -> float:
+    """
+    Exact chance that a roll of num_dice dice passes test.
+
+    test gets the roll as a sorted tuple. Results are cached per test, so
+    pass a module-level function rather than a new lambda each time.
+    """
+    return sum(p for p, roll in roll_outcomes(num_dice, sides) if test(roll))
+
+
+@functools.cache
+def keep_choices(roll: tuple[int, ...]) -> tuple[tuple[int, ...], ...]:
+    """The distinct non-empty sets of dice that can be kept from a sorted roll."""
+    faces = sorted(set(roll))
+    choices = []
+    for counts in product(*(range(roll.count(face) + 1) for face in faces)):
+        keep = tuple(face for face, n in zip(faces, counts) for _ in range(n))
+        if keep:
+            choices.append(keep)
+    return tuple(choices)
+
+
+class KeepTurn:
+    """
+    Best play for turns where each roll keeps at least one die.
+
+    The kept dice are locked, the rest are rolled again, and the turn ends
+    once every die is kept (keeping the whole roll ends it early). value()
+    scores a finished turn from its sorted dice; higher is better. The
+    solver maximizes the expected value.
+
+    key(kept) may map sets of kept dice that are worth the same (e.g. with
+    the same total) to one value, which saves solving each of them. Values
+    are solved on first use and kept, so build one KeepTurn per scoring
+    rule and reuse it.
+    """
+
+    def __init__(
+        self,
+        num_dice: int,
+        value: Callable[[tuple[int, ...]], float],
+        sides: int = 6,
+        key: Callable[[tuple[int, ...]], Hashable] | None = None,
+    ):
+        self.num_dice = num_dice
+        self.sides = sides
+        self._value = value
+        self._key = key or (lambda kept: kept)
+        self._expected: dict[Hashable, float] = {}
+
+    def expected(self, kept: tuple[int, ...] = ()) -> float:
+        """Expected value of the turn with kept locked and the rest to roll."""
+        kept = tuple(sorted(kept))
+        if len(kept) >= self.num_dice:
+            return self._value(kept)
+        key = (len(kept), self._key(kept))
+        value = self._expected.get(key)
+        if value is None:
+            value = sum(
+                p * self._best(kept, roll)[0]
+                for p, roll in roll_outcomes(self.num_dice - len(kept), self.sides)
+            )
+            self._expected[key] = value
+        return value
+
+    def _best(
+        self, kept: tuple[int, ...], roll: tuple[int, ...]
+    ) -> tuple[float, tuple[int, ...]]:
+        """Expected value and dice of the best keep from roll."""
+        return max(
+            (self.expected(kept + keep), keep) for keep in keep_choices(roll)
+        )
+
+    def best_keep(self, kept: list[int], roll: list[int]) -> tuple[int, ...]:
+        """
+        The values to keep from roll (the unlocked dice), kept being locked.
+
+        Keeping every die in roll ends the turn.
+        """
+        return self._best(tuple(sorted(kept)), tuple(sorted(roll)))[1]
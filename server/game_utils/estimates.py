@@ -0,0 +1,189 @@
+"""Cached duration estimates, and the idle-time prefetcher that fills them."""
+
+import functools
+import hashlib
+import json
+import sys
+from concurrent.futures import Future
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .simulation import SimulationRequest, SimulationService
+
+if TYPE_CHECKING:
+    from ..games.base import Game
+    from ..persistence.database import Database
+
+
+def estimate_options(options: Any) -> dict[str, Any]:
+    """Option values of a game's options dataclass, by field name."""
+    if options is None:
+        return {}
+    return {name: getattr(options, name) for name in options.__dataclass_fields__}
+
+
+def canonical_json(value: Any) -> str:
+    """JSON text that is identical for equal values."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def estimate_key(game_type: str, options: dict[str, Any], num_bots: int) -> str:
+    """Cache key for an estimate: a hash of everything a simulation depends on."""
+    data = canonical_json([game_type, options, num_bots])
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _hash_files(digest, root: Path, paths) -> None:
+    """Feed files into digest, named relative to root so moves count too."""
+    for path in sorted(paths):
+        digest.update(path.relative_to(root).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+
+
+@functools.cache
+def _shared_code_digest() -> bytes:
+    """Hash of the code every game's bots run on (game_utils and games/base.py)."""
+    server_dir = Path(__file__).parent.parent
+    digest = hashlib.sha256()
+    paths = [*Path(__file__).parent.glob("*.py"), server_dir / "games" / "base.py"]
+    _hash_files(digest, server_dir, paths)
+    return digest.digest()
+
+
+@functools.cache
+def game_version(game_class: type) -> str:
+    """
+    Version of a game's code, for invalidating cached estimates.
+
+    A hash of every file in the game's package (sources and data such as
+    bot policy tables) and of the shared code bots play through, so any
+    change to how the game plays makes its old estimates stale. Computed
+    once per class.
+    """
+    package_dir = Path(sys.modules[game_class.__module__].__file__).parent
+    digest = hashlib.sha256(_shared_code_digest())
+    paths = [
+        path
+        for path in package_dir.rglob("*")
+        if path.is_file()
+        and "__pycache__" not in path.parts
+        and path.suffix not in (".pyc", ".pyo")
+    ]
+    _hash_files(digest, package_dir, paths)
+    return digest.hexdigest()[:16]
+
+
+def get_cached_estimate(
+    db: "Database", game_class: type, options: dict[str, Any], num_bots: int
+) -> list[int] | None:
+    """Get cached tick counts for these inputs, if current."""
+    key = estimate_key(game_class.get_type(), options, num_bots)
+    return db.get_duration_estimate(key, game_version(game_class))
+
+
+def save_cached_estimate(
+    db: "Database",
+    game_class: type,
+    options: dict[str, Any],
+    num_bots: int,
+    ticks: list[int],
+) -> None:
+    """Cache tick counts simulated for these inputs."""
+    game_type = game_class.get_type()
+    db.save_duration_estimate(
+        estimate_key(game_type, options, num_bots),
+        game_type,
+        game_version(game_class),
+        num_bots,
+        canonical_json(options),
+        ticks,
+    )
+
+
+class EstimatePrefetcher:
+    """
+    Fills the estimate cache while the simulation workers are idle.
+
+    Works through every game with its default options at each supported
+    player count, one batch of simulations at a time, and only when no
+    other simulations are queued, so hosts' own estimates always go first.
+    Most tables keep the defaults, so their estimates are then answered
+    from the cache.
+    """
+
+    CHECK_INTERVAL_TICKS = 100  # 5 seconds
+
+    def __init__(self, db: "Database", service: SimulationService | None = None):
+        self._db = db
+        self._service = service
+        self._queue: list[tuple[type["Game"], int]] | None = None
+        self._batch: tuple[type["Game"], dict[str, Any], int, list[Future]] | None = (
+            None
+        )
+        self._ticks = 0
+        self.batches_completed = 0
+
+    def _build_queue(self) -> list[tuple[type["Game"], int]]:
+        """List (game class, bot count) to fill, dropping stale estimates."""
+        from ..games.registry import GameRegistry
+
+        queue = []
+        for game_class in GameRegistry.get_all():
+            self._db.delete_stale_duration_estimates(
+                game_class.get_type(), game_version(game_class)
+            )
+            for num_bots in range(
+                game_class.get_min_players(), game_class.get_max_players() + 1
+            ):
+                queue.append((game_class, num_bots))
+        # Fill smaller (more common) tables first
+        queue.sort(key=lambda entry: entry[1])
+        return queue
+
+    def on_tick(self) -> None:
+        """Called every server tick."""
+        self._ticks += 1
+        if self._ticks % self.CHECK_INTERVAL_TICKS:
+            return
+        self.step()
+
+    def step(self) -> None:
+        """Collect a finished batch, or start the next one if idle."""
+        service = self._service or SimulationService.shared()
+        if self._batch:
+            game_class, options, num_bots, futures = self._batch
+            if not all(f.done() for f in futures):
+                return
+            self._batch = None
+            ticks = [
+                result["ticks"]
+                for result in (
+                    f.result() for f in futures if not f.cancelled() and not f.exception()
+                )
+                if not result["timed_out"]
+            ]
+            if ticks:
+                save_cached_estimate(self._db, game_class, options, num_bots, ticks)
+            self.batches_completed += 1
+            return
+
+        if service.pending:
+            return
+        if self._queue is None:
+            self._queue = self._build_queue()
+        while self._queue:
+            game_class, num_bots = self._queue.pop(0)
+            options = estimate_options(getattr(game_class(), "options", None))
+            if get_cached_estimate(self._db, game_class, options, num_bots):
+                continue
+            request = SimulationRequest(
+                game_type=game_class.get_type(), num_bots=num_bots, options=options
+            )
+            futures = service.submit_many(
+                [request] * game_class.NUM_ESTIMATE_SIMULATIONS
+            )
+            if futures is not None:
+                self._batch = (game_class, options, num_bots, futures)
+            else:
+                self._queue.insert(0, (game_class, num_bots))
+            return
@@ -0,0 +1,262 @@
+"""
+Optimal hold-at policies for push-your-luck dice games.
+
+In games like Pig a turn adds up points until the player holds (banks them)
+or busts (loses them). A hold-at-h policy keeps rolling until the turn total
+reaches h. Which h wins most often depends on the scores: a moderate h
+scores the most points per turn, but near the end a player behind has to go
+for the win in one turn, and a player ahead can afford to bank less.
+
+HoldPolicy finds the best h for every pair of scores in a two-player game
+(the bot against the best opponent score, first to bank the target wins):
+
+- The turn is described once as a Markov chain over (turn total, phase), the
+  phase being whatever else the turn depends on (e.g. dice left). From it the
+  outcome of a hold-at-h turn (bust chance, chance of banking each total) is
+  computed for every h.
+- Win chances are filled by backward induction over the sum of the scores:
+  banking only raises a score, and a bust hands the turn over at the same
+  scores. That couples each state with its mirror image, so the two are
+  solved together as a 2x2 linear system, choosing h again until the choice
+  is stable.
+
+Solving takes time cubic in the target, so targets above MAX_SOLVED_TARGET
+play the last MAX_SOLVED_TARGET points of the game exactly and treat scores
+before that as the start of the solved game. Even so a solve takes up to
+about a second, so live games get their policies from a PolicyCache, which
+solves on a background thread; until a policy is ready bots hold at
+simple_hold_at().
+"""
+
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import mul
+
+# Per phase, the (points gained, next phase, probability) of each roll that
+# doesn't bust; the rest of the probability is a bust. Every gain is at
+# least 1 (rolls that change nothing are left out and the rest scaled up).
+TurnSteps = dict[int, list[tuple[int, int, float]]]
+
+MAX_SOLVED_TARGET = 100
+# Rounds of re-choosing h for a pair of mirrored states
+_MAX_POLICY_ROUNDS = 32
+
+
+def hold_at_outcomes(
+    steps: TurnSteps, start: int, max_hold: int
+) -> list[tuple[float, list[float]]]:
+    """
+    Outcome of a turn played hold-at-h, for h from 1 to max_hold.
+
+    Returns:
+        A list indexed by h (index 0 unused) of (bust chance, banked) where
+        banked[o] is the chance of banking a turn total of h + o.
+    """
+    phases = sorted(steps)
+    index = {phase: i for i, phase in enumerate(phases)}
+    moves = [
+        [(gain, index[after], p) for gain, after, p in steps[phase]]
+        for phase in phases
+    ]
+    bust_chance = [1.0 - sum(p for _, _, p in phase_moves) for phase_moves in moves]
+    max_gain = max(gain for phase_moves in moves for gain, _, _ in phase_moves)
+
+    # Chance of passing through each (turn total, phase) while still rolling
+    reach = [[0.0] * len(phases) for _ in range(max_hold)]
+    reach[0][index[start]] = 1.0
+    for total in range(max_hold):
+        for i, mass in enumerate(reach[total]):
+            if not mass:
+                continue
+            for gain, after, p in moves[i]:
+                if total + gain < max_hold:
+                    reach[total + gain][after] += mass * p
+
+    outcomes: list[tuple[float, list[float]]] = [(1.0, [])]
+    bust = 0.0
+    for hold in range(1, max_hold + 1):
+        row = reach[hold - 1]
+        bust += sum(mass * b for mass, b in zip(row, bust_chance))
+        banked = [0.0] * max_gain
+        for total in range(max(0, hold - max_gain), hold):
+            for i, mass in enumerate(reach[total]):
+                if not mass:
+                    continue
+                for gain, _, p in moves[i]:
+                    if total + gain >= hold:
+                        banked[total + gain - hold] += mass * p
+        outcomes.append((bust, banked))
+    return outcomes
+
+
+class HoldPolicy:
+    """
+    Best hold-at threshold for every pair of scores.
+
+    Built once per rule set (solving takes up to about a second); each
+    decision is then one table lookup.
+    """
+
+    def __init__(self, steps: TurnSteps, start: int, target: int, min_hold: int = 1):
+        self.target = target
+        self.min_hold = max(1, min_hold)
+        self.solved_target = min(target, MAX_SOLVED_TARGET)
+        size = self.solved_target
+        outcomes = hold_at_outcomes(steps, start, max(size, self.min_hold))
+        self._win = [[0.0] * size for _ in range(size)]
+        self._hold = array("H", bytes(2 * size * size))
+
+        for score_sum in reversed(range(2 * size - 1)):
+            for mine in range(max(0, score_sum - size + 1), score_sum // 2 + 1):
+                self._solve_pair(outcomes, mine, score_sum - mine)
+
+    def _choices(
+        self, outcomes: list[tuple[float, list[float]]], mine: int, theirs: int
+    ) -> list[tuple[float, float, int]]:
+        """
+        (win chance if not busting, bust chance, h) for each useful h.
+
+        Holding at the points still needed always wins, so larger h are
+        never better.
+        """
+        size = self.solved_target
+        # Chance of winning after banking to each score above mine
+        after_bank = [1.0 - w for w in self._win[theirs][mine + 1 :]]
+        after_bank.extend([1.0] * (len(outcomes) + len(outcomes[-1][1])))
+        choices = []
+        for hold in range(self.min_hold, max(self.min_hold, size - mine) + 1):
+            bust, banked = outcomes[hold]
+            won = sum(map(mul, banked, after_bank[hold - 1 : hold - 1 + len(banked)]))
+            choices.append((won, bust, hold))
+        return choices
+
+    def _solve_pair(
+        self, outcomes: list[tuple[float, list[float]]], mine: int, theirs: int
+    ) -> None:
+        """Solve the states (mine, theirs) and (theirs, mine) together."""
+        mine_choices = self._choices(outcomes, mine, theirs)
+        theirs_choices = (
+            mine_choices if mine == theirs else self._choices(outcomes, theirs, mine)
+        )
+
+        def best(choices, bust_value):
+            return max(choices, key=lambda c: c[0] + c[1] * bust_value)
+
+        # x = a + b(1 - y) and y = c + e(1 - x) for the chosen thresholds
+        x = y = 0.5
+        chosen = None
+        for _ in range(_MAX_POLICY_ROUNDS):
+            a, b, hold = best(mine_choices, 1.0 - y)
+            c, e, other_hold = best(theirs_choices, 1.0 - x)
+            if (hold, other_hold) == chosen:
+                break
+            chosen = (hold, other_hold)
+            if mine == theirs:
+                x = y = (a + b) / (1.0 + b)
+            else:
+                x = (a + b * (1.0 - c - e)) / (1.0 - b * e)
+                y = c + e * (1.0 - x)
+
+        size = self.solved_target
+        self._win[mine][theirs] = x
+        self._win[theirs][mine] = y
+        self._hold[mine * size + theirs] = chosen[0]
+        self._hold[theirs * size + mine] = chosen[1]
+
+    def _solved_scores(self, mine: int, theirs: int) -> tuple[int, int]:
+        """Map scores onto the solved (possibly shorter) game."""
+        offset = self.target - self.solved_target
+        return max(0, mine - offset), max(0, theirs - offset)
+
+    def hold_at(self, mine: int, theirs: int) -> int:
+        """
+        Turn total to hold at, given the player's and the best opponent score.
+
+        Once someone has reached the target the turn has to beat the best
+        opponent score.
+        """
+        if mine >= self.target or theirs >= self.target:
+            return max(self.min_hold, theirs + 1 - mine)
+        mine, theirs = self._solved_scores(mine, theirs)
+        return self._hold[mine * self.solved_target + theirs]
+
+    def win_chance(self, mine: int, theirs: int) -> float:
+        """Chance of winning from the start of a turn (both below the target)."""
+        mine, theirs = self._solved_scores(mine, theirs)
+        return self._win[mine][theirs]
+
+
+def simple_hold_at(mine: int, theirs: int, target: int, min_hold: int = 1) -> int:
+    """
+    Turn total to hold at without a solved policy.
+
+    Holds at 20 (close to the best for Pig), or at what it takes to win, or
+    to beat a score already past the target.
+    """
+    if mine >= target or theirs >= target:
+        return max(min_hold, theirs + 1 - mine)
+    return max(min_hold, min(20, target - mine))
+
+
+class PolicyCache:
+    """
+    Solved policies for the most recently used rule sets.
+
+    get() solves on the calling thread. get_ready() solves on a background
+    thread shared by every cache and returns None until the policy is
+    ready, so the tick loop never waits for a solve.
+    """
+
+    DEFAULT_MAX_ENTRIES = 16
+
+    _solver = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hold-policy")
+
+    def __init__(
+        self,
+        solve: Callable[..., HoldPolicy],
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self._solve = solve
+        self.max_entries = max_entries
+        self._futures: OrderedDict[tuple[Hashable, ...], Future] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, *rules: Hashable) -> HoldPolicy:
+        """The policy for a rule set, solving it now if needed."""
+        future = Future()
+        with self._lock:
+            existing = self._store(rules, future)
+        if existing is not None:
+            return existing.result()
+        try:
+            future.set_result(self._solve(*rules))
+        except BaseException as exc:
+            with self._lock:
+                if self._futures.get(rules) is future:
+                    del self._futures[rules]
+            future.set_exception(exc)
+            raise
+        return future.result()
+
+    def get_ready(self, *rules: Hashable) -> HoldPolicy | None:
+        """The policy for a rule set, or None while it is solved in the background."""
+        with self._lock:
+            future = self._futures.get(rules)
+            if future is None:
+                future = self._solver.submit(self._solve, *rules)
+            self._store(rules, future)
+        return future.result() if future.done() else None
+
+    def _store(self, rules: tuple[Hashable, ...], future: Future) -> Future | None:
+        """Add a solve unless one exists (returned instead); call with the lock held."""
+        existing = self._futures.get(rules)
+        if existing is not None:
+            self._futures.move_to_end(rules)
+            return existing
+        self._futures[rules] = future
+        while len(self._futures) > self.max_entries:
+            self._futures.popitem(last=False)
+        return None
@@ -330,6 +330,31 @@ def get_all_option_metas(options_class: type) -> dict[str, OptionMeta]:
     return result
 
 
+# Option actions depend only on the option, its value and the locale, so
+# every player and table with the same settings shares one Action
+_option_action_cache: dict[tuple, Action] = {}
+_OPTION_ACTION_CACHE_SIZE = 4096
+
+
+def _get_option_action(
+    meta: OptionMeta,
+    option_name: str,
+    game: "Game",
+    player: "Player",
+    current_value: Any,
+    locale: str,
+) -> Action:
+    """Get the (shared) action for an option's current value."""
+    key = (id(meta), option_name, type(current_value), current_value, locale)
+    action = _option_action_cache.get(key)
+    if action is None:
+        if len(_option_action_cache) >= _OPTION_ACTION_CACHE_SIZE:
+            _option_action_cache.clear()
+        action = meta.create_action(option_name, game, player, current_value, locale)
+        _option_action_cache[key] = action
+    return action
+
+
 @dataclass
 class GameOptions(DataClassJSONMixin):
     """Base class for game options with declarative option support.
@@ -359,7 +384,9 @@ class GameOptions(DataClassJSONMixin):
 
         for name, meta in self.get_option_metas().items():
             current_value = getattr(self, name)
-            action = meta.create_action(name, game, player, current_value, locale)
+            action = _get_option_action(
+                meta, name, game, player, current_value, locale
+            )
             action_set.add(action)
 
         return action_set
@@ -380,7 +407,9 @@ class GameOptions(DataClassJSONMixin):
                 locale = game.get_user(player).locale if game.get_user(player) else "en"
                 for name, meta in self.get_option_metas().items():
                     current_value = getattr(self, name)
-                    action = meta.create_action(name, game, player, current_value, locale)
+                    action = _get_option_action(
+                        meta, name, game, player, current_value, locale
+                    )
                     existing_set.add(action)
             else:
                 # Fallback: create and add new action set if it doesn't exist
@@ -0,0 +1,68 @@
+"""Per-game random number generator that survives serialization."""
+
+import random
+
+# Words fast-forwarded per getrandbits() call when restoring a generator
+_SKIP_CHUNK_WORDS = 1 << 16
+
+
+class GameRandom(random.Random):
+    """
+    A random.Random that can be serialized as (seed, words drawn).
+
+    Every game owns one (Game.rng) and passes it to the helpers in
+    game_utils, so a game's dice, shuffles and bot decisions depend only on
+    its seed and the actions taken. Unseeded generators draw their seed from
+    the random module (so seeding it still makes a whole process repeatable),
+    and record it so the run can be reproduced.
+
+    All of random.Random's methods draw from getrandbits() and random(), so
+    counting the 32-bit words those consume pins down the exact position
+    in the sequence; restoring reseeds and skips that many words. That
+    keeps the serialized form a few bytes instead of the 2.5 KB Mersenne
+    Twister state.
+    """
+
+    def __init__(self, seed: int | None = None):
+        self.initial_seed = 0
+        self.words_drawn = 0
+        super().__init__(seed)
+
+    def seed(self, a: int | None = None, version: int = 2) -> None:
+        """Start a new sequence from seed a (a random seed if None)."""
+        if a is None:
+            a = random.getrandbits(64)
+        self.initial_seed = a
+        self.words_drawn = 0
+        super().seed(a, version)
+
+    def random(self) -> float:
+        self.words_drawn += 2
+        return super().random()
+
+    def getrandbits(self, k: int) -> int:
+        self.words_drawn += (k + 31) // 32
+        return super().getrandbits(k)
+
+    def skip(self, words: int) -> None:
+        """Advance the sequence by words 32-bit words."""
+        self.words_drawn += words
+        while words > 0:
+            chunk = min(words, _SKIP_CHUNK_WORDS)
+            super().getrandbits(32 * chunk)
+            words -= chunk
+
+
+def serialize_rng(rng: GameRandom) -> dict:
+    """Serialize a generator's seed and position in its sequence."""
+    return {"seed": rng.initial_seed, "drawn": rng.words_drawn}
+
+
+def deserialize_rng(data: dict | None) -> GameRandom:
+    """Restore a generator serialized by serialize_rng."""
+    if not data:
+        # Games saved before they had their own generator
+        return GameRandom()
+    rng = GameRandom(data["seed"])
+    rng.skip(data.get("drawn", 0))
+    return rng
@@ -5,6 +5,7 @@ This is a stateless helper that operates on serialized Game fields:
 - game.round_timer_ticks: Remaining ticks in countdown
 """
 
+import math
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -123,3 +124,14 @@ class RoundTimer:
         if self._game.round_timer_ticks <= 0:
             self._game.round_timer_state = self.IDLE
             self._game.on_round_timer_ready()
+
+    def idle_ticks(self) -> float:
+        """Ticks before the countdown expires (math.inf if not counting)."""
+        if self._game.round_timer_state != self.COUNTING:
+            return math.inf
+        return max(0, self._game.round_timer_ticks - 1)
+
+    def skip_ticks(self, ticks: int) -> None:
+        """Count down as ticks on_tick() calls would, short of expiring."""
+        if self._game.round_timer_state == self.COUNTING:
+            self._game.round_timer_ticks -= ticks
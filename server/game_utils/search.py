@@ -0,0 +1,291 @@
+"""
+Anytime look-ahead search for card game bots.
+
+Card game bots pick moves with one-ply heuristics that only look at the
+cards on the table. BotSearch improves on them by trying the candidate
+moves in playouts:
+
+- The game is cloned from its serialized state, and the cards the bot
+  can't see (the deck and the other hands) are dealt again at random, so
+  the bot never peeks (determinized Monte Carlo).
+- The move is played on the clone, and the game continues with every seat
+  played by the heuristic bot until a horizon the game chooses (e.g. the
+  end of the round), where the game scores the outcome for the bot.
+- The move with the best average outcome is played. Moves are sampled
+  with UCB1, so the promising ones get most of the playouts.
+
+Playouts run on each tick the bot spends thinking (bot_think_ticks). All
+searches on the server share one SearchBudget of SECONDS_PER_TICK of CPU
+per tick, held by the TableManager; a playout that runs out of budget is
+paused between two of its simulated ticks and resumed on the next tick, so
+a search never holds up the tick loop by more than one simulated tick.
+When the bot is due to act it plays the best move found so far, or its
+heuristic move if there is none. The move depends on the CPU time the
+search got, so it is recorded in the table's journal and journal replay
+plays it back without searching. Headless games (simulations) ignore the
+time limit, which keeps them reproducible from their seed.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+import time
+from typing import TYPE_CHECKING
+
+from .bot_helper import BotHelper
+
+if TYPE_CHECKING:
+    from ..games.base import Game, Player
+
+# CPU all searches together may use per server tick
+SECONDS_PER_TICK = 0.008
+PLAYOUTS_PER_TICK = 4
+MAX_PLAYOUTS = 96
+# Ticks a playout may run before it is scored where it stands
+MAX_PLAYOUT_STEPS = 2000
+# UCB1 exploration weight, in units of the observed value range
+EXPLORATION = 0.7
+
+
+class SearchBudget:
+    """
+    CPU time for bot searches in one server tick, shared by every table.
+
+    The owner calls start_tick() once per tick; each search then runs
+    until the shared deadline. Outside a tick (e.g. a game without a table)
+    every call to deadline() gets a fresh budget of its own.
+    """
+
+    def __init__(self, seconds: float = SECONDS_PER_TICK):
+        self.seconds = seconds
+        self._deadline: float | None = None
+
+    def start_tick(self) -> None:
+        """Start a new tick's budget."""
+        self._deadline = time.perf_counter() + self.seconds
+
+    def deadline(self) -> float:
+        """The perf_counter() time searches must pause at."""
+        if self._deadline is None:
+            return time.perf_counter() + self.seconds
+        return self._deadline
+
+
+class BotSearch:
+    """
+    A search for one bot decision, advanced a few playouts at a time.
+
+    The game is serialized once when the search starts; every playout
+    restores a fresh clone from that snapshot, so the real game is never
+    touched.
+    """
+
+    def __init__(self, game: Game, player: Player, moves: list[str], seed: int):
+        self.player_id = player.id
+        self.moves = list(moves)
+        self.playouts = 0
+        self._game_class = type(game)
+        # Through JSON like a saved game, so every value is plain data
+        # (to_dict() keeps e.g. str enums, which from_dict() doesn't read back)
+        self._snapshot = json.loads(game.to_json())
+        # Clones are reseeded, so skip restoring the generator's position
+        self._snapshot["rng"] = {"seed": 0, "drawn": 0}
+        self._rng = random.Random(seed)
+        # Unchanged copy of the starting position for the game's hooks
+        self.root = self._clone()
+        self._totals = [0.0] * len(self.moves)
+        self._counts = [0] * len(self.moves)
+        self._low = math.inf
+        self._high = -math.inf
+        # The playout in progress: (move index, clone, bot player, steps run)
+        self._playout: tuple[int, Game, Player, int] | None = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether every playout has been run."""
+        return self.playouts >= MAX_PLAYOUTS
+
+    def step(self, playouts: int, deadline: float | None = None) -> None:
+        """
+        Run up to playouts playouts, pausing at deadline (a perf_counter time).
+
+        Work is done one simulated tick at a time and a paused playout
+        resumes on the next step, so a step overruns its deadline by at most
+        one simulated tick (or starting a playout). The first one always
+        runs, so every search makes progress.
+        """
+        worked = False
+        done = 0
+        while done < playouts and not self.finished:
+            if worked and deadline is not None and time.perf_counter() >= deadline:
+                return
+            worked = True
+            if self._playout is None:
+                self._playout = self._start_playout()
+            elif self._advance():
+                done += 1
+
+    def best_move(self) -> str | None:
+        """The move with the best average so far, or None before any playout."""
+        best, best_mean = None, -math.inf
+        for move, total, count in zip(self.moves, self._totals, self._counts):
+            if count and total / count > best_mean:
+                best, best_mean = move, total / count
+        return best
+
+    def _select(self) -> int:
+        """Index of the move to try next (UCB1, untried moves first)."""
+        for i, count in enumerate(self._counts):
+            if not count:
+                return i
+        spread = max(self._high - self._low, 1e-9) * EXPLORATION
+        log_total = math.log(self.playouts)
+        return max(
+            range(len(self.moves)),
+            key=lambda i: self._totals[i] / self._counts[i]
+            + spread * math.sqrt(log_total / self._counts[i]),
+        )
+
+    def _clone(self) -> Game:
+        """A bot-only, headless copy of the game from the snapshot."""
+        game = self._game_class.from_dict(self._snapshot)
+        game._headless = True
+        game._search_playout = True
+        game.rebuild_runtime_state()
+        for player in game.players:
+            if not player.is_spectator:
+                player.is_bot = True
+        game.rng.seed(self._rng.getrandbits(64))
+        return game
+
+    def _start_playout(self) -> tuple[int, Game, Player, int]:
+        """Play the next move to try on a determinized clone."""
+        i = self._select()
+        game = self._clone()
+        player = game.get_player_by_id(self.player_id)
+        game.search_determinize(player, game.rng)
+        player.bot_think_ticks = 0
+        player.bot_pending_action = None
+        game.execute_action(player, self.moves[i])
+        return i, game, player, 0
+
+    def _advance(self) -> bool:
+        """Run one simulated tick of the playout; True once it has been scored."""
+        i, game, player, steps = self._playout
+        if (
+            steps < MAX_PLAYOUT_STEPS
+            and game.game_active
+            and not game.search_horizon(player, self.root)
+        ):
+            idle = game.get_idle_ticks()
+            if 1 <= idle < math.inf:
+                game.skip_idle_ticks(int(idle))
+            else:
+                game.on_tick()
+            self._playout = (i, game, player, steps + 1)
+            return False
+
+        value = game.search_value(player, self.root)
+        self._playout = None
+        self._totals[i] += value
+        self._counts[i] += 1
+        self.playouts += 1
+        self._low = min(self._low, value)
+        self._high = max(self._high, value)
+        return True
+
+
+class SearchBotMixin:
+    """
+    Mixin letting a game's bots search for their moves with BotSearch.
+
+    BotHelper advances the search on the ticks the bot spends thinking, and
+    bot_think() asks for the result with bot_search_move().
+
+    Games implement:
+    - search_enabled(player) -> bool: Whether player's bot searches (e.g. a
+      bot strategy option).
+    - search_moves(player) -> list[str]: The actions worth comparing, one
+      per distinct outcome. Fewer than two means there is nothing to search.
+    - search_determinize(player, rng): Called on a clone; deal the cards
+      player can't see again at random using rng.
+    - search_horizon(player, root) -> bool: Whether a playout has gone far
+      enough to be scored. root is the game as the search started.
+    - search_value(player, root) -> float: How good the playout's outcome is
+      for player (higher is better, any scale).
+
+    Usage:
+        class MyGame(Game, SearchBotMixin):
+            def bot_think(self, player):
+                return self.bot_search_move(player) or heuristic_move(self, player)
+    """
+
+    # Runtime only (unannotated, so not serialized): the search in progress,
+    # and whether this game is a playout clone (whose bots play heuristics)
+    _bot_search = None
+    _search_playout = False
+
+    def _search_for(self, player: Player) -> BotSearch | None:
+        """The search for player's next decision, started if needed."""
+        if self._search_playout or not self.search_enabled(player):
+            return None
+        moves = self.search_moves(player)
+        search = self._bot_search
+        if search is None or search.player_id != player.id or search.moves != moves:
+            search = None
+            if len(moves) >= 2:
+                # Seeded from the game's position, so reruns search alike
+                seed = self.rng.initial_seed * 1_000_003 + self.rng.words_drawn
+                search = BotSearch(self, player, moves, seed)
+            self._bot_search = search
+        return search
+
+    def bot_search_busy(self, player: Player) -> bool:
+        """Whether thinking ticks would still advance a search for player."""
+        if self._bot_replay is not None:
+            return False
+        search = self._search_for(player)
+        return search is not None and not search.finished
+
+    def bot_search_tick(self, player: Player) -> None:
+        """Advance player's search by one tick's budget."""
+        if self._bot_replay is not None:
+            return  # Replay plays the journaled move instead
+        search = self._search_for(player)
+        if search is None or search.finished:
+            return
+        deadline = None if self._headless else self._search_deadline()
+        search.step(PLAYOUTS_PER_TICK, deadline)
+
+    def _search_deadline(self) -> float:
+        """When this tick's searches must pause, from the server-wide budget."""
+        table = self._table
+        budget = table._manager.search_budget if table and table._manager else None
+        return (budget or SearchBudget()).deadline()
+
+    def bot_search_move(self, player: Player) -> str | None:
+        """
+        The best move found for player, ending the search.
+
+        Returns None if the search is off or found nothing; callers then
+        fall back on their heuristic.
+
+        How far a live search got depends on the CPU time it was given, so
+        the move is a journaled choice: replaying the journal plays the
+        recorded move without searching.
+        """
+        search = self._bot_search
+        self._bot_search = None
+        if self._search_playout or not self.search_enabled(player):
+            return None
+
+        def best_move() -> str | None:
+            if search is None or search.player_id != player.id:
+                return None
+            if search.moves != self.search_moves(player):
+                return None
+            return search.best_move()
+
+        return BotHelper.journaled_choice(self, player, best_move)
@@ -0,0 +1,190 @@
+"""Shared pool of warm worker processes for bot-only game simulations."""
+
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+@dataclass
+class SimulationRequest:
+    """A bot-only game to simulate. Options are passed as typed values."""
+
+    game_type: str
+    num_bots: int
+    options: dict[str, Any] = field(default_factory=dict)
+    max_ticks: int = 1_000_000  # About 14 hours of play
+    seed: int | None = None
+    headless: bool = True  # Skip messages, menus and sounds
+    time_bots: bool = False  # Count and time bot decisions (varies between runs)
+
+
+def _init_worker() -> None:
+    """Import every game and compile localization once per worker process."""
+    import server.cli  # noqa: F401
+    from server.messages.localization import Localization
+
+    # Simulations render messages in English for their spectator
+    Localization.preload("en")
+
+
+def peak_rss_kb() -> int | None:
+    """Peak resident memory of this process in KB, where the OS reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_simulation(request: SimulationRequest) -> dict[str, Any]:
+    """
+    Run one simulation to completion (in a worker process).
+
+    Returns:
+        ticks, rounds, timed_out, the seed the game ran with, the winning
+        seats (indices of the bots), each seat's final score (None if the
+        game doesn't report scores), the bot decision count and time spent
+        deciding (0 unless time_bots is set), and the process's peak RSS in
+        KB.
+    """
+    from server.cli import GameSimulator
+    from server.games.base import BOT_NAMES
+
+    simulator = GameSimulator(
+        game_type=request.game_type,
+        bot_names=BOT_NAMES[: request.num_bots],
+        options=request.options,
+        json_mode=True,
+        quiet=True,
+        max_ticks=request.max_ticks,
+        seed=request.seed,
+        headless=request.headless,
+        time_bots=request.time_bots,
+    )
+    if not simulator.setup():
+        raise ValueError(
+            f"Cannot simulate {request.game_type} with {request.num_bots} bots"
+        )
+    result = simulator.run()
+    return {
+        "ticks": result["ticks"],
+        "rounds": result["rounds"],
+        "timed_out": result["timed_out"],
+        "seed": result["seed"],
+        "winners": result["winners"],
+        "scores": result["scores"],
+        "bot_decisions": result["bot_decisions"],
+        "bot_think_seconds": result["bot_think_seconds"],
+        "peak_rss_kb": peak_rss_kb(),
+    }
+
+
+class SimulationService:
+    """
+    Runs simulations on a process pool shared by every game on the server.
+
+    Workers are started once and keep every game imported, so a simulation
+    costs only its own run. The pool size caps how many simulations run at
+    once across all tables, and max_pending caps how many may be queued;
+    beyond that submissions are refused instead of piling up.
+    """
+
+    DEFAULT_MAX_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+    DEFAULT_MAX_PENDING = 64
+
+    _shared: "SimulationService | None" = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "SimulationService":
+        """Get the server-wide service, creating it on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def shutdown_shared(cls) -> None:
+        """Stop the server-wide service's workers, if it was started."""
+        with cls._shared_lock:
+            if cls._shared is not None:
+                cls._shared.shutdown()
+                cls._shared = None
+
+    @property
+    def pending(self) -> int:
+        """Simulations submitted and not yet finished."""
+        return self._pending
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawned (not forked) workers don't inherit the server's
+            # threads, sockets or event loop
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return self._executor
+
+    def _on_done(self, _future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def submit_many(self, requests: list[SimulationRequest]) -> list[Future] | None:
+        """
+        Queue simulations, all or none.
+
+        Returns:
+            One future per request (resolving to run_simulation's result),
+            or None if that many would exceed max_pending.
+        """
+        with self._lock:
+            if self._pending + len(requests) > self.max_pending:
+                return None
+            self._pending += len(requests)
+            futures = []
+            for request in requests:
+                try:
+                    future = self._get_executor().submit(run_simulation, request)
+                except BrokenProcessPool:
+                    # A worker died; start a fresh pool for this and later jobs
+                    self._executor = None
+                    future = self._get_executor().submit(run_simulation, request)
+                futures.append(future)
+        for future in futures:
+            future.add_done_callback(self._on_done)
+        return futures
+
+    def submit(self, request: SimulationRequest) -> Future | None:
+        """Queue one simulation. Returns None if the queue is full."""
+        futures = self.submit_many([request])
+        return futures[0] if futures else None
+
+    def shutdown(self) -> None:
+        """Cancel queued simulations and stop the workers."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
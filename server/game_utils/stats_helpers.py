@@ -4,10 +4,16 @@ Stats helper utilities for leaderboards and player ratings.
 Provides:
 - LeaderboardHelper: Build leaderboards from game results
 - RatingHelper: Track player skill ratings using OpenSkill (Plackett-Luce model)
+- RatingCache: Process-wide in-memory ratings with write-behind persistence
+- RatingRebuilder: Recompute all ratings by replaying stored game results
 """
 
+import json
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Callable, TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 from openskill.models import PlackettLuce
 
@@ -162,6 +168,118 @@ class PlayerRating:
         return f"{self.mu:.1f} ± {self.sigma:.1f}"
 
 
+class RatingCache:
+    """
+    Process-wide cache of player ratings for one database, with write-behind.
+
+    Ratings are loaded on first use and kept in memory for every table that
+    shares the database. Updates change the cached value immediately and are
+    queued; flush() writes the queued ratings to player_ratings in a single
+    transaction. The server flushes periodically and on shutdown.
+
+    The cache holds at most max_entries ratings and evicts the least recently
+    used ones. Evicting a queued rating flushes the queue first, so no update
+    is lost and an evicted rating reloads from the database unchanged.
+
+    Get the shared instance with RatingCache.for_db(db).
+    """
+
+    DEFAULT_MAX_ENTRIES = 10000
+
+    _instances: "WeakKeyDictionary[Database, RatingCache]" = WeakKeyDictionary()
+
+    def __init__(self, db: "Database", max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.db = db
+        self.max_entries = max_entries
+        # (game_type, player_id) -> (mu, sigma), or None if known to be unrated
+        self._ratings: OrderedDict[tuple[str, str], tuple[float, float] | None] = (
+            OrderedDict()
+        )
+        self._dirty: set[tuple[str, str]] = set()
+        self.evictions = 0
+
+    @classmethod
+    def for_db(cls, db: "Database") -> "RatingCache":
+        """Get the shared cache for a database, creating it on first use."""
+        cache = cls._instances.get(db)
+        if cache is None:
+            cache = cls(db)
+            cls._instances[db] = cache
+        return cache
+
+    def get(self, game_type: str, player_id: str) -> tuple[float, float] | None:
+        """Get (mu, sigma) for a player, loading it from the database on a miss."""
+        key = (game_type, player_id)
+        if key in self._ratings:
+            self._ratings.move_to_end(key)
+            return self._ratings[key]
+        rating = self.db.get_player_rating(player_id, game_type)
+        self._store(key, rating)
+        return rating
+
+    def preload(self, game_type: str, player_ids: list[str]) -> None:
+        """Load ratings for players not yet cached, using a single query."""
+        missing = []
+        for pid in player_ids:
+            key = (game_type, pid)
+            if key in self._ratings:
+                self._ratings.move_to_end(key)
+            else:
+                missing.append(pid)
+        if not missing:
+            return
+        found = self.db.get_player_ratings(missing, game_type)
+        for pid in missing:
+            self._store((game_type, pid), found.get(pid))
+
+    def set(self, game_type: str, player_id: str, mu: float, sigma: float) -> None:
+        """Update a cached rating and queue it for the next flush."""
+        key = (game_type, player_id)
+        self._store(key, (mu, sigma))
+        self._dirty.add(key)
+
+    def _store(
+        self, key: tuple[str, str], rating: tuple[float, float] | None
+    ) -> None:
+        """Cache a rating, evicting the least recently used ones if full."""
+        self._ratings[key] = rating
+        self._ratings.move_to_end(key)
+        while len(self._ratings) > self.max_entries:
+            oldest = next(iter(self._ratings))
+            if oldest in self._dirty:
+                self.flush()
+            del self._ratings[oldest]
+            self.evictions += 1
+
+    @property
+    def pending_writes(self) -> int:
+        """Number of ratings waiting to be flushed."""
+        return len(self._dirty)
+
+    def flush(self) -> int:
+        """
+        Write all queued ratings to the database in one batch.
+
+        Returns:
+            Number of ratings written.
+        """
+        if not self._dirty:
+            return 0
+        rows = []
+        for game_type, player_id in self._dirty:
+            mu, sigma = self._ratings[(game_type, player_id)]
+            rating = PlayerRating(player_id=player_id, mu=mu, sigma=sigma)
+            rows.append((player_id, game_type, mu, sigma, rating.ordinal))
+        self.db.set_player_ratings(rows)
+        self._dirty.clear()
+        return len(rows)
+
+    def clear(self) -> None:
+        """Forget all cached ratings. Queued writes are flushed first."""
+        self.flush()
+        self._ratings.clear()
+
+
 class RatingHelper:
     """
     Helper for tracking player skill ratings using OpenSkill.
@@ -171,7 +289,8 @@ class RatingHelper:
     - Teams
     - Ties (players in same rank group)
 
-    Ratings are stored in the database and updated after each game.
+    Ratings are read from and written to the shared RatingCache, which
+    persists them to the database in batches.
     """
 
     # Default rating values (same as OpenSkill defaults)
@@ -189,6 +308,7 @@ class RatingHelper:
         self.db = db
         self.game_type = game_type
         self.model = PlackettLuce()
+        self.cache = RatingCache.for_db(db)
 
     def get_rating(self, player_id: str) -> PlayerRating:
         """
@@ -196,7 +316,7 @@ class RatingHelper:
 
         Returns default rating if player has no rating history.
         """
-        result = self.db.get_player_rating(player_id, self.game_type)
+        result = self.cache.get(self.game_type, player_id)
         if result:
             mu, sigma = result
             return PlayerRating(player_id=player_id, mu=mu, sigma=sigma)
@@ -208,6 +328,7 @@ class RatingHelper:
 
     def get_ratings(self, player_ids: list[str]) -> dict[str, PlayerRating]:
         """Get ratings for multiple players."""
+        self.cache.preload(self.game_type, player_ids)
         return {pid: self.get_rating(pid) for pid in player_ids}
 
     def update_ratings(
@@ -250,15 +371,13 @@ class RatingHelper:
         # Calculate new ratings
         new_teams = self.model.rate(teams)
 
-        # Update database and build result
+        # Update cache (written to the database on the next flush) and build result
         updated_ratings: dict[str, PlayerRating] = {}
 
         for group_idx, group in enumerate(rankings):
             for player_idx, pid in enumerate(group):
                 new_rating = new_teams[group_idx][player_idx]
-                self.db.set_player_rating(
-                    pid, self.game_type, new_rating.mu, new_rating.sigma
-                )
+                self.cache.set(self.game_type, pid, new_rating.mu, new_rating.sigma)
                 updated_ratings[pid] = PlayerRating(
                     player_id=pid,
                     mu=new_rating.mu,
@@ -317,18 +436,34 @@ class RatingHelper:
 
         return self.update_ratings(rankings)
 
-    def get_leaderboard(self, limit: int = 10) -> list[PlayerRating]:
+    def get_leaderboard(self, limit: int = 10, offset: int = 0) -> list[PlayerRating]:
         """
-        Get the rating leaderboard for this game type.
+        Get a page of the rating leaderboard for this game type.
 
         Returns players sorted by ordinal (conservative skill estimate).
+        Use offset to page past the top entries (offset=10 for ranks 11-20).
         """
-        rows = self.db.get_rating_leaderboard(self.game_type, limit)
+        self.cache.flush()
+        rows = self.db.get_rating_leaderboard(self.game_type, limit, offset)
         return [
             PlayerRating(player_id=pid, mu=mu, sigma=sigma)
             for pid, mu, sigma in rows
         ]
 
+    def get_rank(self, player_id: str) -> int | None:
+        """
+        Get a player's 1-based position on the rating leaderboard.
+
+        Returns None if the player has no rating for this game type.
+        """
+        self.cache.flush()
+        return self.db.get_player_rating_rank(player_id, self.game_type)
+
+    def get_rated_count(self) -> int:
+        """Get the number of rated players for this game type."""
+        self.cache.flush()
+        return self.db.get_rated_player_count(self.game_type)
+
     def predict_win_probability(
         self, player1_id: str, player2_id: str
     ) -> float:
@@ -337,11 +472,175 @@ class RatingHelper:
 
         Returns a value between 0 and 1.
         """
-        r1 = self.get_rating(player1_id)
-        r2 = self.get_rating(player2_id)
+        ratings = self.get_ratings([player1_id, player2_id])
+        r1 = ratings[player1_id]
+        r2 = ratings[player2_id]
 
         rating1 = self.model.rating(mu=r1.mu, sigma=r1.sigma)
         rating2 = self.model.rating(mu=r2.mu, sigma=r2.sigma)
 
         # Use OpenSkill's predict_win
         return self.model.predict_win([[rating1], [rating2]])[0]
+
+
+class RatingRebuilder:
+    """
+    Rebuild player_ratings by replaying every stored game result.
+
+    Results are streamed from the database in timestamp order, in chunks,
+    and replayed through the Plackett-Luce model with all ratings held in
+    memory. After each chunk the changed ratings and a checkpoint are written
+    to a staging table, so an interrupted rebuild can resume where it left
+    off. The staging table replaces player_ratings in a single transaction
+    once the whole history has been replayed.
+
+    Run this while the server is stopped: a running server keeps its own
+    RatingCache and would not see the rebuilt ratings.
+    """
+
+    DEFAULT_CHUNK_SIZE = 5000
+
+    def __init__(
+        self,
+        db: "Database",
+        ranking_extractors: dict[str, Callable[["GameResult"], list[list[str]]]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Create a rebuilder.
+
+        Args:
+            db: Database to rebuild ratings in
+            ranking_extractors: game_type -> function returning rankings for a
+                                result (same contract as get_rankings_for_rating).
+                                Results of other game types are skipped.
+            chunk_size: Number of results replayed between checkpoints
+        """
+        self.db = db
+        self.ranking_extractors = ranking_extractors
+        self.chunk_size = chunk_size
+        self.model = PlackettLuce()
+
+    def run(
+        self,
+        resume: bool = False,
+        on_progress: Callable[[dict], None] | None = None,
+    ) -> dict:
+        """
+        Replay the full history and swap in the rebuilt ratings.
+
+        Args:
+            resume: Continue an interrupted rebuild from its last checkpoint
+            on_progress: Called with the running stats after every chunk
+
+        Returns:
+            Stats dict with games_processed, games_rated, players_rated,
+            elapsed_seconds and games_per_second. The game counts cover the
+            whole rebuild, including runs before a resume; the timings cover
+            this run only.
+        """
+        from .game_result import GameResult, PlayerResult
+
+        last_timestamp, last_id, processed, rated, saved = (
+            self.db.start_ratings_rebuild(resume)
+        )
+        ratings: dict[tuple[str, str], tuple[float, float]] = {
+            (game_type, pid): (mu, sigma) for pid, game_type, mu, sigma in saved
+        }
+        start_processed = processed
+        start = time.perf_counter()
+        stats: dict = {}
+
+        while True:
+            chunk = self.db.get_game_results_chunk(
+                last_timestamp, last_id, self.chunk_size
+            )
+            if not chunk:
+                break
+
+            changed: set[tuple[str, str]] = set()
+            for result_id, game_type, timestamp, duration, custom_json, players in chunk:
+                extractor = self.ranking_extractors.get(game_type)
+                if extractor:
+                    result = GameResult(
+                        game_type=game_type,
+                        timestamp=timestamp,
+                        duration_ticks=duration or 0,
+                        player_results=[
+                            PlayerResult(player_id=pid, player_name=name, is_bot=is_bot)
+                            for pid, name, is_bot in players
+                        ],
+                        custom_data=json.loads(custom_json) if custom_json else {},
+                    )
+                    if self._replay(result, extractor, ratings, changed):
+                        rated += 1
+
+            processed += len(chunk)
+            last_timestamp, last_id = chunk[-1][2], chunk[-1][0]
+            rows = []
+            for game_type, pid in changed:
+                rating = PlayerRating(pid, *ratings[(game_type, pid)])
+                rows.append((pid, game_type, rating.mu, rating.sigma, rating.ordinal))
+            self.db.save_ratings_rebuild_chunk(
+                rows, last_timestamp, last_id, processed, rated
+            )
+
+            stats = self._stats(processed, start_processed, rated, ratings, start)
+            if on_progress:
+                on_progress(stats)
+
+        self.db.finish_ratings_rebuild()
+        return self._stats(processed, start_processed, rated, ratings, start)
+
+    def _replay(
+        self,
+        result: "GameResult",
+        extractor: Callable[["GameResult"], list[list[str]]],
+        ratings: dict[tuple[str, str], tuple[float, float]],
+        changed: set[tuple[str, str]],
+    ) -> bool:
+        """Apply one result to the in-memory ratings. Returns True if rated."""
+        # Mirror Game._persist_result/_update_ratings: humans only, 2+ groups
+        if not result.has_human_players():
+            return False
+        rankings = extractor(result)
+        if not rankings or len(rankings) < 2:
+            return False
+
+        game_type = result.game_type
+        teams = []
+        for group in rankings:
+            team = []
+            for pid in group:
+                mu, sigma = ratings.get(
+                    (game_type, pid),
+                    (RatingHelper.DEFAULT_MU, RatingHelper.DEFAULT_SIGMA),
+                )
+                team.append(self.model.rating(mu=mu, sigma=sigma))
+            teams.append(team)
+
+        new_teams = self.model.rate(teams)
+        for group, new_team in zip(rankings, new_teams):
+            for pid, new_rating in zip(group, new_team):
+                ratings[(game_type, pid)] = (new_rating.mu, new_rating.sigma)
+                changed.add((game_type, pid))
+        return True
+
+    def _stats(
+        self,
+        processed: int,
+        start_processed: int,
+        rated: int,
+        ratings: dict,
+        start: float,
+    ) -> dict:
+        """Build the running stats dict."""
+        elapsed = time.perf_counter() - start
+        replayed = processed - start_processed
+        return {
+            "games_processed": processed,
+            "games_rated": rated,
+            "players_rated": len(ratings),
+            "elapsed_seconds": elapsed,
+            "games_per_second": replayed / elapsed if elapsed > 0 else 0.0,
+        }
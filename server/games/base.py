@@ -3,12 +3,13 @@
 from dataclasses import dataclass, field
 from typing import Any, Callable
 from abc import ABC, abstractmethod
-import subprocess
-import sys
-import json as json_module
-from pathlib import Path
+from collections import deque
+from concurrent.futures import Future
+import math
 import threading
+import uuid
 
+from mashumaro import field_options
 from mashumaro.mixins.json import DataClassJSONMixin
 from mashumaro.config import BaseConfig
 
@@ -21,13 +22,23 @@ from ..game_utils.actions import (
     EditboxInput,
     Visibility,
     ResolvedAction,
+    deserialize_action_sets,
+    serialize_action_sets,
+    template_action_set,
 )
 from ..game_utils.options import (
     GameOptions as DeclarativeGameOptions,
     get_option_meta,
     MenuOption,
 )
+from ..game_utils.estimates import (
+    estimate_options,
+    get_cached_estimate,
+    save_cached_estimate,
+)
 from ..game_utils.game_result import GameResult, PlayerResult
+from ..game_utils.rng import GameRandom, deserialize_rng, serialize_rng
+from ..game_utils.simulation import SimulationRequest, SimulationService
 from ..game_utils.stats_helpers import RatingHelper
 from ..game_utils.teams import TeamManager
 from ..messages.localization import Localization
@@ -142,10 +153,23 @@ class Game(ABC, DataClassJSONMixin):
         default_factory=list
     )  # [[tick, sound, vol, pan, pitch], ...]
     sound_scheduler_tick: int = 0  # Current tick counter
-    # Action sets (serialized - actions are pure data now)
-    player_action_sets: dict[str, list[ActionSet]] = field(default_factory=dict)
+    # Action sets (serialized - actions are pure data now, each distinct
+    # action is stored once per game and shared in memory via ActionTemplates)
+    player_action_sets: dict[str, list[ActionSet]] = field(
+        default_factory=dict,
+        metadata=field_options(
+            serialize=serialize_action_sets, deserialize=deserialize_action_sets
+        ),
+    )
     # Team manager (serialized for persistence)
     _team_manager: TeamManager = field(default_factory=TeamManager)
+    # Random generator for everything random in the game (dice, shuffles,
+    # bot choices). Serialized with its state so a restored game continues
+    # the same sequence; seed it for reproducible runs.
+    rng: GameRandom = field(
+        default_factory=GameRandom,
+        metadata=field_options(serialize=serialize_rng, deserialize=deserialize_rng),
+    )
 
     def __post_init__(self):
         """Initialize non-serialized state."""
@@ -164,11 +188,19 @@ class Game(ABC, DataClassJSONMixin):
         self._status_box_open: set[str] = set()  # player_ids with status box open
         self._actions_menu_open: set[str] = set()  # player_ids with actions menu open
         self._destroyed: bool = False  # Whether game has been destroyed
+        # No user consumes output (bot-only simulations): messages, sounds
+        # and menus are skipped while game logic runs unchanged
+        self._headless: bool = False
+        # While a journal is replayed: the (player_id, choice) of each
+        # journaled bot choice, in order (see BotHelper.journaled_choice)
+        self._bot_replay: deque[tuple[str, str | None]] | None = None
         # Duration estimation state
-        self._estimate_threads: list[threading.Thread] = []  # Running simulation threads
+        self._estimate_futures: list[Future] = []  # Queued simulations
         self._estimate_results: list[int] = []  # Collected tick counts
         self._estimate_errors: list[str] = []  # Collected errors
         self._estimate_running: bool = False  # Whether estimation is in progress
+        self._estimate_announced: int = 0  # Results already announced
+        self._estimate_inputs: tuple[dict, int] = ({}, 0)  # (options, num_bots)
         self._estimate_lock: threading.Lock = threading.Lock()  # Protect results list
 
     def rebuild_runtime_state(self) -> None:
@@ -208,6 +240,15 @@ class Game(ABC, DataClassJSONMixin):
         """Return the category localization key for this game."""
         return "category-uncategorized"
 
+    @classmethod
+    def warm_up(cls) -> None:
+        """
+        Precompute tables the bots use, so they aren't built on the tick loop.
+
+        Called once for every registered game when the server starts.
+        """
+        pass
+
     @classmethod
     def get_min_players(cls) -> int:
         """Return minimum number of players."""
@@ -291,6 +332,24 @@ class Game(ABC, DataClassJSONMixin):
         # Check if duration estimation has completed
         self.check_estimate_completion()
 
+    def get_idle_ticks(self) -> float:
+        """How many upcoming ticks would only count down timers.
+
+        Bot-only simulations skip that many ticks at once with
+        skip_idle_ticks() instead of calling on_tick() for each. Games
+        override both to combine the countdowns their on_tick() runs
+        (get_sound_idle_ticks(), BotHelper.idle_ticks(), RoundTimer.idle_ticks());
+        math.inf means nothing is scheduled. The default of 0 always ticks.
+        """
+        return 0
+
+    def skip_idle_ticks(self, ticks: int) -> None:
+        """Advance by ticks ticks, exactly as that many on_tick() calls would.
+
+        Only called with ticks <= get_idle_ticks().
+        """
+        pass
+
     def on_round_timer_ready(self) -> None:
         """Called when round timer expires. Override in subclasses that use RoundTimer."""
         pass
@@ -307,13 +366,14 @@ class Game(ABC, DataClassJSONMixin):
         """
         self.game_active = False
         self.status = "finished"
+        self.mark_dirty()
 
         # Build and persist the game result
         result = self.build_game_result()
         self._persist_result(result)
 
         # Show end screen
-        if show_end_screen:
+        if show_end_screen and not self._headless:
             self._show_end_screen(result)
 
         # Auto-destroy if no humans remain (bot-only games)
@@ -387,6 +447,14 @@ class Game(ABC, DataClassJSONMixin):
         # Update ratings
         rating_helper.update_ratings(rankings)
 
+    def _preload_ratings(self) -> None:
+        """Load all human players' ratings into the shared rating cache."""
+        if not self._table or not self._table._db:
+            return
+        human_ids = [p.id for p in self.players if not p.is_bot and not p.is_spectator]
+        if human_ids:
+            RatingHelper(self._table._db, self.get_type()).get_ratings(human_ids)
+
     def get_rankings_for_rating(self, result: GameResult) -> list[list[str]]:
         """Get player rankings for rating update. Override for custom ranking logic.
 
@@ -626,6 +694,22 @@ class Game(ABC, DataClassJSONMixin):
         context: ActionContext | None = None,
     ) -> None:
         """Execute an action for a player, optionally with input value and context."""
+        if self._table is None:
+            self._execute_action(player, action_id, input_value, context)
+            return
+        # Player input is journaled so the table can be replayed
+        with self._table.journal.action_scope(
+            player.id, action_id, input_value, context
+        ):
+            self._execute_action(player, action_id, input_value, context)
+
+    def _execute_action(
+        self,
+        player: Player,
+        action_id: str,
+        input_value: str | None,
+        context: ActionContext | None,
+    ) -> None:
         action = self.find_action(player, action_id)
         if not action:
             return
@@ -676,6 +760,17 @@ class Game(ABC, DataClassJSONMixin):
         finally:
             # Clean up context
             self._action_context.pop(player.id, None)
+            self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        """Flag this game's table for the next checkpoint.
+
+        Action execution marks the table automatically. Call this after
+        changing state outside an action (e.g. from on_tick) to have the
+        change persisted before the next shutdown.
+        """
+        if self._table:
+            self._table.mark_dirty()
 
     def get_action_context(self, player: Player) -> ActionContext:
         """Get the current action context for a player (for use in handlers)."""
@@ -869,7 +964,7 @@ class Game(ABC, DataClassJSONMixin):
     def announce_turn(self, turn_sound: str = "game_pig/turn.ogg") -> None:
         """Announce the current player's turn with sound and message."""
         player = self.current_player
-        if not player:
+        if not player or self._headless:
             return
 
         # Play turn sound to the current player (if they have it enabled)
@@ -931,6 +1026,17 @@ class Game(ABC, DataClassJSONMixin):
             self.schedule_sound(sound, delay_ticks=current_tick)
             current_tick += delay_after
 
+    def get_sound_idle_ticks(self) -> float:
+        """Ticks before process_scheduled_sounds() plays the next sound."""
+        if not self.scheduled_sounds:
+            return math.inf
+        next_tick = min(scheduled[0] for scheduled in self.scheduled_sounds)
+        return max(0, next_tick - self.sound_scheduler_tick)
+
+    def skip_sound_ticks(self, ticks: int) -> None:
+        """Advance the sound schedule without any sound coming due."""
+        self.sound_scheduler_tick += ticks
+
     def clear_scheduled_sounds(self) -> None:
         """Clear all scheduled sounds."""
         self.scheduled_sounds.clear()
@@ -957,6 +1063,8 @@ class Game(ABC, DataClassJSONMixin):
         self, text: str, buffer: str = "misc", exclude: Player | None = None
     ) -> None:
         """Send a message to all players, optionally excluding one."""
+        if self._headless:
+            return
         for player in self.players:
             if player is exclude:
                 continue
@@ -972,6 +1080,8 @@ class Game(ABC, DataClassJSONMixin):
         **kwargs,
     ) -> None:
         """Send a localized message to all players (each in their own locale)."""
+        if self._headless:
+            return
         for player in self.players:
             if player is exclude:
                 continue
@@ -1000,6 +1110,8 @@ class Game(ABC, DataClassJSONMixin):
             buffer: Audio buffer for speech.
             **kwargs: Additional arguments passed to all speak_l calls.
         """
+        if self._headless:
+            return
         user = self.get_user(player)
         if user:
             user.speak_l(personal_message_id, buffer, **kwargs)
@@ -1030,6 +1142,8 @@ class Game(ABC, DataClassJSONMixin):
         self, name: str, volume: int = 100, pan: int = 0, pitch: int = 100
     ) -> None:
         """Play a sound for all players."""
+        if self._headless:
+            return
         for player in self.players:
             user = self.get_user(player)
             if user:
@@ -1044,6 +1158,8 @@ class Game(ABC, DataClassJSONMixin):
     def play_music(self, name: str, looping: bool = True) -> None:
         """Play music for all players and store as current."""
         self.current_music = name
+        if self._headless:
+            return
         for player in self.players:
             user = self.get_user(player)
             if user:
@@ -1052,6 +1168,8 @@ class Game(ABC, DataClassJSONMixin):
     def play_ambience(self, loop: str, intro: str = "", outro: str = "") -> None:
         """Play ambient sound for all players."""
         self.current_ambience = loop
+        if self._headless:
+            return
         for player in self.players:
             user = self.get_user(player)
             if user:
@@ -1060,6 +1178,8 @@ class Game(ABC, DataClassJSONMixin):
     def stop_ambience(self) -> None:
         """Stop ambient sound for all players."""
         self.current_ambience = ""
+        if self._headless:
+            return
         for player in self.players:
             user = self.get_user(player)
             if user:
@@ -1069,7 +1189,7 @@ class Game(ABC, DataClassJSONMixin):
 
     def rebuild_player_menu(self, player: Player) -> None:
         """Rebuild the turn menu for a player."""
-        if self._destroyed:
+        if self._destroyed or self._headless:
             return  # Don't rebuild menus after game is destroyed
         if self.status == "finished":
             return  # Don't rebuild turn menu after game has ended
@@ -1090,7 +1210,7 @@ class Game(ABC, DataClassJSONMixin):
 
     def rebuild_all_menus(self) -> None:
         """Rebuild menus for all players."""
-        if self._destroyed:
+        if self._destroyed or self._headless:
             return  # Don't rebuild menus after game is destroyed
         for player in self.players:
             self.rebuild_player_menu(player)
@@ -1099,7 +1219,7 @@ class Game(ABC, DataClassJSONMixin):
         self, player: Player, selection_id: str | None = None
     ) -> None:
         """Update the turn menu for a player, preserving focus position."""
-        if self._destroyed:
+        if self._destroyed or self._headless:
             return
         if self.status == "finished":
             return
@@ -1115,7 +1235,7 @@ class Game(ABC, DataClassJSONMixin):
 
     def update_all_menus(self) -> None:
         """Update menus for all players, preserving focus position."""
-        if self._destroyed:
+        if self._destroyed or self._headless:
             return
         for player in self.players:
             self.update_player_menu(player)
@@ -1299,6 +1419,7 @@ class Game(ABC, DataClassJSONMixin):
     def destroy(self) -> None:
         """Request destruction of this game/table."""
         self._destroyed = True
+        self._cancel_estimate()
         if self._table:
             self._table.destroy()
 
@@ -1483,6 +1604,7 @@ class Game(ABC, DataClassJSONMixin):
     # Action set creation
     # ==========================================================================
 
+    @template_action_set
     def create_lobby_action_set(self, player: Player) -> ActionSet:
         """Create the lobby action set for a player."""
         user = self.get_user(player)
@@ -1542,6 +1664,7 @@ class Game(ABC, DataClassJSONMixin):
         )
         return action_set
 
+    @template_action_set
     def create_estimate_action_set(self, player: Player) -> ActionSet:
         """Create the estimate duration action set for a player."""
         user = self.get_user(player)
@@ -1559,6 +1682,7 @@ class Game(ABC, DataClassJSONMixin):
         )
         return action_set
 
+    @template_action_set
     def create_standard_action_set(self, player: Player) -> ActionSet:
         """Create the standard action set (F5, save) for a player."""
         user = self.get_user(player)
@@ -1737,6 +1861,9 @@ class Game(ABC, DataClassJSONMixin):
                     self.broadcast_l(error, buffer="misc")
             return
 
+        # Warm the rating cache so predictions and post-game updates stay in memory
+        self._preload_ratings()
+
         # Announce game is starting
         self.broadcast_l("game-starting")
 
@@ -1773,7 +1900,9 @@ class Game(ABC, DataClassJSONMixin):
                     user.speak_l("no-bot-names-available")
                 return
 
-        bot_user = Bot(bot_name)
+        # Drawn from the game's generator so seeded runs and replays match
+        bot_id = uuid.UUID(int=self.rng.getrandbits(128), version=4)
+        bot_user = Bot(bot_name, uuid=str(bot_id))
         bot_player = self.create_player(bot_user.uuid, bot_name, is_bot=True)
         self.players.append(bot_player)
         self.attach_user(bot_player.id, bot_user)
@@ -1952,11 +2081,9 @@ class Game(ABC, DataClassJSONMixin):
             user.speak_l("predict-need-players")
             return
 
-        # Get ratings for all players
-        player_ratings = []
-        for p in human_players:
-            rating = rating_helper.get_rating(p.id)
-            player_ratings.append((p, rating))
+        # Get ratings for all players (served from the shared rating cache)
+        ratings = rating_helper.get_ratings([p.id for p in human_players])
+        player_ratings = [(p, ratings[p.id]) for p in human_players]
 
         # Sort by ordinal (conservative skill estimate) descending
         player_ratings.sort(key=lambda x: x[1].ordinal, reverse=True)
@@ -2016,6 +2143,7 @@ class Game(ABC, DataClassJSONMixin):
         self.attach_user(player.id, user)
         # Set up action sets for the new player
         self.setup_player_actions(player)
+        self.mark_dirty()
         return player
 
     def initialize_lobby(self, host_name: str, host_user: User) -> None:
@@ -2110,94 +2238,119 @@ class Game(ABC, DataClassJSONMixin):
     HUMAN_SPEED_MULTIPLIER = 2  # How much slower humans are than bots (override per game)
 
     def _action_estimate_duration(self, player: Player, action_id: str) -> None:
-        """Start duration estimation by spawning CLI simulation threads."""
+        """Start duration estimation on the shared simulation workers."""
         if self._estimate_running:
             user = self.get_user(player)
             if user:
                 user.speak_l("estimate-already-running")
             return
 
-        # Build the options string for CLI
-        options_args = []
-        if hasattr(self, "options"):
-            for field_name in self.options.__dataclass_fields__:
-                value = getattr(self.options, field_name)
-                options_args.extend(["-o", f"{field_name}={value}"])
+        # Options go to the workers as typed values
+        options = estimate_options(getattr(self, "options", None))
 
         # Determine number of bots (use current player count, minimum 2)
         num_bots = max(len([p for p in self.players if not p.is_spectator]), self.get_min_players())
 
-        # Build CLI command
-        cli_path = Path(__file__).parent.parent / "cli.py"
-        base_cmd = [
-            sys.executable, str(cli_path), "simulate",
-            self.get_type(),
-            "--bots", str(num_bots),
-            "--json", "--quiet"
-        ] + options_args
+        # Answer straight away if these settings were simulated before
+        db = self._table._db if self._table else None
+        if db:
+            cached = get_cached_estimate(db, type(self), options, num_bots)
+            if cached:
+                self._announce_estimate(cached)
+                return
+
+        request = SimulationRequest(
+            game_type=self.get_type(), num_bots=num_bots, options=options
+        )
+        futures = SimulationService.shared().submit_many(
+            [request] * self.NUM_ESTIMATE_SIMULATIONS
+        )
+        if futures is None:
+            # Too many estimates queued server-wide
+            self.broadcast_l("estimate-busy")
+            return
 
         # Reset results
         self._estimate_results = []
         self._estimate_errors = []
-        self._estimate_threads = []
-
-        # Spawn simulation threads
-        def run_simulation():
-            try:
-                result = subprocess.run(
-                    base_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=600,  # 10 minute timeout per simulation
-                )
-                if result.returncode == 0 and result.stdout:
-                    data = json_module.loads(result.stdout)
-                    if "ticks" in data and not data.get("timed_out", False):
-                        with self._estimate_lock:
-                            self._estimate_results.append(data["ticks"])
-                elif result.stderr:
-                    with self._estimate_lock:
-                        self._estimate_errors.append(result.stderr.strip()[:200])
-            except Exception as e:
-                with self._estimate_lock:
-                    self._estimate_errors.append(str(e)[:200])
-
-        for _ in range(self.NUM_ESTIMATE_SIMULATIONS):
-            thread = threading.Thread(target=run_simulation, daemon=True)
-            thread.start()
-            self._estimate_threads.append(thread)
-
-        if self._estimate_threads:
-            self._estimate_running = True
-            self.broadcast_l("estimate-computing")
-        else:
-            self.broadcast_l("estimate-error")
+        self._estimate_announced = 0
+        self._estimate_futures = futures
+        self._estimate_inputs = (options, num_bots)
+        for future in futures:
+            future.add_done_callback(self._on_estimate_done)
+
+        self._estimate_running = True
+        self.broadcast_l("estimate-computing")
+
+    def _on_estimate_done(self, future: Future) -> None:
+        """Collect a finished simulation (runs on the pool's thread)."""
+        if future.cancelled():
+            return
+        try:
+            data = future.result()
+        except Exception as e:
+            with self._estimate_lock:
+                self._estimate_errors.append(str(e)[:200])
+            return
+        if not data["timed_out"]:
+            with self._estimate_lock:
+                self._estimate_results.append(data["ticks"])
+
+    def _cancel_estimate(self) -> None:
+        """Drop queued simulations, e.g. when the game goes away."""
+        for future in self._estimate_futures:
+            future.cancel()
+        self._estimate_futures = []
+        self._estimate_running = False
 
     def check_estimate_completion(self) -> None:
-        """Check if duration estimation simulations have completed.
+        """Announce duration estimation results as simulations finish.
 
         Called automatically from on_tick().
         """
-        if not self._estimate_running or not self._estimate_threads:
+        if not self._estimate_running or not self._estimate_futures:
             return
 
-        # Check if all threads have completed
-        all_done = all(not t.is_alive() for t in self._estimate_threads)
-        if not all_done:
-            return
-
-        # Get results (already collected by threads)
+        all_done = all(f.done() for f in self._estimate_futures)
         with self._estimate_lock:
             tick_counts = list(self._estimate_results)
             errors = list(self._estimate_errors)
 
+        if not all_done:
+            # Announce the running estimate when new results arrive
+            if len(tick_counts) > self._estimate_announced:
+                self._estimate_announced = len(tick_counts)
+                avg_ticks = sum(tick_counts) / len(tick_counts)
+                self.broadcast_l(
+                    "estimate-progress",
+                    bot_time=self._format_duration(avg_ticks),
+                    done=len(tick_counts),
+                    total=len(self._estimate_futures),
+                )
+            return
+
         # Clean up
-        self._estimate_threads = []
+        options, num_bots = self._estimate_inputs
+        self._estimate_futures = []
         self._estimate_results = []
         self._estimate_errors = []
         self._estimate_running = False
 
-        # Calculate and announce result
+        if tick_counts:
+            if self._table and self._table._db:
+                save_cached_estimate(
+                    self._table._db, type(self), options, num_bots, tick_counts
+                )
+            self._announce_estimate(tick_counts)
+        else:
+            if errors:
+                # Show the first error for debugging
+                self.broadcast(f"Estimation failed: {errors[0][:200]}")
+            else:
+                self.broadcast_l("estimate-error")
+
+    def _announce_estimate(self, tick_counts: list[int]) -> None:
+        """Announce the estimated duration from simulated tick counts."""
         if tick_counts:
             # Calculate statistics
             avg_ticks = sum(tick_counts) / len(tick_counts)
@@ -2222,12 +2375,6 @@ class Game(ABC, DataClassJSONMixin):
                 outlier_info=outlier_info,
                 human_time=human_time,
             )
-        else:
-            if errors:
-                # Show the first error for debugging
-                self.broadcast(f"Estimation failed: {errors[0][:200]}")
-            else:
-                self.broadcast_l("estimate-error")
 
     def _calculate_std_dev(self, values: list[int], mean: float) -> float:
         """Calculate standard deviation of a list of values."""
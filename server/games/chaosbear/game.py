@@ -6,7 +6,6 @@ cards for special effects. The bear chases from behind, catching players
 who fall too far back. Last player standing (or furthest distance) wins!
 """
 
-import random
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -230,7 +229,7 @@ class ChaosBearGame(Game):
         self._announce_turn()
 
         # Jolt bots
-        BotHelper.jolt_bots(self, ticks=random.randint(30, 60))
+        BotHelper.jolt_bots(self, ticks=self.rng.randint(30, 60))
 
     def _announce_turn(self) -> None:
         """Announce whose turn it is."""
@@ -257,6 +256,15 @@ class ChaosBearGame(Game):
         # Process bot thinking
         BotHelper.on_tick(self)
 
+    def get_idle_ticks(self) -> float:
+        """Ticks that would only count down sounds and bot thinking."""
+        return min(self.get_sound_idle_ticks(), BotHelper.idle_ticks(self))
+
+    def skip_idle_ticks(self, ticks: int) -> None:
+        """Skip ticks that only count down sounds and bot thinking."""
+        self.skip_sound_ticks(ticks)
+        BotHelper.skip_ticks(self, ticks)
+
     def bot_think(self, player: ChaosBearPlayer) -> str | None:
         """Determine what action a bot should take."""
         if not player.alive:
@@ -301,7 +309,7 @@ class ChaosBearGame(Game):
         self.rebuild_all_menus()
 
         # Jolt bots
-        BotHelper.jolt_bots(self, ticks=random.randint(30, 60))
+        BotHelper.jolt_bots(self, ticks=self.rng.randint(30, 60))
 
     def _bear_turn(self) -> None:
         """The bear takes its turn."""
@@ -310,18 +318,18 @@ class ChaosBearGame(Game):
             if player.alive and not player.is_spectator:
                 if player.position - self.bear_position <= 10:
                     self.play_sound(
-                        f"game_chaosbear/bearwarn{random.randint(1, 2)}.ogg"
+                        f"game_chaosbear/bearwarn{self.rng.randint(1, 2)}.ogg"
                     )
                     break
 
         # Bear dice roll sounds (scheduled for timing)
         self.schedule_sound("game_chaosbear/beardice0.ogg", delay_ticks=10)
         self.schedule_sound(
-            f"game_chaosbear/beardice{random.randint(1, 3)}.ogg", delay_ticks=18
+            f"game_chaosbear/beardice{self.rng.randint(1, 3)}.ogg", delay_ticks=18
         )
 
         # Bear rolls 1-3 + energy
-        bear_die = random.randint(1, 3)
+        bear_die = self.rng.randint(1, 3)
         move_distance = bear_die + self.bear_energy
 
         self.broadcast_l(
@@ -336,7 +344,7 @@ class ChaosBearGame(Game):
             self.bear_energy += 1
             self.broadcast_l("chaosbear-bear-energy-up", energy=self.bear_energy)
             self.schedule_sound(
-                f"game_chaosbear/energyup{random.randint(1, 2)}.ogg", delay_ticks=25
+                f"game_chaosbear/energyup{self.rng.randint(1, 2)}.ogg", delay_ticks=25
             )
             # Don't count the extra energy toward movement this turn
             move_distance -= 1
@@ -348,7 +356,7 @@ class ChaosBearGame(Game):
         step_delay = 35
         for i in range(bear_die + bonus_steps):
             self.schedule_sound(
-                f"game_chaosbear/bearstep{random.randint(1, 5)}.ogg",
+                f"game_chaosbear/bearstep{self.rng.randint(1, 5)}.ogg",
                 delay_ticks=step_delay + i * 4,
             )
 
@@ -364,13 +372,13 @@ class ChaosBearGame(Game):
                 if self.bear_position >= player.position:
                     player.alive = False
                     self.schedule_sound(
-                        f"game_chaosbear/playerdie{random.randint(1, 2)}.ogg",
+                        f"game_chaosbear/playerdie{self.rng.randint(1, 2)}.ogg",
                         delay_ticks=catch_delay,
                     )
                     self.broadcast_l("chaosbear-player-caught", player=player.name)
                     kills += 1
                     self.schedule_sound(
-                        f"game_chaosbear/energydown{random.randint(1, 3)}.ogg",
+                        f"game_chaosbear/energydown{self.rng.randint(1, 3)}.ogg",
                         delay_ticks=catch_delay + 40,
                     )
                     catch_delay += 50
@@ -491,7 +499,7 @@ class ChaosBearGame(Game):
 
         self.play_sound("game_pig/roll.ogg")
 
-        roll = random.randint(1, 6)
+        roll = self.rng.randint(1, 6)
         player.position += roll
 
         self.broadcast_l("chaosbear-roll", player=player.name, roll=roll)
@@ -499,7 +507,7 @@ class ChaosBearGame(Game):
         # Schedule player step sounds
         for i in range(roll):
             self.schedule_sound(
-                f"game_chaosbear/playerstep{random.randint(1, 5)}.ogg",
+                f"game_chaosbear/playerstep{self.rng.randint(1, 5)}.ogg",
                 delay_ticks=6 + i * 4,
             )
 
@@ -518,16 +526,16 @@ class ChaosBearGame(Game):
         if player.position % 5 != 0 or player.position == 0:
             return
 
-        self.play_sound(f"game_chaosbear/draw{random.randint(1, 2)}.ogg")
+        self.play_sound(f"game_chaosbear/draw{self.rng.randint(1, 2)}.ogg")
         self.broadcast_l("chaosbear-draws-card", player=player.name)
 
-        card = random.randint(0, 5)
+        card = self.rng.randint(0, 5)
 
         if card == 0:
             # Impulsion - forward 3
             player.position += 3
             self.schedule_sound(
-                f"game_chaosbear/impulsion{random.randint(1, 2)}.ogg", delay_ticks=4
+                f"game_chaosbear/impulsion{self.rng.randint(1, 2)}.ogg", delay_ticks=4
             )
             self.broadcast_l(
                 "chaosbear-card-impulsion", player=player.name, position=player.position
@@ -536,7 +544,7 @@ class ChaosBearGame(Game):
             # Super impulsion - forward 5
             player.position += 5
             self.schedule_sound(
-                f"game_chaosbear/impulsion{random.randint(1, 2)}.ogg", delay_ticks=4
+                f"game_chaosbear/impulsion{self.rng.randint(1, 2)}.ogg", delay_ticks=4
             )
             self.broadcast_l(
                 "chaosbear-card-super-impulsion",
@@ -547,21 +555,21 @@ class ChaosBearGame(Game):
             # Tiredness - bear energy -1
             self.bear_energy = max(1, self.bear_energy - 1)
             self.schedule_sound(
-                f"game_chaosbear/tiredness{random.randint(1, 2)}.ogg", delay_ticks=4
+                f"game_chaosbear/tiredness{self.rng.randint(1, 2)}.ogg", delay_ticks=4
             )
             self.broadcast_l("chaosbear-card-tiredness", energy=self.bear_energy)
             self.schedule_sound(
-                f"game_chaosbear/energydown{random.randint(1, 3)}.ogg", delay_ticks=24
+                f"game_chaosbear/energydown{self.rng.randint(1, 3)}.ogg", delay_ticks=24
             )
         elif card == 3:
             # Hunger - bear energy +1
             self.bear_energy += 1
             self.schedule_sound(
-                f"game_chaosbear/hunger{random.randint(1, 2)}.ogg", delay_ticks=4
+                f"game_chaosbear/hunger{self.rng.randint(1, 2)}.ogg", delay_ticks=4
             )
             self.broadcast_l("chaosbear-card-hunger", energy=self.bear_energy)
             self.schedule_sound(
-                f"game_chaosbear/energyup{random.randint(1, 2)}.ogg", delay_ticks=14
+                f"game_chaosbear/energyup{self.rng.randint(1, 2)}.ogg", delay_ticks=14
             )
         elif card == 4:
             # Backward push - back 3
@@ -573,8 +581,8 @@ class ChaosBearGame(Game):
         else:
             # Random gift - forward/back 1-6
             self.broadcast_l("chaosbear-card-random-gift")
-            amount = random.randint(1, 6)
-            if random.random() < 0.5:
+            amount = self.rng.randint(1, 6)
+            if self.rng.random() < 0.5:
                 player.position = max(0, player.position - amount)
                 self.schedule_sound("game_chaosbear/backpush.ogg", delay_ticks=4)
                 self.broadcast_l(
@@ -583,7 +591,7 @@ class ChaosBearGame(Game):
             else:
                 player.position += amount
                 self.schedule_sound(
-                    f"game_chaosbear/impulsion{random.randint(1, 2)}.ogg", delay_ticks=4
+                    f"game_chaosbear/impulsion{self.rng.randint(1, 2)}.ogg", delay_ticks=4
                 )
                 self.broadcast_l(
                     "chaosbear-gift-forward",
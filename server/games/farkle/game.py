@@ -7,7 +7,6 @@ Push your luck by rolling again or bank your points.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-import random
 
 from ..base import Game, Player, GameOptions
 from ..registry import register_game
@@ -17,6 +16,24 @@ from ...game_utils.game_result import GameResult, PlayerResult
 from ...game_utils.options import IntOption, option_field
 from ...messages.localization import Localization
 from ...ui.keybinds import KeybindState
+from .scoring import (
+    COMBO_DOUBLE_TRIPLETS,
+    COMBO_FIVE_OF_KIND,
+    COMBO_FOUR_KIND_PLUS_PAIR,
+    COMBO_FOUR_OF_KIND,
+    COMBO_SINGLE_1,
+    COMBO_SINGLE_5,
+    COMBO_SIX_OF_KIND,
+    COMBO_STRAIGHT,
+    COMBO_THREE_OF_KIND,
+    COMBO_THREE_PAIRS,
+    combo_dice,
+    farkle_chance,
+    get_available_combinations,
+    get_combination_points,
+    has_scoring_dice,
+)
+from .policy import load_policy
 
 
 @dataclass
@@ -62,18 +79,6 @@ class FarkleOptions(GameOptions):
     )
 
 
-# Scoring combination types
-COMBO_SINGLE_1 = "single_1"
-COMBO_SINGLE_5 = "single_5"
-COMBO_THREE_OF_KIND = "three_of_kind"
-COMBO_FOUR_OF_KIND = "four_of_kind"
-COMBO_FIVE_OF_KIND = "five_of_kind"
-COMBO_SIX_OF_KIND = "six_of_kind"
-COMBO_STRAIGHT = "straight"
-COMBO_THREE_PAIRS = "three_pairs"
-COMBO_DOUBLE_TRIPLETS = "double_triplets"
-COMBO_FOUR_KIND_PLUS_PAIR = "four_kind_pair"
-
 # Combo sounds
 COMBO_SOUNDS = {
     COMBO_SINGLE_1: "game_farkle/point10.ogg",
@@ -89,182 +94,6 @@ COMBO_SOUNDS = {
 }
 
 
-def count_dice(dice: list[int]) -> dict[int, int]:
-    """Count occurrences of each die value (1-6)."""
-    counts = {i: 0 for i in range(1, 7)}
-    for die in dice:
-        counts[die] += 1
-    return counts
-
-
-def has_combination(dice: list[int], combo_type: str, number: int = 0) -> bool:
-    """Check if dice contain a specific combination."""
-    counts = count_dice(dice)
-
-    if combo_type == COMBO_SINGLE_1:
-        return counts[1] >= 1
-    elif combo_type == COMBO_SINGLE_5:
-        return counts[5] >= 1
-    elif combo_type == COMBO_THREE_OF_KIND:
-        return counts[number] >= 3
-    elif combo_type == COMBO_FOUR_OF_KIND:
-        return counts[number] >= 4
-    elif combo_type == COMBO_FIVE_OF_KIND:
-        return counts[number] >= 5
-    elif combo_type == COMBO_SIX_OF_KIND:
-        return counts[number] == 6
-    elif combo_type == COMBO_STRAIGHT:
-        if len(dice) != 6:
-            return False
-        return all(counts[i] == 1 for i in range(1, 7))
-    elif combo_type == COMBO_THREE_PAIRS:
-        if len(dice) != 6:
-            return False
-        pairs = sum(1 for i in range(1, 7) if counts[i] == 2)
-        return pairs == 3
-    elif combo_type == COMBO_DOUBLE_TRIPLETS:
-        if len(dice) != 6:
-            return False
-        triplets = sum(1 for i in range(1, 7) if counts[i] == 3)
-        return triplets == 2
-    elif combo_type == COMBO_FOUR_KIND_PLUS_PAIR:
-        if len(dice) != 6:
-            return False
-        has_quad = any(counts[i] == 4 for i in range(1, 7))
-        has_pair = any(counts[i] == 2 for i in range(1, 7))
-        return has_quad and has_pair
-
-    return False
-
-
-def get_combination_points(combo_type: str, number: int = 0) -> int:
-    """Get point value for a combination."""
-    if combo_type == COMBO_SINGLE_1:
-        return 100
-    elif combo_type == COMBO_SINGLE_5:
-        return 50
-    elif combo_type == COMBO_THREE_OF_KIND:
-        return 300 if number == 1 else number * 100
-    elif combo_type == COMBO_FOUR_OF_KIND:
-        return 1000
-    elif combo_type == COMBO_FIVE_OF_KIND:
-        return 2000
-    elif combo_type == COMBO_SIX_OF_KIND:
-        return 3000
-    elif combo_type == COMBO_STRAIGHT:
-        return 1500
-    elif combo_type == COMBO_THREE_PAIRS:
-        return 1500
-    elif combo_type == COMBO_DOUBLE_TRIPLETS:
-        return 2500
-    elif combo_type == COMBO_FOUR_KIND_PLUS_PAIR:
-        return 1500
-    return 0
-
-
-def has_scoring_dice(dice: list[int]) -> bool:
-    """Check if dice contain any scoring combinations (for farkle detection)."""
-    if not dice:
-        return False
-
-    counts = count_dice(dice)
-
-    # Single 1s or 5s
-    if counts[1] > 0 or counts[5] > 0:
-        return True
-
-    # Three or more of a kind
-    if any(counts[i] >= 3 for i in range(1, 7)):
-        return True
-
-    # Straight (1-2-3-4-5-6)
-    if len(dice) == 6 and all(counts[i] == 1 for i in range(1, 7)):
-        return True
-
-    # Three pairs
-    if len(dice) == 6:
-        pairs = sum(1 for i in range(1, 7) if counts[i] == 2)
-        if pairs == 3:
-            return True
-
-    # Double triplets
-    if len(dice) == 6:
-        triplets = sum(1 for i in range(1, 7) if counts[i] == 3)
-        if triplets == 2:
-            return True
-
-    return False
-
-
-def get_available_combinations(dice: list[int]) -> list[tuple[str, int, int]]:
-    """Get all available scoring combinations as (combo_type, number, points) tuples."""
-    combinations = []
-
-    if not dice:
-        return combinations
-
-    counts = count_dice(dice)
-
-    # Six of a kind (check first, highest points)
-    for num in range(1, 7):
-        if has_combination(dice, COMBO_SIX_OF_KIND, num):
-            points = get_combination_points(COMBO_SIX_OF_KIND, num)
-            combinations.append((COMBO_SIX_OF_KIND, num, points))
-
-    # Five of a kind
-    for num in range(1, 7):
-        if has_combination(dice, COMBO_FIVE_OF_KIND, num):
-            points = get_combination_points(COMBO_FIVE_OF_KIND, num)
-            combinations.append((COMBO_FIVE_OF_KIND, num, points))
-
-    # Four of a kind
-    for num in range(1, 7):
-        if has_combination(dice, COMBO_FOUR_OF_KIND, num):
-            points = get_combination_points(COMBO_FOUR_OF_KIND, num)
-            combinations.append((COMBO_FOUR_OF_KIND, num, points))
-
-    # Double triplets (higher priority than three pairs)
-    if has_combination(dice, COMBO_DOUBLE_TRIPLETS):
-        points = get_combination_points(COMBO_DOUBLE_TRIPLETS)
-        combinations.append((COMBO_DOUBLE_TRIPLETS, 0, points))
-
-    # Straight (1-2-3-4-5-6)
-    if has_combination(dice, COMBO_STRAIGHT):
-        points = get_combination_points(COMBO_STRAIGHT)
-        combinations.append((COMBO_STRAIGHT, 0, points))
-
-    # Four of a kind plus a pair
-    if has_combination(dice, COMBO_FOUR_KIND_PLUS_PAIR):
-        points = get_combination_points(COMBO_FOUR_KIND_PLUS_PAIR)
-        combinations.append((COMBO_FOUR_KIND_PLUS_PAIR, 0, points))
-
-    # Three pairs
-    if has_combination(dice, COMBO_THREE_PAIRS):
-        points = get_combination_points(COMBO_THREE_PAIRS)
-        combinations.append((COMBO_THREE_PAIRS, 0, points))
-
-    # Three of a kind
-    for num in range(1, 7):
-        if has_combination(dice, COMBO_THREE_OF_KIND, num):
-            points = get_combination_points(COMBO_THREE_OF_KIND, num)
-            combinations.append((COMBO_THREE_OF_KIND, num, points))
-
-    # Single 1s (always available if there's at least one 1)
-    if counts[1] > 0:
-        points = get_combination_points(COMBO_SINGLE_1)
-        combinations.append((COMBO_SINGLE_1, 1, points))
-
-    # Single 5s
-    if counts[5] > 0:
-        points = get_combination_points(COMBO_SINGLE_5)
-        combinations.append((COMBO_SINGLE_5, 5, points))
-
-    # Sort by points descending
-    combinations.sort(key=lambda x: x[2], reverse=True)
-
-    return combinations
-
-
 @dataclass
 @register_game
 class FarkleGame(Game):
@@ -628,11 +457,11 @@ class FarkleGame(Game):
         self.play_sound("game_pig/roll.ogg")
 
         # Jolt bot to pause before next action
-        BotHelper.jolt_bot(player, ticks=random.randint(10, 20))
+        BotHelper.jolt_bot(player, ticks=self.rng.randint(10, 20))
 
         # Roll the dice
         farkle_player.current_roll = sorted(
-            [random.randint(1, 6) for _ in range(num_dice)]
+            [self.rng.randint(1, 6) for _ in range(num_dice)]
         )
 
         # Announce the roll
@@ -665,7 +494,7 @@ class FarkleGame(Game):
         farkle_player: FarklePlayer = player  # type: ignore
 
         # Jolt bot to pause before next action
-        BotHelper.jolt_bot(player, ticks=random.randint(8, 12))
+        BotHelper.jolt_bot(player, ticks=self.rng.randint(8, 12))
 
         # Parse combo type and number from action_id (e.g., "score_three_of_kind_4")
         parts = action_id.split("_", 1)[1]  # Remove "score_" prefix
@@ -755,27 +584,7 @@ class FarkleGame(Game):
         self, dice: list[int], combo_type: str, number: int
     ) -> list[int]:
         """Return dice for the combo so they can be removed."""
-        counts = count_dice(dice)
-        if combo_type == COMBO_SINGLE_1 and counts[1] >= 1:
-            return [1]
-        if combo_type == COMBO_SINGLE_5 and counts[5] >= 1:
-            return [5]
-        if combo_type == COMBO_THREE_OF_KIND and counts[number] >= 3:
-            return [number] * 3
-        if combo_type == COMBO_FOUR_OF_KIND and counts[number] >= 4:
-            return [number] * 4
-        if combo_type == COMBO_FIVE_OF_KIND and counts[number] >= 5:
-            return [number] * 5
-        if combo_type == COMBO_SIX_OF_KIND and counts[number] >= 6:
-            return [number] * 6
-        if combo_type in (
-            COMBO_STRAIGHT,
-            COMBO_THREE_PAIRS,
-            COMBO_DOUBLE_TRIPLETS,
-            COMBO_FOUR_KIND_PLUS_PAIR,
-        ):
-            return list(dice)
-        return []
+        return combo_dice(dice, combo_type, number)
 
     def _action_bank(self, player: Player, action_id: str) -> None:
         """Handle bank action."""
@@ -793,7 +602,7 @@ class FarkleGame(Game):
         # Sync to TeamManager for score actions
         self._team_manager.add_to_team_score(player.name, farkle_player.turn_score)
 
-        self.play_sound(f"game_farkle/bank{random.randint(1, 3)}.ogg")
+        self.play_sound(f"game_farkle/bank{self.rng.randint(1, 3)}.ogg")
 
         self.broadcast_l(
             "farkle-banks",
@@ -817,17 +626,29 @@ class FarkleGame(Game):
         current = self.current_player
         if current:
             farkle_current: FarklePlayer = current  # type: ignore
-            self.status_box(
-                player,
-                [
+            lines = [
+                Localization.get(
+                    "en",
+                    "farkle-turn-score",
+                    player=current.name,
+                    points=farkle_current.turn_score,
+                )
+            ]
+            can_roll = (
+                len(farkle_current.current_roll) == 0
+                or farkle_current.has_taken_combo
+            )
+            if can_roll:
+                num_dice = self._get_roll_dice_count(farkle_current)
+                lines.append(
                     Localization.get(
                         "en",
-                        "farkle-turn-score",
-                        player=current.name,
-                        points=farkle_current.turn_score,
+                        "farkle-farkle-chance",
+                        count=num_dice,
+                        percent=f"{farkle_chance(num_dice) * 100:.1f}",
                     )
-                ],
-            )
+                )
+            self.status_box(player, lines)
         else:
             self.status_box(
                 player, [Localization.get("en", "farkle-no-turn")]
@@ -959,7 +780,7 @@ class FarkleGame(Game):
         while True:
             rolls = {}
             for player in contenders:
-                roll = random.randint(1, 6)
+                roll = self.rng.randint(1, 6)
                 rolls[player.id] = roll
                 self.broadcast_l("farkle-start-roll", player=player.name, roll=roll)
 
@@ -981,61 +802,52 @@ class FarkleGame(Game):
 
         BotHelper.on_tick(self)
 
-    def bot_think(self, player: FarklePlayer) -> str | None:
-        """Bot AI decision making."""
-        turn_set = self.get_action_set(player, "turn")
-        if not turn_set:
-            return None
+    def get_idle_ticks(self) -> float:
+        """Ticks that would only count down sounds and bot thinking."""
+        return min(self.get_sound_idle_ticks(), BotHelper.idle_ticks(self))
 
-        # Resolve actions to get enabled state
-        resolved = turn_set.resolve_actions(self, player)
+    def skip_idle_ticks(self, ticks: int) -> None:
+        """Skip ticks that only count down sounds and bot thinking."""
+        self.skip_sound_ticks(ticks)
+        BotHelper.skip_ticks(self, ticks)
 
-        # Take highest-value scoring combo first
-        for ra in resolved:
-            if ra.enabled and ra.action.id.startswith("score_"):
-                return ra.action.id
+    def bot_think(self, player: FarklePlayer) -> str | None:
+        """Bot AI decision making, from the expected-value policy tables."""
+        if not self.get_action_set(player, "turn"):
+            return None
 
-        # Check roll/bank enabled state
+        can_take = (
+            bool(player.current_roll) and self._is_scoring_action_enabled(player) is None
+        )
         roll_enabled = self._is_roll_enabled(player) is None
         bank_enabled = self._is_bank_enabled(player) is None
+        if not (can_take or roll_enabled or bank_enabled):
+            return None
 
+        move = load_policy().best_move(
+            player.current_roll,
+            player.turn_score,
+            player.has_taken_combo,
+            goal=self._bot_turn_goal(player),
+        )
+        if isinstance(move, tuple):
+            combo_type, number = move
+            return f"score_{combo_type}_{number}"
+        if move == "bank" and bank_enabled:
+            return "bank"
         if roll_enabled:
-            # Banking decision based on dice remaining and points
-            dice_remaining = 6 - len(player.banked_dice)
-            if dice_remaining == 0:
-                dice_remaining = 6  # Hot dice
-
-            score_to_beat = self.final_round_score
-            potential_total = player.score + player.turn_score
-
-            # If a final round is active, must beat the current leader
-            if score_to_beat is not None and potential_total <= score_to_beat:
-                return "roll"
-
-            # Banking decision based on turn score and dice remaining
-            bank_threshold = max(350, self.options.min_bank_points)
-            if player.turn_score >= bank_threshold:
-                # Bank probability increases as fewer dice remain
-                bank_probabilities = {
-                    6: 0.40,
-                    5: 0.50,
-                    4: 0.55,
-                    3: 0.65,
-                    2: 0.70,
-                    1: 0.75,
-                }
-                bank_prob = bank_probabilities.get(dice_remaining, 0.50)
-
-                if random.random() < bank_prob:
-                    if bank_enabled:
-                        return "bank"
-
             return "roll"
+        return "bank" if bank_enabled else None
 
-        if bank_enabled:
-            return "bank"
-
-        return None
+    def _bot_turn_goal(self, player: FarklePlayer) -> int:
+        """Turn score below which banking doesn't help the bot."""
+        goal = 0
+        if not player.has_banked:
+            goal = max(1, self.options.min_bank_points)
+        if self.final_round_score is not None:
+            # Must beat the current leader before the final round ends
+            goal = max(goal, self.final_round_score - player.score + 1)
+        return goal
 
     def _on_turn_end(self) -> None:
         """Handle end of a player's turn."""
@@ -1118,5 +930,5 @@ class FarkleGame(Game):
 
     def end_turn(self, jolt_min: int = 20, jolt_max: int = 30) -> None:
         """End the current player's turn."""
-        BotHelper.jolt_bots(self, ticks=random.randint(jolt_min, jolt_max))
+        BotHelper.jolt_bots(self, ticks=self.rng.randint(jolt_min, jolt_max))
         self._on_turn_end()
@@ -0,0 +1,280 @@
+"""
+Expected-value policy for the Farkle bot.
+
+A Farkle turn is a small Markov decision process. Between rolls the state is
+the turn score and how many dice would be rolled next; everything the bot
+has to decide (which combinations to take, whether to roll or bank) only
+compares the values of such states. Two tables hold those values:
+
+- Roll values: the expected points banked by rolling n dice with a given
+  turn score at stake and playing the rest of the turn to maximize points.
+- Reach chances: the chance of adding at least a given number of points
+  this turn before farkling, when the turn has to reach a score (getting on
+  the board, or beating the leader in the final round).
+
+Every combination scores a multiple of POINT_UNIT and adds to the turn
+score, so the tables are filled by backward induction from the largest
+turn score (value iteration over an acyclic state space). They are
+generated offline with `python -m server.cli policy farkle` and shipped in
+policy.bin, so the server only reads them:
+
+    MAGIC (4 bytes) | version (1 byte) | unit, max turn units, max need
+    units (3 x uint16) | roll values (6 x max turn units x float32) |
+    reach chances (6 x max need units x float32)
+
+All numbers are little-endian.
+"""
+
+import functools
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+from ...game_utils.dice import roll_outcomes
+from .scoring import combo_dice, get_available_combinations
+
+POLICY_PATH = Path(__file__).parent / "policy.bin"
+POLICY_MAGIC = b"FKPL"
+POLICY_VERSION = 1
+
+# Every combination is worth a multiple of this
+POINT_UNIT = 50
+# Turn scores from here on always bank (30,000 points)
+MAX_TURN_UNITS = 600
+# Larger needs use the chance for the largest one (10,000 points)
+MAX_NEED_UNITS = 200
+NUM_DICE = 6
+
+_HEADER = struct.Struct("<4sBHHH")
+
+
+class FarklePolicyError(ValueError):
+    """Raised when a policy file cannot be read."""
+
+
+@functools.cache
+def keep_options(roll: tuple[int, ...]) -> tuple[tuple[int, int], ...]:
+    """
+    Ways to score a roll, as (dice left, points) pairs.
+
+    Covers every sequence of one or more combinations taken from the roll,
+    keeping only the most points for each number of dice left (what
+    happens next depends only on that number). Empty for a farkle.
+    """
+    best: dict[int, int] = {}
+    seen: set[tuple[tuple[int, ...], int]] = set()
+
+    def take(dice: tuple[int, ...], points: int) -> None:
+        for combo_type, number, combo_points in get_available_combinations(list(dice)):
+            rest = list(dice)
+            for die in combo_dice(rest, combo_type, number):
+                rest.remove(die)
+            state = (tuple(rest), points + combo_points)
+            if state in seen:
+                continue
+            seen.add(state)
+            if state[1] > best.get(len(rest), 0):
+                best[len(rest)] = state[1]
+            take(*state)
+
+    take(roll, 0)
+    return tuple(sorted(best.items()))
+
+
+def _transitions(num_dice: int) -> list[tuple[float, tuple[tuple[int, int], ...]]]:
+    """
+    Scoring outcomes of rolling num_dice dice, as (probability, choices).
+
+    Choices are (dice to roll next, points in units) pairs; hot dice roll
+    all six again. Rolls with the same choices are merged and farkles
+    (which score nothing) are left out.
+    """
+    merged: dict[tuple[tuple[int, int], ...], float] = {}
+    for probability, roll in roll_outcomes(num_dice):
+        choices = tuple(
+            (left or NUM_DICE, points // POINT_UNIT)
+            for left, points in keep_options(roll)
+        )
+        if choices:
+            merged[choices] = merged.get(choices, 0.0) + probability
+    return [(probability, choices) for choices, probability in merged.items()]
+
+
+def build_tables() -> tuple[list[array], list[array]]:
+    """
+    Compute roll values and reach chances by backward induction.
+
+    Returns (roll_values, reach) indexed by [num_dice][units], with index 0
+    of each list unused: roll_values[n][t] is the expected points banked
+    by rolling n dice at a turn score of t units, and reach[n][k] the
+    chance of adding at least k units by rolling n dice.
+    """
+    transitions = [[]] + [_transitions(n) for n in range(1, NUM_DICE + 1)]
+    roll_values = [array("d", [0.0]) * MAX_TURN_UNITS for _ in range(NUM_DICE + 1)]
+    reach = [array("d", [0.0]) * MAX_NEED_UNITS for _ in range(NUM_DICE + 1)]
+
+    def stop_value(units: int, num_dice: int) -> float:
+        # Bank, or roll on if that is expected to bank more
+        if units >= MAX_TURN_UNITS:
+            return units * POINT_UNIT
+        return max(units * POINT_UNIT, roll_values[num_dice][units])
+
+    for units in reversed(range(MAX_TURN_UNITS)):
+        for n in range(1, NUM_DICE + 1):
+            roll_values[n][units] = sum(
+                probability * max(stop_value(units + gain, left) for left, gain in choices)
+                for probability, choices in transitions[n]
+            )
+
+    def chance(need: int, num_dice: int) -> float:
+        return 1.0 if need <= 0 else reach[num_dice][need]
+
+    for need in range(MAX_NEED_UNITS):
+        for n in range(1, NUM_DICE + 1):
+            reach[n][need] = 1.0 if need == 0 else sum(
+                probability * max(chance(need - gain, left) for left, gain in choices)
+                for probability, choices in transitions[n]
+            )
+
+    return roll_values, reach
+
+
+def encode_policy(roll_values: list[array], reach: list[array]) -> bytes:
+    """Pack the tables into the policy file format."""
+    parts = [
+        _HEADER.pack(
+            POLICY_MAGIC, POLICY_VERSION, POINT_UNIT, MAX_TURN_UNITS, MAX_NEED_UNITS
+        )
+    ]
+    for table in (roll_values, reach):
+        for n in range(1, NUM_DICE + 1):
+            packed = array("f", table[n])
+            if sys.byteorder != "little":
+                packed.byteswap()
+            parts.append(packed.tobytes())
+    return b"".join(parts)
+
+
+class FarklePolicy:
+    """
+    Table-driven decisions for the Farkle bot.
+
+    Every decision compares the values of the states it could lead to, and
+    each value is one table lookup.
+    """
+
+    def __init__(self, data: bytes):
+        if len(data) < _HEADER.size:
+            raise FarklePolicyError("Farkle policy file is truncated")
+        magic, version, unit, turn_units, need_units = _HEADER.unpack_from(data)
+        if magic != POLICY_MAGIC or version != POLICY_VERSION:
+            raise FarklePolicyError("Not a Farkle policy file (or an old version)")
+        if unit != POINT_UNIT:
+            raise FarklePolicyError(f"Farkle policy uses {unit}-point units")
+        expected = _HEADER.size + 4 * NUM_DICE * (turn_units + need_units)
+        if len(data) != expected:
+            raise FarklePolicyError("Farkle policy file is truncated")
+        values = array("f")
+        values.frombytes(data[_HEADER.size :])
+        if sys.byteorder != "little":
+            values.byteswap()
+
+        self.max_turn_units = turn_units
+        self.max_need_units = need_units
+        reach_start = NUM_DICE * turn_units
+        self._roll_values = [array("f")] + [
+            values[(n - 1) * turn_units : n * turn_units] for n in range(1, NUM_DICE + 1)
+        ]
+        self._reach = [array("f")] + [
+            values[reach_start + (n - 1) * need_units : reach_start + n * need_units]
+            for n in range(1, NUM_DICE + 1)
+        ]
+
+    def roll_value(self, turn_score: int, num_dice: int) -> float:
+        """Expected points banked by rolling num_dice dice now (0 means hot dice)."""
+        units = turn_score // POINT_UNIT
+        if units >= self.max_turn_units:
+            return 0.0
+        return self._roll_values[num_dice or NUM_DICE][units]
+
+    def should_roll(self, turn_score: int, num_dice: int) -> bool:
+        """Whether rolling is expected to bank more than banking turn_score now."""
+        return self.roll_value(turn_score, num_dice) > turn_score
+
+    def reach_chance(self, need: int, num_dice: int) -> float:
+        """Chance of adding at least need points this turn, rolling num_dice next."""
+        if need <= 0:
+            return 1.0
+        units = min(-(-need // POINT_UNIT), self.max_need_units - 1)
+        return self._reach[num_dice or NUM_DICE][units]
+
+    def _stop(self, turn_score: int, num_dice: int, goal: int) -> tuple[tuple, str]:
+        """Value and action for stopping to take combinations: roll or bank."""
+        if turn_score < goal:
+            # Banking is useless (or not allowed) until the goal is reached
+            chance = self.reach_chance(goal - turn_score, num_dice)
+            return (chance, self.roll_value(turn_score, num_dice)), "roll"
+        roll = self.roll_value(turn_score, num_dice)
+        if roll > turn_score:
+            return (1.0, roll), "roll"
+        return (1.0, float(turn_score)), "bank"
+
+    def best_move(
+        self, roll: list[int], turn_score: int, has_taken: bool, goal: int = 0
+    ) -> str | tuple[str, int]:
+        """
+        Choose the bot's next move.
+
+        Args:
+            roll: Dice still available to take (empty before the first roll
+                and after hot dice).
+            turn_score: Points taken so far this turn.
+            has_taken: Whether a combination was taken since the last roll.
+            goal: Turn score below which banking does not help (the minimum
+                to get on the board, or what it takes to beat the leader).
+
+        Returns:
+            "roll", "bank", or the (combo_type, number) to take. Moves are
+            ranked by the chance of reaching the goal, then by expected
+            points.
+        """
+        if not roll:
+            if turn_score <= 0:
+                return "roll"
+            return self._stop(turn_score, 0, goal)[1]
+
+        memo: dict[tuple[tuple[int, ...], int], tuple] = {}
+
+        def value(dice: list[int], score: int, taken: bool) -> tuple[tuple, object]:
+            key = (tuple(dice), score)
+            if taken and key in memo:
+                return memo[key]
+            best: tuple[tuple, object] | None = None
+            if taken:
+                best = self._stop(score, len(dice), goal)
+            for combo_type, number, points in get_available_combinations(dice):
+                rest = list(dice)
+                for die in combo_dice(rest, combo_type, number):
+                    rest.remove(die)
+                result = value(rest, score + points, True)[0]
+                if best is None or result > best[0]:
+                    best = (result, (combo_type, number))
+            if best is None:
+                # A farkle; the game ends the turn before the bot is asked
+                best = ((0.0, 0.0), "roll")
+            if taken:
+                memo[key] = best
+            return best
+
+        return value(list(roll), turn_score, has_taken)[1]
+
+
+@functools.cache
+def load_policy(path: Path = POLICY_PATH) -> FarklePolicy:
+    """Load the shipped policy, building it in-process if the file is missing."""
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        data = encode_policy(*build_tables())
+    return FarklePolicy(data)
@@ -0,0 +1,216 @@
+"""
+Scoring combinations for Farkle.
+
+Combinations depend only on the face counts of a roll, so every roll of up
+to six dice is scanned once at import time and later looked up.
+"""
+
+from array import array
+from itertools import combinations_with_replacement
+
+from ...game_utils.dice import outcome_chance
+
+
+# Scoring combination types
+COMBO_SINGLE_1 = "single_1"
+COMBO_SINGLE_5 = "single_5"
+COMBO_THREE_OF_KIND = "three_of_kind"
+COMBO_FOUR_OF_KIND = "four_of_kind"
+COMBO_FIVE_OF_KIND = "five_of_kind"
+COMBO_SIX_OF_KIND = "six_of_kind"
+COMBO_STRAIGHT = "straight"
+COMBO_THREE_PAIRS = "three_pairs"
+COMBO_DOUBLE_TRIPLETS = "double_triplets"
+COMBO_FOUR_KIND_PLUS_PAIR = "four_kind_pair"
+
+
+def count_dice(dice: list[int]) -> dict[int, int]:
+    """Count occurrences of each die value (1-6)."""
+    counts = {i: 0 for i in range(1, 7)}
+    for die in dice:
+        counts[die] += 1
+    return counts
+
+
+def get_combination_points(combo_type: str, number: int = 0) -> int:
+    """Get point value for a combination."""
+    if combo_type == COMBO_SINGLE_1:
+        return 100
+    elif combo_type == COMBO_SINGLE_5:
+        return 50
+    elif combo_type == COMBO_THREE_OF_KIND:
+        return 300 if number == 1 else number * 100
+    elif combo_type == COMBO_FOUR_OF_KIND:
+        return 1000
+    elif combo_type == COMBO_FIVE_OF_KIND:
+        return 2000
+    elif combo_type == COMBO_SIX_OF_KIND:
+        return 3000
+    elif combo_type == COMBO_STRAIGHT:
+        return 1500
+    elif combo_type == COMBO_THREE_PAIRS:
+        return 1500
+    elif combo_type == COMBO_DOUBLE_TRIPLETS:
+        return 2500
+    elif combo_type == COMBO_FOUR_KIND_PLUS_PAIR:
+        return 1500
+    return 0
+
+
+# Combos that name the face they use, with how many of it they take
+_KIND_SIZES = {
+    COMBO_SIX_OF_KIND: 6,
+    COMBO_FIVE_OF_KIND: 5,
+    COMBO_FOUR_OF_KIND: 4,
+    COMBO_THREE_OF_KIND: 3,
+}
+
+
+def _scan_combinations(counts: dict[int, int]) -> list[tuple[str, int, int]]:
+    """
+    Find every scoring combination in a roll, given its face counts.
+
+    Returns (combo_type, number, points) tuples, highest points first.
+    Used to build the combination table; look rolls up with
+    get_available_combinations instead.
+    """
+    num_dice = sum(counts.values())
+    combinations = []
+
+    # Six, five and four of a kind (six first, highest points)
+    for combo_type in (COMBO_SIX_OF_KIND, COMBO_FIVE_OF_KIND, COMBO_FOUR_OF_KIND):
+        for num in range(1, 7):
+            if counts[num] >= _KIND_SIZES[combo_type]:
+                combinations.append(
+                    (combo_type, num, get_combination_points(combo_type, num))
+                )
+
+    if num_dice == 6:
+        values = sorted(counts.values())
+        # Double triplets (higher priority than three pairs)
+        if values.count(3) == 2:
+            combinations.append(
+                (COMBO_DOUBLE_TRIPLETS, 0, get_combination_points(COMBO_DOUBLE_TRIPLETS))
+            )
+        # Straight (1-2-3-4-5-6)
+        if values == [1] * 6:
+            combinations.append(
+                (COMBO_STRAIGHT, 0, get_combination_points(COMBO_STRAIGHT))
+            )
+        # Four of a kind plus a pair
+        if 4 in values and 2 in values:
+            combinations.append(
+                (
+                    COMBO_FOUR_KIND_PLUS_PAIR,
+                    0,
+                    get_combination_points(COMBO_FOUR_KIND_PLUS_PAIR),
+                )
+            )
+        # Three pairs
+        if values.count(2) == 3:
+            combinations.append(
+                (COMBO_THREE_PAIRS, 0, get_combination_points(COMBO_THREE_PAIRS))
+            )
+
+    # Three of a kind
+    for num in range(1, 7):
+        if counts[num] >= 3:
+            combinations.append(
+                (COMBO_THREE_OF_KIND, num, get_combination_points(COMBO_THREE_OF_KIND, num))
+            )
+
+    # Single 1s and 5s (always available if there's at least one)
+    if counts[1] > 0:
+        combinations.append((COMBO_SINGLE_1, 1, get_combination_points(COMBO_SINGLE_1)))
+    if counts[5] > 0:
+        combinations.append((COMBO_SINGLE_5, 5, get_combination_points(COMBO_SINGLE_5)))
+
+    # Sort by points descending
+    combinations.sort(key=lambda x: x[2], reverse=True)
+    return combinations
+
+
+# Combination table: every roll of up to MAX_DICE dice, indexed by its face
+# counts. A roll's code is its counts in base 7 (sum of _FACE_WEIGHTS[die]);
+# _ROLL_INDEX maps the code to a dense index into the per-roll tables, which
+# hold the combinations (highest points first), the (combo_type, number)
+# pairs they contain, and whether anything scores at all.
+MAX_DICE = 6
+_FACE_WEIGHTS = tuple([0] + [7**i for i in range(6)])
+_NO_ROLL = 0xFFFF
+
+
+def _build_combination_tables() -> tuple[
+    array, tuple[tuple[tuple[str, int, int], ...], ...], tuple[frozenset, ...], bytes
+]:
+    """Scan every roll of up to MAX_DICE dice once and tabulate the results."""
+    index = array("H", [_NO_ROLL]) * 7**6
+    combos: list[tuple[tuple[str, int, int], ...]] = []
+    for num_dice in range(MAX_DICE + 1):
+        for roll in combinations_with_replacement(range(1, 7), num_dice):
+            index[sum(_FACE_WEIGHTS[d] for d in roll)] = len(combos)
+            combos.append(tuple(_scan_combinations(count_dice(list(roll)))))
+    present = tuple(
+        frozenset((combo_type, number) for combo_type, number, _ in roll_combos)
+        for roll_combos in combos
+    )
+    scoring = bytes(bool(roll_combos) for roll_combos in combos)
+    return index, tuple(combos), present, scoring
+
+
+_ROLL_INDEX, _ROLL_COMBOS, _ROLL_PRESENT, _ROLL_SCORING = _build_combination_tables()
+
+
+def _roll_index(dice: list[int]) -> int:
+    """Index of a roll in the combination tables."""
+    if len(dice) > MAX_DICE:
+        raise ValueError(f"Farkle rolls have at most {MAX_DICE} dice, got {len(dice)}")
+    code = 0
+    for die in dice:
+        code += _FACE_WEIGHTS[die]
+    return _ROLL_INDEX[code]
+
+
+def has_combination(dice: list[int], combo_type: str, number: int = 0) -> bool:
+    """Check if dice contain a specific combination."""
+    if combo_type == COMBO_SINGLE_1:
+        number = 1
+    elif combo_type == COMBO_SINGLE_5:
+        number = 5
+    elif combo_type not in _KIND_SIZES:
+        number = 0
+    return (combo_type, number) in _ROLL_PRESENT[_roll_index(dice)]
+
+
+def has_scoring_dice(dice: list[int]) -> bool:
+    """Check if dice contain any scoring combinations (for farkle detection)."""
+    return bool(_ROLL_SCORING[_roll_index(dice)])
+
+
+def farkle_chance(num_dice: int) -> float:
+    """Exact chance that rolling num_dice dice scores nothing."""
+    return 1.0 - outcome_chance(has_scoring_dice, num_dice)
+
+
+def get_available_combinations(dice: list[int]) -> list[tuple[str, int, int]]:
+    """Get all available scoring combinations as (combo_type, number, points) tuples."""
+    return list(_ROLL_COMBOS[_roll_index(dice)])
+
+
+def combo_dice(dice: list[int], combo_type: str, number: int) -> list[int]:
+    """The dice a combination takes from a roll (empty if it isn't there)."""
+    counts = count_dice(dice)
+    if combo_type == COMBO_SINGLE_1 and counts[1] >= 1:
+        return [1]
+    if combo_type == COMBO_SINGLE_5 and counts[5] >= 1:
+        return [5]
+    if combo_type in _KIND_SIZES and counts[number] >= _KIND_SIZES[combo_type]:
+        return [number] * _KIND_SIZES[combo_type]
+    if combo_type in (
+        COMBO_STRAIGHT,
+        COMBO_THREE_PAIRS,
+        COMBO_DOUBLE_TRIPLETS,
+        COMBO_FOUR_KIND_PLUS_PAIR,
+    ):
+        return list(dice)
+    return []
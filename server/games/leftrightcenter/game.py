@@ -8,7 +8,6 @@ from play. Last player holding chips wins.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-import random
 
 from ..base import Game, Player, GameOptions
 from ..registry import register_game
@@ -208,7 +207,7 @@ class LeftRightCenterGame(Game):
             self.end_turn()
             return
         if player.is_bot:
-            BotHelper.jolt_bot(player, ticks=random.randint(5, 10))
+            BotHelper.jolt_bot(player, ticks=self.rng.randint(5, 10))
 
         self.rebuild_all_menus()
 
@@ -251,7 +250,7 @@ class LeftRightCenterGame(Game):
             return
         self.play_sound("game_pig/roll.ogg")
 
-        faces = [random.choice(DICE_FACES) for _ in range(roll_count)]
+        faces = [self.rng.choice(DICE_FACES) for _ in range(roll_count)]
         self._broadcast_roll_results(lrc_player, faces)
 
         # Delay the chip movements slightly for pacing
@@ -355,6 +354,27 @@ class LeftRightCenterGame(Game):
             return
         BotHelper.on_tick(self)
 
+    def get_idle_ticks(self) -> float:
+        """Ticks that would only count down sounds, delays and bot thinking."""
+        sounds = self.get_sound_idle_ticks()
+        if self._roll_delay_ticks > 0:
+            return min(sounds, self._roll_delay_ticks - 1)
+        if self.turn_delay_ticks > 0:
+            return min(sounds, self.turn_delay_ticks)
+        if self._pending_turn_advance:
+            return 0
+        return min(sounds, BotHelper.idle_ticks(self))
+
+    def skip_idle_ticks(self, ticks: int) -> None:
+        """Skip ticks that only count down sounds, delays and bot thinking."""
+        self.skip_sound_ticks(ticks)
+        if self._roll_delay_ticks > 0:
+            self._roll_delay_ticks -= ticks
+        elif self.turn_delay_ticks > 0:
+            self.turn_delay_ticks -= ticks
+        else:
+            BotHelper.skip_ticks(self, ticks)
+
     def bot_think(self, player: LeftRightCenterPlayer) -> str | None:
         return "roll"
 
@@ -376,7 +396,7 @@ class LeftRightCenterGame(Game):
         """End the current turn with optional delay for turn resolution."""
         current = self.current_player
         if current and current.is_bot:
-            BotHelper.jolt_bot(current, ticks=random.randint(10, 15))
+            BotHelper.jolt_bot(current, ticks=self.rng.randint(10, 15))
         if delay_ticks > 0:
             self.turn_delay_ticks = delay_ticks
             self._pending_turn_advance = True
@@ -6,7 +6,6 @@ A resource management game where you shoot a turret to gain light and coins.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-import random
 
 from ..base import Game, Player
 from ..registry import register_game
@@ -198,11 +197,11 @@ class LightTurretGame(Game):
             return
 
         # Play shoot sound
-        shoot_sound = f"game_lightturret/shoot{random.randint(1, 3)}.ogg"
+        shoot_sound = f"game_lightturret/shoot{self.rng.randint(1, 3)}.ogg"
         self.play_sound(shoot_sound)
 
         # Gain light and coins
-        gain = random.randint(1, 4)
+        gain = self.rng.randint(1, 4)
         lt_player.light += gain
         lt_player.coins += gain * 2
 
@@ -247,9 +246,9 @@ class LightTurretGame(Game):
         self.broadcast_l("lightturret-buys-upgrade", player=player.name)
 
         # 25% chance of accident
-        if random.randint(0, 3) == 3:
+        if self.rng.randint(0, 3) == 3:
             # Accident - upgrade infuses with turret
-            accident_light = random.randint(1, 5)
+            accident_light = self.rng.randint(1, 5)
             lt_player.light += accident_light
             # Schedule merge sound after delay (5 ticks = 250ms)
             self.schedule_sound("game_lightturret/upgrademerge.ogg", delay_ticks=5)
@@ -261,7 +260,7 @@ class LightTurretGame(Game):
                 self._eliminate_player(lt_player)
         else:
             # Normal upgrade
-            power_gain = random.randint(2, 8)
+            power_gain = self.rng.randint(2, 8)
             lt_player.power += power_gain
             self.broadcast_l(
                 "lightturret-power-gained",
@@ -357,7 +356,7 @@ class LightTurretGame(Game):
         self.announce_turn()
 
         if player.is_bot:
-            BotHelper.jolt_bot(player, ticks=random.randint(12, 20))
+            BotHelper.jolt_bot(player, ticks=self.rng.randint(12, 20))
 
         self.rebuild_all_menus()
 
@@ -378,6 +377,17 @@ class LightTurretGame(Game):
             return
         BotHelper.on_tick(self)
 
+    def get_idle_ticks(self) -> float:
+        """Ticks that would only count down sounds and bot thinking."""
+        if self._pending_finish and not self.scheduled_sounds:
+            return 0
+        return min(self.get_sound_idle_ticks(), BotHelper.idle_ticks(self))
+
+    def skip_idle_ticks(self, ticks: int) -> None:
+        """Skip ticks that only count down sounds and bot thinking."""
+        self.skip_sound_ticks(ticks)
+        BotHelper.skip_ticks(self, ticks)
+
     def bot_think(self, player: Player) -> str | None:
         """Bot AI decision making."""
         if not isinstance(player, LightTurretPlayer) or not player.alive:
@@ -542,5 +552,5 @@ class LightTurretGame(Game):
 
     def end_turn(self, jolt_min: int = 15, jolt_max: int = 25) -> None:
         """End the current player's turn."""
-        BotHelper.jolt_bots(self, ticks=random.randint(jolt_min, jolt_max))
+        BotHelper.jolt_bots(self, ticks=self.rng.randint(jolt_min, jolt_max))
         self._on_turn_end()
@@ -7,13 +7,13 @@ The other 4 dice are summed for points (max 24). Highest score wins the round.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-import random
+import functools
 
 from ..base import Game, Player, GameOptions
 from ..registry import register_game
 from ...game_utils.actions import Action, ActionSet, Visibility
 from ...game_utils.bot_helper import BotHelper
-from ...game_utils.dice import DiceSet
+from ...game_utils.dice import DiceSet, KeepTurn
 from ...game_utils.dice_game_mixin import DiceGameMixin
 from ...game_utils.game_result import GameResult, PlayerResult
 from ...game_utils.options import IntOption, option_field
@@ -21,6 +21,37 @@ from ...messages.localization import Localization
 from ...ui.keybinds import KeybindState
 
 
+NUM_DICE = 6
+# Score counts for this much of a round win when choosing dice, so the bot
+# still prefers higher scores once it is ahead
+SCORE_WEIGHT = 0.01
+
+
+def _split_qualifiers(kept: tuple[int, ...]) -> tuple[bool, bool, int]:
+    """Whether kept has a 1 and a 4, and the sum of the other dice."""
+    has_one = 1 in kept
+    has_four = 4 in kept
+    return has_one, has_four, sum(kept) - has_one - 4 * has_four
+
+
+@functools.cache
+def midnight_turn(to_beat: int) -> KeepTurn:
+    """
+    Turn solver for a bot that needs to match to_beat (-1: just qualify).
+
+    Qualifying with at least to_beat counts as a round win; each point
+    of score adds SCORE_WEIGHT.
+    """
+
+    def value(kept: tuple[int, ...]) -> float:
+        has_one, has_four, score = _split_qualifiers(kept)
+        if not (has_one and has_four):
+            return 0.0
+        return (1.0 if score >= to_beat else 0.0) + SCORE_WEIGHT * score
+
+    return KeepTurn(NUM_DICE, value, key=_split_qualifiers)
+
+
 @dataclass
 class MidnightPlayer(Player):
     """Player state for 1-4-24 (Midnight) game."""
@@ -76,6 +107,12 @@ class MidnightGame(Game, DiceGameMixin):
     def get_category(cls) -> str:
         return "category-dice-games"
 
+    @classmethod
+    def warm_up(cls) -> None:
+        # Bots may have to beat any qualifying score (4 dice: 4 to 24)
+        for to_beat in (-1, *range(4, 25)):
+            midnight_turn(to_beat).expected()
+
     @classmethod
     def get_min_players(cls) -> int:
         return 2
@@ -191,7 +228,7 @@ class MidnightGame(Game, DiceGameMixin):
         self.play_sound("game_pig/roll.ogg")
 
         # Roll dice (locks kept dice)
-        midnight_player.dice.roll(lock_kept=True, clear_kept=True)
+        midnight_player.dice.roll(lock_kept=True, clear_kept=True, rng=self.rng)
 
         # Format roll results
         result_text = ", ".join(str(v) for v in midnight_player.dice.values)
@@ -208,7 +245,7 @@ class MidnightGame(Game, DiceGameMixin):
 
         # Give bot time to think about next action
         if player.is_bot:
-            BotHelper.jolt_bot(player, ticks=random.randint(10, 20))
+            BotHelper.jolt_bot(player, ticks=self.rng.randint(10, 20))
 
         self.rebuild_all_menus()
 
@@ -282,7 +319,7 @@ class MidnightGame(Game, DiceGameMixin):
             )
 
         # Jolt all bots to pause for the turn change
-        BotHelper.jolt_bots(self, ticks=random.randint(20, 30))
+        BotHelper.jolt_bots(self, ticks=self.rng.randint(20, 30))
 
         self._on_turn_end()
 
@@ -410,56 +447,42 @@ class MidnightGame(Game, DiceGameMixin):
 
         BotHelper.on_tick(self)
 
+    def get_idle_ticks(self) -> float:
+        """Ticks that would only count down bot thinking."""
+        return BotHelper.idle_ticks(self)
+
+    def skip_idle_ticks(self, ticks: int) -> None:
+        """Skip ticks that only count down bot thinking."""
+        BotHelper.skip_ticks(self, ticks)
+
     def bot_think(self, player: MidnightPlayer) -> str | None:
         """Bot AI decision making. Called by BotHelper."""
-        # Strategy: Keep 1 and 4 first, then keep highest dice
-        if not player.dice.has_rolled:
-            return "roll"
-
-        # If we have kept dice but haven't rolled yet to lock them, roll
-        if player.dice.kept_unlocked_count > 0:
+        dice = player.dice
+        if not dice.has_rolled:
             return "roll"
 
-        # Look for 1 if we don't have one locked yet
-        if 1 not in [player.dice.values[i] for i in player.dice.locked]:
-            for i in range(6):
-                if not player.dice.is_locked(i) and player.dice.values[i] == 1:
-                    return f"toggle_die_{i}"
-
-        # Look for 4 if we don't have one locked yet
-        if 4 not in [player.dice.values[i] for i in player.dice.locked]:
-            for i in range(6):
-                if not player.dice.is_locked(i) and player.dice.values[i] == 4:
-                    return f"toggle_die_{i}"
-
-        # Keep highest available die
-        best_index = -1
-        best_value = 0
-        for i in range(6):
-            if not player.dice.is_locked(i) and not player.dice.is_kept(i):
-                if player.dice.values[i] > best_value:
-                    best_value = player.dice.values[i]
-                    best_index = i
-
-        if best_index >= 0:
-            return f"toggle_die_{best_index}"
-
-        # No more dice to keep - decide whether to roll or stop
-        # If we have both 1 and 4 locked, we can stop
-        locked_values = [player.dice.values[i] for i in player.dice.locked]
-        has_one = 1 in locked_values
-        has_four = 4 in locked_values
-
-        if has_one and has_four:
-            # We have what we need, bank to lock in score
-            return "bank"
-
-        # Still missing 1 or 4, keep trying (but can't roll if kept_unlocked_count is 0)
-        # In this case, bank anyway to avoid getting stuck
-        if player.dice.kept_unlocked_count == 0:
-            return "bank"
-
-        return "roll"
+        # Keep the dice the exact turn solver picks for the score to beat
+        locked = [dice.values[i] for i in dice.locked]
+        unlocked = [i for i in range(dice.num_dice) if not dice.is_locked(i)]
+        turn = midnight_turn(self._score_to_beat(player))
+        keep = list(turn.best_keep(locked, [dice.values[i] for i in unlocked]))
+
+        # Toggle one die at a time until the kept dice match
+        for i in unlocked:
+            wanted = dice.values[i] in keep
+            if wanted:
+                keep.remove(dice.values[i])
+            if wanted != dice.is_kept(i):
+                return f"toggle_die_{i}"
+
+        return "bank" if dice.all_decided else "roll"
+
+    def _score_to_beat(self, player: MidnightPlayer) -> int:
+        """Best score qualified this round by someone else, or -1 if none."""
+        return max(
+            (p.round_score for p in self.players if p is not player and p.qualified),
+            default=-1,
+        )
 
     def _on_turn_end(self) -> None:
         """Handle end of a player's turn."""
@@ -1,10 +1,12 @@
 """Card definitions and deck management for Mile by Mile."""
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 import random
 
 from mashumaro.mixins.json import DataClassJSONMixin
+from mashumaro.types import SerializableType
 
 
 class CardType(str, Enum):
@@ -96,13 +98,81 @@ CARD_NAMES: dict[str, str] = {
 }
 
 
-@dataclass
-class Card(DataClassJSONMixin):
-    """A single card in Mile by Mile."""
+# Every kind of card, in deck building order. A card packs its id and the
+# index of its kind into one int (see Card).
+CARD_KINDS: tuple[tuple[str, str], ...] = (
+    *((CardType.DISTANCE, miles) for miles in ("25", "50", "75", "100", "200")),
+    *((CardType.HAZARD, hazard) for hazard in HazardType),
+    *((CardType.REMEDY, remedy) for remedy in RemedyType),
+    *((CardType.SAFETY, safety) for safety in SafetyType),
+    (CardType.SPECIAL, "false_virtue"),
+)
+_KIND_INDEX: dict[tuple[str, str], int] = {
+    kind: i for i, kind in enumerate(CARD_KINDS)
+}
+KIND_BITS = 5
+
+
+class Card(SerializableType):
+    """
+    A single card in Mile by Mile.
+
+    Cards are immutable and interned (one object per id and kind), and
+    serialize as id << KIND_BITS | kind index. Cards saved as {"id",
+    "card_type", "value"} objects by older versions still load.
+    """
+
+    __slots__ = ("id", "card_type", "value", "kind")
 
     id: int  # Unique ID for this card instance
     card_type: str  # CardType value
     value: str  # Distance value or hazard/remedy/safety type
+    kind: int  # Index in CARD_KINDS
+
+    def __new__(cls, id: int, card_type: str, value: str) -> "Card":
+        return cls.from_kind(id, _KIND_INDEX[(card_type, value)])
+
+    @classmethod
+    def from_kind(cls, id: int, kind: int) -> "Card":
+        """The card with the given id and index in CARD_KINDS."""
+        packed = id << KIND_BITS | kind
+        card = _INTERNED_CARDS.get(packed)
+        if card is None:
+            card = object.__new__(cls)
+            card_type, value = CARD_KINDS[kind]
+            object.__setattr__(card, "id", id)
+            object.__setattr__(card, "card_type", card_type)
+            object.__setattr__(card, "value", value)
+            object.__setattr__(card, "kind", kind)
+            _INTERNED_CARDS[packed] = card
+        return card
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("cards are immutable")
+
+    def __reduce__(self):
+        return Card.from_kind, (self.id, self.kind)
+
+    def __repr__(self) -> str:
+        return f"Card(id={self.id}, card_type={self.card_type!r}, value={self.value!r})"
+
+    def __hash__(self) -> int:
+        return self.id << KIND_BITS | self.kind
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Card):
+            return False
+        return self.id == other.id and self.kind == other.kind
+
+    def _serialize(self) -> int:
+        return self.id << KIND_BITS | self.kind
+
+    @classmethod
+    def _deserialize(cls, value: int | dict) -> "Card":
+        if isinstance(value, dict):
+            # Saved before cards were packed
+            return cls(value["id"], value["card_type"], value["value"])
+        return cls.from_kind(value >> KIND_BITS, value & (1 << KIND_BITS) - 1)
 
     @property
     def name(self) -> str:
@@ -119,13 +189,25 @@ class Card(DataClassJSONMixin):
         return 0
 
 
+# Every card created so far, by packed value
+_INTERNED_CARDS: dict[int, Card] = {}
+
+
 @dataclass
 class Deck(DataClassJSONMixin):
-    """A deck of cards with draw and shuffle functionality."""
+    """
+    A deck of cards with draw and shuffle functionality.
+
+    Cards are kept top first in a deque, so draws take constant time.
+    """
 
-    cards: list[Card] = field(default_factory=list)
+    cards: deque[Card] = field(default_factory=deque)
     _next_id: int = 0
 
+    def __post_init__(self):
+        if not isinstance(self.cards, deque):
+            self.cards = deque(self.cards)
+
     def _create_card(self, card_type: str, value: str) -> Card:
         """Create a card with a unique ID."""
         card = Card(id=self._next_id, card_type=card_type, value=value)
@@ -139,7 +221,7 @@ class Deck(DataClassJSONMixin):
         include_karma_cards: bool = False,
     ) -> None:
         """Build a standard Mile by Mile deck."""
-        self.cards = []
+        self.cards = deque()
 
         # Distance cards (46 total)
         for _ in range(10):
@@ -192,24 +274,30 @@ class Deck(DataClassJSONMixin):
             for _ in range(2):
                 self.cards.append(self._create_card(CardType.SPECIAL, "false_virtue"))
 
-    def shuffle(self) -> None:
-        """Shuffle the deck using Fisher-Yates."""
-        random.shuffle(self.cards)
+    def shuffle(self, rng: random.Random | None = None) -> None:
+        """Shuffle the deck using Fisher-Yates, with rng if given."""
+        cards = list(self.cards)
+        (rng or random).shuffle(cards)
+        self.cards = deque(cards)
+
+    def replace(self, cards: list[Card]) -> None:
+        """Replace the deck's cards (top first)."""
+        self.cards = deque(cards)
 
     def draw(self) -> Card | None:
         """Draw a card from the top of the deck."""
         if self.cards:
-            return self.cards.pop(0)
+            return self.cards.popleft()
         return None
 
     def draw_non_duplicate(self, hand: list[Card]) -> Card | None:
         """Draw a card that isn't already in the hand (for disallow duplicates mode)."""
         # First try to find a non-duplicate
+        held = {c.kind for c in hand}
         for i, card in enumerate(self.cards):
-            if not any(
-                c.card_type == card.card_type and c.value == card.value for c in hand
-            ):
-                return self.cards.pop(i)
+            if card.kind not in held:
+                del self.cards[i]
+                return card
         # Fall back to normal draw if all are duplicates
         return self.draw()
 
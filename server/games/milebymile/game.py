@@ -7,7 +7,7 @@ while playing hazards on opponents and defending with safeties.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-import random
+import itertools
 
 from mashumaro.mixins.json import DataClassJSONMixin
 
@@ -24,6 +24,7 @@ from ...game_utils.options import (
     option_field,
 )
 from ...game_utils.round_timer import RoundTimer
+from ...game_utils.search import SearchBotMixin
 from ...game_utils.teams import TeamManager
 from ...messages.localization import Localization
 from ...ui.keybinds import KeybindState
@@ -42,10 +43,43 @@ from .cards import (
 # Hand size
 HAND_SIZE = 6
 
+# Localization keys of card names (also used for problems and safeties)
+CARD_NAME_KEYS: dict[str, str] = {
+    # Hazards
+    HazardType.OUT_OF_GAS: "milebymile-card-out-of-gas",
+    HazardType.FLAT_TIRE: "milebymile-card-flat-tire",
+    HazardType.ACCIDENT: "milebymile-card-accident",
+    HazardType.SPEED_LIMIT: "milebymile-card-speed-limit",
+    HazardType.STOP: "milebymile-card-stop",
+    # Remedies
+    RemedyType.GASOLINE: "milebymile-card-gasoline",
+    RemedyType.SPARE_TIRE: "milebymile-card-spare-tire",
+    RemedyType.REPAIRS: "milebymile-card-repairs",
+    RemedyType.END_OF_LIMIT: "milebymile-card-end-of-limit",
+    RemedyType.ROLL: "milebymile-card-green-light",
+    # Safeties
+    SafetyType.EXTRA_TANK: "milebymile-card-extra-tank",
+    SafetyType.PUNCTURE_PROOF: "milebymile-card-puncture-proof",
+    SafetyType.DRIVING_ACE: "milebymile-card-driving-ace",
+    SafetyType.RIGHT_OF_WAY: "milebymile-card-right-of-way",
+    # Special
+    "false_virtue": "milebymile-card-false-virtue",
+}
+
+
+# Race state revisions: unique and increasing across all race states, so the
+# newest revision of several states changes whenever any of them does
+_race_revisions = itertools.count(1)
+
 
 @dataclass
 class RaceState(DataClassJSONMixin):
-    """Per-team race state for Mile by Mile (resets each race)."""
+    """
+    Per-team race state for Mile by Mile (resets each race).
+
+    revision (runtime only) changes on every change to the state, which is
+    what the game's card playability cache checks.
+    """
 
     miles: int = 0
     problems: list[str] = field(default_factory=list)  # Active hazard types
@@ -71,16 +105,27 @@ class RaceState(DataClassJSONMixin):
         """Add a problem to the team."""
         if problem_type not in self.problems:
             self.problems.append(problem_type)
+            self._touch()
 
     def remove_problem(self, problem_type: str) -> None:
         """Remove a problem from the team."""
         if problem_type in self.problems:
             self.problems.remove(problem_type)
+            self._touch()
 
     def add_safety(self, safety_type: str) -> None:
         """Add a safety to the team."""
         if safety_type not in self.safeties:
             self.safeties.append(safety_type)
+            self._touch()
+
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        self._touch()
+
+    def _touch(self) -> None:
+        """Give the state a new revision."""
+        super().__setattr__("revision", next(_race_revisions))
 
     def can_play_distance(self) -> bool:
         """Check if team can play distance cards."""
@@ -105,6 +150,21 @@ class RaceState(DataClassJSONMixin):
         self.has_karma = True
 
 
+@dataclass
+class SlotPlayability:
+    """
+    Whether the card in a hand slot can be played (runtime cache entry).
+
+    key holds the card and the race state revisions the answer was worked
+    out from; the entry is stale once it no longer matches.
+    """
+
+    key: tuple
+    playable: bool
+    targets: list[int]  # Teams a playable hazard can be played on
+    reasons: dict[str, str] = field(default_factory=dict)  # Why not, by locale
+
+
 @dataclass
 class MileByMilePlayer(Player):
     """Player state for Mile by Mile."""
@@ -191,11 +251,25 @@ class MileByMileOptions(GameOptions):
             change_msg="milebymile-option-changed-rig",
         )
     )
+    bot_strategy: str = option_field(
+        MenuOption(
+            default="simple",
+            value_key="strategy",
+            choices=["simple", "search"],
+            choice_labels={
+                "simple": "game-bot-strategy-simple",
+                "search": "game-bot-strategy-search",
+            },
+            label="game-set-bot-strategy",
+            prompt="game-select-bot-strategy",
+            change_msg="game-option-changed-bot-strategy",
+        )
+    )
 
 
 @dataclass
 @register_game
-class MileByMileGame(Game):
+class MileByMileGame(Game, SearchBotMixin):
     """
     Mile by Mile - A racing card game based on Mille Bornes.
 
@@ -230,11 +304,13 @@ class MileByMileGame(Game):
         """Initialize runtime state."""
         super().__post_init__()
         self._round_timer = RoundTimer(self, delay_seconds=10.0)
+        self._playability: dict[tuple[str, int], SlotPlayability] = {}
 
     def rebuild_runtime_state(self) -> None:
         """Rebuild non-serialized state after deserialization."""
         super().rebuild_runtime_state()
         self._round_timer = RoundTimer(self, delay_seconds=10.0)
+        self._playability = {}
 
     @classmethod
     def get_name(cls) -> str:
@@ -449,20 +525,17 @@ class MileByMileGame(Game):
                 turn_set._order.remove(action_id)
 
         # Add actions for cards in hand
-        for i, card in enumerate(player.hand, 1):
+        for i in range(1, len(player.hand) + 1):
             action_id = f"card_slot_{i}"
-            playable = self._can_play_card(player, card)
 
             # Check if hazard with multiple targets needs menu
             input_request = None
-            if card.card_type == CardType.HAZARD and playable:
-                targets = self._get_valid_hazard_targets(player, card.value)
-                if len(targets) > 1:
-                    input_request = MenuInput(
-                        prompt="milebymile-select-target",
-                        options="_hazard_target_options",
-                        bot_select="_bot_select_hazard_target",
-                    )
+            if len(self._slot_playability(player, i - 1).targets) > 1:
+                input_request = MenuInput(
+                    prompt="milebymile-select-target",
+                    options="_hazard_target_options",
+                    bot_select="_bot_select_hazard_target",
+                )
 
             # Always show cards in menu, but enable/disable based on state
             # Use dynamic label to ensure locale changes are reflected
@@ -569,8 +642,51 @@ class MileByMileGame(Game):
     # Card Logic
     # ==========================================================================
 
+    def _slot_playability(self, player: MileByMilePlayer, slot: int) -> SlotPlayability:
+        """
+        Playability of the card in a hand slot, cached per (player, slot).
+
+        Menus and bots ask about every card in every hand on each rebuild,
+        but the answer only changes with the card in the slot, the player's
+        race state or (for hazards) the other teams' race states, so it is
+        worked out again only when one of those has changed.
+        """
+        card = player.hand[slot]
+        race_state = self.get_player_race_state(player)
+        if race_state is None:
+            key = (card, None)
+        elif card.card_type == CardType.HAZARD:
+            # Any team's change gives the newest revision
+            key = (card, max(state.revision for state in self.race_states))
+        else:
+            key = (card, race_state.revision)
+
+        entry = self._playability.get((player.id, slot))
+        if entry is None or entry.key != key:
+            playable = self._check_card_playable(player, card)
+            targets = []
+            if playable and card.card_type == CardType.HAZARD:
+                targets = self._get_valid_hazard_targets(player, card.value)
+            entry = SlotPlayability(key, playable, targets)
+            self._playability[(player.id, slot)] = entry
+        return entry
+
+    def _hand_slot(self, player: MileByMilePlayer, card: Card) -> int | None:
+        """The slot holding card in player's hand, if it's there."""
+        for slot, held in enumerate(player.hand):
+            if held is card:
+                return slot
+        return None
+
     def _can_play_card(self, player: MileByMilePlayer, card: Card) -> bool:
-        """Check if a card can be played."""
+        """Check if a card can be played (cached for cards in hand)."""
+        slot = self._hand_slot(player, card)
+        if slot is not None:
+            return self._slot_playability(player, slot).playable
+        return self._check_card_playable(player, card)
+
+    def _check_card_playable(self, player: MileByMilePlayer, card: Card) -> bool:
+        """Work out whether a card can be played."""
         race_state = self.get_player_race_state(player)
         if not race_state:
             return False
@@ -592,6 +708,18 @@ class MileByMileGame(Game):
         self, player: MileByMilePlayer, card: Card, locale: str = "en"
     ) -> str:
         """Get a human-readable reason why a card can't be played."""
+        slot = self._hand_slot(player, card)
+        if slot is None:
+            return self._work_out_unplayable_reason(player, card, locale)
+        reasons = self._slot_playability(player, slot).reasons
+        if locale not in reasons:
+            reasons[locale] = self._work_out_unplayable_reason(player, card, locale)
+        return reasons[locale]
+
+    def _work_out_unplayable_reason(
+        self, player: MileByMilePlayer, card: Card, locale: str
+    ) -> str:
+        """Word the reason a card can't be played."""
         from ...messages.localization import Localization
 
         race_state = self.get_player_race_state(player)
@@ -657,27 +785,14 @@ class MileByMileGame(Game):
         """Get localized name for a problem/hazard type."""
         from ...messages.localization import Localization
 
-        key_map = {
-            HazardType.OUT_OF_GAS: "milebymile-card-out-of-gas",
-            HazardType.FLAT_TIRE: "milebymile-card-flat-tire",
-            HazardType.ACCIDENT: "milebymile-card-accident",
-            HazardType.SPEED_LIMIT: "milebymile-card-speed-limit",
-            HazardType.STOP: "milebymile-card-stop",
-        }
-        key = key_map.get(problem, "")
+        key = CARD_NAME_KEYS.get(problem, "")
         return Localization.get(locale, key) if key else problem
 
     def _get_localized_safety_name(self, safety: str, locale: str) -> str:
         """Get localized name for a safety type."""
         from ...messages.localization import Localization
 
-        key_map = {
-            SafetyType.EXTRA_TANK: "milebymile-card-extra-tank",
-            SafetyType.PUNCTURE_PROOF: "milebymile-card-puncture-proof",
-            SafetyType.DRIVING_ACE: "milebymile-card-driving-ace",
-            SafetyType.RIGHT_OF_WAY: "milebymile-card-right-of-way",
-        }
-        key = key_map.get(safety, "")
+        key = CARD_NAME_KEYS.get(safety, "")
         return Localization.get(locale, key) if key else safety
 
     def _get_localized_card_name(self, card: Card, locale: str) -> str:
@@ -687,28 +802,7 @@ class MileByMileGame(Game):
         if card.card_type == CardType.DISTANCE:
             return Localization.get(locale, "milebymile-card-miles", miles=card.value)
 
-        key_map = {
-            # Hazards
-            HazardType.OUT_OF_GAS: "milebymile-card-out-of-gas",
-            HazardType.FLAT_TIRE: "milebymile-card-flat-tire",
-            HazardType.ACCIDENT: "milebymile-card-accident",
-            HazardType.SPEED_LIMIT: "milebymile-card-speed-limit",
-            HazardType.STOP: "milebymile-card-stop",
-            # Remedies
-            RemedyType.GASOLINE: "milebymile-card-gasoline",
-            RemedyType.SPARE_TIRE: "milebymile-card-spare-tire",
-            RemedyType.REPAIRS: "milebymile-card-repairs",
-            RemedyType.END_OF_LIMIT: "milebymile-card-end-of-limit",
-            RemedyType.ROLL: "milebymile-card-green-light",
-            # Safeties
-            SafetyType.EXTRA_TANK: "milebymile-card-extra-tank",
-            SafetyType.PUNCTURE_PROOF: "milebymile-card-puncture-proof",
-            SafetyType.DRIVING_ACE: "milebymile-card-driving-ace",
-            SafetyType.RIGHT_OF_WAY: "milebymile-card-right-of-way",
-            # Special
-            "false_virtue": "milebymile-card-false-virtue",
-        }
-        key = key_map.get(card.value, "")
+        key = CARD_NAME_KEYS.get(card.value, "")
         return Localization.get(locale, key) if key else card.name
 
     def _can_play_distance(self, race_state: RaceState, card: Card) -> bool:
@@ -958,7 +1052,7 @@ class MileByMileGame(Game):
         if card.card_type != CardType.HAZARD:
             return []
 
-        target_indices = self._get_valid_hazard_targets(player, card.value)
+        target_indices = self._slot_playability(player, slot).targets
         # Format like v10: "Name (X miles)" for individual, "Team N: members (X miles)" for teams
         options = []
         for team_idx in target_indices:
@@ -994,7 +1088,7 @@ class MileByMileGame(Game):
         if card.card_type != CardType.HAZARD:
             return None
 
-        target_indices = self._get_valid_hazard_targets(player, card.value)
+        target_indices = self._slot_playability(player, slot).targets
         if not target_indices:
             return None
 
@@ -1120,12 +1214,12 @@ class MileByMileGame(Game):
             race_state.used_200_mile = True
 
         # Play sounds
-        self.play_sound(f"game_cards/play{random.randint(1, 4)}.ogg")
+        self.play_sound(f"game_cards/play{self.rng.randint(1, 4)}.ogg")
 
         # Distance-specific sounds
         sound_variants = {25: 2, 50: 3, 75: 3, 100: 3, 200: 3}
         if distance in sound_variants:
-            variant = random.randint(1, sound_variants[distance])
+            variant = self.rng.randint(1, sound_variants[distance])
             self.play_sound(f"game_milebymile/{distance}miles{variant}.ogg")
 
         # Announce
@@ -1246,7 +1340,7 @@ class MileByMileGame(Game):
                 attacker_state.has_karma = False
                 target_state.has_karma = False
 
-                self.play_sound(f"game_cards/play{random.randint(1, 4)}.ogg")
+                self.play_sound(f"game_cards/play{self.rng.randint(1, 4)}.ogg")
 
                 # First announce the attack
                 if self.is_individual_mode():
@@ -1287,11 +1381,11 @@ class MileByMileGame(Game):
                 target_state.add_problem(HazardType.STOP)
 
         # Announce
-        self.play_sound(f"game_cards/play{random.randint(1, 4)}.ogg")
+        self.play_sound(f"game_cards/play{self.rng.randint(1, 4)}.ogg")
 
         # Hazard-specific sounds
         hazard_sounds = {
-            HazardType.ACCIDENT: f"game_milebymile/crash{random.randint(1, 2)}.ogg",
+            HazardType.ACCIDENT: f"game_milebymile/crash{self.rng.randint(1, 2)}.ogg",
             HazardType.OUT_OF_GAS: "game_milebymile/outofgas.ogg",
             HazardType.FLAT_TIRE: "game_milebymile/flat.ogg",
             HazardType.STOP: "game_milebymile/stop.ogg",
@@ -1329,7 +1423,7 @@ class MileByMileGame(Game):
         for member_name in target_team.members:
             member = self._get_player_by_name(member_name)
             if member and member.is_bot:
-                BotHelper.jolt_bot(member, ticks=random.randint(12, 18))
+                BotHelper.jolt_bot(member, ticks=self.rng.randint(12, 18))
 
         self._end_turn()
 
@@ -1343,14 +1437,14 @@ class MileByMileGame(Game):
         race_state.battle_pile.append(card)
 
         remedy = card.value
-        self.play_sound(f"game_cards/play{random.randint(1, 4)}.ogg")
+        self.play_sound(f"game_cards/play{self.rng.randint(1, 4)}.ogg")
 
         if remedy == RemedyType.END_OF_LIMIT:
             race_state.remove_problem(HazardType.SPEED_LIMIT)
             self.play_sound("game_milebymile/speedlimitend.ogg")
         elif remedy == RemedyType.ROLL:
             race_state.remove_problem(HazardType.STOP)
-            self.play_sound(f"game_milebymile/greenlight{random.randint(1, 3)}.ogg")
+            self.play_sound(f"game_milebymile/greenlight{self.rng.randint(1, 3)}.ogg")
         elif remedy == RemedyType.GASOLINE:
             race_state.remove_problem(HazardType.OUT_OF_GAS)
             self.play_sound("game_milebymile/gas.ogg")
@@ -1359,7 +1453,7 @@ class MileByMileGame(Game):
             self.play_sound("game_milebymile/sparetyre.ogg")
         elif remedy == RemedyType.REPAIRS:
             race_state.remove_problem(HazardType.ACCIDENT)
-            self.play_sound(f"game_milebymile/repair{random.randint(1, 2)}.ogg")
+            self.play_sound(f"game_milebymile/repair{self.rng.randint(1, 2)}.ogg")
 
         self._broadcast_card_message("milebymile-plays-card", card, player=player.name)
         self.discard_pile.append(card)
@@ -1402,12 +1496,12 @@ class MileByMileGame(Game):
             self._broadcast_card_message(
                 "milebymile-plays-card", card, player=player.name
             )
-            self.play_sound(f"game_cards/play{random.randint(1, 4)}.ogg")
+            self.play_sound(f"game_cards/play{self.rng.randint(1, 4)}.ogg")
 
             # Safety-specific sounds
             safety_sounds = {
                 SafetyType.DRIVING_ACE: "game_milebymile/drivingace.ogg",
-                SafetyType.EXTRA_TANK: f"game_milebymile/extratank{random.randint(1, 2)}.ogg",
+                SafetyType.EXTRA_TANK: f"game_milebymile/extratank{self.rng.randint(1, 2)}.ogg",
                 SafetyType.PUNCTURE_PROOF: "game_milebymile/punctureproof.ogg",
                 SafetyType.RIGHT_OF_WAY: "game_milebymile/rightofway.ogg",
             }
@@ -1440,7 +1534,7 @@ class MileByMileGame(Game):
 
         # Jolt bot to think about next play
         if player.is_bot:
-            BotHelper.jolt_bot(player, ticks=random.randint(30, 40))
+            BotHelper.jolt_bot(player, ticks=self.rng.randint(30, 40))
 
     def _play_special(self, player: MileByMilePlayer, slot: int, card: Card) -> None:
         """Play a special card (False Virtue)."""
@@ -1452,7 +1546,7 @@ class MileByMileGame(Game):
 
         if card.value == "false_virtue":
             race_state.has_karma = True
-            self.play_sound(f"game_cards/play{random.randint(1, 4)}.ogg")
+            self.play_sound(f"game_cards/play{self.rng.randint(1, 4)}.ogg")
 
             # Personalized messages like v10
             self._announce_false_virtue(player, player.team_index)
@@ -1471,7 +1565,7 @@ class MileByMileGame(Game):
             self.discard_pile.append(card)
 
         self.broadcast_l("milebymile-discards", player=player.name)
-        self.play_sound(f"game_cards/discard{random.randint(1, 3)}.ogg")
+        self.play_sound(f"game_cards/discard{self.rng.randint(1, 3)}.ogg")
         self._end_turn()
 
     # ==========================================================================
@@ -1486,9 +1580,9 @@ class MileByMileGame(Game):
             # Reshuffle discard pile
             self.deck.add_all(self.discard_pile)
             self.discard_pile = []
-            self.deck.shuffle()
+            self.deck.shuffle(self.rng)
             self.broadcast_l("milebymile-deck-reshuffled")
-            self.play_sound(f"game_cards/shuffle{random.randint(1, 3)}.ogg")
+            self.play_sound(f"game_cards/shuffle{self.rng.randint(1, 3)}.ogg")
 
         if self.options.rig_game == "No Duplicates":
             return self.deck.draw_non_duplicate(player.hand)
@@ -1531,7 +1625,10 @@ class MileByMileGame(Game):
 
     def on_start(self) -> None:
         """Called when the game starts."""
-        # Teams were already set up in prestart_validate()
+        # Teams are normally set up in prestart_validate(), which simulations
+        # and tests skip
+        if not self._team_manager.teams:
+            self._setup_teams()
         self.status = "playing"
         self.game_active = True
         self.current_race = 0
@@ -1565,7 +1662,7 @@ class MileByMileGame(Game):
             defense_multiplier=defense_mult,
             include_karma_cards=self.options.karma_rule,
         )
-        self.deck.shuffle()
+        self.deck.shuffle(self.rng)
 
         self.discard_pile = []
         self.protections_pile = []
@@ -1574,7 +1671,7 @@ class MileByMileGame(Game):
         self._deal_initial_hands()
 
         # Play shuffle sound (like Scopa)
-        shuffle_sound = random.choice(["shuffle1.ogg", "shuffle2.ogg", "shuffle3.ogg"])
+        shuffle_sound = self.rng.choice(["shuffle1.ogg", "shuffle2.ogg", "shuffle3.ogg"])
         self.play_sound(f"game_cards/{shuffle_sound}")
         self.broadcast_l("milebymile-new-race")
 
@@ -1592,7 +1689,7 @@ class MileByMileGame(Game):
         card = self._draw_card(player)
         if card:
             player.hand.append(card)
-            self.play_sound(f"game_cards/draw{random.randint(1, 4)}.ogg")
+            self.play_sound(f"game_cards/draw{self.rng.randint(1, 4)}.ogg")
             user = self.get_user(player)
             if user:
                 card_name = self._get_localized_card_name(card, user.locale)
@@ -1602,7 +1699,7 @@ class MileByMileGame(Game):
         self.announce_turn()
 
         if player.is_bot:
-            BotHelper.jolt_bot(player, ticks=random.randint(30, 50))
+            BotHelper.jolt_bot(player, ticks=self.rng.randint(30, 50))
 
         self._update_all_turn_actions()
         self.rebuild_all_menus()
@@ -1627,7 +1724,7 @@ class MileByMileGame(Game):
                 return
 
         # Advance to next player
-        BotHelper.jolt_bots(self, ticks=random.randint(15, 25))
+        BotHelper.jolt_bots(self, ticks=self.rng.randint(15, 25))
         self.advance_turn(announce=False)
         self._start_turn()
 
@@ -1975,6 +2072,24 @@ class MileByMileGame(Game):
 
         BotHelper.on_tick(self)
 
+    def get_idle_ticks(self) -> float:
+        """Ticks that would only count down timers and bot thinking."""
+        idle = min(
+            self._round_timer.idle_ticks(),
+            # Bots wait out the between-race countdown (see bot_think)
+            BotHelper.idle_ticks(self, waiting=self._round_timer.is_active),
+        )
+        if self.dirty_trick_window_ticks > 0:
+            idle = min(idle, self.dirty_trick_window_ticks - 1)
+        return idle
+
+    def skip_idle_ticks(self, ticks: int) -> None:
+        """Skip ticks that only count down timers and bot thinking."""
+        self._round_timer.skip_ticks(ticks)
+        if self.dirty_trick_window_ticks > 0:
+            self.dirty_trick_window_ticks -= ticks
+        BotHelper.skip_ticks(self, ticks)
+
     def bot_think(self, player: MileByMilePlayer) -> str | None:
         """Bot AI decision making."""
         # Don't act during between-race countdown
@@ -1999,7 +2114,7 @@ class MileByMileGame(Game):
             return None
 
         # Choose best card to play
-        return self._bot_choose_card(player)
+        return self.bot_search_move(player) or self._bot_choose_card(player)
 
     def _bot_choose_card(self, player: MileByMilePlayer) -> str | None:
         """Bot card selection logic."""
@@ -2028,6 +2143,72 @@ class MileByMileGame(Game):
 
         return f"card_slot_{best_slot + 1}"
 
+    # Look-ahead search (see SearchBotMixin); playouts last until the bot's
+    # next turn or the end of the race
+
+    def search_enabled(self, player: MileByMilePlayer) -> bool:
+        """Whether bots search, per the bot strategy option."""
+        return self.options.bot_strategy == "search"
+
+    def search_moves(self, player: MileByMilePlayer) -> list[str]:
+        """One card slot per distinct card in hand (bots discard unplayable cards)."""
+        if self.current_player != player or self._round_timer.is_active:
+            return []
+        moves = []
+        kinds = set()
+        for i, card in enumerate(player.hand):
+            kind = (card.card_type, card.value)
+            if kind not in kinds:
+                kinds.add(kind)
+                moves.append(f"card_slot_{i + 1}")
+        return moves
+
+    def search_determinize(self, player: MileByMilePlayer, rng) -> None:
+        """Deal the deck and the other hands again from their combined cards."""
+        others = [p for p in self.get_active_players() if p.id != player.id]
+        unseen = [*self.deck.cards, *(card for p in others for card in p.hand)]
+        rng.shuffle(unseen)
+        for other in others:
+            count = len(other.hand)
+            other.hand = unseen[:count]
+            unseen = unseen[count:]
+        self.deck.replace(unseen)
+
+    def search_horizon(
+        self, player: MileByMilePlayer, root: "MileByMileGame"
+    ) -> bool:
+        """Stop when it's the player's turn again or the race is over."""
+        current = self.current_player
+        return (
+            self._round_timer.is_active
+            or self.current_race != root.current_race
+            or (current is not None and current.id == player.id)
+        )
+
+    def search_value(self, player: MileByMilePlayer, root: "MileByMileGame") -> float:
+        """
+        Points the player's team gained (or is on course for), against the
+        average other team.
+        """
+        racing = not self._round_timer.is_active and self.current_race == root.current_race
+        gains = []
+        for team_idx, race_state in self.iter_teams():
+            gain = self.get_team_score(team_idx) - root.get_team_score(team_idx)
+            if racing:
+                gain += self._search_race_value(race_state)
+            gains.append(gain)
+        mine = gains.pop(player.team_index)
+        return mine - sum(gains) / max(1, len(gains))
+
+    def _search_race_value(self, race_state: RaceState) -> float:
+        """Rough worth in points of a team's position in a race still running."""
+        value = race_state.miles + 100 * len(race_state.safeties)
+        if not race_state.can_play_distance():
+            value -= 150
+        elif race_state.has_problem(HazardType.SPEED_LIMIT):
+            value -= 50
+        return value
+
     def _bot_score_card(
         self,
         player: MileByMilePlayer,
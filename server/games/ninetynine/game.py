@@ -9,7 +9,6 @@ Rules match v10 implementation with Quentin C and RS Games variants.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-import random
 
 from ..base import Game, Player, GameOptions
 from ..registry import register_game
@@ -32,6 +31,7 @@ from ...game_utils.cards import (
     RS_RANK_NINETY_NINE,
 )
 from ...game_utils.options import BoolOption, IntOption, MenuOption, option_field
+from ...game_utils.search import SearchBotMixin
 from ...messages.localization import Localization
 from ...ui.keybinds import KeybindState
 from .bot import bot_think as _bot_think
@@ -121,11 +121,25 @@ class NinetyNineOptions(GameOptions):
             change_msg="ninetynine-option-changed-autodraw",
         )
     )
+    bot_strategy: str = option_field(
+        MenuOption(
+            default="simple",
+            value_key="strategy",
+            choices=["simple", "search"],
+            choice_labels={
+                "simple": "game-bot-strategy-simple",
+                "search": "game-bot-strategy-search",
+            },
+            label="game-set-bot-strategy",
+            prompt="game-select-bot-strategy",
+            change_msg="game-option-changed-bot-strategy",
+        )
+    )
 
 
 @dataclass
 @register_game
-class NinetyNineGame(Game):
+class NinetyNineGame(Game, SearchBotMixin):
     """
     Ninety Nine - A card game where players try to avoid going over 99.
 
@@ -525,9 +539,9 @@ class NinetyNineGame(Game):
 
         # Build and shuffle deck based on variant
         if self.is_quentin_c:
-            self.deck, _ = DeckFactory.standard_deck()
+            self.deck, _ = DeckFactory.standard_deck(rng=self.rng)
         else:
-            self.deck, _ = DeckFactory.rs_games_deck()
+            self.deck, _ = DeckFactory.rs_games_deck(self.rng)
         self.discard_pile = []
 
         # Update alive players list
@@ -547,7 +561,7 @@ class NinetyNineGame(Game):
         # Set turn order to alive players
         self.set_turn_players(self.alive_players)
 
-        self.play_sound(f"game_cards/shuffle{random.randint(1, 3)}.ogg")
+        self.play_sound(f"game_cards/shuffle{self.rng.randint(1, 3)}.ogg")
         self.broadcast_l("ninetynine-round", round=self.round)
 
         self._start_turn()
@@ -573,7 +587,7 @@ class NinetyNineGame(Game):
 
         # Set up bot thinking
         if player.is_bot:
-            BotHelper.jolt_bot(player, ticks=random.randint(20, 40))
+            BotHelper.jolt_bot(player, ticks=self.rng.randint(20, 40))
 
         self._update_all_turn_actions()
         self.rebuild_all_menus()
@@ -635,7 +649,7 @@ class NinetyNineGame(Game):
             self.turn_index = (self.turn_index + self.turn_direction) % len(self.turn_player_ids)
             attempts += 1
 
-        BotHelper.jolt_bots(self, ticks=random.randint(15, 25))
+        BotHelper.jolt_bots(self, ticks=self.rng.randint(15, 25))
         self._start_turn()
 
     def _draw_card(self) -> Card | None:
@@ -644,9 +658,9 @@ class NinetyNineGame(Game):
             if not self.discard_pile:
                 return None
             # Reshuffle discard pile into deck
-            self.deck.cards = self.discard_pile[:]
+            self.deck.replace(self.discard_pile)
             self.discard_pile = []
-            self.deck.shuffle()
+            self.deck.shuffle(self.rng)
 
         return self.deck.draw_one()
 
@@ -783,7 +797,7 @@ class NinetyNineGame(Game):
         self.discard_pile.append(card)
 
         # Play card sound
-        self.play_sound(f"game_cards/play{random.randint(1, 4)}.ogg", 70)
+        self.play_sound(f"game_cards/play{self.rng.randint(1, 4)}.ogg", 70)
 
         # Announce the play
         self.broadcast_personal_l(
@@ -1051,7 +1065,7 @@ class NinetyNineGame(Game):
             player.hand.append(drawn)
             self._sort_hand(player)
 
-            self.play_sound(f"game_cards/draw{random.randint(1, 4)}.ogg")
+            self.play_sound(f"game_cards/draw{self.rng.randint(1, 4)}.ogg")
 
             user = self.get_user(player)
             if user:
@@ -1112,6 +1126,62 @@ class NinetyNineGame(Game):
 
         BotHelper.on_tick(self)
 
+    def get_idle_ticks(self) -> float:
+        """Ticks that would only count down bot thinking."""
+        if self.pending_draw_player_id:
+            return 0
+        return BotHelper.idle_ticks(self)
+
+    def skip_idle_ticks(self, ticks: int) -> None:
+        """Skip ticks that only count down bot thinking."""
+        BotHelper.skip_ticks(self, ticks)
+
     def bot_think(self, player: NinetyNinePlayer) -> str | None:
         """Bot AI decision making - delegates to bot module."""
-        return _bot_think(self, player)
+        return self.bot_search_move(player) or _bot_think(self, player)
+
+    # Look-ahead search (see SearchBotMixin); playouts last until the round ends
+
+    def search_enabled(self, player: NinetyNinePlayer) -> bool:
+        """Whether bots search, per the bot strategy option."""
+        return self.options.bot_strategy == "search"
+
+    def search_moves(self, player: NinetyNinePlayer) -> list[str]:
+        """The choice options, or one card slot per rank in hand."""
+        if self.current_player != player:
+            return []
+        if self.pending_choice is not None:
+            return ["choice_1", "choice_2"]
+        moves = []
+        ranks = set()
+        for i, card in enumerate(player.hand):
+            if card.rank not in ranks:
+                ranks.add(card.rank)
+                moves.append(f"card_slot_{i + 1}")
+        return moves
+
+    def search_determinize(self, player: NinetyNinePlayer, rng) -> None:
+        """Deal the deck and the other hands again from their combined cards."""
+        others = [p for p in self.alive_players if p.id != player.id]
+        unseen = [*self.deck.cards, *(card for p in others for card in p.hand)]
+        rng.shuffle(unseen)
+        for other in others:
+            count = len(other.hand)
+            other.hand = unseen[:count]
+            unseen = unseen[count:]
+            self._sort_hand(other)
+        self.deck.replace(unseen)
+
+    def search_horizon(self, player: NinetyNinePlayer, root: "NinetyNineGame") -> bool:
+        """Stop when the round is over (someone lost tokens)."""
+        return self.round != root.round
+
+    def search_value(self, player: NinetyNinePlayer, root: "NinetyNineGame") -> float:
+        """Tokens the player lost, against the average the others lost."""
+        losses = {
+            p.id: root_player.tokens - p.tokens
+            for p, root_player in zip(self.players, root.players)
+            if not p.is_spectator
+        }
+        mine = losses.pop(player.id)
+        return sum(losses.values()) / max(1, len(losses)) - mine
@@ -7,17 +7,18 @@ Supports individual and team modes via TeamManager.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-import random
 
 from ..base import Game, Player, GameOptions
 from ..registry import register_game
 from ...game_utils.actions import Action, ActionSet, Visibility
 from ...game_utils.bot_helper import BotHelper
 from ...game_utils.game_result import GameResult, PlayerResult
+from ...game_utils.hold_policy import simple_hold_at
 from ...game_utils.options import IntOption, MenuOption, TeamModeOption, option_field
 from ...game_utils.teams import TeamManager
 from ...messages.localization import Localization
 from ...ui.keybinds import KeybindState
+from .policy import policies
 
 
 @dataclass
@@ -225,9 +226,9 @@ class PigGame(Game):
         self.play_sound("game_pig/roll.ogg")
 
         # Jolt the rolling player to pause before next action
-        BotHelper.jolt_bot(player, ticks=random.randint(10, 20))
+        BotHelper.jolt_bot(player, ticks=self.rng.randint(10, 20))
 
-        roll = random.randint(1, self.options.dice_sides)
+        roll = self.rng.randint(1, self.options.dice_sides)
 
         if roll == 1:
             # Bust!
@@ -300,6 +301,10 @@ class PigGame(Game):
         # Initialize turn order
         self.set_turn_players(active_players)
 
+        # Start solving the bots' policy in the background for their turns
+        if not self._headless and any(p.is_bot for p in active_players):
+            policies.get_ready(*self._policy_rules())
+
         # Reset player round scores (total scores are in TeamManager)
         for player in active_players:
             player.round_score = 0
@@ -341,48 +346,51 @@ class PigGame(Game):
         # Rebuild menus to reflect new turn
         self.rebuild_all_menus()
 
-    def _setup_bot_target(self, player: Player) -> None:
-        """Set up the bot's target score for this turn."""
-        # Base target: random between 10-25
-        target = random.randint(10, 25)
+    def _policy_rules(self) -> tuple[int, int, int]:
+        """The options the bots' hold-at policy is solved for."""
+        return (
+            self.options.target_score,
+            self.options.min_bank_points,
+            self.options.dice_sides,
+        )
 
-        # Check if anyone is close to winning or has won (active players only)
-        active_players = self.get_active_players()
-        someone_hit_threshold = False
-        highest_score = 0
+    def _setup_bot_target(self, player: Player) -> None:
+        """
+        Set up the turn total the bot banks at, from the hold-at policy.
+
+        Live games don't wait for the policy to be solved; until it is, the
+        bot holds at simple_hold_at(). Which one applied depends on a
+        background thread, so the target is a journaled choice.
+        """
+        choice = BotHelper.journaled_choice(
+            self, player, lambda: str(self._bot_hold_at(player))
+        )
+        target = int(choice) if choice is not None else self._bot_hold_at(player)
+        BotHelper.set_target(player, target)
+
+    def _bot_hold_at(self, player: Player) -> int:
+        """The turn total for the bot to bank at this turn."""
+        my_team = self._team_manager.get_team(player.name)
+        best_opponent = max(
+            (
+                self.get_player_score(other)
+                for other in self.get_active_players()
+                if self._team_manager.get_team(other.name) is not my_team
+            ),
+            default=0,
+        )
+        rules = self._policy_rules()
+        # Simulations wait for the solve, which keeps them reproducible
+        policy = policies.get(*rules) if self._headless else policies.get_ready(*rules)
         my_score = self.get_player_score(player)
-
-        for other in active_players:
-            if other != player:
-                other_score = self.get_player_score(other)
-                if other_score >= self.options.target_score:
-                    someone_hit_threshold = True
-                    highest_score = max(highest_score, other_score)
-                elif other_score >= self.options.target_score - 1:
-                    highest_score = max(highest_score, other_score)
-
-        if someone_hit_threshold:
-            # Need to beat the highest score
-            target = highest_score + 1 - my_score
-        elif highest_score > 0:
-            # Someone close, try to beat them
-            target = highest_score + 1 - my_score
-
-        # If bot is close to winning, can relax
-        if (my_score + player.round_score) >= (
-            self.options.target_score - 1
-        ) and not someone_hit_threshold:
-            can_relax = True
-            for other in active_players:
-                if other != player:
-                    other_score = self.get_player_score(other)
-                    if other_score > (my_score + player.round_score - 8):
-                        can_relax = False
-                        break
-            if can_relax:
-                target = 0
-
-        BotHelper.set_target(player, max(0, target))
+        if policy is None:
+            return simple_hold_at(
+                my_score,
+                best_opponent,
+                self.options.target_score,
+                self.options.min_bank_points,
+            )
+        return policy.hold_at(my_score, best_opponent)
 
     def on_tick(self) -> None:
         """Called every tick. Handle bot AI."""
@@ -398,6 +406,17 @@ class PigGame(Game):
 
         BotHelper.on_tick(self)
 
+    def get_idle_ticks(self) -> float:
+        """Ticks that would only count down bot thinking."""
+        player = self.current_player
+        if player and player.is_bot and BotHelper.get_target(player) is None:
+            return 0  # on_tick() sets up the bot's target first
+        return BotHelper.idle_ticks(self)
+
+    def skip_idle_ticks(self, ticks: int) -> None:
+        """Skip ticks that only count down bot thinking."""
+        BotHelper.skip_ticks(self, ticks)
+
     def bot_think(self, player: PigPlayer) -> str | None:
         """Bot AI decision making. Called by BotHelper."""
         target = BotHelper.get_target(player)
@@ -522,5 +541,5 @@ class PigGame(Game):
     def end_turn(self, jolt_min: int = 20, jolt_max: int = 30) -> None:
         """Override to use Pig's turn advancement logic."""
         # Jolt all bots to pause for the turn change
-        BotHelper.jolt_bots(self, ticks=random.randint(jolt_min, jolt_max))
+        BotHelper.jolt_bots(self, ticks=self.rng.randint(jolt_min, jolt_max))
         self._on_turn_end()
@@ -0,0 +1,28 @@
+"""
+Hold-at policy for the Pig bot.
+
+Each roll of the die adds its value to the turn, except a 1, which busts.
+HoldPolicy turns that into the best turn total to bank at for every pair of
+scores; the bank minimum is the smallest threshold allowed.
+"""
+
+from ...game_utils.hold_policy import HoldPolicy, PolicyCache, TurnSteps
+
+
+def turn_steps(dice_sides: int) -> TurnSteps:
+    """The turn as a one-phase chain (see HoldPolicy)."""
+    return {0: [(roll, 0, 1 / dice_sides) for roll in range(2, dice_sides + 1)]}
+
+
+def solve_policy(target_score: int, min_bank_points: int, dice_sides: int) -> HoldPolicy:
+    """Solve the bot's policy for one set of options."""
+    return HoldPolicy(turn_steps(dice_sides), 0, target_score, min_bank_points)
+
+
+# Solved policies by options; live games use policies.get_ready()
+policies = PolicyCache(solve_policy)
+
+
+def load_policy(target_score: int, min_bank_points: int, dice_sides: int) -> HoldPolicy:
+    """The bot's policy for one set of options, solved on first use."""
+    return policies.get(target_score, min_bank_points, dice_sides)
@@ -9,7 +9,6 @@ to determine which actions to take.
 from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
-import random
 
 if TYPE_CHECKING:
     from .game import PiratesGame
@@ -103,12 +102,12 @@ def _analyze_and_decide(game: "PiratesGame", player: "PiratesPlayer") -> BotDeci
             # Try to activate sword fighter or skilled captain first
             if SWORD_FIGHTER.is_unlocked(player):
                 can_use, _ = SWORD_FIGHTER.can_perform(game, player)
-                if can_use and random.random() < 0.8:  # 80% chance to buff first
+                if can_use and game.rng.random() < 0.8:  # 80% chance to buff first
                     return BotDecision(action_id="use_skill", skill_name="sword_fighter")
 
             if SKILLED_CAPTAIN.is_unlocked(player):
                 can_use, _ = SKILLED_CAPTAIN.can_perform(game, player)
-                if can_use and random.random() < 0.8:
+                if can_use and game.rng.random() < 0.8:
                     return BotDecision(action_id="use_skill", skill_name="skilled_captain")
 
         # Decide whether to attack
@@ -117,7 +116,7 @@ def _analyze_and_decide(game: "PiratesGame", player: "PiratesPlayer") -> BotDeci
             has_attack_buff, target_has_defense, gem_distance
         )
 
-        if random.random() < attack_chance:
+        if game.rng.random() < attack_chance:
             # Use battleship if available and multiple targets or valuable target
             if BATTLESHIP.is_unlocked(player):
                 can_use, _ = BATTLESHIP.can_perform(game, player)
@@ -141,14 +140,14 @@ def _analyze_and_decide(game: "PiratesGame", player: "PiratesPlayer") -> BotDeci
         if can_use:
             # Check if another player is closer to a gem
             other_near_gem = _is_other_player_near_gem(game, player)
-            if other_near_gem and random.random() < 0.6:  # 60% chance to portal
+            if other_near_gem and game.rng.random() < 0.6:  # 60% chance to portal
                 return BotDecision(action_id="use_skill", skill_name="portal")
 
     # Priority 4: Use gem seeker if we have uses and can't find gems
     if gem_distance > 15:
         if GEM_SEEKER.is_unlocked(player):
             can_use, _ = GEM_SEEKER.can_perform(game, player)
-            if can_use and random.random() < 0.3:  # 30% chance
+            if can_use and game.rng.random() < 0.3:  # 30% chance
                 return BotDecision(action_id="use_skill", skill_name="gem_seeker")
 
     # Priority 5: Activate double devastation if targets are just out of range
@@ -158,7 +157,7 @@ def _analyze_and_decide(game: "PiratesGame", player: "PiratesPlayer") -> BotDeci
             # Check if there are targets in extended range but not current range
             extended_targets = combat.get_targets_in_range(game, player, max_range=10)
             current_targets = combat.get_targets_in_range(game, player, max_range=5)
-            if len(extended_targets) > len(current_targets) and random.random() < 0.5:
+            if len(extended_targets) > len(current_targets) and game.rng.random() < 0.5:
                 return BotDecision(action_id="use_skill", skill_name="double_devastation")
 
     # Default: Move toward closest gem or random
@@ -220,8 +219,8 @@ def _find_valuable_target(
         return scored_targets[0][0]
 
     # If no target has gems, still return one for XP (50% chance)
-    if targets and random.random() < 0.5:
-        return random.choice(targets)
+    if targets and game.rng.random() < 0.5:
+        return game.rng.choice(targets)
 
     return None
 
@@ -296,7 +295,7 @@ def _decide_movement(game: "PiratesGame", player: "PiratesPlayer") -> BotDecisio
         return _decide_movement_toward(game, player, closest_gem)
 
     # No gems left, random movement
-    direction = random.choice(["left", "right"])
+    direction = game.rng.choice(["left", "right"])
     return _get_best_move_action(game, player, direction)
 
 
@@ -312,7 +311,7 @@ def _decide_movement_toward(
         direction = "left"
     else:
         # Already at position, move randomly
-        direction = random.choice(["left", "right"])
+        direction = game.rng.choice(["left", "right"])
         return _get_best_move_action(game, player, direction)
 
     return _get_best_move_action(game, player, direction, target_pos)
@@ -373,7 +372,7 @@ def bot_select_target(
         return decision.target
 
     # Fall back to finding valuable target
-    return _find_valuable_target(game, player, targets) or random.choice(targets)
+    return _find_valuable_target(game, player, targets) or game.rng.choice(targets)
 
 
 def bot_select_boarding_action(
@@ -390,7 +389,7 @@ def bot_select_boarding_action(
     - Our attack bonuses vs their defense bonuses
     """
     if not can_steal or not defender.has_gems():
-        return random.choice(["left", "right"])
+        return game.rng.choice(["left", "right"])
 
     # Calculate steal success probability
     attack_bonus = skills.get_attack_bonus(player)
@@ -411,10 +410,10 @@ def bot_select_boarding_action(
     # More gems = more tempting to steal
     steal_chance += min(0.2, len(defender.gems) * 0.05)
 
-    if random.random() < steal_chance:
+    if game.rng.random() < steal_chance:
         return "steal"
 
-    return random.choice(["left", "right"])
+    return game.rng.choice(["left", "right"])
 
 
 def bot_select_portal_ocean(
@@ -460,10 +459,10 @@ def bot_select_portal_ocean(
 
     # Pick the best ocean, with some randomness
     if scored_oceans:
-        if random.random() < 0.8:  # 80% chance to pick best
+        if game.rng.random() < 0.8:  # 80% chance to pick best
             return scored_oceans[0][0]
         else:
-            return random.choice([o[0] for o in scored_oceans])
+            return game.rng.choice([o[0] for o in scored_oceans])
 
     return ocean_options[0][0]
 
@@ -9,7 +9,6 @@ scattered throughout the Lua code.
 from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
-import random
 
 if TYPE_CHECKING:
     from .game import PiratesGame
@@ -92,7 +91,7 @@ def do_attack(
         CombatResult with the outcome
     """
     # Play cannon sound
-    sound_num = random.randint(1, 3)
+    sound_num = game.rng.randint(1, 3)
     game.play_sound(f"game_pirates/cannon{sound_num}.ogg", volume=60)
 
     # Announce attack
@@ -115,7 +114,7 @@ def do_attack(
     defense_bonus = skills.get_defense_bonus(defender)
 
     # Roll attack
-    attack_roll = random.randint(1, 6)
+    attack_roll = game.rng.randint(1, 6)
     game.broadcast_l("pirates-attack-roll", roll=attack_roll)
 
     if attack_bonus > 0:
@@ -123,7 +122,7 @@ def do_attack(
         attack_roll += attack_bonus
 
     # Roll defense
-    defense_roll = random.randint(1, 6)
+    defense_roll = game.rng.randint(1, 6)
     if defender_user:
         defender_user.speak_l("pirates-defense-roll", roll=defense_roll)
     game.broadcast_l("pirates-defense-roll-others", player=defender.name, roll=defense_roll, exclude=defender)
@@ -140,7 +139,7 @@ def do_attack(
 
     if hit:
         # Hit!
-        sound_num = random.randint(1, 3)
+        sound_num = game.rng.randint(1, 3)
         game.play_sound(f"game_pirates/cannonhit{sound_num}.ogg", volume=70)
 
         if attacker_user:
@@ -155,7 +154,7 @@ def do_attack(
         )
 
         # Give XP to attacker
-        xp_gain = random.randint(50, 150)
+        xp_gain = game.rng.randint(50, 150)
         attacker.leveling.give_xp(
             game, attacker.name, xp_gain, moon_mult, global_xp_multiplier
         )
@@ -189,7 +188,7 @@ def do_attack(
         )
 
         # Give XP to defender for successful defense
-        xp_gain = random.randint(30, 100)
+        xp_gain = game.rng.randint(30, 100)
         defender.leveling.give_xp(
             game, defender.name, xp_gain, moon_mult, global_xp_multiplier
         )
@@ -247,7 +246,7 @@ def _handle_boarding(
             return
 
     # Bot or timeout - random push
-    direction = random.choice(["left", "right"])
+    direction = game.rng.choice(["left", "right"])
     _push_defender(game, attacker, defender, direction)
 
 
@@ -258,7 +257,7 @@ def _push_defender(
     direction: str
 ) -> None:
     """Push the defender in the specified direction."""
-    push_amount = random.randint(3, 8)
+    push_amount = game.rng.randint(3, 8)
     if direction == "left":
         push_amount = -push_amount
 
@@ -315,8 +314,8 @@ def _attempt_gem_steal(
     """
     game.broadcast_l("pirates-steal-attempt", attacker=attacker.name)
 
-    steal_roll = random.randint(1, 6) + attack_bonus
-    defend_roll = random.randint(1, 6) + defense_bonus
+    steal_roll = game.rng.randint(1, 6) + attack_bonus
+    defend_roll = game.rng.randint(1, 6) + defense_bonus
 
     game.broadcast_l(
         "pirates-steal-rolls",
@@ -326,7 +325,7 @@ def _attempt_gem_steal(
 
     if steal_roll > defend_roll:
         # Successful steal
-        stolen_index = random.randint(0, len(defender.gems) - 1)
+        stolen_index = game.rng.randint(0, len(defender.gems) - 1)
         stolen_gem = defender.remove_gem(stolen_index)
         if stolen_gem is not None:
             gem_value = gems.get_gem_value(stolen_gem)
@@ -336,7 +335,7 @@ def _attempt_gem_steal(
             defender.recalculate_score(gems.get_gem_value)
 
             # Play steal sound
-            sound_num = random.randint(1, 2)
+            sound_num = game.rng.randint(1, 2)
             game.play_sound(f"game_pirates/stealgem{sound_num}.ogg", volume=70)
 
             gem_name = gems.get_gem_name(stolen_gem)
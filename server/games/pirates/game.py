@@ -9,7 +9,6 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING
-import random
 
 from ..base import Game, Player
 from ..registry import register_game
@@ -445,20 +444,20 @@ class PiratesGame(Game):
 
         # Select 4 random oceans
         available = list(OCEAN_NAMES)
-        random.shuffle(available)
+        self.rng.shuffle(available)
         self.selected_oceans = available[:4]
 
         self.broadcast_l("pirates-oceans", oceans=", ".join(self.selected_oceans))
 
         # Initialize player positions randomly
         for player in self.get_active_players():
-            player.position = random.randint(1, 40)
+            player.position = self.rng.randint(1, 40)
 
         # Initialize charted tiles
         self.charted_tiles = {i: False for i in range(1, 41)}
 
         # Place gems
-        self.gem_positions = gems.place_gems(40)
+        self.gem_positions = gems.place_gems(40, self.rng)
         self.total_gems = 18
         self.gems_collected = 0
 
@@ -473,7 +472,7 @@ class PiratesGame(Game):
         self._start_round()
 
         # Jolt bots
-        BotHelper.jolt_bots(self, ticks=random.randint(80, 120))
+        BotHelper.jolt_bots(self, ticks=self.rng.randint(80, 120))
 
     def _start_round(self) -> None:
         """Start a new round."""
@@ -520,6 +519,15 @@ class PiratesGame(Game):
         # Process bot thinking
         BotHelper.on_tick(self)
 
+    def get_idle_ticks(self) -> float:
+        """Ticks that would only count down sounds and bot thinking."""
+        return min(self.get_sound_idle_ticks(), BotHelper.idle_ticks(self))
+
+    def skip_idle_ticks(self, ticks: int) -> None:
+        """Skip ticks that only count down sounds and bot thinking."""
+        self.skip_sound_ticks(ticks)
+        BotHelper.skip_ticks(self, ticks)
+
     def bot_think(self, player: Player) -> str | None:
         """Determine what action a bot should take."""
         if not isinstance(player, PiratesPlayer):
@@ -552,7 +560,7 @@ class PiratesGame(Game):
         self.rebuild_all_menus()
 
         # Jolt bots
-        BotHelper.jolt_bots(self, ticks=random.randint(80, 120))
+        BotHelper.jolt_bots(self, ticks=self.rng.randint(80, 120))
 
     def _check_gem_collection(self, player: PiratesPlayer) -> None:
         """Check if player is on a gem and collect it."""
@@ -564,7 +572,7 @@ class PiratesGame(Game):
         gem_name = gems.get_gem_name(gem_type)
 
         # Play collection sound
-        sound_num = random.randint(1, 3)
+        sound_num = self.rng.randint(1, 3)
         self.play_sound(f"game_pirates/grabgem{sound_num}.ogg", volume=70)
 
         # Add gem to player
@@ -582,7 +590,7 @@ class PiratesGame(Game):
         )
 
         # Give XP for finding gem
-        xp_gain = random.randint(150, 300)
+        xp_gain = self.rng.randint(150, 300)
         moon_mult = 3.0 if self.golden_moon_active else 1.0
         player.leveling.give_xp(
             self, player.name, xp_gain, moon_mult, self.options.find_gem_xp_multiplier
@@ -607,7 +615,7 @@ class PiratesGame(Game):
         winners = [p for p in active_players if p.score == highest_score]
 
         # If tie, pick random winner
-        winner = random.choice(winners)
+        winner = self.rng.choice(winners)
 
         self.play_sound("game_pig/win.ogg", volume=80)
         self.broadcast_l("pirates-winner", player=winner.name, score=winner.score)
@@ -701,13 +709,13 @@ class PiratesGame(Game):
         # Play movement sound
         abs_amount = abs(amount)
         if abs_amount == 1:
-            sound_num = random.randint(1, 3)
+            sound_num = self.rng.randint(1, 3)
             self.play_sound(f"game_pirates/move{sound_num}.ogg", volume=60)
         elif abs_amount == 2:
-            sound_num = random.randint(1, 3)
+            sound_num = self.rng.randint(1, 3)
             self.play_sound(f"game_pirates/boat{sound_num}.ogg", volume=60)
         elif abs_amount == 3:
-            sound_num = random.randint(1, 2)
+            sound_num = self.rng.randint(1, 2)
             self.play_sound(f"game_pirates/future{sound_num}.ogg", volume=60)
 
         direction = "right" if amount > 0 else "left"
@@ -905,7 +913,7 @@ class PiratesGame(Game):
             chosen_ocean = bot_ai.bot_select_portal_ocean(self, player, occupied_oceans)
         else:
             # For now, simplified to random selection
-            chosen_ocean = random.choice(occupied_oceans)[0]
+            chosen_ocean = self.rng.choice(occupied_oceans)[0]
 
         if chosen_ocean is None:
             return "continue"
@@ -913,12 +921,12 @@ class PiratesGame(Game):
         # Teleport to random position in chosen ocean
         ocean_start = chosen_ocean * 10 + 1
         ocean_end = (chosen_ocean + 1) * 10
-        new_pos = random.randint(ocean_start, ocean_end)
+        new_pos = self.rng.randint(ocean_start, ocean_end)
 
         player.position = new_pos
         skill.start_cooldown(player)
 
-        sound_num = random.randint(1, 2)
+        sound_num = self.rng.randint(1, 2)
         self.play_sound(f"game_pirates/portal{sound_num}.ogg", volume=60)
 
         ocean_name = self.selected_oceans[chosen_ocean] if chosen_ocean < len(self.selected_oceans) else "Unknown"
@@ -83,12 +83,15 @@ def calculate_score_from_gems(gems: list[int]) -> int:
     return sum(get_gem_value(gem) for gem in gems)
 
 
-def place_gems(map_size: int = 40) -> dict[int, int]:
+def place_gems(
+    map_size: int = 40, rng: random.Random | None = None
+) -> dict[int, int]:
     """
     Place all gems randomly across the map.
 
     Args:
         map_size: Total number of tiles (default 40)
+        rng: Random generator to place with (e.g. the game's)
 
     Returns:
         Dictionary mapping position -> gem_type (-1 if no gem)
@@ -101,7 +104,7 @@ def place_gems(map_size: int = 40) -> dict[int, int]:
 
     # Place all 18 gems randomly
     available_positions = list(range(1, map_size + 1))
-    random.shuffle(available_positions)
+    (rng or random).shuffle(available_positions)
 
     for gem_type in range(TOTAL_GEM_TYPES):
         pos = available_positions.pop()
@@ -13,7 +13,6 @@ Player stores skill state in simple dicts:
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
-import random
 
 if TYPE_CHECKING:
     from .game import PiratesGame
@@ -185,7 +184,7 @@ class SailorsInstinctSkill(Skill):
         return True, None
 
     def do_action(self, game: "PiratesGame", player: "PiratesPlayer") -> str:
-        sound_num = random.randint(1, 2)
+        sound_num = game.rng.randint(1, 2)
         game.play_sound(f"game_pirates/instinct{sound_num}.ogg", volume=60)
 
         ocean_index = (player.position - 1) // 10
@@ -276,7 +275,7 @@ class GemSeekerSkill(Skill):
     def do_action(self, game: "PiratesGame", player: "PiratesPlayer") -> str:
         self.set_uses(player, self.get_uses(player) - 1)
 
-        sound_num = random.randint(1, 2)
+        sound_num = game.rng.randint(1, 2)
         game.play_sound(f"game_pirates/gemseeker{sound_num}.ogg", volume=60)
 
         from .gems import GEM_NAMES
@@ -332,7 +331,7 @@ class PushSkill(BuffSkill):
 
     def do_action(self, game: "PiratesGame", player: "PiratesPlayer") -> str:
         self.activate(player)
-        sound_num = random.randint(1, 2)
+        sound_num = game.rng.randint(1, 2)
         game.play_sound(f"game_pirates/push{sound_num}.ogg", volume=60)
 
         user = game.get_user(player)
@@ -7,11 +7,14 @@ Handles bot decision making for card play.
 from typing import TYPE_CHECKING
 
 from ...game_utils.cards import Card
-from .capture import find_captures, select_best_capture
+from .capture import find_best_capture
 
 if TYPE_CHECKING:
     from .game import ScopaGame, ScopaPlayer
 
+# Value of clearing the table, on the scale of capture_value()
+SCOPA_VALUE = 100
+
 
 def bot_think(game: "ScopaGame", player: "ScopaPlayer") -> str | None:
     """
@@ -54,43 +57,36 @@ def evaluate_card(game: "ScopaGame", card: Card, player: "ScopaPlayer") -> float
     Returns:
         Score for this card (higher is better).
     """
-    score = 0.0
     inverse = game.options.inverse_scopa
     escoba = game.options.escoba
 
-    captures = find_captures(game.table_cards, card.rank, escoba)
+    best_capture = find_best_capture(game.table_cards, card.rank, escoba)
 
-    if not captures:
+    if not best_capture:
         # No capture available
         if inverse:
-            score = 10 - (card.rank * 0.5)  # Prefer playing low cards
-        else:
-            score = -5 + (card.rank * 0.5)  # Prefer playing high cards
-    else:
-        best_capture = select_best_capture(captures)
-        num_captured = len(best_capture)
-
-        if inverse:
-            # Inverse: avoid capturing
-            score = -num_captured * 10
-        else:
-            # Normal: prefer capturing
-            score = num_captured * 10
-
-        # Check for scopa
-        is_scopa = num_captured == len(game.table_cards) and len(game.table_cards) > 0
-        if is_scopa:
-            score += 100 if not inverse else -100
-
-        # Evaluate captured card values
-        for c in best_capture:
-            if c.suit == 1:  # Diamond
-                score += 5 if not inverse else -5
-            if c.rank == 7 and c.suit == 1:  # 7 of diamonds
-                score += 20 if not inverse else -20
-            if c.rank == 7:  # Any 7
-                score += 3 if not inverse else -3
-            if c.rank in (1, 6):  # Primiera cards
-                score += 2 if not inverse else -2
-
-    return score
+            return 10 - (card.rank * 0.5)  # Prefer playing low cards
+        return -5 + (card.rank * 0.5)  # Prefer playing high cards
+
+    score = float(sum(capture_value(c) for c in best_capture))
+
+    # Check for scopa
+    if len(best_capture) == len(game.table_cards):
+        score += SCOPA_VALUE
+
+    # Inverse: avoid capturing
+    return -score if inverse else score
+
+
+def capture_value(card: Card) -> int:
+    """How much the bot wants to capture a card (towards the round's points)."""
+    value = 10
+    if card.suit == 1:  # Diamond
+        value += 5
+    if card.rank == 7 and card.suit == 1:  # 7 of diamonds
+        value += 20
+    if card.rank == 7:  # Any 7
+        value += 3
+    if card.rank in (1, 6):  # Primiera cards
+        value += 2
+    return value
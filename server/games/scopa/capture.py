@@ -2,31 +2,85 @@
 Capture logic for Scopa game.
 
 Handles finding valid capture combinations and selecting the best one.
+
+Captures depend only on the ranks of the table cards (in table order), so
+they are computed as bitmasks over those ranks (bit i = the i-th table
+card) and cached. Within a turn the bot's evaluation of every card, the
+capture hints in every menu label and the capture made by the card played
+all look up the same table state and share one computation; the same rank
+layouts also recur across turns and games.
 """
 
+import functools
+
 from ...game_utils.cards import Card, card_name
 
+# Escoba captures sum to this, including the card played
+ESCOBA_TOTAL = 15
 
-def find_subsets_with_sum(cards: list[Card], target: int) -> list[list[Card]]:
-    """Find all subsets of cards that sum to target."""
+
+@functools.lru_cache(maxsize=4096)
+def subset_sum_masks(ranks: tuple[int, ...], target: int) -> tuple[int, ...]:
+    """
+    Find every subset of ranks that sums to target, as bitmasks.
+
+    Subsets come in lexicographic order of their indices (the order a
+    backtracking search over the cards finds them). Partial results are
+    shared between branches, keyed by (first index, remaining sum).
+    """
     if target <= 0:
-        return []
+        return ()
+
+    count = len(ranks)
+    memo: dict[tuple[int, int], tuple[int, ...]] = {}
+
+    def masks_from(start: int, remaining: int) -> tuple[int, ...]:
+        key = (start, remaining)
+        if key in memo:
+            return memo[key]
+        masks: list[int] = []
+        for i in range(start, count):
+            rank = ranks[i]
+            if rank == remaining:
+                masks.append(1 << i)
+            elif rank < remaining:
+                bit = 1 << i
+                masks.extend(bit | rest for rest in masks_from(i + 1, remaining - rank))
+        result = memo[key] = tuple(masks)
+        return result
+
+    return masks_from(0, target)
+
+
+@functools.lru_cache(maxsize=4096)
+def capture_masks(
+    ranks: tuple[int, ...], card_value: int, escoba: bool = False
+) -> tuple[int, ...]:
+    """Bitmasks of the table cards each valid capture takes (see find_captures)."""
+    if escoba:
+        return subset_sum_masks(ranks, ESCOBA_TOTAL - card_value)
+    # Standard scopa: any single rank match must be taken instead of a sum
+    rank_matches = tuple(1 << i for i, rank in enumerate(ranks) if rank == card_value)
+    return rank_matches or subset_sum_masks(ranks, card_value)
 
-    results: list[list[Card]] = []
 
-    def backtrack(start: int, current: list[Card], current_sum: int):
-        if current_sum == target:
-            results.append(list(current))
-            return
-        if current_sum > target:
-            return
-        for i in range(start, len(cards)):
-            current.append(cards[i])
-            backtrack(i + 1, current, current_sum + cards[i].rank)
-            current.pop()
+@functools.lru_cache(maxsize=4096)
+def best_capture_mask(
+    ranks: tuple[int, ...], card_value: int, escoba: bool = False
+) -> int:
+    """Bitmask of the best capture (most cards, first found), or 0 if none."""
+    return max(capture_masks(ranks, card_value, escoba), key=int.bit_count, default=0)
 
-    backtrack(0, [], 0)
-    return results
+
+def _cards_in_mask(cards: list[Card], mask: int) -> list[Card]:
+    """The cards whose bits are set in mask, in table order."""
+    return [card for i, card in enumerate(cards) if mask >> i & 1]
+
+
+def find_subsets_with_sum(cards: list[Card], target: int) -> list[list[Card]]:
+    """Find all subsets of cards that sum to target."""
+    masks = subset_sum_masks(tuple(c.rank for c in cards), target)
+    return [_cards_in_mask(cards, mask) for mask in masks]
 
 
 def find_captures(
@@ -46,18 +100,21 @@ def find_captures(
     For standard scopa: rank match first, then sum combinations.
     For escoba: find combinations that sum to 15 (including played card).
     """
-    if escoba:
-        # Escoba: find subsets that sum to 15 - card_value
-        target = 15 - card_value
-        return find_subsets_with_sum(table_cards, target)
-    else:
-        # Standard scopa: rank match first
-        rank_matches = [c for c in table_cards if c.rank == card_value]
-        if rank_matches:
-            # Return each single match as a separate option
-            return [[c] for c in rank_matches]
-        # No rank match, find sum combinations
-        return find_subsets_with_sum(table_cards, card_value)
+    masks = capture_masks(tuple(c.rank for c in table_cards), card_value, escoba)
+    return [_cards_in_mask(table_cards, mask) for mask in masks]
+
+
+def find_best_capture(
+    table_cards: list[Card], card_value: int, escoba: bool = False
+) -> list[Card]:
+    """
+    Find the best capture for a card value: select_best_capture(find_captures()).
+
+    Returns:
+        The captured cards, or an empty list if the card captures nothing.
+    """
+    mask = best_capture_mask(tuple(c.rank for c in table_cards), card_value, escoba)
+    return _cards_in_mask(table_cards, mask)
 
 
 def select_best_capture(captures: list[list[Card]]) -> list[Card]:
@@ -82,10 +139,9 @@ def get_capture_hint(
     Returns:
         Hint string like " -> 7 of Coins" or " -> 3 cards", or empty string.
     """
-    captures = find_captures(table_cards, card.rank, escoba)
-    if not captures:
+    best = find_best_capture(table_cards, card.rank, escoba)
+    if not best:
         return ""
-    best = select_best_capture(captures)
     if len(best) == 1:
         return f" -> {card_name(best[0], locale)}"
     else:
@@ -6,7 +6,6 @@ Classic Italian card game: capture cards from the table by matching ranks or sum
 
 from dataclasses import dataclass, field
 from datetime import datetime
-import random
 
 from ..base import Game, Player, GameOptions
 from ..registry import register_game
@@ -30,13 +29,14 @@ from ...game_utils.options import (
 )
 from ...game_utils.teams import TeamManager
 from ...game_utils.round_timer import RoundTimer
+from ...game_utils.search import SearchBotMixin
 from ...messages.localization import Localization
 from ...ui.keybinds import KeybindState
 
 # Modular components
-from .capture import find_captures, select_best_capture, get_capture_hint
+from .capture import find_best_capture, get_capture_hint
 from .scoring import score_round, check_winner, declare_winner
-from .bot import bot_think
+from .bot import SCOPA_VALUE, bot_think, capture_value
 
 
 @dataclass
@@ -149,11 +149,25 @@ class ScopaOptions(GameOptions):
             change_msg="scopa-option-changed-inverse",
         )
     )
+    bot_strategy: str = option_field(
+        MenuOption(
+            default="simple",
+            value_key="strategy",
+            choices=["simple", "search"],
+            choice_labels={
+                "simple": "game-bot-strategy-simple",
+                "search": "game-bot-strategy-search",
+            },
+            label="game-set-bot-strategy",
+            prompt="game-select-bot-strategy",
+            change_msg="game-option-changed-bot-strategy",
+        )
+    )
 
 
 @dataclass
 @register_game
-class ScopaGame(Game):
+class ScopaGame(Game, SearchBotMixin):
     """
     Scopa card game.
 
@@ -512,9 +526,11 @@ class ScopaGame(Game):
 
     def _create_deck(self) -> None:
         """Create and shuffle the deck."""
-        self.deck, _ = DeckFactory.italian_deck(self.options.number_of_decks)
+        self.deck, _ = DeckFactory.italian_deck(
+            self.options.number_of_decks, self.rng
+        )
         # Play shuffle sound
-        shuffle_sound = random.choice(["shuffle1.ogg", "shuffle2.ogg", "shuffle3.ogg"])
+        shuffle_sound = self.rng.choice(["shuffle1.ogg", "shuffle2.ogg", "shuffle3.ogg"])
         self.play_sound(f"game_cards/{shuffle_sound}")
 
     def _start_round(self) -> None:
@@ -571,7 +587,7 @@ class ScopaGame(Game):
                     break
                 # Re-shuffle and try again
                 self.deck.add(self.table_cards)
-                self.deck.shuffle()
+                self.deck.shuffle(self.rng)
         else:
             self.table_cards = self.deck.draw(initial_table)
 
@@ -627,7 +643,7 @@ class ScopaGame(Game):
         self.announce_turn()
 
         if player.is_bot:
-            BotHelper.jolt_bot(player, ticks=random.randint(15, 25))
+            BotHelper.jolt_bot(player, ticks=self.rng.randint(15, 25))
 
         self._update_all_card_actions()
         self.rebuild_all_menus()
@@ -638,14 +654,15 @@ class ScopaGame(Game):
         player.hand = [c for c in player.hand if c.id != card.id]
 
         # Play sound
-        play_sound = random.choice(["play1.ogg", "play2.ogg", "play3.ogg", "play4.ogg"])
+        play_sound = self.rng.choice(["play1.ogg", "play2.ogg", "play3.ogg", "play4.ogg"])
         self.play_sound(f"game_cards/{play_sound}")
 
         # Find and execute capture
-        captures = find_captures(self.table_cards, card.rank, self.options.escoba)
+        best_capture = find_best_capture(
+            self.table_cards, card.rank, self.options.escoba
+        )
 
-        if captures:
-            best_capture = select_best_capture(captures)
+        if best_capture:
             self._execute_capture(player, card, best_capture)
         else:
             # No capture, card goes to table
@@ -661,7 +678,7 @@ class ScopaGame(Game):
                 "scopa-player-puts-down", card=card, player=player.name, exclude=player
             )
 
-        BotHelper.jolt_bots(self, ticks=random.randint(8, 15))
+        BotHelper.jolt_bots(self, ticks=self.rng.randint(8, 15))
         self._end_turn()
 
     def _execute_capture(
@@ -854,11 +871,76 @@ class ScopaGame(Game):
         self._round_timer.on_tick()
         BotHelper.on_tick(self)
 
+    def get_idle_ticks(self) -> float:
+        """Ticks that would only count down the round timer and bot thinking."""
+        # Between rounds hands are empty, so bots have nothing to play
+        player = self.current_player
+        waiting = self._round_timer.is_active and player is not None and not player.hand
+        return min(
+            self._round_timer.idle_ticks(), BotHelper.idle_ticks(self, waiting=waiting)
+        )
+
+    def skip_idle_ticks(self, ticks: int) -> None:
+        """Skip ticks that only count down the round timer and bot thinking."""
+        self._round_timer.skip_ticks(ticks)
+        BotHelper.skip_ticks(self, ticks)
+
     def bot_think(self, player: Player) -> str | None:
         """Bot AI decision making - delegated to bot module."""
         if not isinstance(player, ScopaPlayer):
             return None
-        return bot_think(self, player)
+        return self.bot_search_move(player) or bot_think(self, player)
+
+    # Look-ahead search (see SearchBotMixin); playouts last until the deal
+    # is played out
+
+    def search_enabled(self, player: Player) -> bool:
+        """Whether bots search, per the bot strategy option."""
+        return self.options.bot_strategy == "search"
+
+    def search_moves(self, player: Player) -> list[str]:
+        """One play per card in hand."""
+        if self.current_player != player or self._round_timer.is_active:
+            return []
+        return [f"play_card_{card.id}" for card in player.hand]
+
+    def search_determinize(self, player: Player, rng) -> None:
+        """Deal the deck and the other hands again from their combined cards."""
+        others = [p for p in self.get_active_players() if p.id != player.id]
+        unseen = [*self.deck.cards, *(card for p in others for card in p.hand)]
+        rng.shuffle(unseen)
+        for other in others:
+            count = len(other.hand)
+            other.hand = unseen[:count]
+            unseen = unseen[count:]
+        self.deck.replace(unseen)
+
+    def search_horizon(self, player: Player, root: "ScopaGame") -> bool:
+        """Stop once the hands are empty (next deal or end of round)."""
+        return self._current_deal != root._current_deal or not any(
+            p.hand for p in self.get_active_players()
+        )
+
+    def search_value(self, player: Player, root: "ScopaGame") -> float:
+        """
+        Captures and points the player's team gained, against the average
+        other team (reversed for inverse scopa).
+        """
+        gains = [0.0] * len(self.team_manager.teams)
+        for p, root_player in zip(self.players, root.players):
+            if p.is_spectator:
+                continue
+            captured = p.captured[len(root_player.captured) :]
+            team = self.team_manager.get_team_index(p.name)
+            gains[team] += sum(capture_value(card) for card in captured)
+        for team, root_team in zip(self.team_manager.teams, root.team_manager.teams):
+            points = team.total_score + team.round_score
+            root_points = root_team.total_score + root_team.round_score
+            gains[team.index] += (points - root_points) * SCOPA_VALUE
+
+        mine = gains.pop(self.team_manager.get_team_index(player.name))
+        value = mine - sum(gains) / max(1, len(gains))
+        return -value if self.options.inverse_scopa else value
 
     # ==========================================================================
     # Action Handlers
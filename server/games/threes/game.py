@@ -7,13 +7,13 @@ Threes = 0 points. Lowest score wins!
 
 from dataclasses import dataclass, field
 from datetime import datetime
-import random
+import functools
 
 from ..base import Game, Player
 from ..registry import register_game
 from ...game_utils.actions import Action, ActionSet, Visibility
 from ...game_utils.bot_helper import BotHelper
-from ...game_utils.dice import DiceSet
+from ...game_utils.dice import DiceSet, KeepTurn
 from ...game_utils.dice_game_mixin import DiceGameMixin
 from ...game_utils.game_result import GameResult, PlayerResult
 from ...game_utils.options import IntOption, option_field, GameOptions
@@ -21,6 +21,28 @@ from ...messages.localization import Localization
 from ...ui.keybinds import KeybindState
 
 
+NUM_DICE = 5
+MOON_SCORE = -30
+
+
+def threes_score(dice: tuple[int, ...]) -> int:
+    """Score of a finished turn: threes count 0, five sixes shoot the moon."""
+    if len(dice) == NUM_DICE and dice.count(6) == NUM_DICE:
+        return MOON_SCORE
+    return sum(v for v in dice if v != 3)
+
+
+def _threes_key(kept: tuple[int, ...]) -> tuple[int, bool]:
+    """What the rest of a turn depends on: the score so far, and all sixes."""
+    return sum(v for v in kept if v != 3), kept.count(6) == len(kept)
+
+
+@functools.cache
+def threes_turn() -> KeepTurn:
+    """Turn solver minimizing the expected turn score."""
+    return KeepTurn(NUM_DICE, lambda dice: -threes_score(dice), key=_threes_key)
+
+
 @dataclass
 class ThreesPlayer(Player):
     """Player state for Threes game."""
@@ -81,6 +103,10 @@ class ThreesGame(Game, DiceGameMixin):
     def get_category(cls) -> str:
         return "category-dice-games"
 
+    @classmethod
+    def warm_up(cls) -> None:
+        threes_turn().expected()
+
     @classmethod
     def get_min_players(cls) -> int:
         return 2
@@ -270,7 +296,7 @@ class ThreesGame(Game, DiceGameMixin):
 
         # Roll dice (locks kept dice and rerolls unlocked)
         self.play_sound("game_pig/roll.ogg")
-        player.dice.roll()
+        player.dice.roll(rng=self.rng)
 
         # Announce roll
         dice_str = player.dice.format_values_only()
@@ -285,9 +311,7 @@ class ThreesGame(Game, DiceGameMixin):
 
         # Give bot time to think about next action
         if player.is_bot:
-            import random
-
-            BotHelper.jolt_bot(player, ticks=random.randint(15, 30))
+            BotHelper.jolt_bot(player, ticks=self.rng.randint(15, 30))
 
         self.rebuild_all_menus()
 
@@ -317,12 +341,10 @@ class ThreesGame(Game, DiceGameMixin):
     def _score_turn(self, player: ThreesPlayer) -> None:
         """Calculate and apply turn score."""
         # Threes = 0 points, so sum all values excluding 3s
-        score = player.dice.sum_values(exclude_value=3)
-        six_count = player.dice.count_value(6)
+        score = threes_score(tuple(player.dice.values))
 
         # Check for shooting the moon (5 sixes)
-        if six_count == 5:
-            score = -30
+        if score == MOON_SCORE:
             self.play_sound("game_pig/win.ogg")
             self.broadcast_personal_l(player, "threes-you-shot-moon", "threes-shot-moon")
         else:
@@ -349,7 +371,9 @@ class ThreesGame(Game, DiceGameMixin):
         """End the current round."""
         # Announce round scores
         scores = [
-            (p.name, p.total_score) for p in self.players if isinstance(p, ThreesPlayer)
+            (p.name, p.total_score)
+            for p in self.get_active_players()
+            if isinstance(p, ThreesPlayer)
         ]
         scores.sort(key=lambda x: x[1])  # Sort by score (lowest first)
         scores_str = ", ".join(f"{name}: {score}" for name, score in scores)
@@ -392,9 +416,7 @@ class ThreesGame(Game, DiceGameMixin):
         self.announce_turn(turn_sound="game_3cardpoker/turn.ogg")
 
         if player.is_bot:
-            import random
-
-            BotHelper.jolt_bot(player, ticks=random.randint(20, 40))
+            BotHelper.jolt_bot(player, ticks=self.rng.randint(20, 40))
 
         self.rebuild_all_menus()
 
@@ -402,7 +424,9 @@ class ThreesGame(Game, DiceGameMixin):
         """End the game and announce winner."""
         # Find winner(s) (lowest score)
         players_with_scores = [
-            (p, p.total_score) for p in self.players if isinstance(p, ThreesPlayer)
+            (p, p.total_score)
+            for p in self.get_active_players()
+            if isinstance(p, ThreesPlayer)
         ]
         players_with_scores.sort(key=lambda x: x[1])
 
@@ -424,7 +448,7 @@ class ThreesGame(Game, DiceGameMixin):
         """Build the game result with Threes-specific data."""
         # Sorted by score ascending (lowest wins)
         sorted_players = sorted(
-            [p for p in self.players if isinstance(p, ThreesPlayer)],
+            [p for p in self.get_active_players() if isinstance(p, ThreesPlayer)],
             key=lambda p: p.total_score,
         )
 
@@ -497,6 +521,14 @@ class ThreesGame(Game, DiceGameMixin):
             return
         BotHelper.on_tick(self)
 
+    def get_idle_ticks(self) -> float:
+        """Ticks that would only count down bot thinking."""
+        return BotHelper.idle_ticks(self)
+
+    def skip_idle_ticks(self, ticks: int) -> None:
+        """Skip ticks that only count down bot thinking."""
+        BotHelper.skip_ticks(self, ticks)
+
     def bot_think(self, player: Player) -> str | None:
         """Bot AI decision making."""
         if not isinstance(player, ThreesPlayer):
@@ -514,9 +546,13 @@ class ThreesGame(Game, DiceGameMixin):
         if player.dice.all_decided:
             return "bank"
 
-        # Decide what to keep using strategy
+        # Decide what to keep using the exact turn solver
         self._bot_decide_keepers(player)
 
+        # Keeping every die ends the turn
+        if player.dice.all_decided:
+            return "bank"
+
         # If we've kept something new, roll
         if player.dice.kept_unlocked_count > 0:
             return "roll"
@@ -525,53 +561,18 @@ class ThreesGame(Game, DiceGameMixin):
         return None
 
     def _bot_decide_keepers(self, player: ThreesPlayer) -> None:
-        """Bot AI to decide which dice to keep."""
+        """Bot AI to decide which dice to keep (lowest expected turn score)."""
         dice = player.dice
 
         # Clear current kept dice (except locked ones)
         dice.kept = list(dice.locked)
 
-        # Group available dice by value
-        available: dict[int, list[int]] = {}  # value -> list of indices
-        for i in range(5):
-            if not dice.is_locked(i):
-                value = dice.get_value(i)
-                if value is not None:
-                    if value not in available:
-                        available[value] = []
-                    available[value].append(i)
-
-        # Count locked sixes for moon shot check
-        locked_sixes = sum(1 for i in dice.locked if dice.get_value(i) == 6)
-        available_sixes = available.get(6, [])
-
-        # Strategy 1: Go for moon shot if 3+ sixes locked or 4+ total sixes
-        if locked_sixes >= 3 or (len(available_sixes) + locked_sixes >= 4):
-            for i in available_sixes:
-                dice.keep(i)
-            if available_sixes:
-                return
-
-        # Strategy 2: Keep threes (0 points!)
-        if 3 in available:
-            for i in available[3]:
-                dice.keep(i)
-            return
-
-        # Strategy 3: Keep ones (low value)
-        if 1 in available:
-            for i in available[1]:
-                dice.keep(i)
-            return
-
-        # Strategy 4: Keep twos
-        if 2 in available:
-            for i in available[2]:
+        locked = [dice.values[i] for i in dice.locked]
+        unlocked = [i for i in range(dice.num_dice) if not dice.is_locked(i)]
+        keep = list(
+            threes_turn().best_keep(locked, [dice.values[i] for i in unlocked])
+        )
+        for i in unlocked:
+            if dice.values[i] in keep:
+                keep.remove(dice.values[i])
                 dice.keep(i)
-            return
-
-        # Strategy 5: Keep lowest available
-        for value in [4, 5, 6]:
-            if value in available:
-                dice.keep(available[value][0])
-                return
@@ -8,17 +8,18 @@ All red = bust! Bank your points or risk it all.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-import random
 
 from ..base import Game, Player, GameOptions
 from ..registry import register_game
 from ...game_utils.actions import Action, ActionSet, Visibility
 from ...game_utils.bot_helper import BotHelper
 from ...game_utils.game_result import GameResult, PlayerResult
+from ...game_utils.hold_policy import simple_hold_at
 from ...game_utils.options import IntOption, MenuOption, option_field
 from ...game_utils.teams import TeamManager
 from ...messages.localization import Localization
 from ...ui.keybinds import KeybindState
+from .policy import policies
 
 
 @dataclass
@@ -242,7 +243,7 @@ class TossUpGame(Game):
         self.play_sound("game_pig/roll.ogg")
 
         # Jolt the rolling player to pause before next action
-        BotHelper.jolt_bot(player, ticks=random.randint(10, 20))
+        BotHelper.jolt_bot(player, ticks=self.rng.randint(10, 20))
 
         # Roll the dice
         green = 0
@@ -254,7 +255,7 @@ class TossUpGame(Game):
         for _ in range(tossup_player.dice_count):
             if is_standard:
                 # Standard: 3 green, 2 yellow, 1 red (6-sided die)
-                roll = random.randint(1, 6)
+                roll = self.rng.randint(1, 6)
                 if roll <= 3:
                     green += 1
                 elif roll <= 5:
@@ -263,7 +264,7 @@ class TossUpGame(Game):
                     red += 1
             else:
                 # PlayPalace: Equal distribution (3-sided die)
-                roll = random.randint(1, 3)
+                roll = self.rng.randint(1, 3)
                 if roll == 1:
                     green += 1
                 elif roll == 2:
@@ -387,6 +388,10 @@ class TossUpGame(Game):
         # Initialize turn order
         self.set_turn_players(active_players)
 
+        # Start solving the bots' policy in the background for their turns
+        if not self._headless and any(p.is_bot for p in active_players):
+            policies.get_ready(*self._policy_rules())
+
         # Reset player state
         for player in active_players:
             player.turn_points = 0
@@ -436,42 +441,45 @@ class TossUpGame(Game):
         # Rebuild menus to reflect new turn
         self.rebuild_all_menus()
 
-    def _setup_bot_target(self, player: Player) -> None:
-        """Set up the bot's target score for this turn."""
-        tossup_player: TossUpPlayer = player  # type: ignore
-
-        # Base target: random between 10-25
-        target = random.randint(10, 25)
-
-        # Check if anyone is close to winning
-        active_players = self.get_active_players()
-        someone_hit_threshold = False
-        highest_score = 0
-        my_score = self.get_player_score(tossup_player)
-
-        for other in active_players:
-            if other != player:
-                other_score = self.get_player_score(other)
-                if other_score >= self.options.target_score:
-                    someone_hit_threshold = True
-                    highest_score = max(highest_score, other_score)
-
-        if someone_hit_threshold:
-            # Need to beat the highest score
-            target = highest_score + 1 - my_score
-        else:
-            # Check if opponent is within 20 points of winning (go desperate)
-            max_opponent_score = 0
-            for other in active_players:
-                if other != player:
-                    other_score = self.get_player_score(other)
-                    max_opponent_score = max(max_opponent_score, other_score)
-
-            if max_opponent_score >= (self.options.target_score - 20):
-                # Desperate mode: never bank unless winning
-                target = 999  # Very high target
+    def _policy_rules(self) -> tuple[int, int, str]:
+        """The options the bots' hold-at policy is solved for."""
+        return (
+            self.options.target_score,
+            self.options.starting_dice,
+            self.options.rules_variant,
+        )
 
-        BotHelper.set_target(player, max(0, target))
+    def _setup_bot_target(self, player: Player) -> None:
+        """
+        Set up the turn total the bot banks at, from the hold-at policy.
+
+        Live games don't wait for the policy to be solved; until it is, the
+        bot holds at simple_hold_at(). Which one applied depends on a
+        background thread, so the target is a journaled choice.
+        """
+        choice = BotHelper.journaled_choice(
+            self, player, lambda: str(self._bot_hold_at(player))
+        )
+        target = int(choice) if choice is not None else self._bot_hold_at(player)
+        BotHelper.set_target(player, target)
+
+    def _bot_hold_at(self, player: Player) -> int:
+        """The turn total for the bot to bank at this turn."""
+        best_opponent = max(
+            (
+                self.get_player_score(other)
+                for other in self.get_active_players()
+                if other != player
+            ),
+            default=0,
+        )
+        rules = self._policy_rules()
+        # Simulations wait for the solve, which keeps them reproducible
+        policy = policies.get(*rules) if self._headless else policies.get_ready(*rules)
+        my_score = self.get_player_score(player)
+        if policy is None:
+            return simple_hold_at(my_score, best_opponent, self.options.target_score)
+        return policy.hold_at(my_score, best_opponent)
 
     def on_tick(self) -> None:
         """Called every tick. Handle bot AI."""
@@ -487,43 +495,28 @@ class TossUpGame(Game):
 
         BotHelper.on_tick(self)
 
+    def get_idle_ticks(self) -> float:
+        """Ticks that would only count down bot thinking."""
+        player = self.current_player
+        if player and player.is_bot and BotHelper.get_target(player) is None:
+            return 0  # on_tick() sets up the bot's target first
+        return BotHelper.idle_ticks(self)
+
+    def skip_idle_ticks(self, ticks: int) -> None:
+        """Skip ticks that only count down bot thinking."""
+        BotHelper.skip_ticks(self, ticks)
+
     def bot_think(self, player: TossUpPlayer) -> str | None:
         """Bot AI decision making. Called by BotHelper."""
         target = BotHelper.get_target(player)
         if target is None:
             target = 15  # Default fallback
 
-        # If we can win this turn, bank immediately
-        my_score = self.get_player_score(player)
-        if my_score + player.turn_points >= self.options.target_score:
+        # Bank at the target, after rolling at least once (tied bots already
+        # at the game's target would otherwise bank 0 forever)
+        if player.turn_points > 0 and player.turn_points >= target:
             return "bank"
-
-        # Decide based on dice count and target
-        dice_count = player.dice_count
-
-        # If we haven't rolled yet, always roll
-        if player.turn_points == 0:
-            return "roll"
-
-        # If we've hit our target, consider banking based on dice count
-        if player.turn_points >= target:
-            # More dice = more likely to bust, so bank more often
-            if dice_count == 1:
-                bank_chance = 0.55
-            elif dice_count == 2:
-                bank_chance = 0.30
-            elif dice_count == 3:
-                bank_chance = 0.10
-            else:
-                bank_chance = 0.02
-
-            if random.random() < bank_chance:
-                return "bank"
-            else:
-                return "roll"
-        else:
-            # Haven't hit target yet, keep rolling
-            return "roll"
+        return "roll"
 
     def _on_turn_end(self) -> None:
         """Handle end of a player's turn."""
@@ -629,5 +622,5 @@ class TossUpGame(Game):
     def end_turn(self, jolt_min: int = 20, jolt_max: int = 30) -> None:
         """Override to use TossUp's turn advancement logic."""
         # Jolt all bots to pause for the turn change
-        BotHelper.jolt_bots(self, ticks=random.randint(jolt_min, jolt_max))
+        BotHelper.jolt_bots(self, ticks=self.rng.randint(jolt_min, jolt_max))
         self._on_turn_end()
@@ -0,0 +1,58 @@
+"""
+Hold-at policy for the Toss Up bot.
+
+A turn's state is the points so far and the dice left to roll. Each die
+comes up green (points, set aside), yellow (no points, set aside) or red
+(no points, stays), and a roll busts by the variant's rule. The chances of
+each number of greens are worked out exactly and handed to HoldPolicy.
+"""
+
+from math import comb
+
+from ...game_utils.hold_policy import HoldPolicy, PolicyCache, TurnSteps
+
+# (green, yellow, red) chances of one die
+DIE_SIDES = {
+    "Standard": (3 / 6, 2 / 6, 1 / 6),
+    "PlayPalace": (1 / 3, 1 / 3, 1 / 3),
+}
+
+
+def turn_steps(starting_dice: int, rules_variant: str) -> TurnSteps:
+    """The turn as a chain over dice left (see HoldPolicy)."""
+    green, yellow, red = DIE_SIDES.get(rules_variant, DIE_SIDES["Standard"])
+    steps: TurnSteps = {}
+    for dice in range(1, starting_dice + 1):
+        if rules_variant == "PlayPalace":
+            # Busts only when every die is red
+            no_green = (1 - green) ** dice - red**dice
+        else:
+            # Busts when no die is green and one is red
+            no_green = yellow**dice
+        # A roll without greens changes nothing; leave it out
+        scale = 1.0 / (1.0 - no_green)
+        steps[dice] = [
+            (
+                greens,
+                dice - greens or starting_dice,  # fresh dice when all are green
+                comb(dice, greens) * green**greens * (1 - green) ** (dice - greens) * scale,
+            )
+            for greens in range(1, dice + 1)
+        ]
+    return steps
+
+
+def solve_policy(target_score: int, starting_dice: int, rules_variant: str) -> HoldPolicy:
+    """Solve the bot's policy for one set of options."""
+    return HoldPolicy(
+        turn_steps(starting_dice, rules_variant), starting_dice, target_score
+    )
+
+
+# Solved policies by options; live games use policies.get_ready()
+policies = PolicyCache(solve_policy)
+
+
+def load_policy(target_score: int, starting_dice: int, rules_variant: str) -> HoldPolicy:
+    """The bot's policy for one set of options, solved on first use."""
+    return policies.get(target_score, starting_dice, rules_variant)
@@ -8,7 +8,7 @@ players score based on set combinations formed from their 15 dice.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-import random
+import math
 
 from ..base import Game, Player, GameOptions
 from ..registry import register_game
@@ -842,7 +842,7 @@ class TradeoffGame(Game):
             score = self._get_player_score(p.name)
             # Tiebreaker: sum of current hand (lower goes first)
             dice_sum = sum(p.hand) if p.hand else sum(p.rolled_dice) if p.rolled_dice else 0
-            return (score, dice_sum, random.random())  # Final random for complete ties
+            return (score, dice_sum, self.rng.random())  # Final random for complete ties
 
         sorted_players = sorted(active_players, key=sort_key)
         self.taking_order = [p.id for p in sorted_players if p.dice_traded_count > 0]
@@ -871,7 +871,7 @@ class TradeoffGame(Game):
 
             # Bot thinking time
             if player.is_bot:
-                BotHelper.jolt_bot(player, ticks=random.randint(10, 20))
+                BotHelper.jolt_bot(player, ticks=self.rng.randint(10, 20))
 
     def _advance_taker(self) -> None:
         """Advance to the next player in taking order (round-robin)."""
@@ -1009,7 +1009,7 @@ class TradeoffGame(Game):
         active_players = self.get_active_players()
         for p in active_players:
             tp: TradeoffPlayer = p  # type: ignore
-            tp.rolled_dice = roll_dice(5, 6)
+            tp.rolled_dice = roll_dice(5, 6, self.rng)
             tp.trading_indices = list(range(5))  # All dice traded by default
             tp.trades_confirmed = False
             tp.traded_dice = []
@@ -1025,7 +1025,7 @@ class TradeoffGame(Game):
         # Jolt bots
         for p in active_players:
             if p.is_bot:
-                BotHelper.jolt_bot(p, ticks=random.randint(15, 30))
+                BotHelper.jolt_bot(p, ticks=self.rng.randint(15, 30))
 
         self.rebuild_all_menus()
 
@@ -1224,6 +1224,35 @@ class TradeoffGame(Game):
         elif self.phase == "taking":
             self._process_taking_bot()
 
+    def _thinking_bots(self) -> list[Player]:
+        """Bots whose turn processing runs this tick (see on_tick)."""
+        if self.phase == "trading":
+            return [
+                p
+                for p in self.players
+                if p.is_bot and not p.is_spectator and not p.trades_confirmed
+            ]
+        if self.phase == "taking" and self.taking_index < len(self.taking_order):
+            taker = self.get_player_by_id(self.taking_order[self.taking_index])
+            if taker and taker.is_bot:
+                return [taker]
+        return []
+
+    def get_idle_ticks(self) -> float:
+        """Ticks that would only count down bot thinking."""
+        return min(
+            (
+                0 if p.bot_pending_action else p.bot_think_ticks
+                for p in self._thinking_bots()
+            ),
+            default=math.inf,
+        )
+
+    def skip_idle_ticks(self, ticks: int) -> None:
+        """Skip ticks that only count down bot thinking."""
+        for player in self._thinking_bots():
+            player.bot_think_ticks -= ticks
+
     def _process_trading_bots(self) -> None:
         """Process all bot actions during trading phase."""
         for player in self.players:
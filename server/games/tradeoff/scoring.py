@@ -2,9 +2,15 @@
 Scoring logic for Tradeoff game.
 
 Handles set detection and optimal scoring combinations.
+
+The best combination depends only on how many dice show each face, so it is
+looked up in a table covering every hand of up to MAX_TABLE_DICE dice. The
+table (about 54,000 hands) is built at import time by a dynamic program over
+face counts that tries sets in the same order as the exhaustive search, so a
+lookup returns exactly what the search returns for the sorted hand.
 """
 
-from itertools import combinations
+from itertools import combinations, combinations_with_replacement
 
 
 # Set definitions with point values
@@ -93,12 +99,116 @@ def is_all_triplets(dice: list[int]) -> bool:
     return sorted(counts.values()) == [3, 3, 3, 3, 3]
 
 
+# Hands are at most 15 dice (5 per iteration for 3 iterations)
+MAX_TABLE_DICE = 15
+DIE_FACES = 6
+
+# Face counts are packed into one int, 5 bits per face. The top bit of each
+# field is a guard: subtracting a set's counts from (counts | _GUARD) clears a
+# guard bit exactly when the hand lacks dice for that face.
+_FIELD_BITS = 5
+_GUARD = sum(1 << (_FIELD_BITS * i + _FIELD_BITS - 1) for i in range(DIE_FACES))
+
+
+def _pack_counts(dice) -> int:
+    """Pack how many dice show each face into one int."""
+    packed = 0
+    for d in dice:
+        packed += 1 << (_FIELD_BITS * (d - 1))
+    return packed
+
+
+def _set_moves() -> tuple[tuple[str, int, tuple[int, ...], int], ...]:
+    """
+    Every set that can be taken from a hand, in the search's trial order.
+
+    Returns (set_name, packed_counts_used, dice_used, points) tuples.
+    """
+    faces = range(1, DIE_FACES + 1)
+    moves: list[tuple[str, list[int], int]] = []
+    moves += [("double_group", [a] * 5 + [b] * 5, 30) for a, b in combinations(faces, 2)]
+    moves += [("straight", list(range(start, start + 5)), 12) for start in [1, 2]]
+    moves += [("double_triple", [a] * 3 + [b] * 3, 10) for a, b in combinations(faces, 2)]
+    moves += [("group", [v] * 5, 8) for v in faces]
+    moves += [("mini_straight", list(range(start, start + 4)), 7) for start in [1, 2, 3]]
+    moves += [("triple", [v] * 3, 3) for v in faces]
+    return tuple(
+        (name, _pack_counts(used), tuple(used), points) for name, used, points in moves
+    )
+
+
+_SET_MOVES = _set_moves()
+
+
+def _build_scoring_table() -> dict[int, tuple[int, int]]:
+    """
+    Best (score, first set) for every hand of up to MAX_TABLE_DICE dice.
+
+    Keyed by packed face counts. The first set is an index into _SET_MOVES
+    (-1 when nothing scores); the rest of the combination is the entry for
+    the counts left after taking it. Hands are filled in order of size, so
+    the counts left over are always already in the table. Ties keep the
+    first set in trial order, which is the combination the exhaustive
+    search finds first.
+    """
+    table: dict[int, tuple[int, int]] = {}
+    moves = [(index, used, points) for index, (_, used, _, points) in enumerate(_SET_MOVES)]
+    for size in range(MAX_TABLE_DICE + 1):
+        for hand in combinations_with_replacement(range(1, DIE_FACES + 1), size):
+            guarded = _pack_counts(hand) | _GUARD
+            best_score, best_move = 0, -1
+            for index, used, points in moves:
+                rest = guarded - used
+                if rest & _GUARD == _GUARD:
+                    score = points + table[rest ^ _GUARD][0]
+                    if score > best_score:
+                        best_score, best_move = score, index
+            table[guarded ^ _GUARD] = (best_score, best_move)
+    return table
+
+
+_SCORING_TABLE = _build_scoring_table()
+
+
 def find_best_scoring(dice: list[int]) -> list[tuple[str, list[int], int]]:
     """
     Find the best combination of non-overlapping sets from dice.
 
     Returns list of (set_name, dice_used, points) tuples.
-    Uses exhaustive search for optimal solution.
+    Looks the hand up in the scoring table; the result is the one
+    search_best_scoring gives for the same dice in sorted order.
+    """
+    if not dice:
+        return []
+    if len(dice) > MAX_TABLE_DICE:
+        return search_best_scoring(sorted(dice))
+
+    # The big 15-dice sets take the whole hand (they're worth the same, 50 pts)
+    if len(dice) == 15:
+        if is_all_groups(dice):
+            return [("all_groups", sorted(dice), 50)]
+        if is_all_triplets(dice):
+            return [("all_triplets", sorted(dice), 50)]
+
+    table = _SCORING_TABLE
+    counts = _pack_counts(dice)
+    sets: list[tuple[str, list[int], int]] = []
+    move = table[counts][1]
+    while move >= 0:
+        name, used, dice_used, points = _SET_MOVES[move]
+        sets.append((name, list(dice_used), points))
+        counts -= used
+        move = table[counts][1]
+    return sets
+
+
+def search_best_scoring(dice: list[int]) -> list[tuple[str, list[int], int]]:
+    """
+    Find the best combination of non-overlapping sets by exhaustive search.
+
+    Returns list of (set_name, dice_used, points) tuples. Ties go to the
+    combination found first, which depends on the order of the dice.
+    find_best_scoring is the fast equivalent for sorted hands.
     """
     if not dice:
         return []
@@ -7,7 +7,6 @@ Fill all categories to complete the game. Highest total score wins.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-import random
 
 from ..base import Game, Player, GameOptions
 from ..registry import register_game
@@ -16,24 +15,22 @@ from ...game_utils.bot_helper import BotHelper
 from ...game_utils.dice import DiceSet
 from ...game_utils.dice_game_mixin import DiceGameMixin
 from ...game_utils.game_result import GameResult, PlayerResult
-from ...game_utils.options import IntOption, option_field
+from ...game_utils.options import IntOption, MenuOption, option_field
 from ...messages.localization import Localization
 from ...ui.keybinds import KeybindState
+from .scoring import (
+    ALL_CATEGORIES,
+    CATEGORY_INDEX,
+    LOWER_CATEGORIES,
+    UPPER_CATEGORIES,
+    calculate_score,
+    count_dice,
+    is_yahtzee,
+    roll_scores,
+)
+from .policy import YahtzeePolicy, load_policy
 
 
-# Scoring categories
-UPPER_CATEGORIES = ["ones", "twos", "threes", "fours", "fives", "sixes"]
-LOWER_CATEGORIES = [
-    "three_kind",
-    "four_kind",
-    "full_house",
-    "small_straight",
-    "large_straight",
-    "yahtzee",
-    "chance",
-]
-ALL_CATEGORIES = UPPER_CATEGORIES + LOWER_CATEGORIES
-
 # Category display names (for localization keys)
 CATEGORY_NAMES = {
     "ones": "yahtzee-category-ones",
@@ -51,99 +48,6 @@ CATEGORY_NAMES = {
     "chance": "yahtzee-category-chance",
 }
 
-# Upper section target values
-UPPER_VALUES = {
-    "ones": 1,
-    "twos": 2,
-    "threes": 3,
-    "fours": 4,
-    "fives": 5,
-    "sixes": 6,
-}
-
-
-def count_dice(dice: list[int]) -> dict[int, int]:
-    """Count occurrences of each die value (1-6)."""
-    counts = {i: 0 for i in range(1, 7)}
-    for die in dice:
-        counts[die] += 1
-    return counts
-
-
-def calculate_score(dice: list[int], category: str) -> int:
-    """Calculate the score for a category given the dice."""
-    if not dice or len(dice) != 5:
-        return 0
-
-    counts = count_dice(dice)
-    dice_sum = sum(dice)
-
-    # Upper section - sum of matching dice
-    if category in UPPER_VALUES:
-        target = UPPER_VALUES[category]
-        return counts[target] * target
-
-    # Three of a Kind - sum of all if 3+ of same
-    if category == "three_kind":
-        if any(c >= 3 for c in counts.values()):
-            return dice_sum
-        return 0
-
-    # Four of a Kind - sum of all if 4+ of same
-    if category == "four_kind":
-        if any(c >= 4 for c in counts.values()):
-            return dice_sum
-        return 0
-
-    # Full House - 3 of one kind + 2 of another = 25 points
-    if category == "full_house":
-        has_three = any(c == 3 for c in counts.values())
-        has_two = any(c == 2 for c in counts.values())
-        # Also allow 5 of a kind as full house
-        has_five = any(c == 5 for c in counts.values())
-        if (has_three and has_two) or has_five:
-            return 25
-        return 0
-
-    # Small Straight - 4 consecutive = 30 points
-    if category == "small_straight":
-        # Check for 1-2-3-4, 2-3-4-5, or 3-4-5-6
-        straights = [
-            {1, 2, 3, 4},
-            {2, 3, 4, 5},
-            {3, 4, 5, 6},
-        ]
-        dice_set = set(dice)
-        if any(s.issubset(dice_set) for s in straights):
-            return 30
-        return 0
-
-    # Large Straight - 5 consecutive = 40 points
-    if category == "large_straight":
-        sorted_dice = sorted(dice)
-        if sorted_dice == [1, 2, 3, 4, 5] or sorted_dice == [2, 3, 4, 5, 6]:
-            return 40
-        return 0
-
-    # Yahtzee - 5 of a kind = 50 points
-    if category == "yahtzee":
-        if any(c == 5 for c in counts.values()):
-            return 50
-        return 0
-
-    # Chance - sum of all dice
-    if category == "chance":
-        return dice_sum
-
-    return 0
-
-
-def is_yahtzee(dice: list[int]) -> bool:
-    """Check if dice are a Yahtzee (5 of a kind)."""
-    if len(dice) != 5:
-        return False
-    return len(set(dice)) == 1
-
 
 def _default_scores() -> dict[str, int | None]:
     """Create default scoresheet with all categories unfilled."""
@@ -207,6 +111,21 @@ class YahtzeeOptions(GameOptions):
             change_msg="yahtzee-option-changed-rounds",
         )
     )
+    bot_strategy: str = option_field(
+        MenuOption(
+            default="simple",
+            value_key="strategy",
+            # Optimal play needs the table from `cli.py policy yahtzee`
+            choices=lambda g, p: ["simple", "optimal"] if load_policy() else ["simple"],
+            choice_labels={
+                "simple": "yahtzee-bot-simple",
+                "optimal": "yahtzee-bot-optimal",
+            },
+            label="yahtzee-set-bot-strategy",
+            prompt="yahtzee-select-bot-strategy",
+            change_msg="yahtzee-option-changed-bot-strategy",
+        )
+    )
 
 
 @dataclass
@@ -428,7 +347,9 @@ class YahtzeeGame(Game, DiceGameMixin):
         # - clear_kept: controlled by user preference (default True)
         user = self.get_user(player)
         clear_kept = user.preferences.clear_kept_on_roll if user else True
-        ytz_player.dice.roll(lock_kept=False, clear_kept=clear_kept)
+        ytz_player.dice.roll(
+            lock_kept=False, clear_kept=clear_kept, rng=self.rng
+        )
         ytz_player.rolls_left -= 1
 
         # Announce roll (v10 style: "You rolled: X. Rolls remaining: Y")
@@ -449,7 +370,7 @@ class YahtzeeGame(Game, DiceGameMixin):
 
         # Bot thinking time
         if player.is_bot:
-            BotHelper.jolt_bot(player, ticks=random.randint(15, 25))
+            BotHelper.jolt_bot(player, ticks=self.rng.randint(15, 25))
 
         self.rebuild_all_menus()
 
@@ -688,7 +609,7 @@ class YahtzeeGame(Game, DiceGameMixin):
 
         # Bot setup
         if player.is_bot:
-            BotHelper.jolt_bot(player, ticks=random.randint(10, 20))
+            BotHelper.jolt_bot(player, ticks=self.rng.randint(10, 20))
 
         self.rebuild_all_menus()
 
@@ -714,7 +635,7 @@ class YahtzeeGame(Game, DiceGameMixin):
                 return
 
         # Move to next player
-        BotHelper.jolt_bots(self, ticks=random.randint(15, 25))
+        BotHelper.jolt_bots(self, ticks=self.rng.randint(15, 25))
 
         if self.turn_index >= len(self.turn_players) - 1:
             # Round complete, back to first player
@@ -826,6 +747,14 @@ class YahtzeeGame(Game, DiceGameMixin):
             return
         BotHelper.on_tick(self)
 
+    def get_idle_ticks(self) -> float:
+        """Ticks that would only count down bot thinking."""
+        return BotHelper.idle_ticks(self)
+
+    def skip_idle_ticks(self, ticks: int) -> None:
+        """Skip ticks that only count down bot thinking."""
+        BotHelper.skip_ticks(self, ticks)
+
     def bot_think(self, player: YahtzeePlayer) -> str | None:
         """Bot AI decision making."""
         turn_set = self.get_action_set(player, "turn")
@@ -836,9 +765,12 @@ class YahtzeeGame(Game, DiceGameMixin):
         if not player.dice.has_rolled:
             return "roll"
 
+        policy = load_policy() if self.options.bot_strategy == "optimal" else None
+        if policy:
+            return self._bot_think_optimal(player, policy)
+
         # Analyze current dice
         dice_values = player.dice.values
-        counts = count_dice(dice_values)
 
         # Check for Yahtzee - always score it
         if is_yahtzee(dice_values):
@@ -864,6 +796,40 @@ class YahtzeeGame(Game, DiceGameMixin):
         # Must score - pick best category
         return self._bot_pick_best_category(player)
 
+    def _bot_think_optimal(self, player: YahtzeePlayer, policy: YahtzeePolicy) -> str:
+        """Keep and score as the optimal solitaire strategy says."""
+        dice_values = player.dice.values
+        filled = sum(
+            1 << i for i, cat in enumerate(ALL_CATEGORIES) if player.scores[cat] is not None
+        )
+        upper = player.get_upper_total()
+        bonus = player.scores["yahtzee"] == 50
+
+        if player.rolls_left > 0:
+            keep = policy.best_keep(dice_values, player.rolls_left, filled, upper, bonus)
+            if len(keep) < len(dice_values):
+                current_kept = [player.dice.is_kept(i) for i in range(5)]
+                best_keep = self._bot_keep_flags(dice_values, current_kept, keep)
+                for i in range(5):
+                    if best_keep[i] != current_kept[i]:
+                        return f"toggle_die_{i}"
+                return "roll"
+
+        return f"score_{policy.best_category(dice_values, filled, upper, bonus)}"
+
+    def _bot_keep_flags(
+        self, dice_values: list[int], current_kept: list[bool], keep: tuple[int, ...]
+    ) -> list[bool]:
+        """Which dice to keep for a set of values, preferring dice already kept."""
+        wanted = list(keep)
+        flags = [False] * len(dice_values)
+        for already_kept in (True, False):
+            for i, value in enumerate(dice_values):
+                if current_kept[i] == already_kept and value in wanted:
+                    wanted.remove(value)
+                    flags[i] = True
+        return flags
+
     def _bot_decide_keeps(self, player: YahtzeePlayer) -> list[bool]:
         """Decide which dice to keep for bot."""
         dice_values = player.dice.values
@@ -893,8 +859,9 @@ class YahtzeeGame(Game, DiceGameMixin):
         if not open_cats:
             return None
 
-        # Calculate score for each open category
-        scores = [(cat, calculate_score(player.dice.values, cat)) for cat in open_cats]
+        # Score for each open category, from the roll's row of the table
+        row = roll_scores(player.dice.values)
+        scores = [(cat, row[CATEGORY_INDEX[cat]]) for cat in open_cats]
 
         # Sort by score descending
         scores.sort(key=lambda x: x[1], reverse=True)
@@ -0,0 +1,323 @@
+"""
+Optimal solitaire strategy for the Yahtzee bot.
+
+Between turns a player's position is fully described by which categories
+are filled, the upper section total (capped at 63, where the bonus is
+earned) and whether a Yahtzee was scored for 50 (which makes later
+Yahtzees worth a 100 point bonus). The value of a position is the expected
+score still to come when playing to maximize it. Values are computed
+backwards from a full scoresheet: a position's value is the expected
+result of its best turn, and a turn is solved exactly over the 252 rolls
+and 462 sets of kept dice given the values of the positions it can end in.
+
+With 2**13 x 64 x 2 positions this takes minutes, so the values are built
+offline with `python -m server.cli policy yahtzee` into policy.bin and
+memory-mapped by the server. The file is optional: without it the bot
+plays its simple strategy.
+
+    MAGIC (4 bytes) | version (1 byte) | value scale (uint16) | first
+    filled count (1 byte) | values (uint16 per position)
+
+Values are stored in 1/scale points, little-endian, indexed by
+state_index(). A table with a first filled count above 0 only covers
+positions with at least that many categories filled (used by tests).
+"""
+
+import functools
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Callable
+from itertools import combinations_with_replacement
+from pathlib import Path
+
+from .scoring import ALL_CATEGORIES, NUM_DICE, ROLLS, SCORE_TABLE, roll_index
+
+POLICY_PATH = Path(__file__).parent / "policy.bin"
+POLICY_MAGIC = b"YZPL"
+POLICY_VERSION = 1
+VALUE_SCALE = 128
+
+UPPER_BONUS_TOTAL = 63
+UPPER_BONUS = 35
+YAHTZEE_BONUS = 100
+NUM_CATEGORIES = len(ALL_CATEGORIES)
+NUM_STATES = (1 << NUM_CATEGORIES) << 7
+FULL_MASK = (1 << NUM_CATEGORIES) - 1
+
+_HEADER = struct.Struct("<4sBHB")
+_YAHTZEE = ALL_CATEGORIES.index("yahtzee")
+
+# Every set of kept dice, from none to all five, as sorted tuples. The five
+# dice keeps are the rolls; rolling the rest of a keep gives the average
+# over its six one-die-larger keeps.
+KEEPS = tuple(
+    keep
+    for size in range(NUM_DICE + 1)
+    for keep in combinations_with_replacement(range(1, 7), size)
+)
+_KEEP_INDEX = {keep: i for i, keep in enumerate(KEEPS)}
+_KEEP_ROLL = tuple(
+    roll_index(list(keep)) if len(keep) == NUM_DICE else -1 for keep in KEEPS
+)
+_KEEP_CHILDREN = tuple(
+    tuple(_KEEP_INDEX[tuple(sorted(keep + (face,)))] for face in range(1, 7))
+    if len(keep) < NUM_DICE
+    else ()
+    for keep in KEEPS
+)
+# Partial keeps, largest first, so children are always computed first
+_PARTIAL_KEEPS = tuple(
+    (i, _KEEP_CHILDREN[i])
+    for size in reversed(range(NUM_DICE))
+    for i, keep in enumerate(KEEPS)
+    if len(keep) == size
+)
+_FULL_KEEPS = tuple(
+    (i, _KEEP_ROLL[i]) for i, keep in enumerate(KEEPS) if len(keep) == NUM_DICE
+)
+# The distinct keeps each roll allows
+_ROLL_KEEPS = tuple(
+    tuple(
+        sorted(
+            {
+                _KEEP_INDEX[tuple(d for j, d in enumerate(roll) if mask >> j & 1)]
+                for mask in range(1 << NUM_DICE)
+            }
+        )
+    )
+    for roll in ROLLS
+)
+_SCORE_COLUMNS = tuple(
+    tuple(scores[c] for scores in SCORE_TABLE) for c in range(NUM_CATEGORIES)
+)
+_FACE_COUNTS = tuple(
+    tuple(roll.count(face) for roll in ROLLS) for face in range(1, 7)
+)
+_YAHTZEE_ROLLS = tuple(i for i, roll in enumerate(ROLLS) if len(set(roll)) == 1)
+
+
+class YahtzeePolicyError(ValueError):
+    """Raised when a policy file cannot be read."""
+
+
+def state_index(filled: int, upper: int, bonus: bool) -> int:
+    """Index of a position: filled category bits, upper total, Yahtzee bonus."""
+    return (filled << 7) | (min(upper, UPPER_BONUS_TOTAL) << 1) | int(bonus)
+
+
+def _reachable_upper_totals(filled: int) -> list[int]:
+    """Upper totals (capped) possible with the filled upper categories."""
+    totals = {0}
+    for face in range(1, 7):
+        if filled >> (face - 1) & 1:
+            totals = {
+                min(UPPER_BONUS_TOTAL, total + count * face)
+                for total in totals
+                for count in range(NUM_DICE + 1)
+            }
+    return sorted(totals)
+
+
+def _final_values(
+    values, scale: float, filled: int, upper: int, bonus: bool
+) -> list[float]:
+    """
+    Value of ending the turn with each roll: the best open category's
+    score plus bonuses plus the value of the position it leads to.
+    """
+    columns = []
+    for c in range(NUM_CATEGORIES):
+        bit = 1 << c
+        if filled & bit:
+            continue
+        after = filled | bit
+        scores = _SCORE_COLUMNS[c]
+        if c < 6:
+            # Upper section: the next position depends on how many dice count
+            face = c + 1
+            by_count = []
+            for count in range(NUM_DICE + 1):
+                total = upper + count * face
+                earned = UPPER_BONUS if upper < UPPER_BONUS_TOTAL <= total else 0
+                future = values[state_index(after, total, bonus)] / scale
+                by_count.append(count * face + earned + future)
+            columns.append([by_count[n] for n in _FACE_COUNTS[c]])
+        elif c == _YAHTZEE:
+            missed = values[state_index(after, upper, False)] / scale
+            scored = 50 + values[state_index(after, upper, True)] / scale
+            columns.append([scored if s else missed for s in scores])
+        else:
+            future = values[state_index(after, upper, bonus)] / scale
+            columns.append([s + future for s in scores])
+
+    final = list(map(max, *columns)) if len(columns) > 1 else columns[0]
+    if bonus:
+        for r in _YAHTZEE_ROLLS:
+            final[r] += YAHTZEE_BONUS
+    return final
+
+
+def _keep_values(roll_values: list[float]) -> list[float]:
+    """Expected value of each keep when the other dice are rolled."""
+    values = [0.0] * len(KEEPS)
+    for k, r in _FULL_KEEPS:
+        values[k] = roll_values[r]
+    for k, (a, b, c, d, e, f) in _PARTIAL_KEEPS:
+        values[k] = (values[a] + values[b] + values[c] + values[d] + values[e] + values[f]) / 6
+    return values
+
+
+def _roll_values(keep_values: list[float]) -> list[float]:
+    """Value of each roll when the best keep is chosen from it."""
+    return [max(map(keep_values.__getitem__, keeps)) for keeps in _ROLL_KEEPS]
+
+
+def _solve_turn(final: list[float]) -> tuple[list[float], list[float], list[float]]:
+    """Keep values with one, two and three rolls left, given the final values."""
+    one_left = _keep_values(final)
+    two_left = _keep_values(_roll_values(one_left))
+    three_left = _keep_values(_roll_values(two_left))
+    return one_left, two_left, three_left
+
+
+def build_values(
+    first_filled: int = 0, progress: Callable[[int, int], None] | None = None
+) -> array:
+    """
+    Compute the value of every position with at least first_filled filled.
+
+    Returns one float per state_index(); positions with fewer categories
+    filled are left at 0. progress(done, total) is called after each set
+    of filled categories.
+    """
+    values = array("d", bytes(8 * NUM_STATES))
+    masks = sorted(
+        (m for m in range(FULL_MASK) if m.bit_count() >= first_filled),
+        key=int.bit_count,
+        reverse=True,
+    )
+    for done, filled in enumerate(masks, 1):
+        bonuses = (False, True) if filled >> _YAHTZEE & 1 else (False,)
+        for upper in _reachable_upper_totals(filled):
+            for bonus in bonuses:
+                final = _final_values(values, 1.0, filled, upper, bonus)
+                values[state_index(filled, upper, bonus)] = _solve_turn(final)[2][0]
+        if progress:
+            progress(done, len(masks))
+    return values
+
+
+def encode_policy(values: array, first_filled: int = 0) -> bytes:
+    """Pack position values into the policy file format."""
+    scaled = array("H", (round(v * VALUE_SCALE) for v in values))
+    if sys.byteorder != "little":
+        scaled.byteswap()
+    header = _HEADER.pack(POLICY_MAGIC, POLICY_VERSION, VALUE_SCALE, first_filled)
+    return header + scaled.tobytes()
+
+
+class YahtzeePolicy:
+    """
+    Position values and the turn decisions derived from them.
+
+    Each turn's keep values are solved once from the table (about a
+    millisecond) and reused for every decision in the turn.
+    """
+
+    TURN_CACHE_SIZE = 64
+
+    def __init__(self, data):
+        if len(data) != _HEADER.size + 2 * NUM_STATES:
+            raise YahtzeePolicyError("Yahtzee policy file has the wrong size")
+        magic, version, scale, first_filled = _HEADER.unpack_from(data)
+        if magic != POLICY_MAGIC or version != POLICY_VERSION:
+            raise YahtzeePolicyError("Not a Yahtzee policy file (or an old version)")
+        if sys.byteorder == "little":
+            self._values = memoryview(data)[_HEADER.size :].cast("H")
+        else:
+            self._values = array("H", bytes(data[_HEADER.size :]))
+            self._values.byteswap()
+        self.scale = float(scale)
+        self.first_filled = first_filled
+        self._turns: dict[int, tuple[list[float], ...]] = {}
+
+    @classmethod
+    def open(cls, path: Path) -> "YahtzeePolicy":
+        """Memory-map a policy file."""
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @property
+    def complete(self) -> bool:
+        """Whether every position is covered."""
+        return self.first_filled == 0
+
+    def value(self, filled: int, upper: int, bonus: bool) -> float:
+        """Expected score still to come from a position."""
+        return self._values[state_index(filled, upper, bonus)] / self.scale
+
+    def _turn(self, filled: int, upper: int, bonus: bool) -> tuple[list[float], ...]:
+        """Final roll values, then keep values with one and two rolls left."""
+        key = state_index(filled, upper, bonus)
+        turn = self._turns.get(key)
+        if turn is None:
+            final = _final_values(self._values, self.scale, filled, upper, bonus)
+            one_left = _keep_values(final)
+            two_left = _keep_values(_roll_values(one_left))
+            if len(self._turns) >= self.TURN_CACHE_SIZE:
+                self._turns.clear()
+            turn = self._turns[key] = (final, one_left, two_left)
+        return turn
+
+    def best_keep(
+        self, dice: list[int], rolls_left: int, filled: int, upper: int, bonus: bool
+    ) -> tuple[int, ...]:
+        """
+        The dice to keep before rolling again (sorted values).
+
+        Keeping all five means scoring now is best.
+        """
+        keep_values = self._turn(filled, upper, bonus)[min(rolls_left, 2)]
+        keeps = _ROLL_KEEPS[roll_index(dice)]
+        best = max(keeps, key=keep_values.__getitem__)
+        return KEEPS[best]
+
+    def best_category(
+        self, dice: list[int], filled: int, upper: int, bonus: bool
+    ) -> str:
+        """The open category to score the dice in."""
+        r = roll_index(dice)
+        best_category, best_value = None, 0.0
+        for c, category in enumerate(ALL_CATEGORIES):
+            if filled >> c & 1:
+                continue
+            value = self._category_value(r, c, filled, upper, bonus)
+            if best_category is None or value > best_value:
+                best_category, best_value = category, value
+        return best_category
+
+    def _category_value(
+        self, r: int, c: int, filled: int, upper: int, bonus: bool
+    ) -> float:
+        """Score plus future value of putting roll r in category c."""
+        points = SCORE_TABLE[r][c]
+        after = filled | 1 << c
+        if c < 6:
+            total = upper + points
+            earned = UPPER_BONUS if upper < UPPER_BONUS_TOTAL <= total else 0
+            return points + earned + self.value(after, total, bonus)
+        if c == _YAHTZEE:
+            return points + self.value(after, upper, points == 50)
+        return points + self.value(after, upper, bonus)
+
+
+@functools.cache
+def load_policy(path: Path = POLICY_PATH) -> YahtzeePolicy | None:
+    """Memory-map the generated policy, or None if it hasn't been generated."""
+    try:
+        policy = YahtzeePolicy.open(path)
+    except (FileNotFoundError, ValueError):
+        return None
+    return policy if policy.complete else None
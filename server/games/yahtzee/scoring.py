@@ -0,0 +1,153 @@
+"""
+Scoring for Yahtzee.
+
+A category's score depends only on which five dice were rolled, so every
+category is scored once for each of the 252 possible rolls at import time
+and later looked up.
+"""
+
+from array import array
+from itertools import combinations_with_replacement
+
+
+# Scoring categories
+UPPER_CATEGORIES = ["ones", "twos", "threes", "fours", "fives", "sixes"]
+LOWER_CATEGORIES = [
+    "three_kind",
+    "four_kind",
+    "full_house",
+    "small_straight",
+    "large_straight",
+    "yahtzee",
+    "chance",
+]
+ALL_CATEGORIES = UPPER_CATEGORIES + LOWER_CATEGORIES
+
+# Upper section target values
+UPPER_VALUES = {
+    "ones": 1,
+    "twos": 2,
+    "threes": 3,
+    "fours": 4,
+    "fives": 5,
+    "sixes": 6,
+}
+
+
+CATEGORY_INDEX = {cat: i for i, cat in enumerate(ALL_CATEGORIES)}
+NUM_DICE = 5
+
+
+def count_dice(dice: list[int]) -> dict[int, int]:
+    """Count occurrences of each die value (1-6)."""
+    counts = {i: 0 for i in range(1, 7)}
+    for die in dice:
+        counts[die] += 1
+    return counts
+
+
+def _score_roll(dice: tuple[int, ...], category: str) -> int:
+    """Score five dice in a category (used to build the score table)."""
+    counts = count_dice(list(dice))
+    dice_sum = sum(dice)
+
+    # Upper section - sum of matching dice
+    if category in UPPER_VALUES:
+        target = UPPER_VALUES[category]
+        return counts[target] * target
+
+    # Three of a Kind - sum of all if 3+ of same
+    if category == "three_kind":
+        if any(c >= 3 for c in counts.values()):
+            return dice_sum
+        return 0
+
+    # Four of a Kind - sum of all if 4+ of same
+    if category == "four_kind":
+        if any(c >= 4 for c in counts.values()):
+            return dice_sum
+        return 0
+
+    # Full House - 3 of one kind + 2 of another = 25 points
+    if category == "full_house":
+        has_three = any(c == 3 for c in counts.values())
+        has_two = any(c == 2 for c in counts.values())
+        # Also allow 5 of a kind as full house
+        has_five = any(c == 5 for c in counts.values())
+        if (has_three and has_two) or has_five:
+            return 25
+        return 0
+
+    # Small Straight - 4 consecutive = 30 points
+    if category == "small_straight":
+        # Check for 1-2-3-4, 2-3-4-5, or 3-4-5-6
+        straights = [
+            {1, 2, 3, 4},
+            {2, 3, 4, 5},
+            {3, 4, 5, 6},
+        ]
+        dice_set = set(dice)
+        if any(s.issubset(dice_set) for s in straights):
+            return 30
+        return 0
+
+    # Large Straight - 5 consecutive = 40 points
+    if category == "large_straight":
+        sorted_dice = sorted(dice)
+        if sorted_dice == [1, 2, 3, 4, 5] or sorted_dice == [2, 3, 4, 5, 6]:
+            return 40
+        return 0
+
+    # Yahtzee - 5 of a kind = 50 points
+    if category == "yahtzee":
+        if any(c == 5 for c in counts.values()):
+            return 50
+        return 0
+
+    # Chance - sum of all dice
+    if category == "chance":
+        return dice_sum
+
+    return 0
+
+
+# Every roll as a sorted tuple, in a fixed order; a roll's face counts in
+# base 7 (the sum of _FACE_WEIGHTS[die]) index _ROLL_INDEX, which maps to
+# the roll's position in ROLLS and SCORE_TABLE.
+ROLLS = tuple(combinations_with_replacement(range(1, 7), NUM_DICE))
+_FACE_WEIGHTS = tuple([0] + [7**i for i in range(6)])
+_ROLL_INDEX = array("B", [0]) * (NUM_DICE * 7**5 + 1)
+for _i, _roll in enumerate(ROLLS):
+    _ROLL_INDEX[sum(_FACE_WEIGHTS[d] for d in _roll)] = _i
+
+# SCORE_TABLE[roll index][category index]
+SCORE_TABLE = tuple(
+    tuple(_score_roll(roll, cat) for cat in ALL_CATEGORIES) for roll in ROLLS
+)
+
+
+def roll_index(dice: list[int]) -> int:
+    """Position of five dice (in any order) in ROLLS."""
+    code = 0
+    for die in dice:
+        code += _FACE_WEIGHTS[die]
+    return _ROLL_INDEX[code]
+
+
+def roll_scores(dice: list[int]) -> tuple[int, ...]:
+    """Scores of five dice in every category, in ALL_CATEGORIES order."""
+    return SCORE_TABLE[roll_index(dice)]
+
+
+def calculate_score(dice: list[int], category: str) -> int:
+    """Calculate the score for a category given the dice."""
+    if not dice or len(dice) != NUM_DICE or category not in CATEGORY_INDEX:
+        return 0
+    return SCORE_TABLE[roll_index(dice)][CATEGORY_INDEX[category]]
+
+
+def is_yahtzee(dice: list[int]) -> bool:
+    """Check if dice are a Yahtzee (5 of a kind)."""
+    if len(dice) != 5:
+        return False
+    return len(set(dice)) == 1
@@ -33,6 +33,12 @@ game-option-changed-team = Team mode set to { $mode }.
 game-team-mode-individual = Individual
 game-team-mode-x-teams-of-y = { $num_teams } teams of { $team_size }
 
+game-set-bot-strategy = Bot strategy: { $strategy }
+game-select-bot-strategy = Select bot strategy
+game-option-changed-bot-strategy = Bot strategy set to { $strategy }.
+game-bot-strategy-simple = Simple
+game-bot-strategy-search = Look ahead
+
 # Boolean option values
 option-on = on
 option-off = off
@@ -95,6 +95,8 @@ estimate-computing = Computing estimated game duration...
 estimate-result = Bot average: { $bot_time } (± { $std_dev }). { $outlier_info }Estimated human time: { $human_time }.
 estimate-error = Could not estimate duration.
 estimate-already-running = Duration estimation already in progress.
+estimate-progress = Bot average so far: { $bot_time } ({ $done } of { $total } simulations).
+estimate-busy = The server is busy with other estimates. Try again shortly.
 
 # Save/Restore
 saved-tables = Saved Tables
@@ -198,6 +200,7 @@ my-stats-games-played = Games played: { $value }
 my-stats-total-score = Total score: { $value }
 my-stats-high-score = High score: { $value }
 my-stats-rating = Skill rating: { $value } ({ $mu } ± { $sigma })
+my-stats-rating-rank = Rating rank: #{ $rank } of { $total }
 my-stats-no-rating = No skill rating yet
 my-stats-avg-per-turn = Avg points per turn: { $value }
 my-stats-best-turn = Best single turn: { $value }
@@ -39,6 +39,10 @@ farkle-winners-tie = We have a tie! Winners: { $players }
 
 # Check turn score action
 farkle-turn-score = { $player } has { $points } points this turn.
+farkle-farkle-chance = Rolling { $count } { $count ->
+    [one] die
+   *[other] dice
+} now has a { $percent }% chance to farkle.
 farkle-no-turn = No one is currently taking a turn.
 
 # Farkle-specific options
@@ -93,6 +93,8 @@ estimate-computing = szacowanie czasu trwania gry
 estimate-result = Oszacowany czas bota: { $bot_time } (± { $std_dev }). { $outlier_info }Szacowany czas gracza: { $human_time }.
 estimate-error = Nie można osacować czasu.
 estimate-already-running = Szacowanie w toku
+estimate-progress = Dotychczasowy czas bota: { $bot_time } ({ $done } z { $total } symulacji).
+estimate-busy = Serwer jest zajęty innymi szacowaniami. Spróbuj ponownie za chwilę.
 
 # Save/Restore
 saved-tables = Zapisane stoły
@@ -196,6 +198,7 @@ my-stats-games-played = Zagrane rozgrywki: { $value }
 my-stats-total-score = Wszystkie wyniki: { $value }
 my-stats-high-score = Najwyższy wynik: { $value }
 my-stats-rating = Ocena umiejętności: { $value } ({ $mu } ± { $sigma })
+my-stats-rating-rank = Pozycja w rankingu: #{ $rank } z { $total }
 my-stats-no-rating = Brak oceny umiejętności
 my-stats-avg-per-turn = średnia ilość punktów na turę: { $value }
 my-stats-best-turn = Najlepsza pojedyńcza tura: { $value }
@@ -87,6 +87,11 @@ yahtzee-winners-tie = It's a tie! { $players } all scored { $score } points!
 yahtzee-set-rounds = Number of games: { $rounds }
 yahtzee-enter-rounds = Enter number of games (1-10):
 yahtzee-option-changed-rounds = Number of games set to { $rounds }.
+yahtzee-set-bot-strategy = Bot strategy: { $strategy }
+yahtzee-select-bot-strategy = Select bot strategy
+yahtzee-option-changed-bot-strategy = Bot strategy set to { $strategy }.
+yahtzee-bot-simple = Simple
+yahtzee-bot-optimal = Optimal
 
 # Disabled action reasons
 yahtzee-no-rolls-left = You have no rolls left.
@@ -41,6 +41,10 @@ farkle-winners-tie = Temos um empate! Vencedores: { $players }
 
 # Ação de verificar pontuação do turno
 farkle-turn-score = { $player } tem { $points } pontos neste turno.
+farkle-farkle-chance = Rolar { $count } { $count ->
+    [one] dado
+   *[other] dados
+} agora tem { $percent }% de chance de farkle.
 farkle-no-turn = Ninguém está jogando no momento.
 
 # Opções específicas do Farkle
@@ -33,6 +33,12 @@ game-option-changed-team = Modo de equipe definido para { $mode }.
 game-team-mode-individual = Individual
 game-team-mode-x-teams-of-y = { $num_teams } equipes de { $team_size }
 
+game-set-bot-strategy = Estratégia dos bots: { $strategy }
+game-select-bot-strategy = Selecione a estratégia dos bots
+game-option-changed-bot-strategy = Estratégia dos bots definida para { $strategy }.
+game-bot-strategy-simple = Simples
+game-bot-strategy-search = Pensar adiante
+
 # Valores de opções booleanas
 option-on = ligado
 option-off = desligado
@@ -156,6 +156,7 @@ my-stats-games-played = Jogos disputados: { $value }
 my-stats-total-score = Pontuação total: { $value }
 my-stats-high-score = Maior pontuação: { $value }
 my-stats-rating = Classificação de habilidade: { $value } ({ $mu } ± { $sigma })
+my-stats-rating-rank = Posição no ranking: #{ $rank } de { $total }
 my-stats-no-rating = Ainda sem classificação de habilidade
 my-stats-avg-per-turn = Média de pontos por turno: { $value }
 my-stats-best-turn = Melhor turno: { $value }
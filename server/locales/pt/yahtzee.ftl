@@ -87,6 +87,11 @@ yahtzee-winners-tie = Empate! { $players } todos marcaram { $score } pontos!
 yahtzee-set-rounds = Número de jogos: { $rounds }
 yahtzee-enter-rounds = Digite o número de jogos (1-10):
 yahtzee-option-changed-rounds = Número de jogos definido para { $rounds }.
+yahtzee-set-bot-strategy = Estratégia dos bots: { $strategy }
+yahtzee-select-bot-strategy = Selecione a estratégia dos bots
+yahtzee-option-changed-bot-strategy = Estratégia dos bots definida para { $strategy }.
+yahtzee-bot-simple = Simples
+yahtzee-bot-optimal = Ótima
 
 # Razões para ações desabilitadas
 yahtzee-no-rolls-left = Você não tem mais rolagens.
@@ -35,6 +35,7 @@ farkle-winners-tie = 平局！获胜者：{ $players }
 
 # 检查回合得分操作
 farkle-turn-score = { $player } 本回合有 { $points } 分。
+farkle-farkle-chance = 现在掷 { $count } 个骰子有 { $percent }% 的几率 farkle。
 farkle-no-turn = 当前没有人在进行回合。
 
 # Farkle特定选项
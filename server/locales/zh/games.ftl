@@ -33,6 +33,12 @@ game-option-changed-team = 团队模式已设为 { $mode }。
 game-team-mode-individual = 个人
 game-team-mode-x-teams-of-y = { $num_teams } 个 { $team_size } 人团队
 
+game-set-bot-strategy = 机器人策略：{ $strategy }
+game-select-bot-strategy = 选择机器人策略
+game-option-changed-bot-strategy = 机器人策略设置为 { $strategy }。
+game-bot-strategy-simple = 简单
+game-bot-strategy-search = 前瞻
+
 # 布尔选项值
 option-on = 开启
 option-off = 关闭
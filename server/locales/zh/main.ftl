@@ -149,6 +149,7 @@ my-stats-games-played = 游戏场次：{ $value }
 my-stats-total-score = 总分：{ $value }
 my-stats-high-score = 最高分：{ $value }
 my-stats-rating = 技能评分：{ $value }（{ $mu } ± { $sigma }）
+my-stats-rating-rank = 评分排名：第 { $rank } 名，共 { $total } 名
 my-stats-no-rating = 暂无技能评分
 my-stats-avg-per-turn = 平均每回合得分：{ $value }
 my-stats-best-turn = 单回合最高分：{ $value }
@@ -87,6 +87,11 @@ yahtzee-winners-tie = 平局！{ $players } 都获得了 { $score } 分！
 yahtzee-set-rounds = 游戏局数：{ $rounds }
 yahtzee-enter-rounds = 输入游戏局数（1-10）：
 yahtzee-option-changed-rounds = 游戏局数设置为 { $rounds }。
+yahtzee-set-bot-strategy = 机器人策略：{ $strategy }
+yahtzee-select-bot-strategy = 选择机器人策略
+yahtzee-option-changed-bot-strategy = 机器人策略设置为 { $strategy }。
+yahtzee-bot-simple = 简单
+yahtzee-bot-optimal = 最优
 
 # 操作禁用原因
 yahtzee-no-rolls-left = 你没有掷骰次数了。
@@ -56,6 +56,12 @@ class Localization:
         cls._bundles[locale] = bundle
         return bundle
 
+    @classmethod
+    def preload(cls, *locales: str) -> None:
+        """Compile bundles now instead of on their first message."""
+        for locale in locales:
+            cls._get_bundle(locale)
+
     # Unicode bidi isolation characters that Fluent adds around variables
     _BIDI_CHARS = "\u2068\u2069"  # FIRST STRONG ISOLATE, POP DIRECTIONAL ISOLATE
 
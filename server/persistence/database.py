@@ -2,10 +2,13 @@
 
 import sqlite3
 import json
+from collections.abc import Iterator
 from pathlib import Path
 from dataclasses import dataclass
 
+from ..tables.journal import ENTRY_SEGMENT, JournalEntry
 from ..tables.table import Table
+from .snapshot import FORMAT_BINARY, encode_snapshot
 
 
 @dataclass
@@ -28,7 +31,7 @@ class SavedTableRecord:
     username: str
     save_name: str
     game_type: str
-    game_json: str
+    game_json: str | bytes  # Legacy JSON text or an encoded snapshot
     members_json: str
     saved_at: str
 
@@ -40,8 +43,11 @@ class Database:
     Stores users and tables as specified in persistence.md.
     """
 
-    def __init__(self, db_path: str | Path = "playpalace.db"):
+    def __init__(
+        self, db_path: str | Path = "playpalace.db", snapshot_format: str = FORMAT_BINARY
+    ):
         self.db_path = Path(db_path)
+        self.snapshot_format = snapshot_format  # How game state is written
         self._conn: sqlite3.Connection | None = None
 
     def connect(self) -> None:
@@ -84,6 +90,23 @@ class Database:
             )
         """)
 
+        # Journal of actions since each table's snapshot (see tables.journal)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS table_journal (
+                table_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                tick INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                player_id TEXT,
+                action_id TEXT,
+                input_value TEXT,
+                menu_item_id TEXT,
+                menu_index INTEGER,
+                from_keybind INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (table_id, seq)
+            )
+        """)
+
         # Saved tables (user-saved game states)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS saved_tables (
@@ -131,6 +154,10 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_result_players_player
             ON game_result_players(player_id)
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_result_players_result
+            ON game_result_players(result_id)
+        """)
 
         # Player ratings (for skill-based matchmaking)
         cursor.execute("""
@@ -139,12 +166,48 @@ class Database:
                 game_type TEXT NOT NULL,
                 mu REAL NOT NULL,
                 sigma REAL NOT NULL,
+                ordinal REAL NOT NULL DEFAULT 0,
                 PRIMARY KEY (player_id, game_type)
             )
         """)
+        self._migrate_player_ratings_ordinal(cursor)
+
+        self._create_player_ratings_index(cursor)
+
+        # Cached duration estimates (see game_utils.estimates)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS duration_estimates (
+                estimate_key TEXT PRIMARY KEY,
+                game_type TEXT NOT NULL,
+                game_version TEXT NOT NULL,
+                num_bots INTEGER NOT NULL,
+                options_json TEXT NOT NULL,
+                ticks_json TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        """)
 
         self._conn.commit()
 
+    def _create_player_ratings_index(self, cursor: sqlite3.Cursor) -> None:
+        """Create the index leaderboards and rank lookups walk in ordinal order."""
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_player_ratings_ordinal
+            ON player_ratings(game_type, ordinal DESC, player_id)
+        """)
+
+    def _migrate_player_ratings_ordinal(self, cursor: sqlite3.Cursor) -> None:
+        """Add and backfill the ordinal column on databases created before it existed."""
+        cursor.execute("PRAGMA table_info(player_ratings)")
+        columns = {row["name"] for row in cursor.fetchall()}
+        if "ordinal" in columns:
+            return
+        cursor.execute(
+            "ALTER TABLE player_ratings ADD COLUMN ordinal REAL NOT NULL DEFAULT 0"
+        )
+        # Same formula as PlayerRating.ordinal (mu - 3*sigma)
+        cursor.execute("UPDATE player_ratings SET ordinal = mu - 3 * sigma")
+
     # User operations
 
     def get_user(self, username: str) -> UserRecord | None:
@@ -220,34 +283,148 @@ class Database:
 
     # Table operations
 
-    def save_table(self, table: Table) -> None:
-        """Save a table to the database."""
-        cursor = self._conn.cursor()
+    @staticmethod
+    def table_row(table: Table, game_json: str | None = None) -> tuple:
+        """
+        Build the tables row for a table.
 
-        # Serialize members
+        Args:
+            table: The table to persist
+            game_json: Serialized game state (defaults to table.game_json)
+        """
         members_json = json.dumps(
             [
                 {"username": m.username, "is_spectator": m.is_spectator}
                 for m in table.members
             ]
         )
+        return (
+            table.table_id,
+            table.game_type,
+            table.host,
+            members_json,
+            game_json if game_json is not None else table.game_json,
+            table.status,
+        )
 
-        cursor.execute(
+    @staticmethod
+    def live_snapshot_ids(tables: list[Table]) -> list[str]:
+        """Ids of tables whose game_json is a snapshot of their live game."""
+        return [
+            table.table_id
+            for table in tables
+            if not table.restore_pending and table.game is not None
+        ]
+
+    def save_table(self, table: Table) -> None:
+        """Save a table to the database."""
+        self.save_table_rows(
+            [self.table_row(table)], self.live_snapshot_ids([table])
+        )
+
+    def save_table_rows(
+        self, rows: list[tuple], new_segments: list[str] | None = None
+    ) -> None:
+        """
+        Upsert table rows (as built by table_row) in one transaction.
+
+        Game state is encoded in snapshot_format; rows that already hold an
+        encoded snapshot are written unchanged.
+
+        Args:
+            rows: (table_id, game_type, host, members_json, game_json, status)
+            new_segments: Ids of tables whose row is a fresh snapshot of the
+                live game. Their previous journal is discarded and an empty
+                one started.
+        """
+        if not rows:
+            return
+        rows = [
+            row
+            if row[4] is None
+            else row[:4] + (encode_snapshot(row[4], self.snapshot_format),) + row[5:]
+            for row in rows
+        ]
+        cursor = self._conn.cursor()
+        cursor.executemany(
             """
             INSERT OR REPLACE INTO tables (table_id, game_type, host, members_json, game_json, status)
             VALUES (?, ?, ?, ?, ?, ?)
         """,
-            (
-                table.table_id,
-                table.game_type,
-                table.host,
-                members_json,
-                table.game_json,
-                table.status,
-            ),
+            rows,
+        )
+        if new_segments:
+            cursor.executemany(
+                "DELETE FROM table_journal WHERE table_id = ?",
+                [(table_id,) for table_id in new_segments],
+            )
+            cursor.executemany(
+                """
+                INSERT INTO table_journal (table_id, seq, tick, kind)
+                VALUES (?, 0, 0, ?)
+            """,
+                [(table_id, ENTRY_SEGMENT) for table_id in new_segments],
+            )
+        self._conn.commit()
+
+    def append_journal(self, entries: list[tuple[str, JournalEntry]]) -> None:
+        """Append (table_id, entry) pairs to the table journal."""
+        if not entries:
+            return
+        self._conn.executemany(
+            """
+            INSERT OR REPLACE INTO table_journal
+                (table_id, seq, tick, kind, player_id, action_id, input_value,
+                 menu_item_id, menu_index, from_keybind)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            [
+                (
+                    table_id,
+                    e.seq,
+                    e.tick,
+                    e.kind,
+                    e.player_id,
+                    e.action_id,
+                    e.input_value,
+                    e.menu_item_id,
+                    e.menu_index,
+                    int(e.from_keybind),
+                )
+                for table_id, e in entries
+            ],
         )
         self._conn.commit()
 
+    def load_journal(self, table_id: str) -> list[JournalEntry] | None:
+        """
+        Load a table's journal segment.
+
+        Returns:
+            Entries in seq order, or None if the table's snapshot has no
+            journal.
+        """
+        rows = self._conn.execute(
+            "SELECT * FROM table_journal WHERE table_id = ? ORDER BY seq",
+            (table_id,),
+        ).fetchall()
+        if not rows or rows[0]["kind"] != ENTRY_SEGMENT:
+            return None
+        return [
+            JournalEntry(
+                seq=row["seq"],
+                tick=row["tick"],
+                kind=row["kind"],
+                player_id=row["player_id"],
+                action_id=row["action_id"],
+                input_value=row["input_value"],
+                menu_item_id=row["menu_item_id"],
+                menu_index=row["menu_index"],
+                from_keybind=bool(row["from_keybind"]),
+            )
+            for row in rows[1:]
+        ]
+
     def load_table(self, table_id: str) -> Table | None:
         """Load a table from the database."""
         cursor = self._conn.cursor()
@@ -255,16 +432,27 @@ class Database:
         row = cursor.fetchone()
         if not row:
             return None
+        return self._row_to_table(row)
+
+    def iter_tables(self) -> Iterator[Table]:
+        """Stream all tables from the database with a single query."""
+        cursor = self._conn.execute("SELECT * FROM tables")
+        for row in cursor:
+            yield self._row_to_table(row)
 
-        # Deserialize members
-        members_data = json.loads(row["members_json"])
+    def load_all_tables(self) -> list[Table]:
+        """Load all tables from the database."""
+        return list(self.iter_tables())
+
+    @staticmethod
+    def _row_to_table(row: sqlite3.Row) -> Table:
+        """Build a Table from a tables row."""
         from ..tables.table import TableMember
 
         members = [
             TableMember(username=m["username"], is_spectator=m["is_spectator"])
-            for m in members_data
+            for m in json.loads(row["members_json"])
         ]
-
         return Table(
             table_id=row["table_id"],
             game_type=row["game_type"],
@@ -274,33 +462,25 @@ class Database:
             status=row["status"],
         )
 
-    def load_all_tables(self) -> list[Table]:
-        """Load all tables from the database."""
-        cursor = self._conn.cursor()
-        cursor.execute("SELECT table_id FROM tables")
-        tables = []
-        for row in cursor.fetchall():
-            table = self.load_table(row["table_id"])
-            if table:
-                tables.append(table)
-        return tables
-
     def delete_table(self, table_id: str) -> None:
         """Delete a table from the database."""
         cursor = self._conn.cursor()
         cursor.execute("DELETE FROM tables WHERE table_id = ?", (table_id,))
+        cursor.execute("DELETE FROM table_journal WHERE table_id = ?", (table_id,))
         self._conn.commit()
 
     def delete_all_tables(self) -> None:
         """Delete all tables from the database."""
         cursor = self._conn.cursor()
         cursor.execute("DELETE FROM tables")
+        cursor.execute("DELETE FROM table_journal")
         self._conn.commit()
 
     def save_all_tables(self, tables: list[Table]) -> None:
         """Save multiple tables."""
-        for table in tables:
-            self.save_table(table)
+        self.save_table_rows(
+            [self.table_row(table) for table in tables], self.live_snapshot_ids(tables)
+        )
 
     # Saved table operations (user-saved game states)
 
@@ -316,6 +496,7 @@ class Database:
         from datetime import datetime
 
         saved_at = datetime.now().isoformat()
+        game_json = encode_snapshot(game_json, self.snapshot_format)
 
         cursor = self._conn.cursor()
         cursor.execute(
@@ -640,36 +821,383 @@ class Database:
         return None
 
     def set_player_rating(
-        self, player_id: str, game_type: str, mu: float, sigma: float
+        self,
+        player_id: str,
+        game_type: str,
+        mu: float,
+        sigma: float,
+        ordinal: float | None = None,
     ) -> None:
-        """Set or update a player's rating for a game type."""
+        """
+        Set or update a player's rating for a game type.
+
+        Args:
+            ordinal: Conservative skill estimate used for ranking.
+                     Defaults to mu - 3*sigma (PlayerRating.ordinal).
+        """
+        if ordinal is None:
+            ordinal = mu - 3 * sigma
         cursor = self._conn.cursor()
         cursor.execute(
             """
-            INSERT OR REPLACE INTO player_ratings (player_id, game_type, mu, sigma)
-            VALUES (?, ?, ?, ?)
+            INSERT OR REPLACE INTO player_ratings (player_id, game_type, mu, sigma, ordinal)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (player_id, game_type, mu, sigma, ordinal),
+        )
+        self._conn.commit()
+
+    def get_player_ratings(
+        self, player_ids: list[str], game_type: str
+    ) -> dict[str, tuple[float, float]]:
+        """
+        Get ratings for several players of a game type in one query.
+
+        Returns:
+            Dictionary of player_id -> (mu, sigma) for players that have a rating
+        """
+        if not player_ids:
+            return {}
+        cursor = self._conn.cursor()
+        placeholders = ", ".join("?" for _ in player_ids)
+        cursor.execute(
+            f"""
+            SELECT player_id, mu, sigma FROM player_ratings
+            WHERE game_type = ? AND player_id IN ({placeholders})
             """,
-            (player_id, game_type, mu, sigma),
+            (game_type, *player_ids),
+        )
+        return {row["player_id"]: (row["mu"], row["sigma"]) for row in cursor.fetchall()}
+
+    def set_player_ratings(
+        self, ratings: list[tuple[str, str, float, float, float]]
+    ) -> None:
+        """
+        Set or update many ratings in a single transaction.
+
+        Args:
+            ratings: List of (player_id, game_type, mu, sigma, ordinal) tuples
+        """
+        if not ratings:
+            return
+        cursor = self._conn.cursor()
+        cursor.executemany(
+            """
+            INSERT OR REPLACE INTO player_ratings (player_id, game_type, mu, sigma, ordinal)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            ratings,
         )
         self._conn.commit()
 
     def get_rating_leaderboard(
-        self, game_type: str, limit: int = 10
+        self, game_type: str, limit: int = 10, offset: int = 0
     ) -> list[tuple[str, float, float]]:
         """
-        Get the rating leaderboard for a game type.
+        Get a page of the rating leaderboard for a game type.
+
+        Args:
+            game_type: The game type to query
+            limit: Maximum number of entries (page size)
+            offset: Number of top entries to skip (0 = first page)
 
         Returns:
-            List of (player_id, mu, sigma) tuples sorted by mu descending
+            List of (player_id, mu, sigma) tuples sorted by ordinal descending
         """
         cursor = self._conn.cursor()
         cursor.execute(
             """
             SELECT player_id, mu, sigma FROM player_ratings
             WHERE game_type = ?
-            ORDER BY mu DESC
-            LIMIT ?
+            ORDER BY ordinal DESC, player_id
+            LIMIT ? OFFSET ?
             """,
-            (game_type, limit),
+            (game_type, limit, offset),
         )
         return [(row["player_id"], row["mu"], row["sigma"]) for row in cursor.fetchall()]
+
+    def get_player_rating_rank(self, player_id: str, game_type: str) -> int | None:
+        """
+        Get a player's 1-based position on the rating leaderboard.
+
+        Counts only the players ranked above via the ordinal index, so the
+        cost grows with the rank rather than the number of rated players.
+
+        Returns:
+            The rank, or None if the player has no rating for this game type
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            SELECT ordinal FROM player_ratings
+            WHERE player_id = ? AND game_type = ?
+            """,
+            (player_id, game_type),
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
+
+        ordinal = row["ordinal"]
+        cursor.execute(
+            """
+            SELECT COUNT(*) AS ahead FROM player_ratings
+            WHERE game_type = ?
+              AND (ordinal > ? OR (ordinal = ? AND player_id < ?))
+            """,
+            (game_type, ordinal, ordinal, player_id),
+        )
+        return cursor.fetchone()["ahead"] + 1
+
+    def get_rated_player_count(self, game_type: str) -> int:
+        """Get the number of players with a rating for a game type."""
+        cursor = self._conn.cursor()
+        cursor.execute(
+            "SELECT COUNT(*) AS total FROM player_ratings WHERE game_type = ?",
+            (game_type,),
+        )
+        return cursor.fetchone()["total"]
+
+    # Rating rebuild operations
+
+    def get_game_results_chunk(
+        self, after_timestamp: str, after_id: int, limit: int
+    ) -> list[tuple[int, str, str, int, str | None, list[tuple[str, str, bool]]]]:
+        """
+        Get the next chunk of game results with their players, in timestamp order.
+
+        Uses keyset pagination on (timestamp, id), so each chunk costs the
+        same no matter how far into the history it is.
+
+        Args:
+            after_timestamp: Timestamp of the last result already read ("" to start)
+            after_id: ID of the last result already read (0 to start)
+            limit: Maximum number of results to return
+
+        Returns:
+            List of (id, game_type, timestamp, duration_ticks, custom_data, players)
+            tuples, where players is a list of (player_id, player_name, is_bot)
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            SELECT gr.id, gr.game_type, gr.timestamp, gr.duration_ticks, gr.custom_data,
+                   grp.player_id, grp.player_name, grp.is_bot
+            FROM (
+                SELECT id, game_type, timestamp, duration_ticks, custom_data
+                FROM game_results
+                WHERE timestamp > ? OR (timestamp = ? AND id > ?)
+                ORDER BY timestamp, id
+                LIMIT ?
+            ) gr
+            LEFT JOIN game_result_players grp ON grp.result_id = gr.id
+            ORDER BY gr.timestamp, gr.id, grp.id
+            """,
+            (after_timestamp, after_timestamp, after_id, limit),
+        )
+        results = []
+        for row in cursor.fetchall():
+            if not results or results[-1][0] != row["id"]:
+                results.append(
+                    (
+                        row["id"],
+                        row["game_type"],
+                        row["timestamp"],
+                        row["duration_ticks"],
+                        row["custom_data"],
+                        [],
+                    )
+                )
+            if row["player_id"] is not None:
+                results[-1][5].append(
+                    (row["player_id"], row["player_name"], bool(row["is_bot"]))
+                )
+        return results
+
+    def start_ratings_rebuild(
+        self, resume: bool = False
+    ) -> tuple[str, int, int, int, list[tuple[str, str, float, float]]]:
+        """
+        Prepare the staging table for a ratings rebuild.
+
+        Args:
+            resume: Continue an interrupted rebuild instead of starting over
+
+        Returns:
+            (last_timestamp, last_id, games_processed, games_rated, ratings)
+            where ratings is a list of (player_id, game_type, mu, sigma)
+            already in the staging table
+        """
+        cursor = self._conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS rating_rebuild_state (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                last_timestamp TEXT NOT NULL,
+                last_id INTEGER NOT NULL,
+                games_processed INTEGER NOT NULL,
+                games_rated INTEGER NOT NULL
+            )
+        """)
+        cursor.execute(
+            "SELECT last_timestamp, last_id, games_processed, games_rated"
+            " FROM rating_rebuild_state"
+        )
+        state = cursor.fetchone()
+
+        if resume and state:
+            cursor.execute(
+                "SELECT player_id, game_type, mu, sigma FROM player_ratings_rebuild"
+            )
+            ratings = [
+                (row["player_id"], row["game_type"], row["mu"], row["sigma"])
+                for row in cursor.fetchall()
+            ]
+            return (
+                state["last_timestamp"],
+                state["last_id"],
+                state["games_processed"],
+                state["games_rated"],
+                ratings,
+            )
+
+        cursor.execute("DROP TABLE IF EXISTS player_ratings_rebuild")
+        cursor.execute("""
+            CREATE TABLE player_ratings_rebuild (
+                player_id TEXT NOT NULL,
+                game_type TEXT NOT NULL,
+                mu REAL NOT NULL,
+                sigma REAL NOT NULL,
+                ordinal REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (player_id, game_type)
+            )
+        """)
+        cursor.execute("DELETE FROM rating_rebuild_state")
+        cursor.execute(
+            "INSERT INTO rating_rebuild_state VALUES (1, '', 0, 0, 0)"
+        )
+        self._conn.commit()
+        return ("", 0, 0, 0, [])
+
+    def save_ratings_rebuild_chunk(
+        self,
+        ratings: list[tuple[str, str, float, float, float]],
+        last_timestamp: str,
+        last_id: int,
+        games_processed: int,
+        games_rated: int,
+    ) -> None:
+        """
+        Write ratings changed by a chunk and its checkpoint in one transaction.
+
+        Args:
+            ratings: List of (player_id, game_type, mu, sigma, ordinal) tuples
+            last_timestamp: Timestamp of the last result in the chunk
+            last_id: ID of the last result in the chunk
+            games_processed: Total results replayed so far
+            games_rated: Total results that changed ratings so far
+        """
+        cursor = self._conn.cursor()
+        cursor.executemany(
+            """
+            INSERT OR REPLACE INTO player_ratings_rebuild
+                (player_id, game_type, mu, sigma, ordinal)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            ratings,
+        )
+        cursor.execute(
+            """
+            UPDATE rating_rebuild_state
+            SET last_timestamp = ?, last_id = ?, games_processed = ?,
+                games_rated = ?
+            """,
+            (last_timestamp, last_id, games_processed, games_rated),
+        )
+        self._conn.commit()
+
+    def finish_ratings_rebuild(self) -> None:
+        """Atomically replace player_ratings with the rebuilt staging table."""
+        self._conn.commit()
+        cursor = self._conn.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("DROP TABLE player_ratings")
+            cursor.execute(
+                "ALTER TABLE player_ratings_rebuild RENAME TO player_ratings"
+            )
+            self._create_player_ratings_index(cursor)
+            cursor.execute("DROP TABLE rating_rebuild_state")
+            cursor.execute("COMMIT")
+        except sqlite3.Error:
+            cursor.execute("ROLLBACK")
+            raise
+
+    # Duration estimate cache
+
+    def get_duration_estimate(
+        self, estimate_key: str, game_version: str
+    ) -> list[int] | None:
+        """
+        Get the simulated tick counts cached for an estimate key.
+
+        Returns:
+            The tick counts, or None if nothing is cached for this version
+            of the game.
+        """
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            SELECT ticks_json FROM duration_estimates
+            WHERE estimate_key = ? AND game_version = ?
+            """,
+            (estimate_key, game_version),
+        )
+        row = cursor.fetchone()
+        if row:
+            return json.loads(row["ticks_json"])
+        return None
+
+    def save_duration_estimate(
+        self,
+        estimate_key: str,
+        game_type: str,
+        game_version: str,
+        num_bots: int,
+        options_json: str,
+        ticks: list[int],
+    ) -> None:
+        """Cache the simulated tick counts for an estimate key."""
+        from datetime import datetime
+
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO duration_estimates
+                (estimate_key, game_type, game_version, num_bots, options_json,
+                 ticks_json, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                estimate_key,
+                game_type,
+                game_version,
+                num_bots,
+                options_json,
+                json.dumps(ticks),
+                datetime.now().isoformat(),
+            ),
+        )
+        self._conn.commit()
+
+    def delete_stale_duration_estimates(self, game_type: str, game_version: str) -> int:
+        """Drop a game's estimates made with other versions. Returns the count."""
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """
+            DELETE FROM duration_estimates
+            WHERE game_type = ? AND game_version != ?
+            """,
+            (game_type, game_version),
+        )
+        self._conn.commit()
+        return cursor.rowcount
@@ -0,0 +1,162 @@
+"""
+Versioned, compressed snapshot format for serialized games.
+
+Game state is stored in tables.game_json and saved_tables.game_json. Rows
+written before snapshots existed hold plain JSON text; they are still read
+as-is. New rows are written in one of two formats:
+
+- "binary" (default): a small header followed by compact JSON compressed
+  with zlib using a preset dictionary trained on our game types.
+- "json": plain JSON text, for debugging with an SQLite shell.
+
+Binary layout:
+
+    MAGIC (4 bytes) | version (1 byte) | dictionary id (1 byte) | zlib stream
+
+Dictionaries live in snapshot_dicts/<id>.zdict and must never change once
+shipped, since existing rows need them to decompress. To retrain, write a
+new id with `python -m server.cli snapshot train` and bump
+CURRENT_DICTIONARY_ID.
+"""
+
+import functools
+import json
+import re
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..games.base import Game
+
+SNAPSHOT_MAGIC = b"\x00PPS"
+SNAPSHOT_VERSION = 1
+CURRENT_DICTIONARY_ID = 1
+
+FORMAT_BINARY = "binary"
+FORMAT_JSON = "json"
+SNAPSHOT_FORMATS = (FORMAT_BINARY, FORMAT_JSON)
+
+# zlib uses at most the last 32 KiB of a preset dictionary
+DICTIONARY_SIZE = 32 * 1024
+COMPRESSION_LEVEL = 6
+
+DICTIONARY_DIR = Path(__file__).parent / "snapshot_dicts"
+
+_HEADER_SIZE = len(SNAPSHOT_MAGIC) + 2
+# JSON keys and string values, with the punctuation that usually precedes them
+_TOKEN_RE = re.compile(r'[{,\[]?"(?:[^"\\]|\\.)*":?')
+
+
+class SnapshotError(ValueError):
+    """Raised when stored game state cannot be decoded."""
+
+
+@functools.cache
+def load_dictionary(dictionary_id: int) -> bytes:
+    """Load a preset dictionary by id (0 means no dictionary)."""
+    if dictionary_id == 0:
+        return b""
+    path = DICTIONARY_DIR / f"{dictionary_id}.zdict"
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        raise SnapshotError(f"Unknown snapshot dictionary {dictionary_id}") from None
+
+
+def is_binary_snapshot(data: str | bytes | None) -> bool:
+    """Whether stored game state uses the binary snapshot format."""
+    return isinstance(data, bytes) and data.startswith(SNAPSHOT_MAGIC)
+
+
+def encode_snapshot(
+    state: dict[str, Any] | str | bytes, fmt: str = FORMAT_BINARY
+) -> str | bytes:
+    """
+    Encode game state for storage.
+
+    Args:
+        state: A game's to_dict() output, its JSON text, or an already
+            encoded snapshot (re-encoded only if the format differs)
+        fmt: FORMAT_BINARY or FORMAT_JSON
+
+    Returns:
+        bytes for FORMAT_BINARY, str for FORMAT_JSON.
+    """
+    if fmt not in SNAPSHOT_FORMATS:
+        raise ValueError(f"Unknown snapshot format: {fmt}")
+
+    if isinstance(state, bytes):
+        if fmt == FORMAT_BINARY and is_binary_snapshot(state):
+            return state
+        state = snapshot_to_json(state)
+    if isinstance(state, dict):
+        state = json.dumps(state, separators=(",", ":"))
+    if fmt == FORMAT_JSON:
+        return state
+
+    compressor = zlib.compressobj(
+        COMPRESSION_LEVEL, zdict=load_dictionary(CURRENT_DICTIONARY_ID)
+    )
+    payload = compressor.compress(state.encode("utf-8")) + compressor.flush()
+    header = SNAPSHOT_MAGIC + bytes((SNAPSHOT_VERSION, CURRENT_DICTIONARY_ID))
+    return header + payload
+
+
+def snapshot_to_json(data: str | bytes) -> str:
+    """Get the JSON text of stored game state in any supported format."""
+    if isinstance(data, str):
+        return data
+    if not is_binary_snapshot(data):
+        # Plain JSON stored as a blob
+        return data.decode("utf-8")
+
+    version, dictionary_id = data[len(SNAPSHOT_MAGIC) : _HEADER_SIZE]
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Unsupported snapshot version {version}")
+    decompressor = zlib.decompressobj(zdict=load_dictionary(dictionary_id))
+    try:
+        text = decompressor.decompress(data[_HEADER_SIZE:]) + decompressor.flush()
+    except zlib.error as e:
+        raise SnapshotError(f"Corrupt snapshot: {e}") from None
+    return text.decode("utf-8")
+
+
+def decode_snapshot(data: str | bytes) -> dict[str, Any]:
+    """Decode stored game state into a dict for Game.from_dict()."""
+    return json.loads(snapshot_to_json(data))
+
+
+def load_game(game_class: type["Game"], data: str | bytes) -> "Game":
+    """Deserialize a game from stored state in any supported format."""
+    return game_class.from_dict(decode_snapshot(data))
+
+
+def train_dictionary(samples: list[str], size: int = DICTIONARY_SIZE) -> bytes:
+    """
+    Build a preset dictionary from sample game JSON.
+
+    Keys and string values are ranked by how many bytes they would save
+    (samples containing them x length). zlib finds matches near the end of
+    the dictionary most cheaply, so the most valuable tokens go last.
+    """
+    counts: Counter[str] = Counter()
+    for sample in samples:
+        # Count tokens once per sample so one large game does not dominate
+        counts.update(set(_TOKEN_RE.findall(sample)))
+
+    ranked = sorted(
+        (token for token, count in counts.items() if count > 1),
+        key=lambda token: (counts[token] * len(token), token),
+        reverse=True,
+    )
+    chosen: list[bytes] = []
+    total = 0
+    for token in ranked:
+        encoded = token.encode("utf-8")
+        if total + len(encoded) > size:
+            continue
+        chosen.append(encoded)
+        total += len(encoded)
+    return b"".join(reversed(chosen))
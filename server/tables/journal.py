@@ -0,0 +1,221 @@
+"""Append-only action journal for tables, and the replay engine."""
+
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from ..games.base import ActionContext, Game
+
+
+# Journal entry kinds
+ENTRY_ACTION = "action"  # An action executed from outside a tick
+ENTRY_TICK = "tick"  # Checkpoint marker: the table had run this many ticks
+ENTRY_SEGMENT = "segment"  # Stored first: a journal exists for the snapshot
+ENTRY_BOT_CHOICE = "bot_choice"  # A bot decision that depended on timing
+
+
+@dataclass
+class JournalEntry:
+    """One journaled step. Ticks are counted from the start of the segment."""
+
+    seq: int
+    tick: int
+    kind: str = ENTRY_ACTION
+    player_id: str | None = None
+    action_id: str | None = None
+    input_value: str | None = None
+    menu_item_id: str | None = None
+    menu_index: int | None = None
+    from_keybind: bool = False
+
+
+class ActionJournal:
+    """
+    Records what happens to a table's game since its last snapshot.
+
+    A segment starts at a snapshot. Every action executed from outside a
+    tick (i.e. a player's input) is recorded with the tick it ran at.
+    Ticks, actions run by bots during a tick, and actions nested inside
+    another action follow deterministically from the game's state, whose
+    random generator is part of the snapshot, so they are not recorded.
+    The exception is a bot decision that depends on timing, like a search's
+    move (which depends on the CPU time it got) or a target set before a
+    background solve finished: it is recorded (BotHelper.journaled_choice),
+    and replay plays it back instead of deciding again. Replaying the entries over
+    the snapshot therefore reproduces the game at any tick of the segment.
+
+    Changes made outside actions and ticks (members joining, a game being
+    attached) cannot be replayed, so they set snapshot_required and the
+    next checkpoint writes a full snapshot instead of journal entries.
+    """
+
+    # Start a new segment once replaying this one would take too long
+    MAX_SEGMENT_TICKS = 6000  # 5 minutes of play
+    MAX_SEGMENT_ENTRIES = 500
+
+    def __init__(self, tick: int = 0, next_seq: int = 1):
+        self.tick = tick
+        self.snapshot_required = True
+        self._next_seq = next_seq
+        self._entry_count = next_seq - 1
+        self._unsaved: list[JournalEntry] = []
+        self._depth = 0  # > 0 while inside a tick or a journaled action
+
+    @property
+    def recording(self) -> bool:
+        """Whether changes right now come from a journaled tick or action."""
+        return self._depth > 0
+
+    def needs_snapshot(self) -> bool:
+        """Whether the next checkpoint should write a full snapshot."""
+        return (
+            self.snapshot_required
+            or self.tick >= self.MAX_SEGMENT_TICKS
+            or self._entry_count >= self.MAX_SEGMENT_ENTRIES
+        )
+
+    def start_segment(self) -> None:
+        """Begin a new segment at a snapshot taken now."""
+        self.tick = 0
+        self.snapshot_required = False
+        self._next_seq = 1
+        self._entry_count = 0
+        self._unsaved.clear()
+
+    @contextmanager
+    def tick_scope(self) -> Iterator[None]:
+        """Wrap one game tick."""
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.tick += 1
+
+    @contextmanager
+    def action_scope(
+        self,
+        player_id: str,
+        action_id: str,
+        input_value: str | None,
+        context: "ActionContext | None",
+    ) -> Iterator[None]:
+        """Wrap an action execution, recording it if it is a player's input."""
+        if self._depth == 0:
+            seq = self._next_seq
+            self._next_seq += 1
+            self._entry_count += 1
+            entry = JournalEntry(
+                seq=seq,
+                tick=self.tick,
+                player_id=player_id,
+                action_id=action_id,
+                input_value=input_value,
+            )
+            if context is not None:
+                entry.menu_item_id = context.menu_item_id
+                entry.menu_index = context.menu_index
+                entry.from_keybind = context.from_keybind
+            self._unsaved.append(entry)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+
+    def record_bot_choice(self, player_id: str, choice: str | None) -> None:
+        """Record a bot decision that depended on timing."""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._entry_count += 1
+        self._unsaved.append(
+            JournalEntry(
+                seq=seq,
+                tick=self.tick,
+                kind=ENTRY_BOT_CHOICE,
+                player_id=player_id,
+                action_id=choice,
+            )
+        )
+
+    def take_unsaved(self) -> list[JournalEntry]:
+        """
+        Get entries recorded since the last call, ending with a tick marker.
+
+        The marker tells replay how far the saved state extends.
+        """
+        entries = self._unsaved
+        self._unsaved = []
+        seq = self._next_seq
+        self._next_seq += 1
+        entries.append(JournalEntry(seq=seq, tick=self.tick, kind=ENTRY_TICK))
+        return entries
+
+
+def replay_journal(
+    game: "Game",
+    entries: list[JournalEntry],
+    until_tick: int | None = None,
+) -> int:
+    """
+    Replay journal entries over a game restored from the segment's snapshot.
+
+    The game should be detached from its table (so replayed results and
+    destroys are not persisted again) with bots attached. Journaled bot
+    choices are played back instead of being decided again.
+
+    Args:
+        game: Game deserialized from the segment's snapshot
+        entries: Journal entries of the segment, in seq order
+        until_tick: Stop after this many ticks (default: the last marker)
+
+    Returns:
+        Number of ticks replayed.
+    """
+    if until_tick is None:
+        markers = [e.tick for e in entries if e.kind == ENTRY_TICK]
+        until_tick = markers[-1] if markers else 0
+
+    game._bot_replay = deque(
+        (e.player_id, e.action_id) for e in entries if e.kind == ENTRY_BOT_CHOICE
+    )
+    try:
+        return _replay_entries(game, entries, until_tick)
+    finally:
+        game._bot_replay = None
+
+
+def _replay_entries(
+    game: "Game", entries: list[JournalEntry], until_tick: int
+) -> int:
+    """Run ticks and player actions up to until_tick."""
+    from ..games.base import ActionContext
+
+    tick = 0
+    for entry in entries:
+        if entry.tick > until_tick:
+            break
+        while tick < entry.tick:
+            game.on_tick()
+            tick += 1
+        if entry.kind != ENTRY_ACTION:
+            continue
+        player = game.get_player_by_id(entry.player_id)
+        if not player:
+            continue
+        game.execute_action(
+            player,
+            entry.action_id,
+            entry.input_value,
+            ActionContext(
+                menu_item_id=entry.menu_item_id,
+                menu_index=entry.menu_index,
+                from_keybind=entry.from_keybind,
+            ),
+        )
+    while tick < until_tick:
+        game.on_tick()
+        tick += 1
+    return tick
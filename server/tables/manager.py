@@ -3,6 +3,7 @@
 from typing import TYPE_CHECKING, Any
 import uuid
 
+from ..game_utils.search import SearchBudget
 from .table import Table
 
 if TYPE_CHECKING:
@@ -12,9 +13,15 @@ if TYPE_CHECKING:
 class TableManager:
     """Manages all active tables on the server."""
 
+    # Tables loaded with a deferred restore that are deserialized per tick
+    # (tables touched earlier, e.g. by a reconnect, are restored on demand)
+    RESTORES_PER_TICK = 10
+
     def __init__(self):
         self._tables: dict[str, Table] = {}
         self._server: Any = None  # Reference to server for destroy/save notifications
+        # CPU bot searches at every table may use per tick, together
+        self.search_budget = SearchBudget()
 
     def create_table(
         self,
@@ -69,8 +76,15 @@ class TableManager:
         return None
 
     def on_tick(self) -> None:
-        """Tick all active tables."""
+        """Tick all active tables, restoring a few deferred ones each tick."""
+        self.search_budget.start_tick()
+        budget = self.RESTORES_PER_TICK
         for table in self._tables.values():
+            if table.restore_pending:
+                if budget == 0:
+                    continue
+                budget -= 1
+                table.restore_game()
             table.on_tick()
 
     def add_table(self, table: Table) -> None:
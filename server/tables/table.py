@@ -1,10 +1,13 @@
 """Table management for games."""
 
 from dataclasses import dataclass, field
+import time
 from typing import TYPE_CHECKING, Any
 
 from mashumaro.mixins.json import DataClassJSONMixin
 
+from .journal import ActionJournal, replay_journal
+
 if TYPE_CHECKING:
     from ..games.base import Game
     from ..users.base import User
@@ -31,7 +34,7 @@ class Table(DataClassJSONMixin):
     game_type: str
     host: str
     members: list[TableMember] = field(default_factory=list)
-    game_json: str | None = None  # Serialized game state
+    game_json: str | bytes | None = None  # Game JSON or an encoded snapshot
     status: str = "waiting"  # waiting, playing, finished
 
     # Not serialized
@@ -40,6 +43,11 @@ class Table(DataClassJSONMixin):
     _manager: Any = field(default=None, repr=False)  # Reference to TableManager
     _server: Any = field(default=None, repr=False)  # Reference to Server (for saves)
     _db: Any = field(default=None, repr=False)  # Reference to Database (for ratings)
+    # Monotonic time of the first change not yet checkpointed (None when clean)
+    _dirty_since: float | None = field(default=None, repr=False)
+    # True while game_json holds a game that has not been deserialized yet
+    _restore_pending: bool = field(default=False, repr=False)
+    _journal: ActionJournal | None = field(default=None, repr=False)
 
     def __post_init__(self):
         self._game = None
@@ -47,9 +55,14 @@ class Table(DataClassJSONMixin):
         self._manager = None
         self._server = None
         self._db = None
+        self._dirty_since = None
+        self._restore_pending = False
+        self._journal = ActionJournal()
 
     @property
     def game(self) -> "Game | None":
+        if self._restore_pending:
+            self.restore_game()
         return self._game
 
     @game.setter
@@ -57,6 +70,85 @@ class Table(DataClassJSONMixin):
         self._game = value
         if value:
             self.game_json = value.to_json()
+        self.mark_dirty()
+
+    @property
+    def journal(self) -> ActionJournal:
+        """Actions and ticks since the game's last snapshot."""
+        return self._journal
+
+    @property
+    def restore_pending(self) -> bool:
+        """Whether the saved game is still waiting to be deserialized."""
+        return self._restore_pending
+
+    def defer_restore(self) -> None:
+        """Restore the game from game_json on first access instead of now."""
+        self._restore_pending = self._game is None and bool(self.game_json)
+
+    def restore_game(self) -> "Game | None":
+        """
+        Deserialize the game from game_json and rebuild its runtime state.
+
+        Bots are reattached; humans are attached when they reconnect. If the
+        database holds a journal for the snapshot, it is replayed on top so
+        the game resumes from the last checkpoint.
+        """
+        from ..games.registry import get_game_class
+        from ..persistence.snapshot import load_game
+        from ..users.bot import Bot
+
+        self._restore_pending = False
+        game_class = get_game_class(self.game_type)
+        if not game_class:
+            print(f"WARNING: Could not find game class for {self.game_type}")
+            return None
+
+        game = load_game(game_class, self.game_json)
+        game.rebuild_runtime_state()
+
+        # Setup keybinds (runtime only, not serialized)
+        game.setup_keybinds()
+        # Action sets are already restored from serialization
+        for player in game.players:
+            if player.is_bot:
+                game.attach_user(player.id, Bot(player.name, uuid=player.id))
+
+        entries = self._db.load_journal(self.table_id) if self._db else None
+        if entries is not None:
+            # Replay detached so results and destroys are not repeated
+            ticks = replay_journal(game, entries)
+            next_seq = entries[-1].seq + 1 if entries else 1
+            self._journal = ActionJournal(tick=ticks, next_seq=next_seq)
+            self._journal.snapshot_required = False
+
+        self._game = game
+        game._table = self
+        return game
+
+    @property
+    def dirty(self) -> bool:
+        """Whether the table has changed since its last checkpoint."""
+        return self._dirty_since is not None
+
+    def mark_dirty(self) -> None:
+        """Flag the table for the next checkpoint."""
+        if self._dirty_since is None:
+            self._dirty_since = time.monotonic()
+        if not self._journal.recording:
+            # Not caused by a journaled tick or action, so not replayable
+            self._journal.snapshot_required = True
+
+    def take_dirty(self) -> float | None:
+        """
+        Clear the dirty flag.
+
+        Returns:
+            Monotonic time of the oldest unsaved change, or None if clean.
+        """
+        since = self._dirty_since
+        self._dirty_since = None
+        return since
 
     def add_member(
         self, username: str, user: "User", as_spectator: bool = False
@@ -69,11 +161,13 @@ class Table(DataClassJSONMixin):
 
         self.members.append(TableMember(username=username, is_spectator=as_spectator))
         self._users[username] = user
+        self.mark_dirty()
 
     def remove_member(self, username: str) -> None:
         """Remove a member from the table."""
         self.members = [m for m in self.members if m.username != username]
         self._users.pop(username, None)
+        self.mark_dirty()
 
     def get_user(self, username: str) -> "User | None":
         """Get a user by username."""
@@ -109,7 +203,8 @@ class Table(DataClassJSONMixin):
     def on_tick(self) -> None:
         """Called every tick. Forwards to game."""
         if self._game:
-            self._game.on_tick()
+            with self._journal.tick_scope():
+                self._game.on_tick()
 
     def handle_event(self, username: str, event: dict) -> None:
         """Handle an event from a member."""
@@ -121,9 +216,10 @@ class Table(DataClassJSONMixin):
                     break
 
     def save_game_state(self) -> None:
-        """Save the current game state to game_json."""
+        """Save the current game state to game_json, starting a journal segment."""
         if self._game:
             self.game_json = self._game.to_json()
+            self._journal.start_segment()
 
     def can_start(self, min_players: int) -> bool:
         """Check if the game can start."""
@@ -0,0 +1,109 @@
+"""Tests for shared action templates and compact action set serialization."""
+
+from server.game_utils.actions import (
+    Action,
+    ActionSet,
+    ActionTemplates,
+    deserialize_action_sets,
+    serialize_action_sets,
+)
+from server.games.pig.game import PigGame
+from server.users.bot import Bot
+from server.users.test_user import MockUser
+
+
+def _roll(label: str = "Roll") -> Action:
+    return Action(
+        id="roll",
+        label=label,
+        handler="_action_roll",
+        is_enabled="_is_roll_enabled",
+        is_hidden="_is_roll_hidden",
+    )
+
+
+class TestActionTemplates:
+    """Test that identical actions share one instance."""
+
+    def test_equal_actions_interned(self):
+        first = ActionSet(name="turn")
+        second = ActionSet(name="turn")
+        first.add(_roll())
+        second.add(_roll())
+        assert first.get_action("roll") is second.get_action("roll")
+
+        third = ActionSet(name="turn")
+        third.add(_roll("Lancer"))
+        assert third.get_action("roll") is not first.get_action("roll")
+
+    def test_players_share_actions(self):
+        game = PigGame()
+        game.initialize_lobby("Alice", MockUser("Alice"))
+        game.add_player("Bob", MockUser("Bob"))
+        alice, bob = game.players
+        assert game.find_action(alice, "start_game") is game.find_action(
+            bob, "start_game"
+        )
+        # Each player still owns its set, so edits stay per player
+        game.get_action_set(alice, "lobby").remove("start_game")
+        assert game.find_action(bob, "start_game") is not None
+
+    def test_clone_shares_actions_not_membership(self):
+        action_set = ActionSet(name="turn")
+        action_set.add(_roll())
+        clone = action_set.clone()
+        clone.remove("roll")
+        assert action_set.get_action("roll") is not None
+
+
+class TestActionSetSerialization:
+    """Test the compact serialized form of players' action sets."""
+
+    def _game(self) -> PigGame:
+        game = PigGame()
+        game.initialize_lobby("Alice", MockUser("Alice"))
+        game.add_player("Bot", Bot("Bot"))
+        game.on_start()
+        return game
+
+    def test_each_action_stored_once(self):
+        game = self._game()
+        data = game.to_dict()["player_action_sets"]
+        ids = [t["id"] for t in data["templates"]]
+        assert len(ids) == len(set(ids))
+        assert set(data["players"]) == {p.id for p in game.players}
+
+    def test_round_trip_preserves_order_and_overrides(self):
+        game = self._game()
+        alice = game.players[0]
+        turn = game.get_action_set(alice, "turn")
+        turn._order.reverse()
+        turn.add(_roll("Custom roll"))
+
+        restored = PigGame.from_dict(game.to_dict())
+        restored_turn = restored.get_action_set(restored.players[0], "turn")
+        assert restored_turn._order == turn._order
+        assert restored_turn.get_action("roll").label == "Custom roll"
+        assert [s.name for s in restored.get_action_sets(restored.players[1])] == [
+            s.name for s in game.get_action_sets(game.players[1])
+        ]
+
+    def test_reads_older_per_player_format(self):
+        game = self._game()
+        legacy = {
+            pid: [s.to_dict() for s in sets]
+            for pid, sets in game.player_action_sets.items()
+        }
+        restored = deserialize_action_sets(legacy)
+        assert serialize_action_sets(restored) == serialize_action_sets(
+            game.player_action_sets
+        )
+
+    def test_deserialized_actions_are_templates(self):
+        game = self._game()
+        data = game.to_dict()
+        first = PigGame.from_dict(data)
+        second = PigGame.from_dict(data)
+        action = first.find_action(first.players[0], "leave_game")
+        assert action is second.find_action(second.players[0], "leave_game")
+        assert action is ActionTemplates.intern(action)
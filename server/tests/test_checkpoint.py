@@ -0,0 +1,175 @@
+"""Tests for background table checkpointing."""
+
+import os
+import tempfile
+
+from server.core.server import Server
+from server.games.pig.game import PigGame
+from server.persistence.snapshot import decode_snapshot
+from server.users.test_user import MockUser
+
+
+class TestTableCheckpointer:
+    """Test that changed tables are persisted incrementally."""
+
+    def setup_method(self):
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_file.close()
+        self.server = Server(db_path=self.temp_file.name)
+        self.server._db.connect()
+        self.checkpointer = self.server._checkpointer
+
+    def teardown_method(self):
+        self.server._db.close()
+        os.unlink(self.temp_file.name)
+
+    def _create_table(self, host: MockUser):
+        table = self.server._tables.create_table("pig", host.username, host)
+        game = PigGame()
+        table.game = game
+        game._table = table
+        game.initialize_lobby(host.username, host)
+        return table, game
+
+    def _saved_game(self, table_id: str) -> dict:
+        table = self.server._db.load_table(table_id)
+        return decode_snapshot(table.game_json)
+
+    async def test_only_dirty_tables_written(self):
+        alice = MockUser("Alice")
+        table, _ = self._create_table(alice)
+
+        stats = await self.checkpointer.checkpoint()
+        assert stats["tables_written"] == 1
+        assert stats["rpo_seconds"] >= 0
+        assert self.server._db.load_table(table.table_id) is not None
+
+        stats = await self.checkpointer.checkpoint()
+        assert stats["tables_written"] == 0
+
+    async def test_action_marks_table_dirty(self):
+        alice = MockUser("Alice")
+        table, game = self._create_table(alice)
+        await self.checkpointer.checkpoint()
+
+        game.execute_action(game.players[0], "add_bot", "Bot")
+        assert table.dirty
+
+        # Journaled actions are appended instead of re-snapshotting the game
+        stats = await self.checkpointer.checkpoint()
+        assert stats["tables_written"] == 0
+        assert stats["journal_entries_written"] == 2  # The action and a marker
+        assert len(self._saved_game(table.table_id)["players"]) == 1
+        entries = self.server._db.load_journal(table.table_id)
+        assert entries[0].action_id == "add_bot"
+
+    async def test_snapshot_taken_before_encoding(self):
+        """Changes made after capture are left for the next checkpoint."""
+        alice = MockUser("Alice")
+        table, game = self._create_table(alice)
+        await self.checkpointer.checkpoint()
+        game.execute_action(game.players[0], "add_bot", "Bot")
+        table.journal.snapshot_required = True
+
+        real_to_dict = game.to_dict
+
+        def capture_then_mutate():
+            state = real_to_dict()
+            game.execute_action(game.players[0], "add_bot", "Bot")
+            return state
+
+        game.to_dict = capture_then_mutate
+        await self.checkpointer.checkpoint()
+        del game.to_dict
+
+        assert len(self._saved_game(table.table_id)["players"]) == 2
+        assert table.dirty
+        await self.checkpointer.checkpoint()
+        # The later action went into the new snapshot's journal
+        entries = self.server._db.load_journal(table.table_id)
+        assert [e.action_id for e in entries if e.action_id] == ["add_bot"]
+
+    async def test_destroyed_table_row_removed(self):
+        alice = MockUser("Alice")
+        table, game = self._create_table(alice)
+        await self.checkpointer.checkpoint()
+
+        game.destroy()
+        assert self.server._db.load_table(table.table_id) is None
+
+    async def test_loaded_tables_kept_in_database(self):
+        alice = MockUser("Alice")
+        table, _ = self._create_table(alice)
+        await self.checkpointer.checkpoint()
+
+        restarted = Server(db_path=self.temp_file.name)
+        restarted._db.connect()
+        try:
+            restarted._load_tables()
+            restored = restarted._tables.get_table(table.table_id)
+            assert restored is not None
+            assert not restored.dirty
+            assert restarted._db.load_table(table.table_id) is not None
+        finally:
+            restarted._db.close()
+
+
+class TestLazyTableRestore:
+    """Test that saved games are deserialized on first use, not at startup."""
+
+    def setup_method(self):
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_file.close()
+        server = Server(db_path=self.temp_file.name)
+        server._db.connect()
+        self.table_ids = []
+        for i in range(3):
+            host = MockUser(f"Host{i}")
+            table = server._tables.create_table("pig", host.username, host)
+            game = PigGame()
+            table.game = game
+            game._table = table
+            game.initialize_lobby(host.username, host)
+            game.execute_action(game.players[0], "add_bot", "Bot")
+            self.table_ids.append(table.table_id)
+        server._save_tables()
+        server._db.close()
+
+        self.server = Server(db_path=self.temp_file.name)
+        self.server._db.connect()
+        self.server._load_tables()
+
+    def teardown_method(self):
+        self.server._db.close()
+        os.unlink(self.temp_file.name)
+
+    def test_metadata_available_without_restoring(self):
+        tables = self.server._tables.get_waiting_tables("pig")
+        assert len(tables) == 3
+        assert all(t.restore_pending for t in tables)
+        assert self.server._tables.find_user_table("Host1").host == "Host1"
+
+    def test_first_access_restores_game(self):
+        table = self.server._tables.get_table(self.table_ids[0])
+        game = table.game
+        assert not table.restore_pending
+        assert game._table is table
+        bot = game.players[1]
+        assert bot.is_bot and game.get_user(bot) is not None
+        assert self.server._tables.get_table(self.table_ids[1]).restore_pending
+
+    def test_ticks_restore_a_few_tables_at_a_time(self, monkeypatch):
+        monkeypatch.setattr(self.server._tables, "RESTORES_PER_TICK", 2)
+        self.server._tables.on_tick()
+        pending = [t for t in self.server._tables.get_all_tables() if t.restore_pending]
+        assert len(pending) == 1
+        self.server._tables.on_tick()
+        assert not any(t.restore_pending for t in self.server._tables.get_all_tables())
+
+    async def test_checkpoint_keeps_unrestored_game_json(self):
+        table = self.server._tables.get_table(self.table_ids[2])
+        saved_json = table.game_json
+        table.mark_dirty()
+        await self.server._checkpointer.checkpoint()
+        assert table.restore_pending
+        assert self.server._db.load_table(table.table_id).game_json == saved_json
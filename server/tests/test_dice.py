@@ -0,0 +1,67 @@
+"""Tests for exact dice distributions."""
+
+from itertools import product
+
+import pytest
+
+from server.game_utils.dice import (
+    KeepTurn,
+    keep_choices,
+    outcome_chance,
+    roll_outcomes,
+)
+from server.games.farkle.scoring import farkle_chance
+
+
+def _has_six(roll: tuple[int, ...]) -> bool:
+    return 6 in roll
+
+
+class TestExactDistributions:
+    """Tests for roll_outcomes, outcome_chance and keep_choices."""
+
+    def test_outcomes_match_enumeration(self):
+        """Test every sorted roll gets its share of the ordered rolls."""
+        for num_dice in range(1, 5):
+            expected: dict[tuple[int, ...], int] = {}
+            for roll in product(range(1, 7), repeat=num_dice):
+                key = tuple(sorted(roll))
+                expected[key] = expected.get(key, 0) + 1
+            outcomes = dict((roll, p) for p, roll in roll_outcomes(num_dice))
+            assert outcomes.keys() == expected.keys()
+            for roll, ways in expected.items():
+                assert outcomes[roll] == pytest.approx(ways / 6**num_dice)
+
+    def test_outcome_chance(self):
+        """Test chances against closed forms."""
+        assert outcome_chance(_has_six, 3) == pytest.approx(1 - (5 / 6) ** 3)
+        assert outcome_chance(_has_six, 2, sides=4) == 0.0
+        assert farkle_chance(1) == pytest.approx(2 / 3)
+        assert farkle_chance(6) == pytest.approx(0.0231, abs=1e-4)
+
+    def test_keep_choices(self):
+        """Test each distinct non-empty keep is listed once."""
+        assert keep_choices((2, 2, 5)) == ((5,), (2,), (2, 5), (2, 2), (2, 2, 5))
+        assert len(keep_choices((1, 2, 3, 4, 5, 6))) == 63
+
+
+class TestKeepTurn:
+    """Tests for the keep-at-least-one turn solver."""
+
+    def test_matches_brute_force(self):
+        """Test a two-dice turn against working it out by hand."""
+        turn = KeepTurn(2, sum)
+        # With one die left the turn is worth 3.5 more; a second roll is
+        # only kept whole if both dice beat that
+        one_left = [max(a + 3.5, b + 3.5, a + b) for a, b in product(range(1, 7), repeat=2)]
+        assert turn.expected() == pytest.approx(sum(one_left) / 36)
+        assert turn.best_keep([], [6, 2]) == (6,)
+        assert turn.best_keep([], [6, 5]) == (5, 6)
+
+    def test_key_merges_states(self):
+        """Test a key that merges kept dice gives the same values."""
+        plain = KeepTurn(3, sum)
+        merged = KeepTurn(3, sum, key=sum)
+        for kept in [(), (1,), (3, 4)]:
+            assert merged.expected(kept) == pytest.approx(plain.expected(kept))
+
@@ -0,0 +1,126 @@
+"""Tests for the duration estimate cache and its prefetcher."""
+
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from server.game_utils import estimates
+from server.game_utils.estimates import (
+    EstimatePrefetcher,
+    estimate_key,
+    estimate_options,
+    game_version,
+    get_cached_estimate,
+    save_cached_estimate,
+)
+from server.game_utils.simulation import SimulationService
+from server.games.pig.game import PigGame
+from server.persistence.database import Database
+from server.users.test_user import MockUser
+
+
+@pytest.fixture
+def db():
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+    temp_file.close()
+    database = Database(temp_file.name)
+    database.connect()
+    yield database
+    database.close()
+    os.unlink(temp_file.name)
+
+
+class TestEstimateKey:
+    """Test what an estimate is keyed by."""
+
+    def test_option_order_does_not_matter(self):
+        a = estimate_key("pig", {"target_score": 50, "dice_sides": 6}, 2)
+        b = estimate_key("pig", {"dice_sides": 6, "target_score": 50}, 2)
+        assert a == b
+
+    def test_inputs_change_key(self):
+        base = estimate_key("pig", {"target_score": 50}, 2)
+        assert estimate_key("pig", {"target_score": 60}, 2) != base
+        assert estimate_key("pig", {"target_score": 50}, 3) != base
+        assert estimate_key("tossup", {"target_score": 50}, 2) != base
+
+    def test_game_version_is_stable(self):
+        assert game_version(PigGame) == game_version(PigGame)
+
+    def test_game_version_covers_shared_code_and_data(self, monkeypatch, tmp_path):
+        """Test shared bot code and policy tables change the version."""
+        package = tmp_path / "fakegame"
+        package.mkdir()
+        (package / "game.py").write_text("x = 1\n")
+        (package / "policy.bin").write_bytes(b"v1")
+        module = SimpleNamespace(__file__=str(package / "game.py"))
+        monkeypatch.setitem(sys.modules, "fakegame.game", module)
+        fake = type("FakeGame", (), {"__module__": "fakegame.game"})
+
+        def version():
+            game_version.cache_clear()
+            return game_version(fake)
+
+        base = version()
+        (package / "policy.bin").write_bytes(b"v2")
+        new_data = version()
+        assert new_data != base
+
+        monkeypatch.setattr(estimates, "_shared_code_digest", lambda: b"changed")
+        new_shared = version()
+        game_version.cache_clear()
+        assert new_shared != new_data
+
+
+class TestEstimateCache:
+    """Test answering estimates from the database."""
+
+    def test_cache_hit_answers_without_simulating(self, db, monkeypatch):
+        game = PigGame()
+        host = MockUser("Alice")
+        game.initialize_lobby("Alice", host)
+        game._table = SimpleNamespace(_db=db)
+        options = estimate_options(game.options)
+        save_cached_estimate(db, PigGame, options, 2, [1000, 1100, 1200])
+
+        def refuse(*args):
+            raise AssertionError("simulated despite cache hit")
+
+        monkeypatch.setattr(SimulationService, "submit_many", refuse)
+        game._action_estimate_duration(game.players[0], "estimate_duration")
+        assert not game._estimate_running
+        assert any("Estimated human time" in m for m in host.get_spoken_messages())
+
+    def test_other_versions_are_stale(self, db):
+        options = {"target_score": 50}
+        key = estimate_key("pig", options, 2)
+        db.save_duration_estimate(key, "pig", "old", 2, "{}", [10])
+        assert get_cached_estimate(db, PigGame, options, 2) is None
+        assert db.delete_stale_duration_estimates("pig", game_version(PigGame)) == 1
+        assert db.get_duration_estimate(key, "old") is None
+
+
+class TestEstimatePrefetcher:
+    """Test filling the cache in the background."""
+
+    def test_prefetch_fills_default_options(self, db):
+        service = SimulationService(max_workers=1)
+        try:
+            prefetcher = EstimatePrefetcher(db, service)
+            prefetcher._queue = [(PigGame, 2)]
+            prefetcher.step()
+            deadline = time.monotonic() + 60
+            while not prefetcher.batches_completed:
+                assert time.monotonic() < deadline, "timed out"
+                time.sleep(0.05)
+                prefetcher.step()
+        finally:
+            service.shutdown()
+
+        options = estimate_options(PigGame().options)
+        ticks = get_cached_estimate(db, PigGame, options, 2)
+        assert ticks and len(ticks) == PigGame.NUM_ESTIMATE_SIMULATIONS
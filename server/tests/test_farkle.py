@@ -0,0 +1,186 @@
+"""
+Tests for the Farkle game.
+"""
+
+from itertools import product
+
+import pytest
+
+from server.games.farkle.game import FarkleGame, FarkleOptions
+from server.games.farkle.policy import (
+    POLICY_PATH,
+    FarklePolicy,
+    FarklePolicyError,
+    build_tables,
+    encode_policy,
+    load_policy,
+)
+from server.games.farkle.scoring import (
+    COMBO_DOUBLE_TRIPLETS,
+    COMBO_FOUR_KIND_PLUS_PAIR,
+    COMBO_FOUR_OF_KIND,
+    COMBO_SINGLE_1,
+    COMBO_SINGLE_5,
+    COMBO_STRAIGHT,
+    COMBO_THREE_OF_KIND,
+    COMBO_THREE_PAIRS,
+    _scan_combinations,
+    count_dice,
+    get_available_combinations,
+    has_combination,
+    has_scoring_dice,
+)
+from server.users.bot import Bot
+from server.users.test_user import MockUser
+
+
+class TestFarkleCombinations:
+    """Tests for combination detection through the lookup tables."""
+
+    def test_singles(self):
+        """Test single 1s and 5s."""
+        assert get_available_combinations([1, 2, 5]) == [
+            (COMBO_SINGLE_1, 1, 100),
+            (COMBO_SINGLE_5, 5, 50),
+        ]
+        assert has_combination([2, 5], COMBO_SINGLE_5)
+        assert not has_combination([2, 5], COMBO_SINGLE_1)
+
+    def test_three_of_kind(self):
+        """Test three of a kind is scored by face."""
+        combos = get_available_combinations([4, 4, 4, 2, 3])
+        assert combos == [(COMBO_THREE_OF_KIND, 4, 400)]
+        assert has_combination([4, 4, 4], COMBO_THREE_OF_KIND, 4)
+        assert not has_combination([4, 4, 4], COMBO_THREE_OF_KIND, 3)
+
+    def test_six_dice_patterns(self):
+        """Test the patterns that need all six dice."""
+        assert has_combination([1, 2, 3, 4, 5, 6], COMBO_STRAIGHT)
+        assert has_combination([2, 2, 3, 3, 6, 6], COMBO_THREE_PAIRS)
+        assert has_combination([2, 2, 2, 6, 6, 6], COMBO_DOUBLE_TRIPLETS)
+        assert has_combination([3, 3, 3, 3, 6, 6], COMBO_FOUR_KIND_PLUS_PAIR)
+        assert not has_combination([2, 2, 3, 3, 6], COMBO_THREE_PAIRS)
+
+    def test_combinations_sorted_by_points(self):
+        """Test the highest-value combination comes first."""
+        combos = get_available_combinations([1, 1, 1, 1, 5, 5])
+        assert combos[0] == (COMBO_FOUR_KIND_PLUS_PAIR, 0, 1500)
+        assert (COMBO_FOUR_OF_KIND, 1, 1000) in combos
+        points = [p for _, _, p in combos]
+        assert points == sorted(points, reverse=True)
+
+    def test_farkle_detection(self):
+        """Test rolls with nothing to score."""
+        assert not has_scoring_dice([])
+        assert not has_scoring_dice([2, 3, 4, 6])
+        assert not has_scoring_dice([2, 2, 3, 3, 4, 6])
+        assert has_scoring_dice([2, 2, 3, 3, 4, 4])
+
+    def test_table_matches_scan_for_every_roll(self):
+        """Test every ordered roll of up to six dice against a direct scan."""
+        for num_dice in range(7):
+            for roll in product(range(1, 7), repeat=num_dice):
+                expected = _scan_combinations(count_dice(list(roll)))
+                assert get_available_combinations(list(roll)) == expected
+                assert has_scoring_dice(list(roll)) == bool(expected)
+
+    def test_too_many_dice_rejected(self):
+        """Test rolls larger than the table are refused."""
+        with pytest.raises(ValueError):
+            get_available_combinations([1] * 7)
+
+
+class TestFarklePolicy:
+    """Tests for the bot's expected-value policy tables."""
+
+    def test_shipped_policy_is_current(self):
+        """Test policy.bin matches a fresh build (regenerate with cli policy farkle)."""
+        assert POLICY_PATH.read_bytes() == encode_policy(*build_tables())
+
+    def test_bad_file_rejected(self):
+        """Test files that aren't a policy are refused."""
+        with pytest.raises(FarklePolicyError):
+            FarklePolicy(b"not a policy")
+        with pytest.raises(FarklePolicyError):
+            FarklePolicy(POLICY_PATH.read_bytes()[:-4])
+
+    def test_bank_or_roll(self):
+        """Test banking depends on the turn score and dice left."""
+        policy = load_policy()
+        assert policy.should_roll(0, 6)
+        assert policy.should_roll(1000, 6)  # hot dice rarely farkle
+        assert policy.should_roll(200, 3)
+        assert not policy.should_roll(1000, 2)
+        assert policy.best_move([], 1500, True) == "roll"  # hot dice
+        assert policy.best_move([2, 3], 1000, True) == "bank"
+
+    def test_takes_best_combination(self):
+        """Test the bot takes a straight rather than singles."""
+        policy = load_policy()
+        assert policy.best_move([1, 2, 3, 4, 5, 6], 0, False) == ("straight", 0)
+
+    def test_chases_goal(self):
+        """Test the bot won't bank below the score it needs."""
+        policy = load_policy()
+        assert policy.best_move([2, 3], 1000, True) == "bank"
+        assert policy.best_move([2, 3], 1000, True, goal=1500) == "roll"
+        assert policy.reach_chance(0, 2) == 1.0
+        assert policy.reach_chance(300, 6) > policy.reach_chance(300, 2)
+
+
+class TestFarklePlayTest:
+    """Play tests that run complete games with bots."""
+
+    def test_two_player_game_completes(self):
+        """Test that a 2-player bot game runs to completion."""
+        game = FarkleGame(options=FarkleOptions(target_score=1000))
+        game.add_player("Bot1", Bot("Bot1"))
+        game.add_player("Bot2", Bot("Bot2"))
+        game.on_start()
+
+        for _ in range(50000):
+            if not game.game_active:
+                break
+            game.on_tick()
+
+        assert not game.game_active, "Game should have ended"
+        assert max(p.score for p in game.players) >= 1000
+
+    def test_bot_rolls_to_beat_final_round_leader(self):
+        """Test a bot behind the final-round leader keeps rolling."""
+        game = FarkleGame()
+        game.add_player("Bot1", Bot("Bot1"))
+        game.add_player("Bot2", Bot("Bot2"))
+        game.on_start()
+        player = game.current_player
+        player.has_banked = True
+        player.score = 9000
+        player.turn_score = 1000
+        player.current_roll = [2, 3]
+        player.banked_dice = [1, 1, 1, 5]
+        player.has_taken_combo = True
+        assert game.bot_think(player) == "bank"
+
+        game.final_round_score = 10500
+        assert game.bot_think(player) == "roll"
+
+    def test_check_turn_score_reports_farkle_chance(self):
+        """Test checking the turn score tells the chance the next roll farkles."""
+        game = FarkleGame()
+        user = MockUser("Alice")
+        game.add_player("Alice", user)
+        game.add_player("Bot1", Bot("Bot1"))
+        game.on_start()
+        player = game.players[0]
+        game.set_turn_players([player])
+        player.current_roll = [2, 3]
+        player.banked_dice = [1, 1, 1, 5]
+        player.has_taken_combo = True
+
+        game._action_check_turn_score(player, "check_turn_score")
+        lines = [item.text for item in user.get_current_menu_items("status_box")]
+        assert lines[1] == "Rolling 2 dice now has a 44.4% chance to farkle."
+
+        player.has_taken_combo = False
+        game._action_check_turn_score(player, "check_turn_score")
+        assert len(user.get_current_menu_items("status_box")) == 1
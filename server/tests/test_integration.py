@@ -9,6 +9,7 @@ import tempfile
 import os
 
 from server.persistence.database import Database
+from server.persistence.snapshot import load_game
 from server.auth.auth import AuthManager
 from server.tables.manager import TableManager
 from server.tables.table import Table
@@ -104,8 +105,8 @@ class TestDatabaseIntegration:
         assert loaded is not None
         assert loaded.game_json is not None
 
-        # Deserialize game
-        loaded_game = PigGame.from_json(loaded.game_json)
+        # Deserialize game (stored as a compressed snapshot)
+        loaded_game = load_game(PigGame, loaded.game_json)
         assert loaded_game.round == 3
         assert loaded_game.get_player_score(loaded_game.players[0]) == 25
 
@@ -0,0 +1,177 @@
+"""Tests for the table action journal and replay."""
+
+import os
+import tempfile
+import threading
+
+from server.core.server import Server
+from server.game_utils.hold_policy import PolicyCache
+from server.game_utils.search import SearchBudget
+from server.games.ninetynine.game import NinetyNineGame, NinetyNineOptions
+from server.games.pig.game import PigGame, PigOptions
+from server.games.pig.policy import solve_policy
+from server.persistence.snapshot import load_game
+from server.tables.journal import ENTRY_BOT_CHOICE, ENTRY_TICK, replay_journal
+from server.users.bot import Bot
+from server.users.test_user import MockUser
+
+
+class TestActionJournal:
+    """Test that snapshot plus journal reproduces a live game."""
+
+    def setup_method(self):
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_file.close()
+        self.server = Server(db_path=self.temp_file.name)
+        self.server._db.connect()
+        self.db = self.server._db
+        self.checkpointer = self.server._checkpointer
+
+    def teardown_method(self):
+        self.db.close()
+        os.unlink(self.temp_file.name)
+
+    def _create_table(self, target_score: int = 30):
+        alice = MockUser("Alice")
+        table = self.server._tables.create_table("pig", "Alice", alice)
+        game = PigGame(options=PigOptions(target_score=target_score))
+        table.game = game
+        game._table = table
+        game.initialize_lobby("Alice", alice)
+        game.execute_action(game.players[0], "add_bot", "Bot")
+        return table, game
+
+    def _play(self, table, game, ticks: int) -> None:
+        """Tick the table, with Alice rolling to 10 then banking."""
+        for _ in range(ticks):
+            table.on_tick()
+            alice = game.players[0]
+            if game.game_active and game.current_player is alice:
+                action = "bank" if alice.round_score >= 10 else "roll"
+                game.execute_action(alice, action)
+
+    def _restore(self, table_id: str):
+        restored = self.db.load_table(table_id)
+        restored._db = self.db
+        restored.defer_restore()
+        return restored
+
+    async def test_journal_replay_matches_live_game(self):
+        table, game = self._create_table()
+        stats = await self.checkpointer.checkpoint()
+        assert stats["tables_written"] == 1
+
+        game.execute_action(game.players[0], "start_game")
+        self._play(table, game, 150)
+        assert game.round > 1
+        stats = await self.checkpointer.checkpoint()
+        assert stats["tables_written"] == 0
+        assert stats["journal_entries_written"] > 2
+
+        restored = self._restore(table.table_id)
+        assert restored.game.to_dict() == game.to_dict()
+
+    async def test_replay_plays_journaled_search_moves(self):
+        """Search moves depend on CPU time, so replay uses the recorded ones."""
+        alice = MockUser("Alice")
+        table = self.server._tables.create_table("ninetynine", "Alice", alice)
+        game = NinetyNineGame(options=NinetyNineOptions(bot_strategy="search"))
+        game.rng.seed(5)
+        table.game = game
+        game._table = table
+        game.initialize_lobby("Alice", alice)
+        game.execute_action(game.players[0], "toggle_spectator")
+        game.execute_action(game.players[0], "add_bot", "Bot")
+        game.execute_action(game.players[0], "add_bot", "Bot")
+        await self.checkpointer.checkpoint()
+
+        # A starved budget: live searches get far less than a replay would
+        self.server._tables.search_budget = SearchBudget(seconds=0.0)
+        game.execute_action(game.players[0], "start_game")
+        for _ in range(300):
+            self.server._tables.on_tick()
+        await self.checkpointer.checkpoint()
+
+        entries = self.db.load_journal(table.table_id)
+        assert any(e.kind == ENTRY_BOT_CHOICE for e in entries)
+        restored = self._restore(table.table_id)
+        assert restored.game.to_dict() == game.to_dict()
+
+    async def test_replay_keeps_targets_set_before_policy_was_solved(
+        self, monkeypatch
+    ):
+        """Replay uses the journaled bot targets, not the policy it has now."""
+        release = threading.Event()
+
+        def slow_solve(*rules):
+            release.wait(10)
+            return solve_policy(*rules)
+
+        monkeypatch.setattr("server.games.pig.game.policies", PolicyCache(slow_solve))
+        table, game = self._create_table(target_score=100)
+        await self.checkpointer.checkpoint()
+        game.execute_action(game.players[0], "start_game")
+        self._play(table, game, 150)
+        await self.checkpointer.checkpoint()
+        release.set()
+
+        # After a restart the policy is solved before replay reaches the bot
+        solved = PolicyCache(solve_policy)
+        solved.get(100, 0, 6)
+        monkeypatch.setattr("server.games.pig.game.policies", solved)
+        restored = self._restore(table.table_id)
+        assert restored.game.to_dict() == game.to_dict()
+
+    async def test_restored_table_keeps_journaling(self):
+        table, game = self._create_table()
+        await self.checkpointer.checkpoint()
+        game.execute_action(game.players[0], "start_game")
+        self._play(table, game, 40)
+        await self.checkpointer.checkpoint()
+
+        # Crash: carry on from the checkpoint in a new table object
+        restored = self._restore(table.table_id)
+        self.server._tables.remove_table(table.table_id)
+        self.server._tables.add_table(restored)
+        self._play(restored, restored.game, 40)
+        stats = await self.checkpointer.checkpoint()
+        assert stats["tables_written"] == 0
+
+        again = self._restore(table.table_id)
+        assert again.game.to_dict() == restored.game.to_dict()
+
+    async def test_member_change_forces_snapshot(self):
+        table, _ = self._create_table()
+        await self.checkpointer.checkpoint()
+
+        table.add_member("Bob", MockUser("Bob"), as_spectator=True)
+        stats = await self.checkpointer.checkpoint()
+        assert stats["tables_written"] == 1
+        assert self.db.load_journal(table.table_id) == []
+
+    async def test_replay_to_any_tick(self):
+        table, game = self._create_table()
+        await self.checkpointer.checkpoint()
+        game.execute_action(game.players[0], "start_game")
+        self._play(table, game, 30)
+        midway = game.to_dict()
+        self._play(table, game, 30)
+        await self.checkpointer.checkpoint()
+
+        stored = self.db.load_table(table.table_id)
+        entries = self.db.load_journal(table.table_id)
+        assert entries[-1].kind == ENTRY_TICK and entries[-1].tick == 60
+
+        replayed = load_game(PigGame, stored.game_json)
+        replayed.rebuild_runtime_state()
+        for player in replayed.players:
+            if player.is_bot:
+                replayed.attach_user(player.id, Bot(player.name, uuid=player.id))
+        assert replay_journal(replayed, entries, until_tick=30) == 30
+        assert replayed.to_dict() == midway
+
+    def test_full_save_resets_journal(self):
+        table, game = self._create_table()
+        game.execute_action(game.players[0], "start_game")
+        self.server._save_tables()
+        assert self.db.load_journal(table.table_id) == []
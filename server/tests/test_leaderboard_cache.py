@@ -0,0 +1,106 @@
+"""Tests for the leaderboard response cache."""
+
+import os
+import tempfile
+
+from server.core.leaderboard_cache import LeaderboardCache
+from server.core.server import Server
+from server.game_utils.game_result import GameResult
+from server.users.test_user import MockUser
+
+
+class TestLeaderboardCache:
+    """Unit tests for LeaderboardCache."""
+
+    def test_hit_and_miss_metrics(self):
+        cache = LeaderboardCache()
+        assert cache.get("pig", "wins", "en") is None
+        cache.put("pig", "wins", "en", ["a"])
+        assert cache.get("pig", "wins", "en") == ["a"]
+        assert cache.get("pig", "wins", "pt") is None
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert abs(stats["hit_ratio"] - 1 / 3) < 1e-9
+
+    def test_lru_eviction_respects_bound(self):
+        cache = LeaderboardCache(max_entries=2)
+        cache.put("pig", "wins", "en", 1)
+        cache.put("pig", "rating", "en", 2)
+        cache.get("pig", "wins", "en")  # wins is now most recently used
+        cache.put("pig", "high_score", "en", 3)
+
+        assert len(cache) == 2
+        assert cache.get("pig", "rating", "en") is None
+        assert cache.get("pig", "wins", "en") == 1
+        assert cache.evictions == 1
+
+    def test_invalidate_only_affected_game(self):
+        cache = LeaderboardCache()
+        cache.put("pig", "wins", "en", "pig wins")
+        cache.put("farkle", "wins", "en", "farkle wins")
+        cache.put("pig", "my_stats:alice", "en", "alice", player_id="alice")
+        cache.put("pig", "my_stats:carol", "en", "carol", player_id="carol")
+        cache.put("farkle", "my_stats:carol", "en", "carol", player_id="carol")
+        cache.put("", "my_stats_menu:carol", "en", "menu", player_id="carol")
+
+        removed = cache.invalidate("pig")
+
+        assert removed == 4
+        assert cache.get("pig", "wins", "en") is None
+        assert cache.get("pig", "my_stats:alice", "en") is None
+        # Non-players too: the result can push their games out of the window
+        assert cache.get("pig", "my_stats:carol", "en") is None
+        assert cache.get("", "my_stats_menu:carol", "en") is None
+        assert cache.get("farkle", "wins", "en") == "farkle wins"
+        assert cache.get("farkle", "my_stats:carol", "en") == "carol"
+
+
+class TestServerLeaderboardCaching:
+    """Test that the server reuses and invalidates rendered leaderboards."""
+
+    def setup_method(self):
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_file.close()
+        self.server = Server(db_path=self.temp_file.name)
+        self.server._db.connect()
+
+    def teardown_method(self):
+        self.server._db.close()
+        os.unlink(self.temp_file.name)
+
+    def _record_win(self, winner: MockUser, loser: MockUser) -> None:
+        result = GameResult.create(
+            "pig",
+            100,
+            [(winner.uuid, winner.username, False), (loser.uuid, loser.username, False)],
+            {"winner_name": winner.username, "final_scores": {winner.username: 100}},
+        )
+        self.server.on_game_result(result)
+
+    def test_rendered_items_shared_across_users_of_same_locale(self):
+        alice = MockUser("Alice")
+        bob = MockUser("Bob")
+        self._record_win(alice, bob)
+
+        self.server._show_wins_leaderboard(alice, "pig", "Pig")
+        self.server._show_wins_leaderboard(bob, "pig", "Pig")
+
+        cache = self.server._leaderboard_cache
+        assert cache.get("pig", "wins", "en") is not None
+        assert alice.menus["game_leaderboard"]["items"] == bob.menus["game_leaderboard"]["items"]
+
+    def test_game_result_invalidates_leaderboard(self):
+        alice = MockUser("Alice")
+        bob = MockUser("Bob")
+        self._record_win(alice, bob)
+        self.server._show_games_played_leaderboard(alice, "pig", "Pig")
+        first = alice.menus["game_leaderboard"]["items"][0]
+
+        self._record_win(bob, alice)
+        self.server._show_games_played_leaderboard(alice, "pig", "Pig")
+        second = alice.menus["game_leaderboard"]["items"][0]
+
+        assert first != second
+        assert "2" in str(second)
@@ -71,7 +71,7 @@ def test_roll_transfers(monkeypatch):
     def fake_choice(_):
         return next(sequence)
 
-    monkeypatch.setattr("server.games.leftrightcenter.game.random.choice", fake_choice)
+    monkeypatch.setattr(game.rng, "choice", fake_choice)
 
     current = game.current_player
     assert current is not None
@@ -150,7 +150,7 @@ def test_team_scores_sync(monkeypatch):
     def fake_choice(_):
         return next(sequence)
 
-    monkeypatch.setattr("server.games.leftrightcenter.game.random.choice", fake_choice)
+    monkeypatch.setattr(game.rng, "choice", fake_choice)
 
     current = game.current_player
     assert current is not None
@@ -11,7 +11,7 @@ import pytest
 import random
 import json
 
-from server.games.midnight.game import MidnightGame, MidnightOptions
+from server.games.midnight.game import MidnightGame, MidnightOptions, midnight_turn
 from server.users.test_user import MockUser
 from server.users.bot import Bot
 
@@ -270,6 +270,55 @@ class TestMidnightGameActions:
         assert "roll" not in p2_ids
 
 
+class TestMidnightBot:
+    """Tests for the bot's exact turn solver."""
+
+    def setup_method(self):
+        self.game = MidnightGame()
+        self.bot = self.game.add_player("Bot1", Bot("Bot1"))
+        self.other = self.game.add_player("Bot2", Bot("Bot2"))
+        self.game.on_start()
+
+    def _keeps(self, values: list[int]) -> list[int]:
+        """Values the bot toggles before acting on a fresh roll."""
+        dice = self.bot.dice
+        dice.values = values
+        dice.kept = []
+        dice.locked = []
+        action = self.game.bot_think(self.bot)
+        while action.startswith("toggle_die_"):
+            dice.toggle_keep(int(action.split("_")[-1]))
+            action = self.game.bot_think(self.bot)
+        assert action in ("roll", "bank")
+        return sorted(dice.values[i] for i in dice.kept)
+
+    def test_keeps_qualifiers_and_sixes(self):
+        """Test the bot keeps a 1, a 4 and its sixes in one roll."""
+        assert self._keeps([6, 1, 2, 4, 6, 3]) == [1, 4, 6, 6]
+
+    def test_plays_for_score_to_beat(self):
+        """Test the bot rerolls more dice when it has a high score to beat."""
+        self.other.qualified = True
+        self.other.round_score = 20
+        assert self._keeps([1, 4, 6, 6, 5, 2]) == [1, 4, 6, 6]
+
+    def test_warm_up_solves_every_turn(self):
+        """Test bots don't solve anything on the tick loop after warm_up."""
+        MidnightGame.warm_up()
+        sizes = {
+            to_beat: len(midnight_turn(to_beat)._expected)
+            for to_beat in (-1, *range(4, 25))
+        }
+        for score in (None, 4, 13, 24):
+            self.other.qualified = score is not None
+            self.other.round_score = score or 0
+            self._keeps([1, 4, 6, 6, 5, 2])
+            self._keeps([2, 3, 5, 5, 6, 6])
+        assert midnight_turn.cache_info().currsize == len(sizes)
+        for to_beat, size in sizes.items():
+            assert len(midnight_turn(to_beat)._expected) == size
+
+
 class TestMidnightPlayTest:
     """
     Play tests that run complete games with bots.
@@ -11,7 +11,13 @@ from server.games.milebymile.game import (
     MileByMileOptions,
     RaceState,
 )
-from server.games.milebymile.cards import HazardType, SafetyType
+from server.games.milebymile.cards import (
+    Card,
+    CardType,
+    HazardType,
+    RemedyType,
+    SafetyType,
+)
 from server.users.test_user import MockUser
 from server.users.bot import Bot
 
@@ -143,6 +149,36 @@ class TestMileByMileSerialization:
         loaded_game = MileByMileGame.from_json(json_str)
         assert loaded_game.current_race == 1
 
+    def test_cards_saved_as_ints(self):
+        """Test cards serialize as packed ints and load as the same objects."""
+        game = MileByMileGame()
+        game.add_player("Alice", MockUser("Alice"))
+        game.add_player("Bob", MockUser("Bob"))
+        game.on_start()
+
+        data = json.loads(game.to_json())
+        assert all(isinstance(c, int) for c in data["deck"]["cards"])
+        assert all(isinstance(c, int) for c in data["players"][0]["hand"])
+
+        loaded = MileByMileGame.from_json(game.to_json())
+        assert list(loaded.deck.cards) == list(game.deck.cards)
+        assert loaded.players[0].hand[0] is game.players[0].hand[0]
+        assert isinstance(loaded.players[0].hand[0].card_type, CardType)
+
+    def test_dict_cards_from_old_saves_load(self):
+        """Test games saved with cards as objects still load."""
+        game = MileByMileGame()
+        game.add_player("Alice", MockUser("Alice"))
+        game.add_player("Bob", MockUser("Bob"))
+        game.on_start()
+
+        data = json.loads(game.to_json())
+        hand = game.players[0].hand
+        old_hand = [{"id": c.id, "card_type": c.card_type, "value": c.value} for c in hand]
+        data["players"][0]["hand"] = json.loads(json.dumps(old_hand))
+        loaded = MileByMileGame.from_dict(data)
+        assert loaded.players[0].hand == hand
+
 
 class TestMileByMilePlayTest:
     """Integration tests for complete game play."""
@@ -195,6 +231,75 @@ class TestMileByMilePlayTest:
         assert game.status == "finished"
 
 
+class TestMileByMilePlayabilityCache:
+    """Tests for the per-slot card playability cache."""
+
+    def _game(self) -> MileByMileGame:
+        game = MileByMileGame()
+        game.add_player("Bot1", Bot("Bot1"))
+        game.add_player("Bot2", Bot("Bot2"))
+        game.on_start()
+        return game
+
+    def test_follows_own_and_opponent_race_state(self):
+        """Test cached answers change with the race states they depend on."""
+        game = self._game()
+        player, other = game.players
+        player.hand[0] = Card(id=900, card_type=CardType.REMEDY, value=RemedyType.ROLL)
+        player.hand[1] = Card(id=901, card_type=CardType.HAZARD, value=HazardType.ACCIDENT)
+        own = game.get_player_race_state(player)
+        theirs = game.get_player_race_state(other)
+        theirs.remove_problem(HazardType.STOP)
+
+        assert game._can_play_card(player, player.hand[0])
+        assert game._can_play_card(player, player.hand[1])
+
+        own.remove_problem(HazardType.STOP)
+        assert not game._can_play_card(player, player.hand[0])
+
+        theirs.add_safety(SafetyType.DRIVING_ACE)
+        assert not game._can_play_card(player, player.hand[1])
+        assert game._slot_playability(player, 1).targets == []
+
+    def test_matches_uncached_checks_through_a_game(self):
+        """Test the cache agrees with working playability out every tick."""
+        game = self._game()
+        game.rng.seed(3)
+        for _ in range(3000):
+            if not game.game_active:
+                break
+            game.on_tick()
+            for player in game.players:
+                for slot, card in enumerate(player.hand):
+                    assert game._slot_playability(player, slot).playable == (
+                        game._check_card_playable(player, card)
+                    )
+
+
+class TestMileByMileSearchBot:
+    """Tests for the look-ahead bot strategy."""
+
+    def test_search_picks_a_card(self):
+        """Test the search compares distinct cards and leaves the game alone."""
+        game = MileByMileGame()
+        game.options.bot_strategy = "search"
+        game.rng.seed(7)
+        game.add_player("Bot1", Bot("Bot1"))
+        game.add_player("Bot2", Bot("Bot2"))
+        game.on_start()
+
+        player = game.current_player
+        moves = game.search_moves(player)
+        kinds = {(c.card_type, c.value) for c in player.hand}
+        assert len(moves) == len(kinds)
+
+        before = game.to_json()
+        while game.bot_search_busy(player):
+            game.bot_search_tick(player)
+        assert game.to_json() == before
+        assert game.bot_think(player) in moves
+
+
 class TestMileByMilePersistence:
     """Tests for game persistence."""
 
@@ -10,7 +10,10 @@ Following the testing strategy:
 import pytest
 import random
 import json
+from types import SimpleNamespace
 
+from server.game_utils import search as search_module
+from server.game_utils.search import PLAYOUTS_PER_TICK, SearchBudget
 from server.games.ninetynine.game import (
     NinetyNineGame,
     NinetyNineOptions,
@@ -157,6 +160,42 @@ class TestCardAndDeck:
         ]:
             assert rank_counts.get(rank, 0) == 4, f"Expected 4 cards of rank {rank}"
 
+    def test_cards_interned_and_packed(self):
+        """Test equal cards are one object and serialize as ints."""
+        card = Card(id=7, rank=12, suit=SUIT_HEARTS)
+        assert Card(id=7, rank=12, suit=SUIT_HEARTS) is card
+        assert Card.unpack(card.packed) is card
+        with pytest.raises(AttributeError):
+            card.rank = 1
+
+        deck, _ = DeckFactory.rs_games_deck()
+        data = json.loads(deck.to_json())
+        assert all(isinstance(c, int) for c in data["cards"])
+        assert list(Deck.from_dict(data).cards) == list(deck.cards)
+
+    def test_out_of_range_cards_rejected(self):
+        """Test fields that don't fit their bits are refused."""
+        with pytest.raises(ValueError):
+            Card(id=0, rank=32, suit=SUIT_HEARTS)
+        with pytest.raises(ValueError):
+            Card(id=0, rank=1, suit=8)
+
+    def test_dict_cards_from_old_saves_load(self):
+        """Test decks saved with cards as objects still load."""
+        data = {"cards": [{"id": 3, "rank": 5, "suit": SUIT_HEARTS}]}
+        deck = Deck.from_dict(data)
+        assert deck.draw_one() is Card(id=3, rank=5, suit=SUIT_HEARTS)
+
+    def test_deck_draw_order(self):
+        """Test draws come from the top and add_top keeps order."""
+        deck, _ = DeckFactory.standard_deck()
+        top = list(deck.cards)[:5]
+        assert deck.draw(3) == top[:3]
+        deck.add_top(top[:2])
+        assert deck.draw(3) == [top[0], top[1], top[3]]
+        assert len(deck.clear()) == 48
+        assert deck.is_empty()
+
     def test_rs_games_card_names(self):
         """Test RS Games card naming."""
         # Check special card names
@@ -412,6 +451,94 @@ class TestNinetyNinePlayTest:
         assert not game.game_active
 
 
+class TestNinetyNineSearchBot:
+    """Tests for the look-ahead bot strategy."""
+
+    def _start(self, **options) -> NinetyNineGame:
+        game = NinetyNineGame(options=NinetyNineOptions(bot_strategy="search", **options))
+        game.rng.seed(5)
+        game.add_player("Bot1", Bot("Bot1"))
+        game.add_player("Bot2", Bot("Bot2"))
+        game.setup_keybinds()
+        game.on_start()
+        return game
+
+    def test_search_leaves_game_unchanged(self):
+        """Test playouts run on clones, never on the game itself."""
+        game = self._start()
+        player = game.current_player
+        player.hand = [Card(id=1, rank=3, suit=SUIT_HEARTS), Card(id=2, rank=5, suit=SUIT_HEARTS)]
+        before = game.to_dict()
+        for _ in range(200):
+            game.bot_search_tick(player)
+            if game._bot_search.playouts:
+                break
+        assert game.to_dict() == before
+        assert game._bot_search.playouts > 0
+
+    def _slow_clock(self, monkeypatch) -> list[float]:
+        """A fake clock for searches, advanced a second by each simulated tick."""
+        clock = [0.0]
+        monkeypatch.setattr(
+            search_module, "time", SimpleNamespace(perf_counter=lambda: clock[0])
+        )
+        real_tick = NinetyNineGame.on_tick
+
+        def slow_tick(game):
+            clock[0] += 1.0
+            real_tick(game)
+
+        monkeypatch.setattr(NinetyNineGame, "on_tick", slow_tick)
+        return clock
+
+    def test_step_overshoots_by_at_most_one_tick(self, monkeypatch):
+        """Test a step pauses mid-playout and resumes it on the next step."""
+        clock = self._slow_clock(monkeypatch)
+        game = self._start()
+        search = game._search_for(game.current_player)
+        for budget in [0.5, 2.5, 7.0] * 20:
+            start = clock[0]
+            search.step(PLAYOUTS_PER_TICK, start + budget)
+            assert clock[0] - start <= budget + 1.0
+        assert search.playouts > 0
+
+    def test_searches_share_tick_budget(self, monkeypatch):
+        """Test tables draw from one budget per tick, each making some progress."""
+        clock = self._slow_clock(monkeypatch)
+        budget = SearchBudget(seconds=3.0)
+        table = SimpleNamespace(_manager=SimpleNamespace(search_budget=budget))
+        first, second = self._start(), self._start()
+        first._table = second._table = table
+
+        budget.start_tick()
+        first.bot_search_tick(first.current_player)
+        assert 3.0 <= clock[0] <= 4.0
+        start = clock[0]
+        second.bot_search_tick(second.current_player)
+        assert clock[0] - start <= 1.0
+
+    def test_search_lands_on_milestone(self):
+        """Test the search plays to 66 rather than past it."""
+        game = self._start()
+        player = game.current_player
+        game.count = 63
+        player.hand = [Card(id=1, rank=5, suit=SUIT_HEARTS), Card(id=2, rank=3, suit=SUIT_HEARTS)]
+        assert game.search_moves(player) == ["card_slot_1", "card_slot_2"]
+        while game.bot_search_busy(player):
+            game.bot_search_tick(player)
+        assert game.bot_think(player) == "card_slot_2"
+        assert game._bot_search is None
+
+    def test_search_bot_game_completes(self):
+        """Test a game between searching bots runs to completion."""
+        game = self._start(starting_tokens=2)
+        for _ in range(5000):
+            if not game.game_active:
+                break
+            game.on_tick()
+        assert not game.game_active
+
+
 class TestNinetyNinePersistence:
     """Persistence tests."""
 
@@ -10,8 +10,12 @@ Following the testing strategy:
 import pytest
 import random
 import json
+import threading
 
+from server.game_utils.bot_helper import BotHelper
+from server.game_utils.hold_policy import PolicyCache, hold_at_outcomes, simple_hold_at
 from server.games.pig.game import PigGame, PigOptions
+from server.games.pig.policy import load_policy, solve_policy, turn_steps
 from server.users.test_user import MockUser
 from server.users.bot import Bot
 
@@ -104,13 +108,13 @@ class TestPigGameActions:
 
     def test_roll_not_one(self):
         """Test rolling when result is not 1."""
-        random.seed(42)  # Seed that gives consistent non-1 results
+        self.game.rng.seed(42)  # Seed that gives consistent non-1 results
 
         # Find a seed that gives us a non-1 roll
         for seed in range(100):
-            random.seed(seed)
-            if random.randint(1, 6) != 1:
-                random.seed(seed)
+            self.game.rng.seed(seed)
+            if self.game.rng.randint(1, 6) != 1:
+                self.game.rng.seed(seed)
                 break
 
         self.player1.round_score = 5
@@ -124,9 +128,9 @@ class TestPigGameActions:
         """Test that rolling a 1 loses round points."""
         # Find a seed that gives us a 1
         for seed in range(100):
-            random.seed(seed)
-            if random.randint(1, 6) == 1:
-                random.seed(seed)
+            self.game.rng.seed(seed)
+            if self.game.rng.randint(1, 6) == 1:
+                self.game.rng.seed(seed)
                 break
 
         self.player1.round_score = 15
@@ -196,6 +200,73 @@ class TestPigGameActions:
         assert "roll" not in p2_ids
 
 
+class TestPigPolicy:
+    """Test the bot's optimal hold-at policy."""
+
+    def test_turn_outcomes(self):
+        """Test hold-at turn outcomes are complete distributions."""
+        outcomes = hold_at_outcomes(turn_steps(6), 0, 30)
+        for bust, banked in outcomes[1:]:
+            assert bust + sum(banked) == pytest.approx(1.0)
+        # Holding at 2 busts only on the first roll
+        assert outcomes[2][0] == pytest.approx(1 / 6)
+
+    def test_matches_known_optimum(self):
+        """Test the first player's chance in Pig to 100 (optimal play: 0.5306)."""
+        policy = load_policy(100, 0, 6)
+        assert policy.win_chance(0, 0) == pytest.approx(0.5306, abs=0.0005)
+        assert 20 <= policy.hold_at(0, 0) <= 25
+
+    def test_endgame(self):
+        """Test the bot goes for the win when far behind and respects the minimum."""
+        policy = load_policy(50, 0, 6)
+        assert policy.hold_at(0, 49) == 50
+        assert policy.hold_at(45, 0) == 5
+        # Someone already reached the target: beat them
+        assert policy.hold_at(40, 55) == 16
+        assert load_policy(50, 30, 6).hold_at(0, 0) >= 30
+
+    def test_bot_uses_policy(self):
+        """Test the bot's turn target comes from the policy."""
+        game = PigGame(options=PigOptions(target_score=50))
+        game.add_player("Bot1", Bot("Bot1"))
+        game.add_player("Bot2", Bot("Bot2"))
+        game.on_start()
+        game._team_manager.teams[0].total_score = 10
+        game._team_manager.teams[1].total_score = 45
+        player = game.current_player
+        expected = load_policy(50, 0, 6).hold_at(10, 45)
+        game._setup_bot_target(player)
+        assert BotHelper.get_target(player) == expected
+        player.round_score = expected - 1
+        assert game.bot_think(player) == "roll"
+        player.round_score = expected
+        assert game.bot_think(player) == "bank"
+
+    def test_live_game_does_not_wait_for_solve(self, monkeypatch):
+        """Test live games solve in the background and hold at 20 meanwhile."""
+        release = threading.Event()
+
+        def solve(*rules):
+            release.wait(10)
+            return solve_policy(*rules)
+
+        policies = PolicyCache(solve)
+        monkeypatch.setattr("server.games.pig.game.policies", policies)
+        game = PigGame(options=PigOptions(target_score=50))
+        game.add_player("Bot1", Bot("Bot1"))
+        game.add_player("Bot2", Bot("Bot2"))
+        game.on_start()
+        player = game.current_player
+        assert BotHelper.get_target(player) == simple_hold_at(0, 0, 50) == 20
+
+        release.set()
+        policy = policies.get(50, 0, 6)
+        game._setup_bot_target(player)
+        assert policies.get_ready(50, 0, 6) is policy
+        assert BotHelper.get_target(player) == policy.hold_at(0, 0)
+
+
 class TestPigPlayTest:
     """
     Play tests that run complete games with bots.
@@ -0,0 +1,296 @@
+"""Tests for player ratings storage and the rating leaderboard."""
+
+import os
+import sqlite3
+import tempfile
+
+from server.persistence.database import Database
+from server.game_utils.stats_helpers import RatingCache, RatingHelper
+
+
+class TestRatingLeaderboard:
+    """Test ordinal-sorted rating queries."""
+
+    def setup_method(self):
+        """Create a temporary database for each test."""
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_file.close()
+        self.db = Database(self.temp_file.name)
+        self.db.connect()
+
+    def teardown_method(self):
+        """Clean up temporary database."""
+        self.db.close()
+        os.unlink(self.temp_file.name)
+
+    def test_leaderboard_sorted_by_ordinal_not_mu(self):
+        """A high-mu but uncertain player ranks below a confident one."""
+        self.db.set_player_rating("lucky", "pig", 30.0, 8.0)  # ordinal 6
+        self.db.set_player_rating("steady", "pig", 28.0, 2.0)  # ordinal 22
+        self.db.set_player_rating("other_game", "farkle", 50.0, 1.0)
+
+        helper = RatingHelper(self.db, "pig")
+        board = helper.get_leaderboard(limit=10)
+        assert [r.player_id for r in board] == ["steady", "lucky"]
+
+    def test_leaderboard_pagination(self):
+        """Pages continue where the previous one ended."""
+        for i in range(25):
+            self.db.set_player_rating(f"p{i:02d}", "pig", 25.0 + i, 1.0)
+
+        helper = RatingHelper(self.db, "pig")
+        first = helper.get_leaderboard(limit=10)
+        second = helper.get_leaderboard(limit=10, offset=10)
+        assert first[0].player_id == "p24"
+        assert second[0].player_id == "p14"
+        assert not {r.player_id for r in first} & {r.player_id for r in second}
+
+    def test_player_rank(self):
+        """Rank lookup matches the position on the leaderboard."""
+        for i in range(5):
+            self.db.set_player_rating(f"p{i}", "pig", 20.0 + i, 1.0)
+
+        helper = RatingHelper(self.db, "pig")
+        assert helper.get_rank("p4") == 1
+        assert helper.get_rank("p0") == 5
+        assert helper.get_rank("unrated") is None
+        assert helper.get_rated_count() == 5
+
+    def test_update_ratings_maintains_ordinal(self):
+        """update_ratings stores the ordinal alongside mu and sigma."""
+        helper = RatingHelper(self.db, "pig")
+        updated = helper.update_ratings([["alice"], ["bob"]])
+        helper.cache.flush()
+
+        row = self.db._conn.execute(
+            "SELECT ordinal FROM player_ratings WHERE player_id = 'alice'"
+        ).fetchone()
+        assert abs(row["ordinal"] - updated["alice"].ordinal) < 1e-9
+        assert helper.get_rank("alice") == 1
+
+    def test_leaderboard_uses_ordinal_index(self):
+        """The top-K query is served by the composite index."""
+        plan = self.db._conn.execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT player_id, mu, sigma FROM player_ratings
+            WHERE game_type = ? ORDER BY ordinal DESC, player_id LIMIT 10
+            """,
+            ("pig",),
+        ).fetchall()
+        details = " ".join(row[3] for row in plan)
+        assert "idx_player_ratings_ordinal" in details
+        assert "TEMP B-TREE" not in details
+
+
+class TestRatingCache:
+    """Test the shared in-memory rating cache and its write-behind."""
+
+    def setup_method(self):
+        """Create a temporary database for each test."""
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_file.close()
+        self.db = Database(self.temp_file.name)
+        self.db.connect()
+
+    def teardown_method(self):
+        """Clean up temporary database."""
+        self.db.close()
+        os.unlink(self.temp_file.name)
+
+    def test_cache_shared_between_helpers(self):
+        """Helpers for the same database share one cache."""
+        first = RatingHelper(self.db, "pig")
+        second = RatingHelper(self.db, "pig")
+        assert first.cache is second.cache is RatingCache.for_db(self.db)
+
+        first.update_ratings([["alice"], ["bob"]])
+        assert second.get_rating("alice").mu > RatingHelper.DEFAULT_MU
+
+    def test_updates_written_behind_in_one_batch(self):
+        """update_ratings does not touch disk until the cache is flushed."""
+        helper = RatingHelper(self.db, "pig")
+        helper.update_ratings([["alice"], ["bob"]])
+        helper.update_ratings([["carol"], ["alice"]])
+
+        assert self.db.get_player_rating("alice", "pig") is None
+        assert helper.cache.pending_writes == 3
+
+        assert helper.cache.flush() == 3
+        mu, sigma = self.db.get_player_rating("alice", "pig")
+        assert mu == helper.get_rating("alice").mu
+        assert helper.cache.pending_writes == 0
+
+    def test_lookups_served_from_memory(self):
+        """Once loaded, ratings (and known-unrated players) skip the database."""
+        self.db.set_player_rating("alice", "pig", 30.0, 2.0)
+        helper = RatingHelper(self.db, "pig")
+        helper.get_ratings(["alice", "bob"])
+
+        queries = []
+        self.db._conn.set_trace_callback(queries.append)
+        helper.get_rating("alice")
+        helper.get_rating("bob")
+        helper.predict_win_probability("alice", "bob")
+        self.db._conn.set_trace_callback(None)
+        assert queries == []
+
+    def test_leaderboard_sees_unflushed_updates(self):
+        """Leaderboard queries flush pending writes first."""
+        helper = RatingHelper(self.db, "pig")
+        helper.update_ratings([["alice"], ["bob"]])
+        board = helper.get_leaderboard()
+        assert [r.player_id for r in board] == ["alice", "bob"]
+
+    def test_eviction_flushes_pending_writes(self):
+        """The cache stays bounded and evicting a queued rating writes it."""
+        cache = RatingCache(self.db, max_entries=2)
+        cache.set("pig", "alice", 30.0, 2.0)
+        cache.get("pig", "bob")
+        cache.get("pig", "carol")
+
+        assert len(cache._ratings) == 2
+        assert cache.evictions == 1
+        assert cache.pending_writes == 0
+        assert self.db.get_player_rating("alice", "pig") == (30.0, 2.0)
+        assert cache.get("pig", "alice") == (30.0, 2.0)
+
+
+class TestRatingMigration:
+    """Test upgrading a database created before the ordinal column."""
+
+    def test_ordinal_backfilled(self):
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        temp_file.close()
+        try:
+            conn = sqlite3.connect(temp_file.name)
+            conn.execute("""
+                CREATE TABLE player_ratings (
+                    player_id TEXT NOT NULL,
+                    game_type TEXT NOT NULL,
+                    mu REAL NOT NULL,
+                    sigma REAL NOT NULL,
+                    PRIMARY KEY (player_id, game_type)
+                )
+            """)
+            conn.execute(
+                "INSERT INTO player_ratings VALUES ('alice', 'pig', 30.0, 2.0)"
+            )
+            conn.commit()
+            conn.close()
+
+            db = Database(temp_file.name)
+            db.connect()
+            row = db._conn.execute(
+                "SELECT ordinal FROM player_ratings WHERE player_id = 'alice'"
+            ).fetchone()
+            assert row["ordinal"] == 24.0
+            assert db.get_player_rating_rank("alice", "pig") == 1
+            db.close()
+        finally:
+            os.unlink(temp_file.name)
+
+
+class TestRatingRebuild:
+    """Test replaying game history into a fresh ratings table."""
+
+    def setup_method(self):
+        """Create a temporary database with some game history."""
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_file.close()
+        self.db = Database(self.temp_file.name)
+        self.db.connect()
+
+        names = ["alice", "bob", "carol", "dave"]
+        self.games = []
+        for i in range(40):
+            a, b = names[i % 4], names[(i * 3 + 1) % 4]
+            if a == b:
+                b = names[(i + 1) % 4]
+            self.games.append((a, b))
+            self.db.save_game_result(
+                game_type="pig",
+                timestamp=f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}",
+                duration_ticks=100,
+                players=[(a, a, False), (b, b, False), ("bot", "Bot", True)],
+                custom_data={"winner_name": a},
+            )
+
+    def teardown_method(self):
+        """Clean up temporary database."""
+        self.db.close()
+        os.unlink(self.temp_file.name)
+
+    def _extractors(self):
+        from server.games.pig.game import PigGame
+
+        return {"pig": PigGame().get_rankings_for_rating}
+
+    def _expected(self) -> dict[str, tuple[float, float]]:
+        """Ratings produced by applying each game live, in order."""
+        other = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        other.close()
+        try:
+            live_db = Database(other.name)
+            live_db.connect()
+            helper = RatingHelper(live_db, "pig")
+            for winner, loser in self.games:
+                helper.update_ratings([[winner], [loser]])
+            ratings = {
+                pid: (r.mu, r.sigma)
+                for pid, r in helper.get_ratings(["alice", "bob", "carol", "dave"]).items()
+            }
+            live_db.close()
+            return ratings
+        finally:
+            os.unlink(other.name)
+
+    def _rebuilt(self) -> dict[str, tuple[float, float]]:
+        return {
+            pid: self.db.get_player_rating(pid, "pig")
+            for pid in ["alice", "bob", "carol", "dave"]
+        }
+
+    def test_rebuild_matches_live_updates(self):
+        """Replaying history reproduces the live ratings and swaps them in."""
+        from server.game_utils.stats_helpers import RatingRebuilder
+
+        self.db.set_player_rating("stale", "pig", 99.0, 1.0)
+        stats = RatingRebuilder(self.db, self._extractors(), chunk_size=7).run()
+
+        assert stats["games_processed"] == 40
+        assert stats["games_rated"] == 40
+        assert self.db.get_player_rating("stale", "pig") is None
+        expected = self._expected()
+        for pid, (mu, sigma) in self._rebuilt().items():
+            assert abs(mu - expected[pid][0]) < 1e-9
+            assert abs(sigma - expected[pid][1]) < 1e-9
+        assert RatingHelper(self.db, "pig").get_leaderboard(limit=1)
+
+    def test_interrupted_rebuild_resumes(self):
+        """A rebuild stopped mid-way resumes from its checkpoint."""
+        from server.game_utils.stats_helpers import RatingRebuilder
+
+        class Interrupted(Exception):
+            pass
+
+        def stop_after_two_chunks(stats):
+            if stats["games_processed"] >= 20:
+                raise Interrupted()
+
+        rebuilder = RatingRebuilder(self.db, self._extractors(), chunk_size=10)
+        try:
+            rebuilder.run(on_progress=stop_after_two_chunks)
+        except Interrupted:
+            pass
+        # Live ratings are untouched until the rebuild finishes
+        assert self.db.get_player_rating("alice", "pig") is None
+
+        stats = rebuilder.run(resume=True)
+        assert stats["games_processed"] == 40
+        assert stats["games_rated"] == 40
+
+        expected = self._expected()
+        for pid, (mu, sigma) in self._rebuilt().items():
+            assert abs(mu - expected[pid][0]) < 1e-9
+            assert abs(sigma - expected[pid][1]) < 1e-9
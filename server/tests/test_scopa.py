@@ -1,9 +1,16 @@
 """Tests for Scopa game implementation."""
 
+import itertools
+import random
 from pathlib import Path
 
 from server.games.scopa.game import ScopaGame, ScopaPlayer, ScopaOptions
-from server.games.scopa.capture import find_captures, select_best_capture
+from server.games.scopa.capture import (
+    find_best_capture,
+    find_captures,
+    find_subsets_with_sum,
+    select_best_capture,
+)
 from server.games.registry import GameRegistry
 from server.game_utils.cards import Card, DeckFactory
 from server.game_utils.teams import TeamManager
@@ -299,6 +306,41 @@ class TestScopaCaptureLogic:
         best = select_best_capture(captures)
         assert len(best) == 2
 
+    def test_subsets_match_exhaustive_search(self):
+        """Test the bitmask search finds every subset, in index order."""
+        rng = random.Random(5)
+        for _ in range(50):
+            cards = [
+                Card(id=i, rank=rng.randint(1, 10), suit=1)
+                for i in range(rng.randint(0, 12))
+            ]
+            target = rng.randint(1, 14)
+            expected = [
+                list(combo)
+                for size in range(1, len(cards) + 1)
+                for combo in itertools.combinations(cards, size)
+                if sum(c.rank for c in combo) == target
+            ]
+            found = find_subsets_with_sum(cards, target)
+            assert sorted(found, key=lambda s: [c.id for c in s]) == sorted(
+                expected, key=lambda s: [c.id for c in s]
+            )
+            assert found == sorted(found, key=lambda s: [c.id for c in s])
+
+    def test_best_capture_matches_selection(self):
+        """Test find_best_capture picks what select_best_capture would."""
+        rng = random.Random(9)
+        for _ in range(50):
+            table = [
+                Card(id=i, rank=rng.randint(1, 10), suit=1)
+                for i in range(rng.randint(0, 10))
+            ]
+            rank = rng.randint(1, 10)
+            for escoba in (False, True):
+                assert find_best_capture(table, rank, escoba) == select_best_capture(
+                    find_captures(table, rank, escoba)
+                )
+
 
 class TestScopaGameFlow:
     """Tests for game flow."""
@@ -393,6 +435,31 @@ class TestScopaPlayTest:
         assert game.status == "finished"
 
 
+class TestScopaSearchBot:
+    """Tests for the look-ahead bot strategy."""
+
+    def test_search_takes_the_scopa(self):
+        """Test the search clears the table when it can."""
+        from server.users.bot import Bot
+
+        game = ScopaGame()
+        game.options.bot_strategy = "search"
+        game.rng.seed(3)
+        game.add_player("Bot1", Bot("Bot1"))
+        game.add_player("Bot2", Bot("Bot2"))
+        game.on_start()
+
+        player = game.current_player
+        game.table_cards = [Card(id=101, rank=3, suit=2), Card(id=102, rank=4, suit=3)]
+        player.hand = [Card(id=103, rank=2, suit=2), Card(id=104, rank=7, suit=3)]
+        game._update_all_card_actions()
+        before = game.to_dict()
+        while game.bot_search_busy(player):
+            game.bot_search_tick(player)
+        assert game.to_dict() == before
+        assert game.bot_think(player) == "play_card_104"
+
+
 class TestScopaPersistence:
     """Tests for game persistence/serialization."""
 
@@ -0,0 +1,237 @@
+"""Tests for the shared simulation worker pool and duration estimation."""
+
+import argparse
+import json
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from server.cli import GameSimulator, cmd_bench
+from server.game_utils.simulation import (
+    SimulationRequest,
+    SimulationService,
+    run_simulation,
+)
+from server.games.pig.game import PigGame
+from server.users.test_user import MockUser
+
+
+@pytest.fixture(scope="module")
+def pool():
+    # One set of workers for the module; starting them takes a few seconds
+    service = SimulationService(max_workers=2)
+    yield service
+    service.shutdown()
+
+
+@pytest.fixture
+def service(pool, monkeypatch):
+    _wait(lambda: pool.pending == 0)
+    pool.max_pending = 4
+    monkeypatch.setattr(SimulationService, "_shared", pool)
+    return pool
+
+
+def _wait(predicate, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.05)
+
+
+class TestSimulationShortcuts:
+    """Test that headless runs and fast-forward leave the game unchanged."""
+
+    def _run(
+        self,
+        game_type: str,
+        headless: bool,
+        fast_forward: bool = True,
+        options: dict | None = None,
+    ) -> GameSimulator:
+        simulator = GameSimulator(
+            game_type=game_type,
+            bot_names=["Alice", "Bob"],
+            options=options or {},
+            json_mode=True,
+            quiet=True,
+            seed=11,
+            headless=headless,
+            fast_forward=fast_forward,
+        )
+        assert simulator.setup()
+        simulator.results = simulator.run()
+        return simulator
+
+    @pytest.mark.parametrize("game_type", ["pig", "scopa", "lightturret"])
+    def test_headless_run_matches_full_run(self, game_type):
+        full = self._run(game_type, headless=False)
+        headless = self._run(game_type, headless=True)
+        assert headless.results["ticks"] == full.results["ticks"]
+        assert headless.game.to_dict() == full.game.to_dict()
+        assert full.results["messages"]
+        assert not headless.results["messages"]
+
+    @pytest.mark.parametrize(
+        "game_type",
+        ["pig", "scopa", "milebymile", "leftrightcenter", "tradeoff", "lightturret"],
+    )
+    def test_fast_forward_matches_ticked_run(self, game_type):
+        ticked = self._run(game_type, headless=True, fast_forward=False)
+        skipped = self._run(game_type, headless=True, fast_forward=True)
+        assert not ticked.results["timed_out"]
+        assert skipped.results["ticks"] == ticked.results["ticks"]
+        assert skipped.game.to_dict() == ticked.game.to_dict()
+
+    def test_fast_forward_matches_ticked_run_with_search(self):
+        # Searching bots think on every tick, so those ticks aren't skipped
+        options = {"bot_strategy": "search", "target_score": 3}
+        ticked = self._run("scopa", headless=True, fast_forward=False, options=options)
+        skipped = self._run("scopa", headless=True, fast_forward=True, options=options)
+        assert not ticked.results["timed_out"]
+        assert skipped.results["ticks"] == ticked.results["ticks"]
+        assert skipped.game.to_dict() == ticked.game.to_dict()
+
+    def test_fast_forward_skips_idle_ticks(self):
+        simulator = GameSimulator(
+            game_type="pig",
+            bot_names=["Alice", "Bob"],
+            options={},
+            json_mode=True,
+            quiet=True,
+            seed=11,
+            headless=True,
+        )
+        assert simulator.setup()
+        game = simulator.game
+        calls = 0
+        on_tick = game.on_tick
+
+        def counting_on_tick():
+            nonlocal calls
+            calls += 1
+            on_tick()
+
+        game.on_tick = counting_on_tick
+        results = simulator.run()
+        assert calls * 5 < results["ticks"]
+
+
+class TestBench:
+    """Test the bench command's aggregated report."""
+
+    def _bench(self, capsys, game_types: list[str], games=4, jobs=1) -> dict:
+        args = argparse.Namespace(
+            game_types=game_types,
+            games=games,
+            jobs=jobs,
+            seed=3,
+            bots=None,
+            max_ticks=1_000_000,
+            presentation=False,
+            option=None,
+            json=True,
+        )
+        cmd_bench(args)
+        return json.loads(capsys.readouterr().out)
+
+    def test_report_is_reproducible(self, capsys):
+        first = self._bench(capsys, ["pig", "threes"])
+        second = self._bench(capsys, ["pig", "threes"])
+        for row in first["results"] + second["results"]:
+            assert row.pop("throughput")["games_per_second"] > 0
+        assert first["results"] == second["results"]
+
+        pig, threes = first["results"]
+        assert pig["games"] == 4 and pig["timed_out"] == 0
+        assert pig["ticks"]["min"] <= pig["ticks"]["p50"] <= pig["ticks"]["max"]
+        # Every game has a winner among the bots (not the spectator)
+        for row in (pig, threes):
+            assert len(row["seat_win_rates"]) == row["bots"]
+            assert sum(row["seat_win_rates"]) >= 1 - row["no_winner"] / row["games"]
+
+    def test_more_jobs_than_games(self, capsys):
+        """Test the worker pool takes its warmup and every batch."""
+        report = self._bench(capsys, ["pig", "threes"], games=2, jobs=3)
+        assert [row["games"] for row in report["results"]] == [2, 2]
+
+
+class TestSimulationService:
+    """Test running simulations on warm workers."""
+
+    def test_run_simulation_with_typed_options(self):
+        result = run_simulation(
+            SimulationRequest("pig", 2, options={"target_score": 20}, seed=4)
+        )
+        assert not result["timed_out"]
+        assert result["seed"] == 4
+        assert result == run_simulation(
+            SimulationRequest("pig", 2, options={"target_score": 20}, seed=4)
+        )
+
+    def test_futures_resolve_in_workers(self, service):
+        request = SimulationRequest("pig", 2, options={"target_score": 20}, seed=4)
+        futures = service.submit_many([request, request])
+        results = [f.result(timeout=60) for f in futures]
+        assert results[0] == results[1] == run_simulation(request)
+        _wait(lambda: service.pending == 0)
+
+    def test_pending_cap_refuses_excess(self, service):
+        # Long enough games that none finish before the second submission
+        request = SimulationRequest("pig", 2, options={"target_score": 1000})
+        futures = service.submit_many([request] * 3)
+        assert futures is not None
+        assert service.submit_many([request] * 2) is None
+        for future in futures:
+            future.result(timeout=60)
+        _wait(lambda: service.pending == 0)
+        assert service.submit(request) is not None
+
+    def test_unknown_game_reports_error(self, service):
+        future = service.submit(SimulationRequest("no_such_game", 2))
+        with pytest.raises(ValueError):
+            future.result(timeout=60)
+
+
+class TestDurationEstimate:
+    """Test the estimate_duration action end to end."""
+
+    def _game(self) -> tuple[PigGame, MockUser]:
+        game = PigGame()
+        host = MockUser("Alice")
+        game.initialize_lobby("Alice", host)
+        game.options.target_score = 20
+        return game, host
+
+    def test_estimate_announces_result(self, service):
+        game, host = self._game()
+        game.NUM_ESTIMATE_SIMULATIONS = 4
+        game.execute_action(game.players[0], "estimate_duration")
+        assert game._estimate_running
+
+        def finished():
+            game.check_estimate_completion()
+            return not game._estimate_running
+
+        _wait(finished)
+        assert any("Estimated human time" in m for m in host.get_spoken_messages())
+
+    def test_estimate_announces_progress(self):
+        game, host = self._game()
+        done, queued = Future(), Future()
+        game._estimate_futures = [done, queued]
+        game._estimate_running = True
+        for future in game._estimate_futures:
+            future.add_done_callback(game._on_estimate_done)
+        done.set_result({"ticks": 1200, "timed_out": False})
+        game.check_estimate_completion()
+        assert any("so far" in m for m in host.get_spoken_messages())
+        assert game._estimate_running
+
+    def test_busy_server_refuses_estimate(self, service):
+        service.max_pending = 2
+        game, host = self._game()
+        game.execute_action(game.players[0], "estimate_duration")
+        assert not game._estimate_running
+        assert any("busy" in m for m in host.get_spoken_messages())
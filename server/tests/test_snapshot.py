@@ -0,0 +1,125 @@
+"""Tests for the stored game snapshot format."""
+
+import json
+import os
+import tempfile
+
+import pytest
+
+from server.games.pig.game import PigGame
+from server.persistence.database import Database
+from server.persistence.snapshot import (
+    FORMAT_JSON,
+    SnapshotError,
+    decode_snapshot,
+    encode_snapshot,
+    is_binary_snapshot,
+    load_game,
+    train_dictionary,
+)
+from server.tables.table import Table
+from server.users.test_user import MockUser
+
+
+def _pig_game() -> PigGame:
+    game = PigGame()
+    game.initialize_lobby("Alice", MockUser("Alice"))
+    game.execute_action(game.players[0], "add_bot", "Bot")
+    return game
+
+
+class TestSnapshotCodec:
+    """Test encoding and decoding game state."""
+
+    def test_binary_round_trip(self):
+        game = _pig_game()
+        snapshot = encode_snapshot(game.to_dict())
+        assert is_binary_snapshot(snapshot)
+        assert len(snapshot) < len(game.to_json()) / 5
+
+        restored = load_game(PigGame, snapshot)
+        assert restored.to_dict() == game.to_dict()
+
+    def test_legacy_json_still_decodes(self):
+        game = _pig_game()
+        restored = load_game(PigGame, game.to_json())
+        assert [p.name for p in restored.players] == ["Alice", "Bot"]
+
+    def test_json_debug_format(self):
+        game = _pig_game()
+        text = encode_snapshot(game.to_dict(), FORMAT_JSON)
+        assert isinstance(text, str)
+        assert json.loads(text) == game.to_dict()
+
+        # Binary snapshots convert back to readable JSON
+        assert decode_snapshot(encode_snapshot(text)) == json.loads(text)
+        assert encode_snapshot(encode_snapshot(text), FORMAT_JSON) == text
+
+    def test_encoded_snapshot_passed_through(self):
+        snapshot = encode_snapshot({"a": 1})
+        assert encode_snapshot(snapshot) is snapshot
+
+    def test_corrupt_snapshot_rejected(self):
+        snapshot = encode_snapshot({"a": 1})
+        with pytest.raises(SnapshotError):
+            decode_snapshot(snapshot[:6] + b"garbage")
+
+    def test_train_dictionary_prefers_common_tokens(self):
+        samples = [
+            json.dumps({"common_key": i, "rare_key_" + str(i): "x"}) for i in range(5)
+        ]
+        dictionary = train_dictionary(samples, size=64)
+        assert dictionary.endswith(b'{"common_key":')
+        assert b"rare_key_" not in dictionary
+
+
+class TestSnapshotStorage:
+    """Test that the database writes snapshots and reads old rows."""
+
+    def setup_method(self):
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        self.temp_file.close()
+        self.db = Database(self.temp_file.name)
+        self.db.connect()
+
+    def teardown_method(self):
+        self.db.close()
+        os.unlink(self.temp_file.name)
+
+    def _table(self) -> Table:
+        table = Table(table_id="t1", game_type="pig", host="Alice")
+        table.game = _pig_game()
+        return table
+
+    def test_tables_stored_as_snapshots(self):
+        self.db.save_table(self._table())
+        stored = self.db.load_table("t1")
+        assert is_binary_snapshot(stored.game_json)
+
+        restored = Table(
+            table_id="t1", game_type="pig", host="Alice", game_json=stored.game_json
+        )
+        restored.defer_restore()
+        assert [p.name for p in restored.game.players] == ["Alice", "Bot"]
+
+    def test_json_format_option(self):
+        self.db.snapshot_format = FORMAT_JSON
+        self.db.save_table(self._table())
+        assert json.loads(self.db.load_table("t1").game_json)["host"] == "Alice"
+
+    def test_legacy_rows_restore(self):
+        game = _pig_game()
+        self.db._conn.execute(
+            "INSERT INTO tables VALUES ('old', 'pig', 'Alice', '[]', ?, 'playing')",
+            (game.to_json(),),
+        )
+        table = self.db.load_table("old")
+        table.defer_restore()
+        assert [p.name for p in table.game.players] == ["Alice", "Bot"]
+
+    def test_saved_tables_stored_as_snapshots(self):
+        game = _pig_game()
+        record = self.db.save_user_table("Alice", "save", "pig", game.to_json(), "[]")
+        stored = self.db.get_saved_table(record.id)
+        assert is_binary_snapshot(stored.game_json)
+        assert load_game(PigGame, stored.game_json).host == "Alice"
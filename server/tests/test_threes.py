@@ -68,6 +68,31 @@ class TestThreesGameUnit:
         assert loaded_game.current_round == 3
 
 
+class TestThreesBot:
+    """Tests for the bot's exact turn solver."""
+
+    def test_keeps_threes(self):
+        """Test the bot keeps its threes and rerolls the rest."""
+        game = ThreesGame()
+        bot = game.add_player("Bot1", Bot("Bot1"))
+        game.add_player("Bot2", Bot("Bot2"))
+        game.on_start()
+        bot.dice.values = [3, 6, 3, 5, 1]
+        assert game.bot_think(bot) == "roll"
+        assert sorted(bot.dice.kept) == [0, 2]
+
+    def test_chases_moon_with_four_sixes(self):
+        """Test the bot rerolls for a fifth six rather than banking."""
+        game = ThreesGame()
+        bot = game.add_player("Bot1", Bot("Bot1"))
+        game.add_player("Bot2", Bot("Bot2"))
+        game.on_start()
+        bot.dice.values = [6, 6, 6, 2, 6]
+        bot.dice.locked = [0, 1, 2]
+        assert game.bot_think(bot) == "roll"
+        assert 4 in bot.dice.kept and 3 not in bot.dice.kept
+
+
 class TestThreesPlayTest:
     """Integration tests for complete game play."""
 
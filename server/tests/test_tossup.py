@@ -11,7 +11,9 @@ import pytest
 import random
 import json
 
+from server.game_utils.bot_helper import BotHelper
 from server.games.tossup.game import TossUpGame, TossUpOptions
+from server.games.tossup.policy import load_policy, turn_steps
 from server.users.test_user import MockUser
 from server.users.bot import Bot
 
@@ -115,7 +117,7 @@ class TestTossUpGameActions:
     def test_roll_all_green(self):
         """Test rolling when all dice come up green."""
         # Seed random to get mostly green
-        random.seed(10)
+        self.game.rng.seed(10)
 
         self.player1.dice_count = 10
         self.player1.turn_points = 0
@@ -140,7 +142,7 @@ class TestTossUpGameActions:
             self.player1.dice_count = 3
             self.player1.turn_points = 20
 
-            random.seed(1000 + attempt)
+            self.game.rng.seed(1000 + attempt)
             old_player = self.game.current_player
             self.game.execute_action(self.player1, "roll")
 
@@ -167,7 +169,7 @@ class TestTossUpGameActions:
             self.player1.dice_count = 2
             self.player1.turn_points = 15
 
-            random.seed(2000 + attempt)
+            self.game.rng.seed(2000 + attempt)
             old_player = self.game.current_player
             self.game.execute_action(self.player1, "roll")
 
@@ -185,7 +187,7 @@ class TestTossUpGameActions:
     def test_fresh_dice(self):
         """Test that running out of dice gives fresh dice."""
         # Seed to get all greens or yellows (no red)
-        random.seed(42)
+        self.game.rng.seed(42)
 
         self.player1.dice_count = 2
         self.player1.turn_points = 10
@@ -193,7 +195,7 @@ class TestTossUpGameActions:
         # Find a seed where we remove all dice (greens/yellows only)
         found_clear = False
         for seed in range(1000):
-            random.seed(seed)
+            self.game.rng.seed(seed)
             red = 0
             for _ in range(2):
                 roll = random.randint(1, 6)
@@ -255,6 +257,42 @@ class TestTossUpGameActions:
         assert "roll" not in p2_ids
 
 
+class TestTossUpPolicy:
+    """Test the bot's optimal hold-at policy."""
+
+    def test_turn_steps(self):
+        """Test roll chances for each number of dice, leaving out no-change rolls."""
+        # Standard, one die: green 1/2, red (bust) 1/6, yellow (no change) 1/3
+        steps = turn_steps(10, "Standard")
+        assert steps[1] == [(1, 10, pytest.approx(0.75))]
+        # PlayPalace, one die: green, yellow (no change) or red (bust), 1/3 each
+        steps = turn_steps(10, "PlayPalace")
+        assert steps[1] == [(1, 10, pytest.approx(0.5))]
+        assert [after for _, after, _ in steps[3]] == [2, 1, 10]
+
+    def test_policy(self):
+        """Test the policy banks winning totals and chases the leader."""
+        policy = load_policy(100, 10, "Standard")
+        assert 0.5 < policy.win_chance(0, 0) < 0.6
+        assert policy.hold_at(95, 0) <= 5
+        assert policy.hold_at(0, 95) > policy.hold_at(0, 0)
+        assert policy.hold_at(90, 105) == 16
+
+    def test_bot_banks_at_target(self):
+        """Test the bot rolls until its turn reaches the policy's target."""
+        expected = load_policy(100, 10, "Standard").hold_at(0, 0)
+        game = TossUpGame()
+        game.add_player("Bot1", Bot("Bot1"))
+        game.add_player("Bot2", Bot("Bot2"))
+        game.on_start()
+        player = game.current_player
+        target = BotHelper.get_target(player)
+        assert target == expected
+        assert game.bot_think(player) == "roll"
+        player.turn_points = target
+        assert game.bot_think(player) == "bank"
+
+
 class TestTossUpPlayTest:
     """
     Play tests that run complete games with bots.
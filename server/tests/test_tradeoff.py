@@ -3,6 +3,8 @@ Tests for the Tradeoff game.
 """
 
 import json
+import random
+from itertools import combinations_with_replacement
 
 from server.games.tradeoff.game import (
     TradeoffGame,
@@ -12,6 +14,7 @@ from server.games.tradeoff.game import (
 from server.games.tradeoff.scoring import (
     SET_DEFINITIONS,
     find_best_scoring,
+    search_best_scoring,
     is_triple,
     is_group,
     is_mini_straight,
@@ -205,6 +208,28 @@ class TestTradeoffScoring:
         result = find_best_scoring([])
         assert result == []
 
+    def test_find_best_scoring_matches_search(self):
+        """Test the lookup table against exhaustive search on sorted hands."""
+        for size in range(11):
+            for hand in combinations_with_replacement(range(1, 7), size):
+                assert find_best_scoring(list(hand)) == search_best_scoring(list(hand))
+
+        rng = random.Random(42)
+        for _ in range(200):
+            hand = sorted(rng.randint(1, 6) for _ in range(15))
+            assert find_best_scoring(hand) == search_best_scoring(hand)
+
+    def test_find_best_scoring_ignores_dice_order(self):
+        """Test that an unsorted hand scores the same as the search finds."""
+        rng = random.Random(7)
+        for _ in range(200):
+            hand = [rng.randint(1, 6) for _ in range(rng.randint(3, 15))]
+            result = find_best_scoring(hand)
+            assert result == find_best_scoring(sorted(hand))
+            assert sum(s[2] for s in result) == sum(
+                s[2] for s in search_best_scoring(hand)
+            )
+
 
 class TestTradeoffPlayer:
     """Tests for TradeoffPlayer."""
@@ -3,7 +3,11 @@ Tests for the Yahtzee game.
 """
 
 import json
+from itertools import product
 
+import pytest
+
+from server.games.yahtzee import game as yahtzee_game
 from server.games.yahtzee.game import (
     YahtzeeGame,
     YahtzeePlayer,
@@ -15,6 +19,14 @@ from server.games.yahtzee.game import (
     UPPER_CATEGORIES,
     LOWER_CATEGORIES,
 )
+from server.games.yahtzee.policy import (
+    FULL_MASK,
+    YahtzeePolicy,
+    YahtzeePolicyError,
+    build_values,
+    encode_policy,
+)
+from server.games.yahtzee.scoring import _score_roll, roll_scores
 from server.users.test_user import MockUser
 from server.users.bot import Bot
 
@@ -97,6 +109,66 @@ class TestYahtzeeScoring:
         assert calculate_score([1, 1, 1, 1, 1], "chance") == 5
 
 
+    def test_table_matches_direct_scoring(self):
+        """Test the score table against scoring every ordered roll directly."""
+        for roll in product(range(1, 7), repeat=5):
+            row = roll_scores(list(roll))
+            for i, cat in enumerate(ALL_CATEGORIES):
+                assert row[i] == calculate_score(list(roll), cat) == _score_roll(roll, cat)
+        assert calculate_score([1, 2, 3, 4], "chance") == 0
+        assert calculate_score([1, 2, 3, 4, 5], "no_such_category") == 0
+
+
+def _mask(*open_categories: str) -> int:
+    """Filled-category bits for a scoresheet with only these categories open."""
+    filled = FULL_MASK
+    for cat in open_categories:
+        filled &= ~(1 << ALL_CATEGORIES.index(cat))
+    return filled
+
+
+@pytest.fixture(scope="module")
+def endgame_policy():
+    """A policy covering scoresheets with at most two categories open."""
+    return YahtzeePolicy(encode_policy(build_values(first_filled=11), first_filled=11))
+
+
+class TestYahtzeePolicy:
+    """Tests for the optimal solitaire strategy tables."""
+
+    def test_last_turn_values(self, endgame_policy):
+        """Test expected scores of positions with one category open."""
+        # Chance: keep 5s and 6s with two rolls left, 4s and up with one
+        assert endgame_policy.value(_mask("chance"), 0, False) == pytest.approx(
+            23.33, abs=0.01
+        )
+        assert endgame_policy.value(FULL_MASK, 0, False) == 0
+        assert not endgame_policy.complete
+
+    def test_best_keep(self, endgame_policy):
+        """Test keeps depend on the rolls left."""
+        chance = _mask("chance")
+        assert endgame_policy.best_keep([1, 4, 5, 6, 6], 2, chance, 0, False) == (5, 6, 6)
+        assert endgame_policy.best_keep([1, 4, 5, 6, 6], 1, chance, 0, False) == (4, 5, 6, 6)
+        yahtzee = _mask("yahtzee")
+        assert endgame_policy.best_keep([2, 3, 3, 4, 3], 2, yahtzee, 0, False) == (3, 3, 3)
+
+    def test_best_category(self, endgame_policy):
+        """Test category choice weighs bonuses and the turn still to come."""
+        filled = _mask("ones", "yahtzee")
+        assert endgame_policy.best_category([1, 1, 1, 1, 1], filled, 0, False) == "yahtzee"
+        assert endgame_policy.best_category([1, 1, 1, 2, 3], filled, 0, False) == "ones"
+        # Two sixes are worth more in chance unless they reach the upper bonus
+        filled = _mask("sixes", "chance")
+        assert endgame_policy.best_category([6, 6, 5, 5, 5], filled, 51, False) == "sixes"
+        assert endgame_policy.best_category([6, 6, 5, 5, 5], filled, 0, False) == "chance"
+
+    def test_bad_file_rejected(self):
+        """Test files that aren't a policy are refused."""
+        with pytest.raises(YahtzeePolicyError):
+            YahtzeePolicy(b"not a policy")
+
+
 class TestYahtzeePlayer:
     """Tests for YahtzeePlayer."""
 
@@ -260,6 +332,53 @@ class TestYahtzeePlayTest:
         assert game.status == "finished"
 
 
+class TestYahtzeeOptimalBot:
+    """Tests for the bot playing the optimal strategy."""
+
+    @pytest.fixture
+    def game(self, endgame_policy, monkeypatch):
+        monkeypatch.setattr(yahtzee_game, "load_policy", lambda: endgame_policy)
+        game = YahtzeeGame()
+        game.options.bot_strategy = "optimal"
+        game.add_player("Bot1", Bot("Bot1"))
+        game.on_start()
+        player = game.current_player
+        for cat in ALL_CATEGORIES:
+            player.scores[cat] = 0 if cat != "chance" else None
+        return game
+
+    def test_strategy_needs_policy(self, monkeypatch):
+        """Test optimal play is only offered once the table is generated."""
+        game = YahtzeeGame()
+        game.add_player("Bot1", Bot("Bot1"))
+        option = game.options.get_option_metas()["bot_strategy"]
+        monkeypatch.setattr(yahtzee_game, "load_policy", lambda: None)
+        assert option.get_choices(game, game.players[0]) == ["simple"]
+
+    def test_keeps_then_rolls(self, game):
+        """Test the bot toggles dice to the policy's keep and then rolls."""
+        player = game.current_player
+        player.dice.values = [6, 1, 5, 4, 6]
+        player.dice.kept = [1]
+        player.rolls_left = 2
+        actions = []
+        while (action := game.bot_think(player)).startswith("toggle_die_"):
+            actions.append(action)
+            player.dice.toggle_keep(int(action.rsplit("_", 1)[1]))
+        assert action == "roll"
+        assert sorted(player.dice.values[i] for i in player.dice.kept) == [5, 6, 6]
+        assert actions[0] == "toggle_die_0"
+
+    def test_plays_last_turn(self, game):
+        """Test the bot finishes the game in the open category."""
+        for _ in range(3000):
+            if game.status == "finished":
+                break
+            game.on_tick()
+        assert game.status == "finished"
+        assert game.players[0].scores["chance"] >= 5
+
+
 class TestYahtzeePersistence:
     """Tests for game persistence."""
 
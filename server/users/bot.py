@@ -42,6 +42,9 @@ class Bot(User):
     def speak(self, text: str, buffer: str = "misc") -> None:
         pass
 
+    def speak_l(self, message_id: str, buffer: str = "misc", **kwargs) -> None:
+        pass  # Skip rendering a message nobody hears
+
     def play_sound(
         self, name: str, volume: int = 100, pan: int = 0, pitch: int = 100
     ) -> None: